@@ -0,0 +1,259 @@
+"""
+로컬 네이버 모바일 블로그 fixture 서버
+m.blog.naver.com의 블로그 메인, 글 목록(무한 스크롤 API), 포스트 페이지, 댓글 모듈을 흉내 내
+실제 네이버에 접속하지 않고 크롤러 전체 경로를 재현한다
+
+- /{blogId}                                   블로그 메인
+- /{blogId}?categoryNo=0&listStyle=post&tab=1 글 목록 (스크롤하면 글 목록 API 호출)
+- /api/blogs/{blogId}/post-list?page=N        글 목록 API (최신순, 빈 페이지 = 마지막)
+- /PostView.naver?blogId=...&logNo=...        포스트 페이지 (HTTP 경로와 브라우저 경로 공용)
+- /commentBox/cbox/web_naver_list_jsonp.json  댓글 목록 API (댓글 버튼 클릭 시 호출)
+
+모든 응답은 latency초 지연 후 보낸다 (실제 네트워크 지연 재현).
+"""
+import gzip
+import html
+import json
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+
+# 포스트 번호 시작값 (실제 네이버 logNo와 같은 12자리)
+BASE_LOG_NO = 223000000000
+
+PARAGRAPHS = [
+    "겨울에는 따끈한 호떡이 최고입니다. 반죽은 전날 미리 만들어 두세요.",
+    "설탕과 계피를 섞어 속을 채운 뒤 &amp; 약불에서 천천히 굽습니다.",
+    "기름을 넉넉히 두르고 누르개로 한 번에 눌러야 모양이 고르게 나옵니다.",
+    "남은 반죽은 냉장 보관하고 하루 안에 쓰는 것이 좋습니다.",
+]
+
+
+@dataclass
+class FixtureSite:
+    """재현할 블로그 구성
+
+    comment_every가 N이면 N번째 포스트마다 댓글 comments_per_post개 (0이면 댓글 없음, HTTP 경로만으로 수집 가능).
+    body_repeat는 본문 문단 반복 횟수 (포스트 크기 조절).
+    """
+    blog_ids: List[str] = field(default_factory=lambda: ["benchblog"])
+    posts_per_blog: int = 50
+    page_size: int = 24
+    comment_every: int = 0
+    comments_per_post: int = 3
+    body_repeat: int = 20
+    latency: float = 0.0
+
+    def log_nos(self, blog_id: str) -> List[int]:
+        """블로그의 포스트 번호 (최신순)"""
+        return [BASE_LOG_NO + idx for idx in range(self.posts_per_blog, 0, -1)]
+
+    def post_urls(self, blog_id: str) -> List[str]:
+        return [f"https://m.blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}"
+                for log_no in self.log_nos(blog_id)]
+
+    def comment_count(self, log_no: int) -> int:
+        if self.comment_every and (log_no - BASE_LOG_NO) % self.comment_every == 0:
+            return self.comments_per_post
+        return 0
+
+    def post_list_payload(self, blog_id: str, page: int) -> dict:
+        start = (page - 1) * self.page_size
+        items = [{"logNo": log_no, "titleWithInspectMessage": f"벤치마크 포스트 {log_no - BASE_LOG_NO}"}
+                 for log_no in self.log_nos(blog_id)[start:start + self.page_size]]
+        return {"isSuccess": True, "result": {"items": items}}
+
+    def comment_payload(self, log_no: int) -> dict:
+        comments = [{"userName": f"방문자{idx}", "contents": f"{idx}번째 댓글입니다. 잘 보고 갑니다.",
+                     "regTime": f"2025.01.{idx % 28 + 1:02d}. 10:{idx % 60:02d}", "sympathyCount": idx}
+                    for idx in range(1, self.comment_count(log_no) + 1)]
+        return {"success": True, "result": {"count": {"comment": len(comments)}, "commentList": comments}}
+
+    def main_page(self, blog_id: str) -> str:
+        return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{blog_id} : 네이버 블로그</title></head>
+<body><div class="blog_info"><span class="nickname">{blog_id}</span></div>
+<a href="/{blog_id}?categoryNo=0&amp;listStyle=post&amp;tab=1">전체글</a></body></html>"""
+
+    def list_page(self, blog_id: str) -> str:
+        # 글 목록 컨테이너는 POST_LINKS_JS의 XPath(/html/body/div[1]/div[5]/div[4])와 같은 위치
+        return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{blog_id} : 네이버 블로그</title>
+<style>.postlist__qxOgF {{ height: 240px; }}</style></head>
+<body><div id="root"><div></div><div></div><div></div><div></div>
+<div class="list_area"><div></div><div></div><div></div><div id="post_list"></div></div></div>
+<button data-click-area="pls.sort" onclick="document.getElementById('count_layer').style.display='block'">전체글</button>
+<div id="count_layer" style="display:none"><em class="num_area__d8SvC">{self.posts_per_blog:,}</em>
+<button class="btn__PPrNT" aria-label="닫기" onclick="this.parentNode.style.display='none'">닫기</button></div>
+<script>
+const blogId = {json.dumps(blog_id)};
+let nextPage = 1, loading = false, done = false;
+async function loadMore() {{
+  if (loading || done) return;
+  loading = true;
+  const res = await fetch(`/api/blogs/${{blogId}}/post-list?categoryNo=0&itemCount={self.page_size}&page=${{nextPage}}`);
+  const items = (await res.json()).result.items;
+  nextPage += 1;
+  if (items.length === 0) {{
+    done = true;
+    const top = document.createElement('button');
+    top.className = 'scroll_top_button__uyAEr';
+    top.setAttribute('data-click-area', 'pls.backtotop');
+    top.textContent = '맨 위로';
+    document.body.appendChild(top);
+  }}
+  const list = document.getElementById('post_list');
+  for (const item of items) {{
+    const div = document.createElement('div');
+    div.className = 'postlist__qxOgF';
+    div.innerHTML = `<a class="link__A4O1D" data-click-area="pls.textpost"
+      href="/PostView.naver?blogId=${{blogId}}&logNo=${{item.logNo}}">${{item.titleWithInspectMessage}}</a>`;
+    list.appendChild(div);
+  }}
+  loading = false;
+}}
+window.addEventListener('scroll', () => {{
+  if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 400) loadMore();
+}});
+loadMore();
+</script></body></html>"""
+
+    def post_page(self, blog_id: str, log_no: int) -> str:
+        number = log_no - BASE_LOG_NO
+        title = f"벤치마크 포스트 {number}"
+        paragraphs = "\n".join(
+            f'<div class="se-component se-text"><p class="se-text-paragraph"><span>{PARAGRAPHS[idx % len(PARAGRAPHS)]}'
+            f'</span></p></div>' + (
+                f'<div class="se-component se-image"><div class="se-image">'
+                f'<img data-lazy-src="https://postfiles.pstatic.net/{number}_{idx}.jpg"></div></div>'
+                if idx % 5 == 4 else ''
+            )
+            for idx in range(self.body_repeat)
+        )
+        comment_count = self.comment_count(log_no)
+        return f"""<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><meta property="og:title" content="{html.escape(title)}">
+<title>{html.escape(title)} : 네이버 블로그</title></head>
+<body>
+<div class="post_ct">
+  <div class="se_component_wrap">
+    <div class="se-title-text"><span>{html.escape(title)}</span></div>
+    <div class="blog_info"><span class="nickname">{blog_id}</span>
+      <p class="se_publishDate">2025. 1. {number % 28 + 1}. 10:00</p><div class="category">벤치마크</div></div>
+    <div class="se-main-container">
+{paragraphs}
+      <p class="se-text-paragraph"><a href="/{blog_id}/{log_no - 1}">이전 글</a></p>
+    </div>
+  </div>
+  <div class="meta_foot__I5IqM">
+    <span class="u_likeit_text _count num">{number * 7 % 1000}</span>
+    <button class="comment_btn__TUucZ" data-click-area="pst.re"><span class="num__OVfhz">{comment_count}</span></button>
+  </div>
+  <div class="list_wrap__jKORt"><ul class="list__yr1c8">
+    <li class="item__jRCnW"><a class="tag__tFC3j" data-click-area="pst.tag" href="#">#호떡</a></li>
+    <li class="item__jRCnW"><a class="tag__tFC3j" data-click-area="pst.tag" href="#">#벤치마크</a></li>
+  </ul></div>
+  <div id="cbox_module"></div>
+</div>
+<script>
+document.querySelector('button.comment_btn__TUucZ').addEventListener('click', async () => {{
+  const res = await fetch('/commentBox/cbox/web_naver_list_jsonp.json?objectId={log_no}');
+  const comments = (await res.json()).result.commentList;
+  const items = comments.map(c => `<li class="u_cbox_comment"><span class="u_cbox_nick">${{c.userName}}</span>
+    <span class="u_cbox_contents">${{c.contents}}</span> <span class="u_cbox_date">${{c.regTime}}</span>
+    공감 ${{c.sympathyCount}}</li>`).join('');
+  document.getElementById('cbox_module').innerHTML = '<div class="u_cbox_content_wrap">'
+    + '<div id="naverComment_wai_u_cbox_content_wrap_tabpanel" role="tabpanel">'
+    + (items ? `<ul class="u_cbox_list">${{items}}</ul>` : '<div class="u_cbox_list_no_comment"></div>') + '</div></div>';
+}});
+</script>
+</body>
+</html>"""
+
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    site: FixtureSite = None
+    counter: dict = None
+
+    def setup(self):
+        super().setup()
+        # 헤더와 본문을 따로 쓰므로 Nagle 알고리즘을 끄지 않으면 클라이언트 지연 ACK(약 40ms)만큼 멈춤
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        if self.site.latency:
+            time.sleep(self.site.latency)
+        parsed = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        parts = [part for part in parsed.path.split('/') if part]
+        self.counter['requests'] += 1
+
+        if parsed.path == "/PostView.naver":
+            log_no = int(query.get("logNo", "0") or 0)
+            blog_id = query.get("blogId", "")
+            if blog_id in self.site.blog_ids and log_no in self.site.log_nos(blog_id):
+                return self._send(200, self.site.post_page(blog_id, log_no), "text/html")
+        elif parsed.path.startswith("/commentBox/") and "list" in parsed.path:
+            return self._send(200, json.dumps(self.site.comment_payload(int(query.get("objectId", "0")))),
+                              "application/json")
+        elif len(parts) == 4 and parts[0] == "api" and parts[1] == "blogs" and parts[3] == "post-list":
+            if parts[2] in self.site.blog_ids:
+                payload = self.site.post_list_payload(parts[2], int(query.get("page", "1")))
+                return self._send(200, json.dumps(payload), "application/json")
+        elif len(parts) == 1 and parts[0] in self.site.blog_ids:
+            page = self.site.list_page(parts[0]) if query.get("listStyle") == "post" else self.site.main_page(parts[0])
+            return self._send(200, page, "text/html")
+
+        self._send(404, '<html><body><div class="error">페이지를 찾을 수 없습니다</div></body></html>', "text/html")
+
+    def _send(self, status: int, text: str, content_type: str) -> None:
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.counter['bytes'] += len(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """FixtureSite를 제공하는 로컬 HTTP 서버 (with 문으로 시작/종료)
+
+    base_url은 HttpFetcher(base_url=...)와 ReplayBrowserPool에 넘긴다.
+    """
+
+    def __init__(self, site: Optional[FixtureSite] = None, port: int = 0):
+        self.site = site or FixtureSite()
+        self.counter = {'requests': 0, 'bytes': 0}
+        handler = type("SiteHandler", (_SiteHandler,), {"site": self.site, "counter": self.counter})
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self._server.daemon_threads = True
+        host, port = self._server.server_address[:2]
+        self.base_url = f"http://{host}:{port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self) -> "FixtureServer":
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
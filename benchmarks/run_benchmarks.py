@@ -0,0 +1,397 @@
+"""
+오프라인 크롤링 벤치마크
+로컬 fixture 서버(benchmarks/fixture_server.py)를 대상으로 crawl_by_blog_id와
+crawl_multiple_blog_ids(resume_crawling 경유)를 실행해 초당 포스트 수, 단계별 지연 시간(p95),
+최대 메모리(RSS)를 측정하고 benchmarks/thresholds.json의 기준을 넘으면 실패(종료 코드 1)한다.
+
+fixture 서버는 이 프로세스에서 실행하고 시나리오는 별도 프로세스에서 실행하므로
+최대 RSS와 처리 시간에 서버 부하가 섞이지 않는다 (최대 RSS는 시나리오별 크롤러 프로세스 값,
+크롬 렌더러 프로세스 메모리는 포함하지 않음, resource 모듈이 없는 Windows에서는 측정 생략).
+브라우저 시나리오는 Chromium을 실행할 수 없으면 건너뛴다.
+
+사용법:
+    python benchmarks/run_benchmarks.py                       # 전체 시나리오 실행 + 기준 확인
+    python benchmarks/run_benchmarks.py http_blog http_batch  # 일부 시나리오만
+    python benchmarks/run_benchmarks.py --latency 0.05        # 응답마다 50ms 지연
+    python benchmarks/run_benchmarks.py --update-thresholds   # 측정값으로 기준 갱신 (여유 --margin)
+"""
+import argparse
+import contextlib
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.crawler import batch_crawler
+from src.crawler.browser_pool import BrowserPool
+from src.crawler.engine import crawl_by_blog_id
+from src.crawler.http_fetcher import HttpFetcher
+from src.utils.checkpoint_manager import CheckpointManager
+from src.utils.metrics import CrawlMetrics
+from src.utils.rate_limiter import AdaptiveRateLimiter
+from benchmarks.fixture_server import FixtureServer, FixtureSite
+
+THRESHOLDS_PATH = Path(__file__).resolve().parent / "thresholds.json"
+
+
+@dataclass
+class Scenario:
+    """벤치마크 시나리오 (site: 재현할 블로그 구성, browser: Chromium 필요 여부)"""
+    description: str
+    site: FixtureSite
+    run: Callable[[FixtureSite, str, CrawlMetrics, Path], None]
+    browser: bool = False
+
+
+class ReplayBrowserPool(BrowserPool):
+    """m.blog.naver.com 요청을 로컬 fixture 서버로 보내는 브라우저 풀
+
+    컨텍스트마다 재현 라우트만 추가하므로 쿠키/디바이스 설정/리소스 차단(CDP)은 BrowserPool과 같다
+    (재현 라우트 때문에 벤치마크 컨텍스트에서는 HTTP 캐시가 꺼진다).
+    """
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def new_context(self, storage_state: Optional[dict] = None):
+        context = super().new_context(storage_state)
+        context.route("https://m.blog.naver.com/**", self._replay)
+        return context
+
+    def _replay(self, route) -> None:
+        parsed = urlparse(route.request.url)
+        target = self.base_url + parsed.path + (f"?{parsed.query}" if parsed.query else "")
+        route.fulfill(response=route.fetch(url=target))
+
+
+def unthrottled_rate_limiter(delay: float = 0.0) -> AdaptiveRateLimiter:
+    """요청 간격을 사실상 두지 않는 조절기 (로컬 서버에서는 대기 시간이 측정을 가리므로)"""
+    return AdaptiveRateLimiter(delay=0.001, min_delay=0.001)
+
+
+@contextlib.contextmanager
+def patched(module, **attrs):
+    """모듈 속성을 잠시 바꿈 (배치 크롤러가 직접 만드는 풀/HTTP 연결/조절기를 fixture 서버용으로)"""
+    originals = {name: getattr(module, name) for name in attrs}
+    for name, value in attrs.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(module, name, value)
+
+
+def _discard(posts) -> None:
+    pass
+
+
+def run_http_blog(site: FixtureSite, base_url: str, metrics: CrawlMetrics, work_dir: Path) -> None:
+    """crawl_by_blog_id: 전체 링크 목록(재개 모드) + HTTP 경로"""
+    blog_id = site.blog_ids[0]
+    with HttpFetcher(timeout=10, base_url=base_url) as fetcher:
+        crawl_by_blog_id(blog_id, all_post_urls=site.post_urls(blog_id), save_callback=_discard,
+                         http_fetcher=fetcher, rate_limiter=unthrottled_rate_limiter(), metrics=metrics)
+
+
+def _checkpoint_for(site: FixtureSite, manager: CheckpointManager) -> str:
+    """전체 링크 목록이 기록된 체크포인트 (Phase 1 없이 배치 크롤링을 재개)"""
+    job_data = {
+        "crawl_type": "blog_id",
+        "blog_ids": site.blog_ids,
+        "total_blog_ids": len(site.blog_ids),
+        "processed_blog_ids": 0,
+        "failed_blog_ids": 0,
+        "status": "running",
+        "blog_progress": [
+            {"blog_id": blog_id, "status": "in_progress", "all_post_urls": site.post_urls(blog_id),
+             "crawled_urls": [], "posts_crawled": 0}
+            for blog_id in site.blog_ids
+        ]
+    }
+    return str(manager.create_checkpoint(job_data))
+
+
+def run_http_batch(site: FixtureSite, base_url: str, metrics: CrawlMetrics, work_dir: Path) -> None:
+    """crawl_multiple_blog_ids (resume_crawling 경유): 블로그 여러 개, HTTP 경로, JSONL 저장/체크포인트 포함"""
+    manager = CheckpointManager(str(work_dir / "checkpoints"))
+    checkpoint_path = _checkpoint_for(site, manager)
+    with patched(batch_crawler, HttpFetcher=partial(HttpFetcher, base_url=base_url),
+                 AdaptiveRateLimiter=unthrottled_rate_limiter):
+        batch_crawler.resume_crawling(checkpoint_path, str(work_dir / "output.json"), manager,
+                                      http_fetch=True, metrics=metrics)
+
+
+def run_browser_blog(site: FixtureSite, base_url: str, metrics: CrawlMetrics, work_dir: Path) -> None:
+    """crawl_by_blog_id: 글 목록 무한 스크롤(Phase 1) + 브라우저 상세 크롤링(댓글 포함)"""
+    blog_id = site.blog_ids[0]
+    pool = ReplayBrowserPool(base_url)
+    try:
+        crawl_by_blog_id(blog_id, save_callback=_discard, browser_pool=pool,
+                         rate_limiter=unthrottled_rate_limiter(), metrics=metrics)
+    finally:
+        pool.close()
+
+
+def run_browser_batch(site: FixtureSite, base_url: str, metrics: CrawlMetrics, work_dir: Path) -> None:
+    """crawl_multiple_blog_ids: 블로그 여러 개, Phase 1 + HTTP 우선/댓글 포스트는 브라우저"""
+    manager = CheckpointManager(str(work_dir / "checkpoints"))
+    with patched(batch_crawler, BrowserPool=partial(ReplayBrowserPool, base_url),
+                 HttpFetcher=partial(HttpFetcher, base_url=base_url),
+                 AdaptiveRateLimiter=unthrottled_rate_limiter):
+        batch_crawler.crawl_multiple_blog_ids(site.blog_ids, str(work_dir / "output.json"), manager,
+                                              http_fetch=True, metrics=metrics)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "http_blog": Scenario(
+        "crawl_by_blog_id, HTTP 경로 포스트 200개",
+        FixtureSite(blog_ids=["benchblog"], posts_per_blog=200),
+        run_http_blog
+    ),
+    "http_batch": Scenario(
+        "crawl_multiple_blog_ids, 블로그 4개 × 포스트 50개 (HTTP 경로, 저장/체크포인트 포함)",
+        FixtureSite(blog_ids=[f"benchblog{idx}" for idx in range(1, 5)], posts_per_blog=50),
+        run_http_batch
+    ),
+    "browser_blog": Scenario(
+        "crawl_by_blog_id, 글 목록 스크롤 + 브라우저 포스트 30개 (5개마다 댓글)",
+        FixtureSite(blog_ids=["benchblog"], posts_per_blog=30, comment_every=5),
+        run_browser_blog,
+        browser=True
+    ),
+    "browser_batch": Scenario(
+        "crawl_multiple_blog_ids, 블로그 2개 × 포스트 20개 (HTTP 우선, 댓글 포스트는 브라우저)",
+        FixtureSite(blog_ids=["benchblog1", "benchblog2"], posts_per_blog=20, comment_every=4),
+        run_browser_batch,
+        browser=True
+    ),
+}
+
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB, 측정할 수 없으면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def browser_available() -> bool:
+    """Chromium 실행 가능 여부"""
+    try:
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as playwright:
+            playwright.chromium.launch(headless=True).close()
+        return True
+    except Exception:
+        return False
+
+
+def run_scenario(name: str, base_url: str) -> dict:
+    """시나리오 하나를 현재 프로세스에서 실행하고 측정 결과 반환 (base_url: 실행 중인 fixture 서버)"""
+    scenario = SCENARIOS[name]
+    if scenario.browser and not browser_available():
+        return {"scenario": name, "status": "skipped", "reason": "Chromium을 실행할 수 없습니다"}
+
+    metrics = CrawlMetrics()
+    work_dir = Path(tempfile.mkdtemp(prefix=f"bench_{name}_"))
+    try:
+        start = time.perf_counter()
+        scenario.run(scenario.site, base_url, metrics, work_dir)
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    snapshot = metrics.snapshot()
+    posts = int(snapshot['counters'].get('posts', 0))
+    rss = peak_rss_mb()
+    return {
+        "scenario": name,
+        "status": "ok",
+        "posts": posts,
+        "expected_posts": len(scenario.site.blog_ids) * scenario.site.posts_per_blog,
+        "failed_posts": int(snapshot['counters'].get('failed_posts', 0)),
+        "seconds": round(elapsed, 3),
+        "posts_per_sec": round(posts / elapsed, 2) if elapsed > 0 else 0.0,
+        "peak_rss_mb": round(rss, 1) if rss is not None else None,
+        "stages": {stage: {"mean": round(data['mean'], 4), "p95": data['p95'], "count": data['count']}
+                   for stage, data in snapshot['stages'].items()},
+        "counters": snapshot['counters'],
+    }
+
+
+def run_in_subprocess(name: str, latency: float, verbose: bool = False) -> dict:
+    """fixture 서버를 띄우고 시나리오를 별도 프로세스에서 실행 (크롤러 로그는 실패 시에만 출력)"""
+    site = SCENARIOS[name].site
+    site.latency = latency
+    with FixtureServer(site) as server, tempfile.TemporaryDirectory() as tmp:
+        result_path = Path(tmp) / "result.json"
+        command = [sys.executable, str(Path(__file__).resolve()), "--child", name,
+                   "--base-url", server.base_url, "--result", str(result_path)]
+        completed = subprocess.run(command, cwd=str(project_root), capture_output=not verbose, text=True,
+                                   encoding="utf-8", errors="replace")
+        if completed.returncode != 0 or not result_path.exists():
+            if not verbose:
+                print("\n".join((completed.stdout or "").splitlines()[-30:]))
+                print(completed.stderr or "")
+            return {"scenario": name, "status": "error", "reason": f"종료 코드 {completed.returncode}"}
+        result = json.loads(result_path.read_text(encoding="utf-8"))
+        result["requests"] = server.counter['requests']
+        return result
+
+
+def check_thresholds(result: dict, thresholds: dict) -> List[str]:
+    """기준을 넘은 항목 목록 (빈 목록이면 통과)
+
+    기준 항목: min_posts_per_sec, max_peak_rss_mb, max_failed_posts, max_stage_p95 {단계: 초}
+    """
+    failures = []
+    if result.get("status") != "ok":
+        return failures if result.get("status") == "skipped" else [result.get("reason", "실행 실패")]
+
+    if "min_posts_per_sec" in thresholds and result["posts_per_sec"] < thresholds["min_posts_per_sec"]:
+        failures.append(f"초당 포스트 {result['posts_per_sec']} < 기준 {thresholds['min_posts_per_sec']}")
+    if result.get("peak_rss_mb") is not None and thresholds.get("max_peak_rss_mb") is not None \
+            and result["peak_rss_mb"] > thresholds["max_peak_rss_mb"]:
+        failures.append(f"최대 RSS {result['peak_rss_mb']}MB > 기준 {thresholds['max_peak_rss_mb']}MB")
+    if result["failed_posts"] > thresholds.get("max_failed_posts", 0):
+        failures.append(f"실패한 포스트 {result['failed_posts']}개")
+    if result["posts"] < result["expected_posts"] - result["failed_posts"]:
+        failures.append(f"수집한 포스트 {result['posts']}/{result['expected_posts']}개")
+    for stage, limit in thresholds.get("max_stage_p95", {}).items():
+        p95 = result["stages"].get(stage, {}).get("p95")
+        if p95 is not None and p95 > limit:
+            failures.append(f"{stage} p95 {p95}초 > 기준 {limit}초")
+    return failures
+
+
+def unchecked_reason(result: dict, thresholds: dict) -> Optional[str]:
+    """기준과 비교하지 못한 이유 (건너뜀/기준 없음, 비교했으면 None)
+
+    --allow-skip 없이 실행하면 이런 시나리오가 있을 때 실패로 종료한다
+    (Chromium이 없는 환경에서 HTTP 경로만 확인하고 통과하지 않도록).
+    """
+    if result.get("status") == "skipped":
+        return f"건너뜀 ({result.get('reason', '')})"
+    if result.get("status") == "ok" and result.get("scenario") not in thresholds:
+        return "기준 없음 (--update-thresholds로 기록)"
+    return None
+
+
+def thresholds_from(result: dict, margin: float) -> dict:
+    """측정값에서 기준 생성 (margin만큼 여유, 단계 p95는 구간 상한이므로 2배, 최소 50ms)"""
+    return {
+        "min_posts_per_sec": round(result["posts_per_sec"] * (1 - margin), 2),
+        "max_peak_rss_mb": round(result["peak_rss_mb"] * (1 + margin), 1) if result.get("peak_rss_mb") else None,
+        "max_failed_posts": 0,
+        "max_stage_p95": {stage: round(max(data["p95"], 0.025) * 2, 3) for stage, data in result["stages"].items()},
+    }
+
+
+def print_result(result: dict) -> None:
+    if result["status"] != "ok":
+        print(f"  [{result['status']}] {result.get('reason', '')}")
+        return
+    rss = f"{result['peak_rss_mb']}MB" if result.get("peak_rss_mb") is not None else "측정 안 함"
+    print(f"  포스트 {result['posts']}/{result['expected_posts']}개, {result['seconds']}초, "
+          f"초당 {result['posts_per_sec']}개, 서버 요청 {result.get('requests', '-')}회, 최대 RSS {rss}")
+    for stage, data in sorted(result["stages"].items(), key=lambda item: -item[1]["mean"] * item[1]["count"]):
+        print(f"    {stage:<10} 평균 {data['mean'] * 1000:8.2f}ms  p95 ≤ {data['p95'] * 1000:8.1f}ms  ({data['count']}회)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="오프라인 크롤링 벤치마크")
+    parser.add_argument("scenarios", nargs="*", help=f"실행할 시나리오 (기본: 전체 {', '.join(SCENARIOS)})")
+    parser.add_argument("--latency", type=float, default=0.01, help="fixture 서버 응답 지연 (초)")
+    parser.add_argument("--thresholds", default=str(THRESHOLDS_PATH), help="기준 파일")
+    parser.add_argument("--update-thresholds", action="store_true", help="측정값으로 기준 파일 갱신")
+    parser.add_argument("--margin", type=float, default=0.5, help="기준 갱신 시 여유 비율")
+    parser.add_argument("--allow-skip", action="store_true",
+                        help="건너뛴 시나리오(Chromium 없음)나 기준이 없는 시나리오가 있어도 통과로 처리")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 로그 출력")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        result = run_scenario(args.child, args.base_url)
+        Path(args.result).write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+        return 0
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        print(f"[오류] 알 수 없는 시나리오: {', '.join(unknown)}")
+        return 2
+
+    thresholds_path = Path(args.thresholds)
+    thresholds = json.loads(thresholds_path.read_text(encoding="utf-8")) if thresholds_path.exists() else {}
+
+    print("=" * 60)
+    print(f"오프라인 크롤링 벤치마크 (응답 지연 {args.latency * 1000:.0f}ms)")
+    print("=" * 60)
+
+    failed = False
+    unchecked = []
+    for name in names:
+        print(f"\n=== {name}: {SCENARIOS[name].description} ===")
+        result = run_in_subprocess(name, args.latency, args.verbose)
+        print_result(result)
+
+        if args.update_thresholds:
+            if result["status"] == "ok":
+                thresholds[name] = thresholds_from(result, args.margin)
+                print("  ✓ 기준 갱신")
+            continue
+        reason = unchecked_reason(result, thresholds)
+        if reason:
+            print(f"  [경고] 기준과 비교하지 않음: {reason}")
+            unchecked.append(name)
+            continue
+        failures = check_thresholds(result, thresholds.get(name, {}))
+        for failure in failures:
+            print(f"  ✗ {failure}")
+        if failures:
+            failed = True
+        elif result["status"] == "ok":
+            print("  ✓ 기준 통과")
+
+    if args.update_thresholds:
+        thresholds_path.write_text(json.dumps(thresholds, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n기준 파일 저장: {thresholds_path}")
+        return 0
+
+    print("\n" + "=" * 60)
+    if failed:
+        print("✗ 성능 저하 감지")
+    if unchecked:
+        mark = "[경고]" if args.allow_skip else "✗"
+        print(f"{mark} 기준과 비교하지 않은 시나리오 {len(unchecked)}개: {', '.join(unchecked)}"
+              + ("" if args.allow_skip else " (--allow-skip으로 허용)"))
+    if not failed and not unchecked:
+        print("✓ 모든 시나리오 기준 통과")
+    elif not failed and args.allow_skip:
+        print(f"✓ 비교한 시나리오 {len(names) - len(unchecked)}개 기준 통과")
+    print("=" * 60)
+    return 1 if failed or (unchecked and not args.allow_skip) else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,596 @@
+"""
+크롤링 엔진 (asyncio 버전)
+engine.py의 2단계 크롤링 전략을 playwright.async_api 기반으로 제공
+
+하나의 이벤트 루프에서 여러 페이지를 동시에 구동할 수 있으므로
+스레드나 브라우저를 추가로 띄우지 않고 Phase 2를 병렬로 처리한다.
+여러 블로그를 동시에 크롤링할 때는 browser 인자로 브라우저를 공유한다.
+"""
+import re
+import time
+import asyncio
+from typing import List, Optional, Tuple, Callable
+from playwright.async_api import Page, Browser, async_playwright, TimeoutError as PlaywrightTimeout
+
+from src.models import Post, Author
+from src.crawler.engine import (
+    archive_page, classify_error, extract_post_id_from_url, extract_blog_id_from_url, post_fields_from_bundle,
+    record_rate_failure
+)
+from src.crawler.async_parser import extract_tags, extract_comments, extract_content, extract_metadata
+from src.crawler.scripts import TITLE_JS, POST_LINKS_JS, POST_BUNDLE_JS
+from src.crawler.post_list_api import PostListCollector
+from src.crawler.readiness import ReadinessConfig, DEFAULT_READINESS
+from src.crawler.async_readiness import wait_for_comments, wait_for_content
+from src.utils.exceptions import BlogNotFoundError, TimeoutError, NetworkError, RateLimitedError
+from src.crawler.resource_blocking import (
+    BlockingProfile, BlockingStats, DEFAULT_BLOCKING_PROFILE, install_page_blocking_async, log_blocked
+)
+from src.utils.rate_limiter import AdaptiveRateLimiter, THROTTLE_STATUSES
+from src.utils.html_store import HtmlStore, release_heavy_fields, validate_html_policy
+from src.utils.html_archive import HtmlArchive
+from src.utils.retry import RetryPolicy, DEFAULT_RETRY_POLICY, failure_record, is_transient
+
+
+def _title_from_page_title(page_title: str) -> str:
+    """페이지 title에서 제목 부분만 분리 ("제목 : 네이버 블로그" 형식)"""
+    for separator in (' : ', ' - '):
+        if separator in page_title:
+            return page_title.split(separator)[0].strip()
+    return page_title.strip()
+
+
+async def extract_title(page: Page) -> str:
+    """제목 추출 (모바일 네이버 블로그)"""
+    # 우선: 페이지 title에서 추출 (가장 정확)
+    try:
+        page_title = await page.title()
+        if page_title and (' : ' in page_title or ' - ' in page_title):
+            title = _title_from_page_title(page_title)
+            if title and len(title) < 200:
+                return title
+    except Exception:
+        pass
+
+    # JavaScript로 제목 추출 (Fallback)
+    try:
+        title = await page.evaluate(TITLE_JS)
+        if title and title.strip():
+            return title.strip()
+    except Exception as e:
+        print(f"[경고] JavaScript 제목 추출 실패: {e}")
+
+    # 최종 Fallback: page title에서 추출
+    try:
+        page_title = await page.title()
+        if page_title:
+            return _title_from_page_title(page_title)
+    except Exception:
+        pass
+
+    return ''
+
+
+async def extract_author(page: Page, blog_id: str = '') -> Author:
+    """작성자 정보 추출"""
+    nickname = ''
+
+    for selector in ['.nickname', '.author-name', '.blog-author', '.blog_info .nickname']:
+        try:
+            element = page.locator(selector).first
+            if await element.count() > 0:
+                nickname = (await element.text_content()).strip()
+                if nickname:
+                    break
+        except Exception:
+            continue
+
+    if not nickname:
+        nickname = blog_id  # 기본값
+
+    if not blog_id:
+        blog_id = extract_blog_id_from_url(page.url)
+
+    return Author(blog_id=blog_id, nickname=nickname)
+
+
+async def _first_text(page: Page, selectors: List[str]) -> Optional[str]:
+    """선택자 목록 중 처음으로 텍스트가 있는 요소의 텍스트 반환"""
+    for selector in selectors:
+        try:
+            element = page.locator(selector).first
+            if await element.count() > 0:
+                text = await element.text_content() or ''
+                if text.strip():
+                    return text.strip()
+        except Exception:
+            continue
+    return None
+
+
+async def extract_published_date(page: Page) -> str:
+    """작성일 추출"""
+    return await _first_text(page, [
+        '.se_publishDate',
+        '.publish-date',
+        '.date',
+        '.time__SNGFu',
+        '.desc__k5fQT .time__SNGFu'
+    ]) or ''
+
+
+async def extract_modified_date(page: Page) -> Optional[str]:
+    """수정일 추출"""
+    return await _first_text(page, ['.se_modifyDate', '.modified-date', '.modify-date'])
+
+
+async def extract_post_bundle(page: Page, blog_id: str) -> Optional[dict]:
+    """제목/작성자/날짜/메타데이터/본문을 page.evaluate 1회로 추출 (실패 시 None)"""
+    try:
+        data = await page.evaluate(POST_BUNDLE_JS)
+    except Exception as e:
+        print(f"[경고] 포스트 일괄 추출 실패, 필드별 추출로 대체: {e}")
+        return None
+
+    if not data:
+        return None
+    return post_fields_from_bundle(data, blog_id)
+
+
+async def _collect_all_post_links(
+    page: Page,
+    blog_id: str,
+    max_posts: Optional[int] = None,
+    timeout: int = 30,
+    collector: Optional[PostListCollector] = None
+) -> List[str]:
+    """
+    Phase 1: 링크 수집
+    1. 전체글 갯수 확인
+    2. 스크롤 다운하여 모든 링크 수집
+    3. 글 목록 API 응답(collector)에서 링크 생성, 응답이 없으면 DOM 순서대로 포스트 링크 추출
+    """
+    print("[단계] === Phase 1: 링크 수집 시작 ===")
+
+    # 1단계: 전체글 갯수 확인
+    total_post_count = None
+    current_url = page.url
+
+    sort_button = None
+    for selector in [
+        'button[data-click-area="pls.sort"]',
+        'button.link__dkflP',
+        'button:has-text("전체글")',
+        'button:has(span:text("전체글"))'
+    ]:
+        try:
+            element = page.locator(selector).first
+            if await element.count() > 0:
+                sort_button = element
+                break
+        except Exception:
+            continue
+
+    if sort_button:
+        try:
+            await sort_button.click()
+            await asyncio.sleep(2)
+
+            count_elem = page.locator('em.num_area__d8SvC').first
+            if await count_elem.count() > 0:
+                count_text = await count_elem.text_content() or ''
+                numbers = re.findall(r'\d+', count_text.replace(',', ''))
+                if numbers:
+                    total_post_count = int(numbers[0])
+                    print(f"[단계] 전체글 갯수 확인: {total_post_count}개")
+
+            close_button = page.locator('button.btn__PPrNT[aria-label="닫기"]').first
+            if await close_button.count() > 0:
+                await close_button.click()
+            else:
+                await page.goto(current_url, wait_until='domcontentloaded')
+            await asyncio.sleep(2)
+        except Exception as e:
+            print(f"[경고] 전체글 갯수 확인 실패: {e}")
+            try:
+                await page.goto(current_url, wait_until='domcontentloaded')
+                await asyncio.sleep(2)
+            except Exception:
+                pass
+
+    # 2단계: 스크롤 다운 ('맨 위로' 버튼이 나타날 때까지)
+    scroll_count = 0
+    no_change_count = 0
+    no_change_threshold = 3
+    max_scrolls = 200
+
+    while scroll_count < max_scrolls:
+        scroll_count += 1
+
+        if collector is not None:
+            await collector.harvest_async()
+            if collector.reached_end:
+                print(f"[단계] 글 목록 API 마지막 페이지 도달 - 스크롤 완료 ({len(collector)}개 링크)")
+                break
+
+        scroll_top_button = page.locator('button.scroll_top_button__uyAEr[data-click-area="pls.backtotop"]').first
+        if await scroll_top_button.count() > 0:
+            print("[단계] '맨 위로' 버튼 감지 - 스크롤 완료")
+            await asyncio.sleep(1)
+            break
+
+        old_height = await page.evaluate('document.body.scrollHeight')
+        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+        await asyncio.sleep(0.2)
+        new_height = await page.evaluate('document.body.scrollHeight')
+
+        if new_height == old_height:
+            no_change_count += 1
+            if no_change_count >= no_change_threshold:
+                await asyncio.sleep(1)
+                if await page.evaluate('document.body.scrollHeight') == old_height:
+                    print(f"[단계] 스크롤 완료: 높이 안정화됨 ({old_height}px)")
+                    break
+                no_change_count = 0
+            else:
+                await asyncio.sleep(0.3)
+        else:
+            no_change_count = 0
+
+    await asyncio.sleep(2)
+
+    # 3단계: 링크 수집 (글 목록 API 응답 우선, 부족하면 DOM)
+    links = None
+    if collector is not None:
+        await collector.harvest_async()
+        if len(collector) and total_post_count and len(collector) < total_post_count:
+            print(f"[경고] 글 목록 API 링크 수({len(collector)}개)가 전체글 갯수보다 적어 DOM에서 다시 수집")
+        elif len(collector):
+            links = collector.links
+            print(f"[단계] 글 목록 API 응답 {collector.responses_seen}개에서 {len(links)}개 링크 수집")
+
+    if links is None:
+        links = await page.evaluate(POST_LINKS_JS, blog_id)
+        print(f"[단계] 페이지에서 {len(links)}개 링크 발견")
+
+    if max_posts:
+        links = links[:max_posts]
+
+    print(f"[단계] === Phase 1 완료: 총 {len(links)}개 링크 수집 ===")
+    if total_post_count and len(links) != total_post_count:
+        print(f"[경고] 전체글 갯수({total_post_count}개)와 링크 수({len(links)}개) 불일치")
+
+    return links
+
+
+async def crawl_post_detail_mobile(
+    page: Page,
+    post_url: str,
+    timeout: int = 30,
+    blog_id: str = None,
+    readiness: ReadinessConfig = DEFAULT_READINESS,
+    html_archive: Optional[HtmlArchive] = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    rate_limiter: Optional[AdaptiveRateLimiter] = None
+) -> Post:
+    """
+    Phase 2: 상세 크롤링
+    각 포스트의 상세 정보를 수집 (로딩 대기는 readiness의 최대 대기 시간 안에서 신호 기반)
+    html_archive가 있으면 해시태그/댓글까지 펼친 뒤의 페이지 HTML을 저장한다.
+
+    실패는 engine.classify_error로 분류해 일시적 오류만 retry_policy의 지수 백오프로 재시도한다.
+    페이지가 닫혔으면 같은 페이지로는 재시도하지 않고 NetworkError를 던진다 (호출자가 새 페이지로 재시도).
+    rate_limiter가 있으면 접속마다 요청 슬롯까지 asyncio.sleep으로 대기하고 응답 시간/타임아웃/요청 제한을 반영한다.
+    """
+    max_retries = retry_policy.max_attempts
+
+    for attempt in range(max_retries):
+        try:
+            if page.is_closed():
+                raise NetworkError("페이지가 닫혔습니다")
+
+            # 포스트 페이지 접속
+            if rate_limiter:
+                await asyncio.sleep(rate_limiter.reserve(post_url))
+            request_start = time.monotonic()
+            try:
+                response = await page.goto(post_url, wait_until='domcontentloaded', timeout=timeout * 1000)
+            except PlaywrightTimeout:
+                try:
+                    response = await page.goto(post_url, wait_until='load', timeout=timeout * 1000)
+                except PlaywrightTimeout:
+                    raise TimeoutError(f"페이지 로딩 타임아웃: {post_url}")
+            if response is not None and response.status in THROTTLE_STATUSES:
+                raise RateLimitedError(f"요청 제한 응답 {response.status}: {post_url}")
+            if rate_limiter:
+                rate_limiter.record_response(post_url, time.monotonic() - request_start)
+
+            # 본문 로딩 대기 (네이버 블로그는 동적 로딩, 본문 컨테이너가 나타나면 즉시 진행)
+            await wait_for_content(page, readiness)
+
+            post_id = extract_post_id_from_url(post_url)
+            if not post_id:
+                post_id = str(int(time.time()))
+
+            if not blog_id:
+                blog_id = extract_blog_id_from_url(post_url)
+
+            # 제목/작성자/날짜/메타데이터/본문 일괄 추출 (page.evaluate 1회)
+            bundle = await extract_post_bundle(page, blog_id)
+            if bundle:
+                title = bundle['title']
+                author = bundle['author']
+                published_date = bundle['published_date']
+                modified_date = bundle['modified_date']
+                metadata = bundle['metadata']
+                content = bundle['content']
+            else:
+                # Fallback: 필드별 추출
+                title = await extract_title(page)
+                author = await extract_author(page, blog_id)
+                published_date = await extract_published_date(page)
+                modified_date = await extract_modified_date(page)
+                metadata = await extract_metadata(page)
+                content = await extract_content(page)
+
+            if not title:
+                title = f"포스트 {post_id}"
+
+            # 해시태그 추출 (댓글보다 먼저)
+            metadata.tags = await extract_tags(page, readiness)
+
+            # 댓글 수가 0이면 댓글 수집하지 않음 (크롤링 시간 단축)
+            comment_count = metadata.comments
+            if comment_count == 0:
+                comments = []
+            else:
+                comments, is_secret_only = await extract_comments(page, comment_count=comment_count, readiness=readiness)
+                if len(comments) == 0 and not is_secret_only:
+                    await wait_for_comments(page, readiness)
+                    comments, is_secret_only = await extract_comments(page, comment_count=comment_count, readiness=readiness)
+
+            if html_archive is not None:
+                archive_page(html_archive, blog_id, post_id, post_url, await page.content())
+
+            return Post(
+                post_id=post_id,
+                title=title,
+                author=author,
+                published_date=published_date,
+                modified_date=modified_date,
+                url=post_url,
+                metadata=metadata,
+                content=content,
+                comments=comments
+            )
+
+        except Exception as e:
+            error = classify_error(e)
+            if is_transient(error):
+                record_rate_failure(rate_limiter, post_url, error)
+            if not retry_policy.should_retry(error, attempt) or page.is_closed():
+                raise error from e
+            wait_time = retry_policy.backoff(attempt)
+            print(f"[경고] 재시도 {attempt+1}/{max_retries}: {error}, {wait_time:.1f}초 후 재시도...")
+            await asyncio.sleep(wait_time)
+
+
+async def crawl_by_blog_id(
+    blog_id: str,
+    max_posts: Optional[int] = None,
+    delay: float = 0.5,
+    timeout: int = 30,
+    should_stop: Optional[Callable[[], bool]] = None,
+    all_post_urls: Optional[List[str]] = None,
+    crawled_urls: Optional[List[str]] = None,
+    save_callback: Optional[Callable[[List[Post]], None]] = None,
+    save_interval: int = 10,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    headless: bool = True,
+    post_workers: int = 1,
+    browser: Optional[Browser] = None,
+    device: Optional[dict] = None,
+    readiness: ReadinessConfig = DEFAULT_READINESS,
+    blocking_profile: Optional[BlockingProfile] = DEFAULT_BLOCKING_PROFILE,
+    html_policy: str = 'keep',
+    html_store: Optional[HtmlStore] = None,
+    html_archive: Optional[HtmlArchive] = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    rate_limiter: Optional[AdaptiveRateLimiter] = None
+) -> Tuple[dict, List[Post]]:
+    """
+    블로그 ID 기반 크롤링 (asyncio 버전)
+
+    engine.crawl_by_blog_id와 같은 인자와 반환값을 사용한다.
+
+    Args:
+        post_workers: Phase 2에서 동시에 구동할 페이지 수 (같은 컨텍스트 내 탭)
+        browser: 공유할 브라우저 (없으면 내부에서 실행 후 종료)
+        device: 컨텍스트 디바이스 설정 (기본값: iPhone 12)
+        readiness: 본문/해시태그/댓글 로딩 최대 대기 시간 설정
+        blocking_profile: 이미지/미디어/폰트/광고 요청 차단 설정 (None이면 차단하지 않음,
+            작업 페이지가 여러 개면 포스트별 차단량은 직전 출력 이후 구간 합계)
+        html_policy / html_store: 포스트를 만든 직후 content.html/markdown 처리 방식
+            (engine.crawl_by_blog_id와 같음)
+        html_archive: 지정하면 포스트 페이지 HTML을 압축 아카이브에 저장 (오프라인 재추출용)
+        retry_policy: 포스트 재시도 정책 (일시적 오류만 지수 백오프로 재시도,
+            재시도 후에도 실패한 URL은 blog_info의 failed_urls에 기록)
+        rate_limiter: 호스트별 요청 간격 조절기 (None이면 delay로 시작하는 AdaptiveRateLimiter 생성,
+            모든 작업 페이지가 공유하며 응답 시간/오류/요청 제한에 따라 간격을 조절)
+    """
+    if not blog_id or not blog_id.strip():
+        raise ValueError("블로그 ID가 필요합니다")
+
+    blog_id = blog_id.strip()
+    delay = max(delay, 0.5)
+    timeout = min(max(timeout, 10), 300)
+    post_workers = max(post_workers, 1)
+    if rate_limiter is None:
+        rate_limiter = AdaptiveRateLimiter(delay)
+    validate_html_policy(html_policy, html_store)
+
+    blog_info = {
+        'blog_id': blog_id,
+        'blog_name': blog_id,
+        'author_nickname': blog_id,
+        'total_posts': None,
+        'created_at': None
+    }
+
+    playwright = None
+    owns_browser = browser is None
+    context = None
+
+    try:
+        if owns_browser:
+            playwright = await async_playwright().start()
+            browser = await playwright.chromium.launch(headless=headless)
+            if device is None:
+                device = playwright.devices['iPhone 12']
+        elif device is None:
+            # 공유 브라우저에서는 playwright 핸들이 없으므로 디바이스 정보만 조회
+            async with async_playwright() as device_playwright:
+                device = device_playwright.devices['iPhone 12']
+
+        context = await browser.new_context(**device)
+        blocking_stats = BlockingStats()
+
+        async def new_page():
+            """요청 차단이 설치된 새 페이지"""
+            page = await context.new_page()
+            if blocking_profile is not None:
+                await install_page_blocking_async(context, page, blocking_profile, blocking_stats)
+            return page
+
+        if all_post_urls:
+            post_urls = all_post_urls
+            print(f"[단계] 재개 모드: 체크포인트에서 전체 링크 목록 {len(post_urls)}개 로드")
+        else:
+            page = await new_page()
+
+            blog_main_url = f"https://m.blog.naver.com/{blog_id}"
+            print(f"[단계] 블로그 메인 페이지 접속: {blog_main_url}")
+            await page.goto(blog_main_url, wait_until='domcontentloaded', timeout=timeout * 1000)
+            await asyncio.sleep(2)
+
+            if await page.locator('.error, .not-found, .error-page').first.count() > 0:
+                raise BlogNotFoundError(f"블로그를 찾을 수 없습니다: {blog_id}")
+
+            post_list_url = f"https://m.blog.naver.com/{blog_id}?categoryNo=0&listStyle=post&tab=1"
+            print(f"[단계] 포스트 목록 페이지 접속: {post_list_url}")
+            collector = PostListCollector(blog_id)
+            collector.attach(page)
+            await page.goto(post_list_url, wait_until='domcontentloaded', timeout=timeout * 1000)
+            await asyncio.sleep(5)
+
+            post_urls = await _collect_all_post_links(page, blog_id, max_posts, timeout, collector)
+            collector.detach(page)
+            log_blocked(blocking_stats, "목록 페이지")
+            await page.close()
+
+            if not post_urls:
+                print("[경고] 수집된 링크가 없습니다")
+                return blog_info, []
+
+        blog_info['all_post_urls'] = post_urls
+        blog_info['total_post_urls'] = len(post_urls)
+
+        if should_stop and should_stop():
+            print("[경고] 크롤링이 중단되었습니다.")
+            return blog_info, []
+
+        # 이미 크롤링된 포스트 URL 목록이 있으면 제외
+        crawled_urls_list = crawled_urls or []
+        if crawled_urls_list:
+            crawled_urls_set = set(crawled_urls_list)
+            post_urls = [url for url in post_urls if url not in crawled_urls_set]
+            print(f"[단계] 이미 크롤링된 포스트 {len(crawled_urls_list)}개 건너뛰기 (재개 모드)")
+
+        if not post_urls:
+            print("[경고] 크롤링할 남은 포스트가 없습니다")
+            blog_info['total_posts'] = 0
+            return blog_info, []
+
+        # Phase 2: 상세 크롤링 (post_workers개 페이지가 하나의 URL 큐 공유)
+        posts = []
+        saved_urls = []
+        failed_urls = []  # 재시도 후에도 실패한 URL (체크포인트의 실패 목록으로 기록)
+        total_urls = blog_info['total_post_urls']
+        crawled_count = len(crawled_urls_list)
+        completed = 0
+
+        url_queue: "asyncio.Queue[str]" = asyncio.Queue()
+        for post_url in post_urls:
+            url_queue.put_nowait(post_url)
+        print(f"[단계] 요청 간격 조절: 현재 초당 {rate_limiter.rate():.1f}건부터 응답에 따라 조절")
+
+        def record_post(post: Post) -> None:
+            """크롤링된 포스트 추가 및 저장 간격마다 저장 콜백 호출"""
+            posts.append(release_heavy_fields(post, html_policy, html_store))
+            if save_callback and len(posts) >= save_interval:
+                print(f"[단계] 저장 간격 도달: {len(posts)}개 포스트 저장 중...")
+                saved_urls.extend([p.url for p in posts])
+                save_callback(posts.copy())
+                posts.clear()
+
+        async def worker() -> None:
+            nonlocal completed
+            page = await new_page()
+            try:
+                while not url_queue.empty():
+                    if should_stop and should_stop():
+                        break
+                    post_url = url_queue.get_nowait()
+
+                    # 크롤링 중 페이지가 닫히면 새 페이지로 한 번 더 시도
+                    error = None
+                    for _ in range(2):
+                        try:
+                            if page.is_closed():
+                                page = await new_page()
+                            # 호스트별 요청 간격은 시도마다 rate_limiter로 유지 (전체 작업 페이지 공통)
+                            post = await crawl_post_detail_mobile(page, post_url, timeout, blog_id, readiness,
+                                                                  html_archive, retry_policy, rate_limiter)
+                            log_blocked(blocking_stats)
+                            record_post(post)
+                            error = None
+                            break
+                        except Exception as e:
+                            error = e
+                            if not page.is_closed():
+                                break
+                    if error is not None:
+                        print(f"[오류] 포스트 크롤링 실패: {post_url}, 오류: {error}")
+                        failed_urls.append(failure_record(post_url, classify_error(error)))
+
+                    completed += 1
+                    current_idx = crawled_count + completed
+                    print(f"[단계] [{current_idx}/{total_urls}] 포스트 크롤링 완료")
+                    if progress_callback:
+                        progress_callback(current_idx, total_urls)
+            finally:
+                if not page.is_closed():
+                    await page.close()
+
+        worker_count = min(post_workers, len(post_urls))
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
+
+        blog_info['saved_urls'] = saved_urls
+        blog_info['failed_urls'] = failed_urls
+        if failed_urls:
+            print(f"[경고] 실패한 포스트 {len(failed_urls)}개 (실패 목록에 기록)")
+        blog_info['total_posts'] = len(posts)
+        print(f"[단계] === 크롤링 완료: 총 {len(posts)}개 포스트 남음 (이미 저장된 포스트 제외) ===")
+
+        return blog_info, posts
+
+    finally:
+        if context:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        if owns_browser and browser:
+            await browser.close()
+        if playwright:
+            await playwright.stop()
@@ -0,0 +1,332 @@
+"""
+HTML 파싱 모듈 (asyncio 버전)
+parser.py와 같은 추출 로직을 playwright.async_api 기반으로 제공
+"""
+import re
+from typing import List, Optional, Tuple
+from playwright.async_api import Page
+
+from src.models import PostMetadata, PostContent, Comment
+from src.crawler.parser import clean_text, html_to_markdown
+from src.crawler.scripts import (
+    TAGS_JS, SECRET_COMMENTS_ONLY_JS, COMMENTS_JS,
+    CONTENT_CONTAINER_JS, CONTENT_TEXT_JS
+)
+from src.crawler.readiness import ReadinessConfig, DEFAULT_READINESS
+from src.crawler.async_readiness import (
+    count_tag_links, wait_for_tags_changed, click_and_wait_for_comment_api,
+    wait_for_comment_area, wait_for_comments
+)
+
+
+async def extract_number(page: Page, selectors: List[str]) -> int:
+    """숫자 추출 (조회수, 좋아요, 댓글 수 등)"""
+    for selector in selectors:
+        try:
+            element = page.locator(selector).first
+            if await element.count() > 0:
+                text = await element.text_content() or ""
+                numbers = re.findall(r'\d+', text.replace(',', ''))
+                if numbers:
+                    return int(numbers[0])
+        except Exception:
+            continue
+    return 0
+
+
+async def extract_tags(page: Page, readiness: ReadinessConfig = DEFAULT_READINESS) -> List[str]:
+    """해시태그 추출 (확장 버튼 클릭 후 목록이 늘어날 때까지 대기)"""
+    tags = []
+
+    # 해시태그 확장 버튼 찾기
+    expand_selectors = [
+        'button.tag__tFC3j.expand_btn__oaNLH[data-click-area="pst.tagmore"]',
+        'button.expand_btn__oaNLH[data-click-area="pst.tagmore"]',
+        'button.expand_btn__oaNLH',
+        'button[data-click-area="pst.tagmore"]'
+    ]
+
+    expand_button = None
+    for selector in expand_selectors:
+        try:
+            element = page.locator(selector).first
+            if await element.count() > 0:
+                expand_button = element
+                break
+        except Exception:
+            continue
+
+    # 확장 버튼 클릭
+    if expand_button:
+        try:
+            before = await count_tag_links(page)
+            await expand_button.click(timeout=5000)
+            await wait_for_tags_changed(page, before, readiness)  # 해시태그 로딩 대기
+        except Exception as e:
+            print(f"[경고] 해시태그 확장 버튼 클릭 실패: {e}")
+
+    # 해시태그 요소 추출
+    tag_selectors = [
+        'a.tag__tFC3j[data-click-area="pst.tag"]',
+        'a.tag__tFC3j',
+        '.list_wrap__jKORt .list__yr1c8 .item__jRCnW a.tag__tFC3j',
+        '.tag__tFC3j',
+        '.tag-list .tag',
+        '.area_tag a',
+        '.se_tagList a',
+        '.tag-item'
+    ]
+
+    for selector in tag_selectors:
+        try:
+            elements = await page.locator(selector).all()
+            for element in elements:
+                try:
+                    text = await element.text_content() or ""
+                    tag_name = text.replace('#', '').strip()
+                    if tag_name and tag_name not in tags:
+                        tags.append(tag_name)
+                except Exception:
+                    continue
+            if tags:
+                break
+        except Exception:
+            continue
+
+    # JavaScript Fallback
+    if not tags:
+        try:
+            tags = await page.evaluate(TAGS_JS)
+        except Exception as e:
+            print(f"[경고] JavaScript Fallback 실패: {e}")
+
+    return list(set(tags))  # 중복 제거
+
+
+async def extract_comments(
+    page: Page,
+    comment_count: Optional[int] = None,
+    readiness: ReadinessConfig = DEFAULT_READINESS
+) -> Tuple[List[Comment], bool]:
+    """댓글 추출 (댓글 버튼 클릭 후 댓글 API 응답과 댓글 영역 로드 대기)
+
+    Returns:
+        (comments, is_secret_only): 댓글 리스트와 비밀 댓글 여부
+    """
+    comments = []
+
+    # 댓글 수가 0이면 버튼 클릭하지 않고 빈 리스트 반환 (크롤링 시간 단축)
+    if comment_count is not None and comment_count == 0:
+        return comments, False
+
+    # 댓글 버튼 찾기
+    comment_button_selectors = [
+        'button.comment_btn__TUucZ[data-click-area="pst.re"]',
+        'button.comment_btn__TUucZ',
+        'button[data-click-area*="re"]'
+    ]
+
+    comment_button = None
+    for selector in comment_button_selectors:
+        try:
+            element = page.locator(selector).first
+            if await element.count() > 0:
+                comment_button = element
+                break
+        except Exception:
+            continue
+
+    if not comment_button:
+        return comments, False
+
+    try:
+        await click_and_wait_for_comment_api(page, comment_button, readiness)
+    except Exception:
+        return comments, False
+
+    # 비밀 댓글 확인 (모든 댓글이 비밀 댓글이면 빠르게 패스)
+    try:
+        await wait_for_comment_area(page, readiness)
+
+        if await page.evaluate(SECRET_COMMENTS_ONLY_JS):
+            print("[단계] 모든 댓글이 비밀 댓글입니다. 댓글 수집 건너뛰기 (크롤링 시간 단축)")
+            return comments, True
+    except Exception as e:
+        print(f"[경고] 비밀 댓글 확인 실패: {e}")
+
+    # 댓글 목록 렌더링 대기 (비밀 댓글이 아닌 경우에만)
+    await wait_for_comments(page, readiness)
+
+    # JavaScript 기반 댓글 수집 (우선)
+    try:
+        comments_data = await page.evaluate(COMMENTS_JS)
+        for data in comments_data:
+            comments.append(Comment(
+                author=data.get('author', ''),
+                content=data.get('content', ''),
+                date=data.get('date'),
+                likes=data.get('likes', 0)
+            ))
+    except Exception as e:
+        print(f"[경고] JavaScript 댓글 수집 실패: {e}")
+
+        # Playwright Locator Fallback
+        try:
+            for item in await page.locator('.u_cbox_list_item, .u_cbox_comment').all():
+                try:
+                    item_text = await item.text_content() or ''
+                    if '비밀 댓글입니다.' in item_text:
+                        continue  # 비밀 댓글 건너뛰기
+
+                    author_elem = item.locator('span.u_cbox_nick').first
+                    author = (await author_elem.text_content()).strip() if await author_elem.count() > 0 else ''
+
+                    content_elem = item.locator('span.u_cbox_contents').first
+                    content = (await content_elem.text_content()).strip() if await content_elem.count() > 0 else ''
+
+                    if '비밀 댓글입니다.' in content:
+                        continue  # 비밀 댓글 건너뛰기
+
+                    if author or content:
+                        comments.append(Comment(author=author, content=content, date=None, likes=0))
+                except Exception:
+                    continue
+        except Exception:
+            pass
+
+    return comments, False
+
+
+async def extract_content(page: Page) -> PostContent:
+    """본문 내용 추출 (모바일 네이버 블로그)"""
+    content = PostContent()
+
+    container_info = await page.evaluate(CONTENT_CONTAINER_JS)
+
+    container = None
+
+    # JavaScript에서 찾은 선택자로 컨테이너 찾기
+    if container_info.get('found'):
+        try:
+            container = page.locator(container_info['selector']).first
+            if await container.count() == 0:
+                container = None
+        except Exception:
+            container = None
+
+    # Fallback: 직접 선택자로 찾기
+    if not container:
+        content_selectors = [
+            '.se-main-container',
+            '.se-component-content',
+            '#postViewArea',
+            '.post-view-area',
+            '.post-content',
+            '.area_view',
+            '.post-view',
+            'article',
+            '.post_body'
+        ]
+
+        for selector in content_selectors:
+            try:
+                element = page.locator(selector).first
+                if await element.count() > 0:
+                    text = await element.text_content() or ""
+                    if len(text.strip()) > 50:
+                        container = element
+                        break
+            except Exception:
+                continue
+
+    # 최종 Fallback: body 사용
+    if not container:
+        container = page.locator('body')
+
+    try:
+        content.html = await container.inner_html()
+
+        raw_text = await page.evaluate(
+            CONTENT_TEXT_JS,
+            container_info.get('selector') if container_info.get('found') else None
+        )
+        content.text = clean_text(raw_text)
+        content.word_count = len(content.text.split())
+
+        # 이미지 URL 추출
+        images = []
+        for selector in ['.se-image img', '.post-content img', 'img[src]']:
+            try:
+                for img in await container.locator(selector).all():
+                    src = await img.get_attribute('src') or await img.get_attribute('data-src') or ''
+                    if src and src not in images:
+                        images.append(src)
+            except Exception:
+                continue
+        content.images = images
+
+        # 링크 URL 추출
+        links = []
+        try:
+            for link in await container.locator('a[href]').all():
+                href = await link.get_attribute('href') or ''
+                if href:
+                    if href.startswith('/'):
+                        href = f"https://m.blog.naver.com{href}"
+                    elif not href.startswith('http'):
+                        href = f"https://m.blog.naver.com/{href}"
+                    if href not in links:
+                        links.append(href)
+        except Exception:
+            pass
+        content.links = links
+
+        content.markdown = html_to_markdown(content.html)
+
+    except Exception as e:
+        print(f"[경고] 본문 추출 중 오류: {e}")
+
+    return content
+
+
+async def extract_metadata(page: Page) -> PostMetadata:
+    """메타데이터 추출 (조회수, 좋아요, 댓글 수, 카테고리)"""
+    metadata = PostMetadata()
+
+    metadata.views = await extract_number(page, [
+        '.view-count',
+        '.area_viewcount',
+        '[data-view-count]'
+    ])
+
+    metadata.likes = await extract_number(page, [
+        '.u_likeit_text._count.num',
+        '.u_likeit_text',
+        '.like-count',
+        '.area_likecount',
+        '[data-like-count]',
+        '.meta_foot__I5IqM .like__vTXys'
+    ])
+
+    metadata.comments = await extract_number(page, [
+        '.comment_btn__TUucZ .num__OVfhz',
+        '.num__OVfhz',
+        '.comment-count',
+        '.area_commentcount',
+        '[data-comment-count]',
+        '.meta_foot__I5IqM .comment__bWHnT'
+    ])
+
+    for selector in ['.category', '.area_category', '.se_category']:
+        try:
+            element = page.locator(selector).first
+            if await element.count() > 0:
+                metadata.category = (await element.text_content()).strip()
+                break
+        except Exception:
+            continue
+
+    # 태그는 extract_tags에서 별도로 추출
+    metadata.tags = []
+
+    return metadata
@@ -0,0 +1,95 @@
+"""
+페이지 준비 상태 대기 모듈 (asyncio 버전)
+readiness.py와 같은 대기 규칙을 playwright.async_api 기반으로 제공
+"""
+import time
+from typing import Awaitable, Callable, Optional
+from playwright.async_api import Page, Locator, TimeoutError as PlaywrightTimeout
+
+from src.crawler.readiness import (
+    ReadinessConfig, DEFAULT_READINESS, CONTENT_READY_SELECTOR, TAG_LINK_SELECTOR,
+    is_comment_api_response, log_wait
+)
+from src.crawler.scripts import TAGS_CHANGED_JS, COMMENT_AREA_READY_JS, COMMENTS_RENDERED_JS
+
+
+async def _timed_wait(
+    config: ReadinessConfig,
+    label: str,
+    fixed_sleep: Optional[float],
+    wait: Callable[[], Awaitable]
+) -> bool:
+    """대기 코루틴을 실행하고 소요 시간 기록 (최대 대기 초과 시 False)"""
+    start = time.monotonic()
+    try:
+        await wait()
+        ready = True
+    except PlaywrightTimeout:
+        ready = False
+    log_wait(config, label, time.monotonic() - start, ready, fixed_sleep)
+    return ready
+
+
+async def wait_for_content(page: Page, config: ReadinessConfig = DEFAULT_READINESS) -> bool:
+    """본문 컨테이너가 DOM에 나타날 때까지 대기"""
+    return await _timed_wait(
+        config, "본문 로딩", 1.3,
+        lambda: page.wait_for_selector(
+            CONTENT_READY_SELECTOR, state='attached', timeout=config.content_timeout * 1000
+        )
+    )
+
+
+async def count_tag_links(page: Page) -> int:
+    """현재 해시태그 링크 수"""
+    try:
+        return await page.locator(TAG_LINK_SELECTOR).count()
+    except Exception:
+        return 0
+
+
+async def wait_for_tags_changed(page: Page, before: int, config: ReadinessConfig = DEFAULT_READINESS) -> bool:
+    """해시태그 확장 버튼 클릭 후 목록이 늘어날 때까지 대기"""
+    return await _timed_wait(
+        config, "해시태그 로딩", 2.5,
+        lambda: page.wait_for_function(
+            TAGS_CHANGED_JS, arg=before, timeout=config.tags_timeout * 1000, polling='raf'
+        )
+    )
+
+
+async def click_and_wait_for_comment_api(
+    page: Page,
+    button: Locator,
+    config: ReadinessConfig = DEFAULT_READINESS
+) -> bool:
+    """댓글 버튼 클릭 후 댓글 API 응답 대기 (클릭 실패 시 예외 전달)"""
+    start = time.monotonic()
+    clicked = False
+    try:
+        async with page.expect_response(is_comment_api_response, timeout=config.comment_response_timeout * 1000):
+            await button.click()
+            clicked = True
+        ready = True
+    except PlaywrightTimeout:
+        if not clicked:
+            raise
+        ready = False
+    log_wait(config, "댓글 API 응답", time.monotonic() - start, ready)
+    return ready
+
+
+async def wait_for_comment_area(page: Page, config: ReadinessConfig = DEFAULT_READINESS) -> bool:
+    """댓글 영역이 로드될 때까지 대기"""
+    return await _timed_wait(
+        config, "댓글 영역", 1.0,
+        lambda: page.wait_for_function(COMMENT_AREA_READY_JS, timeout=config.comment_area_timeout * 1000, polling=100)
+    )
+
+
+async def wait_for_comments(page: Page, config: ReadinessConfig = DEFAULT_READINESS) -> bool:
+    """댓글 목록이 렌더링될 때까지 대기"""
+    return await _timed_wait(
+        config, "댓글 목록", 2.0,
+        lambda: page.wait_for_function(COMMENTS_RENDERED_JS, timeout=config.comments_timeout * 1000, polling=100)
+    )
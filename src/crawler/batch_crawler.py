@@ -2,15 +2,240 @@
 배치 처리 모듈
 다중 블로그 크롤링 및 재개 기능
 """
-import json
-from typing import List, Optional, Callable
+import queue
+import threading
+from functools import partial
+from typing import Dict, List, Optional, Callable, Set, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 
 from src.models import Post
-from src.crawler.engine import crawl_by_blog_id
-from src.utils.checkpoint_manager import CheckpointManager
-from src.utils.file_exporter import export_to_json
+from src.crawler.engine import PostWorkerGroup, crawl_by_blog_id
+from src.crawler.browser_pool import BrowserPool
+from src.crawler.http_fetcher import HttpFetcher
+from src.crawler.postprocess import PostProcessor
+from src.utils.rate_limiter import AdaptiveRateLimiter
+from src.utils.retry import merge_failures
+from src.utils.metrics import CrawlMetrics, JsonFileSink, PrometheusSink, metrics_path_for
+from src.crawler.resource_blocking import BlockingProfile, DEFAULT_BLOCKING_PROFILE
+from src.utils.checkpoint_manager import (
+    CheckpointManager, CheckpointWriter, blog_op, blog_progress_ops, blog_urls_op, crawled_op, set_op
+)
+from src.utils.crawl_store import CrawlStore
+from src.utils.html_store import HtmlStore, html_store_dir_for, validate_html_policy
+from src.utils.html_archive import HtmlArchive, html_archive_dir_for
+from src.utils.file_exporter import (
+    JsonlPostWriter, export_to_json, jsonl_path_for, load_post_ids_by_blog
+)
+
+
+PostWriter = Union[JsonlPostWriter, CrawlStore]
+
+
+def _open_post_writer(output_path: str, fsync_policy: str, store_path: Optional[str]) -> PostWriter:
+    """포스트 저장소 열기 (store_path가 있으면 SQLite 저장소, 없으면 JSONL 스트림)
+
+    둘 다 기존 출력 JSON이 있으면 그 포스트를 이어받는다.
+    """
+    if store_path:
+        return CrawlStore(store_path, seed_json_path=output_path)
+    return JsonlPostWriter(jsonl_path_for(output_path), fsync_policy, seed_json_path=output_path)
+
+
+def _new_post_worker_group(
+    post_workers: int,
+    headless: bool,
+    pages_per_context: int,
+    max_heap_mb: Optional[float],
+    blocking_profile: Optional[BlockingProfile]
+) -> Optional[PostWorkerGroup]:
+    """Phase 2 작업 스레드 묶음 (post_workers가 2 이상일 때만, 작업 스레드의 브라우저를 모든 블로그에서 재사용)"""
+    if post_workers <= 1:
+        return None
+    return PostWorkerGroup(post_workers - 1, partial(
+        BrowserPool, headless=headless, max_pages_per_context=pages_per_context,
+        max_heap_mb=max_heap_mb, blocking_profile=blocking_profile
+    ))
+
+
+def _find_blog_progress(job_data: dict, blog_id: str) -> Optional[dict]:
+    """job_data에서 블로그 진행 상황 항목 찾기"""
+    for bp in job_data.get("blog_progress", []):
+        if bp.get("blog_id") == blog_id:
+            return bp
+    return None
+
+
+def _new_blog_progress(
+    blog_id: str,
+    existing_progress: Optional[dict] = None,
+    store: Optional[CrawlStore] = None
+) -> dict:
+    """블로그 진행 상황 항목 생성 (재개 모드면 기존 링크 목록과 크롤링된 URL 이어받기)
+
+    store가 있으면 저장소에 기록된 크롤링된 URL을 합치고 (체크포인트 저장 전에 중단되어도
+    저장소에 저장된 포스트는 다시 크롤링하지 않음), 재개 모드면 링크 목록도 저장소에서 찾는다.
+    """
+    crawled_urls = []
+    all_post_urls = None
+    failed_urls = []
+    if existing_progress:
+        crawled_urls = existing_progress.get("crawled_urls", [])
+        all_post_urls = existing_progress.get("all_post_urls", None)
+        failed_urls = existing_progress.get("failed_urls", [])
+    if store:
+        stored_urls = store.crawled_urls(blog_id)
+        if stored_urls:
+            crawled_urls = list(set(crawled_urls) | set(stored_urls))
+        if existing_progress and not all_post_urls:
+            all_post_urls = store.post_urls(blog_id)
+    if existing_progress or store:
+        if all_post_urls:
+            print(f"[단계] 블로그 {blog_id}: 전체 링크 목록 {len(all_post_urls)}개 로드됨 (재개 모드)")
+            print(f"[단계] 이미 크롤링된 포스트 {len(crawled_urls)}개 발견")
+    
+    return {
+        "blog_id": blog_id,
+        "status": "in_progress",
+        "posts_crawled": len(crawled_urls),
+        "started_at": datetime.now().isoformat(),
+        "crawled_urls": crawled_urls.copy() if crawled_urls else [],
+        "all_post_urls": all_post_urls if all_post_urls else None,  # 전체 링크 목록
+        "failed_urls": list(failed_urls)  # 재시도 후에도 실패한 URL (오류 종류, 시도 횟수)
+    }
+
+
+def _skipped_urls(blog_progress: dict, retry_failed: bool = False) -> List[str]:
+    """crawl_by_blog_id에서 건너뛸 URL
+
+    기본은 크롤링된 URL과 실패 목록의 URL (실패한 URL은 retry_failed 실행에서만 다시 시도),
+    retry_failed면 실패 목록을 뺀 전체 링크 (실패한 URL만 다시 크롤링).
+    """
+    failed = {entry["url"] for entry in blog_progress.get("failed_urls", [])}
+    if retry_failed:
+        return [url for url in blog_progress.get("all_post_urls") or [] if url not in failed]
+    return list(set(blog_progress["crawled_urls"]) | failed)
+
+
+def _update_blog_progress(
+    blog_progress: dict,
+    blog_info: dict,
+    blog_posts: List[Post],
+    store: Optional[CrawlStore] = None
+) -> List[str]:
+    """크롤링 결과로 블로그 진행 상황 갱신 (전체 링크, 크롤링된 URL, 실패 목록, 완료 여부)
+
+    store가 있으면 전체 링크 목록, 크롤링된 URL, 상태를 저장소에도 기록한다.
+    이번에 크롤링된 URL(저장 콜백 + 남은 포스트) 목록을 반환한다.
+    """
+    blog_id = blog_progress["blog_id"]
+    
+    # 전체 링크 목록 저장 (Phase 1에서 수집된 전체 링크 또는 재개 모드에서 로드한 링크)
+    if 'all_post_urls' in blog_info:
+        blog_progress["all_post_urls"] = blog_info['all_post_urls']
+    
+    # 저장 콜백에서 저장된 포스트 URL 추가
+    new_urls = []
+    if 'saved_urls' in blog_info and blog_info['saved_urls']:
+        saved_urls = blog_info['saved_urls']
+        new_urls.extend(saved_urls)
+        print(f"[단계] 저장 콜백에서 저장된 포스트 {len(saved_urls)}개 URL 추가")
+    
+    # blog_posts에 있는 포스트의 URL 추가 (저장 콜백에서 저장된 것은 이미 추가됨)
+    new_urls.extend(post.url for post in blog_posts)
+    blog_progress["crawled_urls"].extend(new_urls)
+    blog_progress["crawled_urls"] = list(set(blog_progress["crawled_urls"]))  # 중복 제거
+    
+    # 실패 목록: 이번에 실패한 URL 추가, 이번에 성공한 URL 제외
+    blog_progress["failed_urls"] = merge_failures(
+        blog_progress.get("failed_urls", []),
+        blog_info.get("failed_urls", []),
+        blog_progress["crawled_urls"]
+    )
+    failed_urls_count = len(blog_progress["failed_urls"])
+    
+    # 완료 여부 확인: 전체 링크 수와 크롤링된(또는 실패 목록에 기록된) URL 수 비교
+    all_urls_count = len(blog_progress.get("all_post_urls") or [])
+    crawled_urls_count = len(blog_progress["crawled_urls"])
+    
+    up_to_date = blog_info.get('all_post_urls') == []  # 증분 모드: 새 포스트 없음
+    if up_to_date or (all_urls_count > 0 and crawled_urls_count + failed_urls_count >= all_urls_count):
+        blog_progress["status"] = "completed"
+        blog_progress["completed_at"] = datetime.now().isoformat()
+        print(f"[단계] 블로그 {blog_id} 크롤링 완료: {crawled_urls_count}/{all_urls_count}개 포스트")
+        if failed_urls_count:
+            print(f"[경고] 블로그 {blog_id}: 실패한 포스트 {failed_urls_count}개 (retry_failed로 재시도 가능)")
+    else:
+        # 일부만 크롤링된 경우 "in_progress" 상태 유지
+        blog_progress["status"] = "in_progress"
+        print(f"[단계] 블로그 {blog_id} 부분 크롤링: {crawled_urls_count}/{all_urls_count}개 포스트 (재개 가능)")
+    
+    blog_progress["posts_crawled"] = crawled_urls_count
+    
+    if store:
+        if blog_progress.get("all_post_urls"):
+            store.set_post_urls(blog_id, blog_progress["all_post_urls"])
+        store.mark_crawled(blog_id, blog_progress["crawled_urls"])
+        store.set_blog_status(blog_id, blog_progress["status"])
+    return new_urls
+
+
+def _blog_result_ops(
+    job_data: dict,
+    blog_progress: dict,
+    start_post_urls: Optional[List[str]],
+    new_urls: List[str]
+) -> List[dict]:
+    """블로그 하나를 마친 뒤의 체크포인트 변경 목록 (그 블로그의 필드, 바뀐 링크 목록, 새 URL, 블로그 수)"""
+    blog_id = blog_progress["blog_id"]
+    ops = [blog_op(blog_progress)]
+    if blog_progress.get("all_post_urls") is not start_post_urls:
+        ops.append(blog_urls_op(blog_id, blog_progress.get("all_post_urls")))
+    if new_urls:
+        ops.append(crawled_op(blog_id, new_urls))
+    ops.append(set_op("processed_blog_ids", job_data["processed_blog_ids"]))
+    ops.append(set_op("failed_blog_ids", job_data["failed_blog_ids"]))
+    return ops
+
+
+def _mark_blog_failed(blog_progress: dict, error: Exception, store: Optional[CrawlStore] = None) -> None:
+    """블로그 진행 상황을 실패로 표시"""
+    blog_progress["status"] = "failed"
+    blog_progress["error"] = str(error)
+    if store:
+        store.set_blog_status(blog_progress["blog_id"], "failed", str(error))
+
+
+def _finalize_output(
+    post_writer: PostWriter,
+    output_path: str,
+    job_data: dict,
+    status: str,
+    **extra
+) -> None:
+    """저장된 포스트(JSONL 스트림 또는 SQLite 저장소)로 {crawl_info, posts} 출력 JSON 문서 생성"""
+    post_writer.finalize(output_path, {
+        "crawl_type": "blog_id",
+        "total_blog_ids": job_data["total_blog_ids"],
+        "processed_blog_ids": job_data["processed_blog_ids"],
+        "failed_blog_ids": job_data["failed_blog_ids"],
+        "status": status,
+        **({"resumed": True} if job_data.get("resumed") else {}),
+        **extra
+    })
+    print(f"[단계] 출력 파일 생성: {output_path} (포스트 {post_writer.count}개, 상태: {status})")
+
+
+def _upsert_blog_progress(job_data: dict, blog_progress: dict) -> None:
+    """블로그 진행 상황 항목 갱신 (기존 항목이 있으면 교체, 없으면 추가)"""
+    if "blog_progress" not in job_data:
+        job_data["blog_progress"] = []
+    
+    for index, bp in enumerate(job_data["blog_progress"]):
+        if bp.get("blog_id") == blog_progress["blog_id"]:
+            job_data["blog_progress"][index] = blog_progress
+            return
+    job_data["blog_progress"].append(blog_progress)
 
 
 def crawl_multiple_blog_ids(
@@ -24,9 +249,61 @@ def crawl_multiple_blog_ids(
     existing_blog_progress: Optional[List[dict]] = None,
     save_interval: int = 10,
     progress_callback: Optional[Callable[[int, int], None]] = None,
-    headless: bool = True
+    headless: bool = True,
+    post_workers: int = 1,
+    max_concurrent_blogs: int = 1,
+    pages_per_context: int = 100,
+    max_heap_mb: Optional[float] = 300.0,
+    blocking_profile: Optional[BlockingProfile] = DEFAULT_BLOCKING_PROFILE,
+    http_fetch: bool = False,
+    incremental: bool = False,
+    fsync_policy: str = 'batch',
+    store_path: Optional[str] = None,
+    html_policy: str = 'drop',
+    html_store_dir: Optional[str] = None,
+    archive_html: bool = False,
+    html_archive_dir: Optional[str] = None,
+    postprocess_workers: int = 0,
+    retry_failed: bool = False,
+    metrics: Optional[CrawlMetrics] = None,
+    metrics_port: Optional[int] = None
 ) -> List[Post]:
-    """다중 블로그 크롤링"""
+    """다중 블로그 크롤링
+
+    max_concurrent_blogs가 2 이상이면 블로그 여러 개를 동시에 크롤링한다.
+    브라우저는 블로그마다 새로 실행하지 않고 브라우저 풀로 재사용하며,
+    컨텍스트는 pages_per_context개 페이지를 로드하거나 렌더러 JS 힙이 max_heap_mb를 넘으면
+    쿠키를 이어받아 새로 만든다 (max_heap_mb가 None이면 힙 크기는 확인하지 않음).
+    blocking_profile이 있으면 이미지/미디어/폰트/광고 요청을 차단한다 (None이면 차단 안 함).
+    http_fetch가 True이면 포스트를 먼저 HTTP로 수집하고 JavaScript가 필요한 포스트만 브라우저를 사용한다.
+    incremental이 True이면 output_path에 이미 저장된 포스트를 기준으로 증분 크롤링한다
+    (목록 스크롤은 이미 수집한 포스트가 나오면 멈추고 새 포스트만 크롤링).
+    
+    포스트는 저장 간격마다 output_path 옆의 JSONL 스트림(.jsonl)에 이어 쓰고
+    (fsync_policy: 'always' / 'batch' / 'none'), 완료·중단 시 output_path에
+    {crawl_info, posts} JSON 문서를 한 번 생성한다.
+    store_path가 있으면 JSONL 대신 SQLite 저장소(포스트, 댓글, 블로그별 URL 상태)에 저장하고
+    중복 확인, 재개, 증분 크롤링, 최종 출력을 저장소 조회로 처리한다.
+    
+    출력에 쓰지 않는 content.html/markdown은 포스트를 만든 직후 비운다 (html_policy='drop').
+    html_policy='spill'이면 원본 HTML을 html_store_dir(기본: 출력 파일 옆 <이름>_html/)에
+    내용 주소 파일로 저장하고 포스트에는 content.html_ref만 남긴다. 'keep'이면 그대로 유지한다.
+    archive_html이 True이면 포스트 페이지 HTML을 html_archive_dir(기본: 출력 파일 옆 <이름>_archive/)에
+    압축해 저장한다 (src.crawler.reparse로 다시 크롤링하지 않고 재추출 가능).
+    postprocess_workers가 1 이상이면 본문 후처리(텍스트 정리, 단어 수, 링크 정규화, 마크다운)를
+    그 수만큼의 프로세스 풀에서 처리해 브라우저를 다루는 스레드가 다음 페이지로 바로 넘어간다
+    (저장 순서는 크롤링 순서 그대로, 모든 블로그가 같은 풀을 공유).
+    
+    포스트 요청 간격은 delay에서 시작해 응답 시간/타임아웃/요청 제한에 따라 자동으로 조절하며
+    (모든 블로그가 같은 AdaptiveRateLimiter 공유), progress_callback에 현재 초당 요청 수(rate)를 함께 전달한다.
+    
+    재시도 후에도 실패한 포스트는 체크포인트의 블로그별 failed_urls(실패 목록)에 기록하고
+    재개할 때 건너뛴다. retry_failed가 True이면 실패 목록의 URL만 다시 크롤링한다.
+    
+    단계별 소요 시간과 카운터는 metrics(None이면 새로 만듦)에 모아 체크포인트 옆 <이름>.metrics 파일에
+    JSON으로 주기적으로 쓰고, metrics_port가 있으면 http://127.0.0.1:<port>/metrics에서 Prometheus 형식으로 제공한다.
+    metrics에 미리 추가한 싱크(GUI 콜백 등)도 같은 주기로 호출되며, 크롤링이 끝나면 모든 싱크를 닫는다.
+    """
     all_posts = []
     total_saved_posts = 0  # 총 저장된 포스트 수
     
@@ -40,10 +317,15 @@ def crawl_multiple_blog_ids(
         "status": "running",
         "blog_progress": existing_blog_progress.copy() if existing_blog_progress else []
     }
+    if existing_blog_progress:
+        job_data["resumed"] = True  # 출력 crawl_info에 재개 여부 표시
     
-    # 체크포인트 생성 (재개 모드가 아닐 때만)
+    # 체크포인트 생성 (재개 모드면 불러온 체크포인트에 이번 작업 정보를 한 번 비교해 기록,
+    # 이후 저장은 바뀐 블로그의 변경 목록만 기록)
     if not existing_blog_progress:
         checkpoint_manager.create_checkpoint(job_data)
+    else:
+        checkpoint_manager.save_checkpoint(job_data, [])
     
     # 초기 저장 (파일이 없을 때만)
     if not Path(output_path).exists():
@@ -55,6 +337,23 @@ def crawl_multiple_blog_ids(
             "status": "running"
         })
     
+    # 원본 HTML 저장소 (html_policy='spill'일 때만)
+    html_store = None
+    if html_policy == 'spill':
+        html_store = HtmlStore(html_store_dir or str(html_store_dir_for(output_path)))
+    validate_html_policy(html_policy, html_store)
+    
+    # 원본 페이지 아카이브 (선택)
+    html_archive = None
+    if archive_html:
+        html_archive = HtmlArchive(html_archive_dir or str(html_archive_dir_for(output_path)))
+        print(f"[단계] 원본 페이지 아카이브: {html_archive.directory} ({html_archive.compression}, "
+              f"기존 {len(html_archive)}개)")
+    
+    # 포스트 저장소 (기존 출력 JSON이 있으면 그 포스트를 이어받음)
+    post_writer = _open_post_writer(output_path, fsync_policy, store_path)
+    store = post_writer if isinstance(post_writer, CrawlStore) else None
+    
     # 전체 포스트 수 계산 (진행상황 표시용)
     total_posts_count = 0
     for bp in job_data.get("blog_progress", []):
@@ -62,106 +361,356 @@ def crawl_multiple_blog_ids(
         if all_urls:
             total_posts_count += len(all_urls)
     
+    # 증분 모드: 기존 출력 파일(또는 저장소)에서 블로그별로 이미 수집한 포스트 ID 로드
+    known_post_ids = {}
+    if incremental:
+        known_post_ids = store.post_ids_by_blog() if store else load_post_ids_by_blog(output_path)
+    if known_post_ids:
+        print(f"[단계] 증분 모드: 기존 포스트 {sum(len(ids) for ids in known_post_ids.values())}개 "
+              f"(블로그 {len(known_post_ids)}개) 로드")
+    
+    # HTTP 직접 요청 (keep-alive 연결 풀은 모든 블로그/작업 스레드가 공유)
+    http_fetcher = HttpFetcher(timeout=timeout) if http_fetch else None
+    
+    # 호스트별 요청 간격 조절 (crawl_by_blog_id와 같이 최소 0.5초에서 시작)
+    rate_limiter = AdaptiveRateLimiter(max(delay, 0.5))
+    
+    # 본문 후처리 프로세스 풀 (0이면 크롤링 스레드에서 처리)
+    post_processor = PostProcessor(postprocess_workers) if postprocess_workers > 0 else None
+    
+    # 크롤링 지표 (체크포인트 옆 JSON 파일, 선택: Prometheus 엔드포인트)
+    if metrics is None:
+        metrics = CrawlMetrics()
+    if checkpoint_manager.current_checkpoint_path:
+        metrics.add_sink(JsonFileSink(metrics_path_for(checkpoint_manager.current_checkpoint_path)))
+    if metrics_port is not None:
+        try:
+            metrics.add_sink(PrometheusSink(metrics, metrics_port))
+        except OSError as e:
+            print(f"[경고] 지표 엔드포인트 시작 실패 (포트 {metrics_port}): {e}")
+    
+    # 동시 크롤링 모드 (블로그 여러 개를 작업 스레드로 동시 처리)
+    if max_concurrent_blogs > 1 and len(blog_ids) > 1:
+        try:
+            return _crawl_blog_ids_concurrently(
+                blog_ids,
+                output_path,
+                checkpoint_manager,
+                job_data,
+                max_concurrent_blogs=max_concurrent_blogs,
+                max_posts_per_blog=max_posts_per_blog,
+                delay=delay,
+                timeout=timeout,
+                should_stop=should_stop,
+                save_interval=save_interval,
+                progress_callback=progress_callback,
+                headless=headless,
+                post_workers=post_workers,
+                pages_per_context=pages_per_context,
+                max_heap_mb=max_heap_mb,
+                blocking_profile=blocking_profile,
+                http_fetcher=http_fetcher,
+                known_post_ids=known_post_ids,
+                post_writer=post_writer,
+                html_policy=html_policy,
+                html_store=html_store,
+                html_archive=html_archive,
+                post_processor=post_processor,
+                rate_limiter=rate_limiter,
+                retry_failed=retry_failed,
+                metrics=metrics
+            )
+        finally:
+            if http_fetcher:
+                http_fetcher.close()
+            if post_processor:
+                post_processor.close()
+            metrics.close()
+    
+    # 브라우저 풀: 모든 블로그가 같은 브라우저를 재사용 (블로그마다 새 컨텍스트)
+    # Phase 2 작업 스레드도 블로그마다 새로 만들지 않고 브라우저와 함께 재사용
+    browser_pool = BrowserPool(headless=headless, max_pages_per_context=pages_per_context,
+                               max_heap_mb=max_heap_mb, blocking_profile=blocking_profile)
+    post_worker_group = _new_post_worker_group(post_workers, headless, pages_per_context, max_heap_mb,
+                                               blocking_profile)
+    
     # 각 블로그 크롤링
-    for idx, blog_id in enumerate(blog_ids, 1):
-        # should_stop 확인
-        if should_stop and should_stop():
-            print(f"[경고] 크롤링이 중단되었습니다. ({idx}/{len(blog_ids)})")
-            job_data["status"] = "paused"
-            if all_posts:
-                export_to_json(all_posts, output_path, {
-                    "crawl_type": "blog_id",
-                    "total_blog_ids": job_data["total_blog_ids"],
-                    "processed_blog_ids": job_data["processed_blog_ids"],
-                    "total_posts": len(all_posts),
-                    "status": "paused",
-                    "interrupted": True
-                })
-            checkpoint_manager.save_checkpoint(job_data, all_posts[-100:] if all_posts else [])
-            return all_posts
-        
-        # 진행상황 업데이트 (블로그 시작)
-        if progress_callback:
-            progress_callback(idx - 1, len(blog_ids), blog_current=idx, blog_total=len(blog_ids), post_progress=0.0)
-        
-        print(f"\n[단계] === 블로그 {idx}/{len(blog_ids)}: {blog_id} ===")
+    try:
+        for idx, blog_id in enumerate(blog_ids, 1):
+            # should_stop 확인
+            if should_stop and should_stop():
+                print(f"[경고] 크롤링이 중단되었습니다. ({idx}/{len(blog_ids)})")
+                job_data["status"] = "paused"
+                post_writer.append(all_posts)
+                _finalize_output(post_writer, output_path, job_data, "paused", interrupted=True)
+                checkpoint_manager.save_changes([set_op("status", "paused")], all_posts[-100:])
+                return all_posts
         
-        # 기존 블로그 진행 상황 확인 (재개 모드)
-        existing_progress = None
-        for bp in job_data.get("blog_progress", []):
-            if bp.get("blog_id") == blog_id:
-                existing_progress = bp
-                break
+            # 진행상황 업데이트 (블로그 시작)
+            if progress_callback:
+                progress_callback(idx - 1, len(blog_ids), blog_current=idx, blog_total=len(blog_ids), post_progress=0.0,
+                                  rate=rate_limiter.rate())
         
-        # 이미 크롤링된 포스트 URL 목록 가져오기
-        crawled_urls = []
-        all_post_urls = None
-        if existing_progress:
-            crawled_urls = existing_progress.get("crawled_urls", [])
-            all_post_urls = existing_progress.get("all_post_urls", None)
-            if all_post_urls:
-                print(f"[단계] 블로그 {blog_id}: 전체 링크 목록 {len(all_post_urls)}개 로드됨 (재개 모드)")
-                print(f"[단계] 이미 크롤링된 포스트 {len(crawled_urls)}개 발견")
+            print(f"\n[단계] === 블로그 {idx}/{len(blog_ids)}: {blog_id} ===")
         
-        blog_progress = {
-            "blog_id": blog_id,
-            "status": "in_progress",
-            "posts_crawled": len(crawled_urls),
-            "started_at": datetime.now().isoformat(),
-            "crawled_urls": crawled_urls.copy() if crawled_urls else [],
-            "all_post_urls": all_post_urls if all_post_urls else None  # 전체 링크 목록
-        }
+            # 기존 블로그 진행 상황 확인 (재개 모드)
+            existing_progress = _find_blog_progress(job_data, blog_id)
+            blog_progress = _new_blog_progress(blog_id, existing_progress, store)
+            start_ops = blog_progress_ops(blog_progress)  # 블로그를 마칠 때 함께 기록
+            crawled_urls = _skipped_urls(blog_progress, retry_failed)
+            all_post_urls = blog_progress["all_post_urls"]
+            new_urls = []
         
-        try:
-            # 저장된 포스트 카운트 추적
-            saved_count_in_callback = 0
+            try:
+                # 저장된 포스트 카운트 추적
+                saved_count_in_callback = 0
             
-            # 저장 콜백 함수 정의 (개별 포스트 크롤링 중 저장)
-            def save_posts(posts_to_save: List[Post]):
-                """포스트 저장 콜백"""
-                nonlocal total_saved_posts, saved_count_in_callback
-                if posts_to_save:
-                    export_to_json(
-                        posts_to_save,
-                        output_path,
-                        {
-                            "crawl_type": "blog_id",
-                            "total_blog_ids": job_data["total_blog_ids"],
-                            "processed_blog_ids": job_data["processed_blog_ids"],
-                            "total_posts": total_saved_posts + len(posts_to_save),
-                            "status": "running"
-                        },
-                        append=True
-                    )
-                    total_saved_posts += len(posts_to_save)
-                    saved_count_in_callback += len(posts_to_save)
-                    print(f"[단계] {len(posts_to_save)}개 포스트 저장 완료. (총 저장된 포스트: {total_saved_posts}개)")
+                # 저장 콜백 함수 정의 (개별 포스트 크롤링 중 저장)
+                def save_posts(posts_to_save: List[Post]):
+                    """포스트 저장 콜백"""
+                    nonlocal total_saved_posts, saved_count_in_callback
+                    if posts_to_save:
+                        post_writer.append(posts_to_save)
+                        total_saved_posts += len(posts_to_save)
+                        saved_count_in_callback += len(posts_to_save)
+                        print(f"[단계] {len(posts_to_save)}개 포스트 저장 완료. (총 저장된 포스트: {total_saved_posts}개)")
             
-            # 진행상황 콜백 정의 (블로그 내 포스트 크롤링 진행상황)
-            post_progress_callback = None
-            if progress_callback:
-                # 블로그별 진행상황 계산을 위한 콜백
-                def create_post_progress_callback(blog_idx, total_blogs):
-                    def callback(current_post, total_posts):
-                        # 전체 진행상황 계산: 블로그 진행률 + 현재 블로그 내 포스트 진행률
-                        # 블로그 단위로 진행상황 표시 (블로그 수 기준)
-                        # 현재 블로그 내 포스트 진행률을 블로그 진행률에 반영
-                        if total_posts > 0:
-                            post_progress = current_post / total_posts
-                            # 전체 진행률 = (완료된 블로그 수 + 현재 블로그 진행률) / 전체 블로그 수
-                            # post_progress는 0~1 사이이므로, 이를 블로그 단위로 변환
-                            overall_current = blog_idx - 1 + post_progress
-                            overall_total = total_blogs
-                            # 블로그 정보와 포스트 진행률을 함께 전달
-                            progress_callback(overall_current, overall_total, 
-                                            blog_current=blog_idx, 
-                                            blog_total=total_blogs,
-                                            post_progress=post_progress * 100)
-                    return callback
+                # 진행상황 콜백 정의 (블로그 내 포스트 크롤링 진행상황)
+                post_progress_callback = None
+                if progress_callback:
+                    # 블로그별 진행상황 계산을 위한 콜백
+                    def create_post_progress_callback(blog_idx, total_blogs):
+                        def callback(current_post, total_posts):
+                            # 전체 진행상황 계산: 블로그 진행률 + 현재 블로그 내 포스트 진행률
+                            # 블로그 단위로 진행상황 표시 (블로그 수 기준)
+                            # 현재 블로그 내 포스트 진행률을 블로그 진행률에 반영
+                            if total_posts > 0:
+                                post_progress = current_post / total_posts
+                                # 전체 진행률 = (완료된 블로그 수 + 현재 블로그 진행률) / 전체 블로그 수
+                                # post_progress는 0~1 사이이므로, 이를 블로그 단위로 변환
+                                overall_current = blog_idx - 1 + post_progress
+                                overall_total = total_blogs
+                                # 블로그 정보와 포스트 진행률을 함께 전달
+                                progress_callback(overall_current, overall_total, 
+                                                blog_current=blog_idx, 
+                                                blog_total=total_blogs,
+                                                post_progress=post_progress * 100,
+                                                rate=rate_limiter.rate())
+                        return callback
                 
-                post_progress_callback = create_post_progress_callback(idx, len(blog_ids))
+                    post_progress_callback = create_post_progress_callback(idx, len(blog_ids))
+            
+                # 블로그 크롤링 (저장 콜백 전달)
+                blog_info, blog_posts = crawl_by_blog_id(
+                    blog_id=blog_id,
+                    max_posts=max_posts_per_blog,
+                    delay=delay,
+                    timeout=timeout,
+                    should_stop=should_stop,
+                    all_post_urls=all_post_urls if all_post_urls else None,
+                    crawled_urls=crawled_urls if crawled_urls else None,
+                    save_callback=save_posts,
+                    save_interval=save_interval,
+                    progress_callback=post_progress_callback,
+                    headless=headless,
+                    post_workers=post_workers,
+                    browser_pool=browser_pool,
+                    post_worker_group=post_worker_group,
+                    http_fetcher=http_fetcher,
+                    known_post_ids=known_post_ids.get(blog_id),
+                    html_policy=html_policy,
+                    html_store=html_store,
+                    html_archive=html_archive,
+                    post_processor=post_processor,
+                    rate_limiter=rate_limiter,
+                    metrics=metrics
+                )
+            
+                # 중복 제거 (URL 기준)
+                existing_urls = {post.url for post in all_posts}
+                new_posts = [post for post in blog_posts if post.url not in existing_urls]
+            
+                all_posts.extend(new_posts)
+            
+                # 크롤링된 URL 목록 및 완료 여부 갱신
+                new_urls = _update_blog_progress(blog_progress, blog_info, blog_posts, store)
+                crawled_urls_count = blog_progress["posts_crawled"]
+                all_urls_count = len(blog_progress.get("all_post_urls") or [])
+            
+                if blog_progress["status"] == "completed":
+                    job_data["processed_blog_ids"] += 1
+                print(f"[단계] 블로그 {blog_id}: {len(blog_posts)}개 새 포스트 크롤링됨 (총 {crawled_urls_count}/{all_urls_count}개)")
             
-            # 블로그 크롤링 (저장 콜백 전달)
+                # 진행상황 업데이트 (블로그 완료)
+                if progress_callback:
+                    progress_callback(idx, len(blog_ids), blog_current=idx, blog_total=len(blog_ids), post_progress=100.0,
+                                      rate=rate_limiter.rate())
+            
+                # 남은 포스트 저장 (저장 간격 미만)
+                if all_posts and len(all_posts) > 0:
+                    save_posts(all_posts.copy())
+                    all_posts.clear()
+            
+            except Exception as e:
+                print(f"[오류] 블로그 {blog_id} 크롤링 실패: {e}")
+                _mark_blog_failed(blog_progress, e, store)
+                job_data["failed_blog_ids"] += 1
+        
+            # 블로그 진행 상황 업데이트 (기존 항목 찾아서 업데이트)
+            _upsert_blog_progress(job_data, blog_progress)
+        
+            # 체크포인트 중간 저장 (이 블로그의 변경분만 기록, 재개 모드에서도 갱신)
+            checkpoint_manager.save_changes(
+                start_ops + _blog_result_ops(job_data, blog_progress, all_post_urls, new_urls), all_posts[-100:]
+            )
+        
+            # should_stop 확인 (블로그 크롤링 후)
+            if should_stop and should_stop():
+                print(f"[경고] 크롤링이 중단되었습니다.")
+                job_data["status"] = "paused"
+                # 남은 포스트 저장
+                if all_posts:
+                    post_writer.append(all_posts)
+                    total_saved_posts += len(all_posts)
+                    all_posts.clear()
+                _finalize_output(post_writer, output_path, job_data, "paused", interrupted=True)
+                checkpoint_manager.save_changes([set_op("status", "paused")])
+                return []
+    finally:
+        if post_worker_group:
+            post_worker_group.close()
+        browser_pool.close()
+        if http_fetcher:
+            http_fetcher.close()
+        if post_processor:
+            post_processor.close()
+        metrics.close()
+    
+    # 최종 저장 (남은 포스트)
+    if all_posts:
+        print(f"[단계] 최종 저장: {len(all_posts)}개 포스트 저장 중...")
+        post_writer.append(all_posts)
+        total_saved_posts += len(all_posts)
+        all_posts.clear()
+        print(f"[단계] 최종 저장 완료. (총 저장된 포스트: {total_saved_posts}개)")
+    
+    job_data["status"] = "completed"
+    checkpoint_manager.save_changes([set_op("status", "completed")])
+    _finalize_output(post_writer, output_path, job_data, "completed")
+    
+    return []
+
+
+def _crawl_blog_ids_concurrently(
+    blog_ids: List[str],
+    output_path: str,
+    checkpoint_manager: CheckpointManager,
+    job_data: dict,
+    max_concurrent_blogs: int,
+    max_posts_per_blog: Optional[int],
+    delay: float,
+    timeout: int,
+    should_stop: Optional[Callable[[], bool]],
+    save_interval: int,
+    progress_callback: Optional[Callable[[int, int], None]],
+    headless: bool,
+    post_workers: int,
+    pages_per_context: int,
+    max_heap_mb: Optional[float],
+    blocking_profile: Optional[BlockingProfile],
+    http_fetcher: Optional[HttpFetcher],
+    known_post_ids: Dict[str, Set[str]],
+    post_writer: PostWriter,
+    html_policy: str,
+    html_store: Optional[HtmlStore],
+    html_archive: Optional[HtmlArchive],
+    post_processor: Optional[PostProcessor],
+    rate_limiter: AdaptiveRateLimiter,
+    retry_failed: bool = False,
+    metrics: Optional[CrawlMetrics] = None
+) -> List[Post]:
+    """다중 블로그 동시 크롤링
+
+    블로그 ID를 크기가 제한된 작업 큐에 넣고 max_concurrent_blogs개의 작업 스레드가
+    하나씩 꺼내 crawl_by_blog_id로 크롤링한다 (스레드마다 별도 브라우저 풀을 두고 블로그 간 재사용).
+    job_data와 출력 파일은 잠금으로 보호하고, 체크포인트는 CheckpointWriter 하나만 기록한다
+    (저장마다 job_data 전체가 아니라 바뀐 블로그의 변경 목록만 넘김).
+    """
+    total_blogs = len(blog_ids)
+    worker_count = min(max_concurrent_blogs, total_blogs)
+    work_queue: "queue.Queue[Optional[Tuple[int, str]]]" = queue.Queue(maxsize=worker_count * 2)
+    state_lock = threading.Lock()  # job_data, 진행률 보호
+    output_lock = threading.Lock()  # 출력 파일 보호
+    checkpoint_writer = CheckpointWriter(checkpoint_manager)
+    store = post_writer if isinstance(post_writer, CrawlStore) else None
+    total_saved_posts = 0
+    blog_fractions = {}  # 블로그별 진행률 (0~1)
+    
+    print(f"[단계] 동시 크롤링 모드: 블로그 {total_blogs}개, 동시 작업 {worker_count}개")
+    
+    def report_progress() -> None:
+        """전체 진행률 = 블로그별 진행률 합 / 전체 블로그 수"""
+        if not progress_callback:
+            return
+        with state_lock:
+            overall_current = sum(blog_fractions.values())
+            finished = sum(1 for fraction in blog_fractions.values() if fraction >= 1.0)
+        progress_callback(overall_current, total_blogs,
+                          blog_current=finished,
+                          blog_total=total_blogs,
+                          post_progress=overall_current / total_blogs * 100,
+                          rate=rate_limiter.rate())
+    
+    def save_posts(posts_to_save: List[Post], blog_progress: dict, crawled_set: Set[str]) -> None:
+        """포스트 저장 후 크롤링된 URL을 진행 상황에 즉시 반영
+
+        blog_progress는 그 블로그를 맡은 작업 스레드만 바꾸므로 변경 목록은 잠금 밖에서 만들고,
+        같은 필드(블로그 수, 상태)를 바꾸는 요청끼리 순서가 섞이지 않도록 제출만 잠금 안에서 한다.
+        """
+        nonlocal total_saved_posts
+        if not posts_to_save:
+            return
+        
+        with output_lock:
+            post_writer.append(posts_to_save)
+            total_saved_posts += len(posts_to_save)
+            print(f"[단계] {len(posts_to_save)}개 포스트 저장 완료. (총 저장된 포스트: {total_saved_posts}개)")
+        
+        # 블로그 도중 중단되어도 저장된 포스트부터 재개할 수 있도록 체크포인트 갱신 (새 URL만 기록)
+        new_urls = [post.url for post in posts_to_save]
+        blog_progress["crawled_urls"].extend(new_urls)
+        crawled_set.update(new_urls)
+        blog_progress["posts_crawled"] = len(crawled_set)
+        ops = [crawled_op(blog_progress["blog_id"], new_urls),
+               blog_op({"blog_id": blog_progress["blog_id"], "posts_crawled": len(crawled_set)})]
+        with state_lock:
+            checkpoint_writer.submit(ops)
+    
+    def crawl_blog(idx: int, blog_id: str, browser_pool: BrowserPool,
+                   post_worker_group: Optional[PostWorkerGroup]) -> None:
+        """블로그 하나 크롤링 (작업 스레드에서 실행)"""
+        print(f"\n[단계] === 블로그 {idx}/{total_blogs}: {blog_id} (동시 크롤링) ===")
+        
+        with state_lock:
+            existing_progress = _find_blog_progress(job_data, blog_id)
+            blog_progress = _new_blog_progress(blog_id, existing_progress, store)
+            _upsert_blog_progress(job_data, blog_progress)
+            blog_fractions[blog_id] = 0.0
+        crawled_set = set(blog_progress["crawled_urls"])
+        crawled_urls = _skipped_urls(blog_progress, retry_failed)
+        all_post_urls = blog_progress["all_post_urls"]
+        ops = blog_progress_ops(blog_progress)
+        with state_lock:
+            checkpoint_writer.submit(ops)
+        
+        def post_progress_callback(current_post, total_posts):
+            if total_posts > 0:
+                with state_lock:
+                    # 완료 처리 전까지는 1.0 미만으로 유지
+                    blog_fractions[blog_id] = min(current_post / total_posts, 0.99)
+                report_progress()
+        
+        try:
             blog_info, blog_posts = crawl_by_blog_id(
                 blog_id=blog_id,
                 max_posts=max_posts_per_blog,
@@ -170,133 +719,93 @@ def crawl_multiple_blog_ids(
                 should_stop=should_stop,
                 all_post_urls=all_post_urls if all_post_urls else None,
                 crawled_urls=crawled_urls if crawled_urls else None,
-                save_callback=save_posts,
+                save_callback=lambda posts_to_save: save_posts(posts_to_save, blog_progress, crawled_set),
                 save_interval=save_interval,
                 progress_callback=post_progress_callback,
-                headless=headless
+                headless=headless,
+                post_workers=post_workers,
+                browser_pool=browser_pool,
+                post_worker_group=post_worker_group,
+                http_fetcher=http_fetcher,
+                known_post_ids=known_post_ids.get(blog_id),
+                html_policy=html_policy,
+                html_store=html_store,
+                html_archive=html_archive,
+                post_processor=post_processor,
+                rate_limiter=rate_limiter,
+                metrics=metrics
             )
             
-            # 전체 링크 목록 저장 (Phase 1에서 수집된 전체 링크 또는 재개 모드에서 로드한 링크)
-            if 'all_post_urls' in blog_info:
-                blog_progress["all_post_urls"] = blog_info['all_post_urls']
-            
-            # 저장 콜백에서 저장된 포스트 URL 추가
-            if 'saved_urls' in blog_info and blog_info['saved_urls']:
-                saved_urls = blog_info['saved_urls']
-                blog_progress["crawled_urls"].extend(saved_urls)
-                print(f"[단계] 저장 콜백에서 저장된 포스트 {len(saved_urls)}개 URL 추가")
-            
-            # 중복 제거 (URL 기준)
-            existing_urls = {post.url for post in all_posts}
-            new_posts = [post for post in blog_posts if post.url not in existing_urls]
-            
-            all_posts.extend(new_posts)
-            
-            # 크롤링된 URL 목록 업데이트
-            # blog_posts에 있는 포스트의 URL 추가 (저장 콜백에서 저장된 것은 이미 추가됨)
-            blog_progress["crawled_urls"].extend([post.url for post in blog_posts])
-            blog_progress["crawled_urls"] = list(set(blog_progress["crawled_urls"]))  # 중복 제거
-            
-            # 완료 여부 확인: 전체 링크 수와 크롤링된 URL 수 비교
-            all_urls_count = len(blog_progress.get("all_post_urls", []))
-            crawled_urls_count = len(blog_progress["crawled_urls"])
-            
-            if all_urls_count > 0 and crawled_urls_count >= all_urls_count:
-                blog_progress["status"] = "completed"
-                blog_progress["completed_at"] = datetime.now().isoformat()
-                print(f"[단계] 블로그 {blog_id} 크롤링 완료: {crawled_urls_count}/{all_urls_count}개 포스트")
-            else:
-                # 일부만 크롤링된 경우 "in_progress" 상태 유지
-                blog_progress["status"] = "in_progress"
-                print(f"[단계] 블로그 {blog_id} 부분 크롤링: {crawled_urls_count}/{all_urls_count}개 포스트 (재개 가능)")
-            
-            blog_progress["posts_crawled"] = crawled_urls_count
-            
-            if blog_progress["status"] == "completed":
-                job_data["processed_blog_ids"] += 1
-            print(f"[단계] 블로그 {blog_id}: {len(blog_posts)}개 새 포스트 크롤링됨 (총 {crawled_urls_count}/{all_urls_count}개)")
-            
-            # 진행상황 업데이트 (블로그 완료)
-            if progress_callback:
-                progress_callback(idx, len(blog_ids), blog_current=idx, blog_total=len(blog_ids), post_progress=100.0)
-            
             # 남은 포스트 저장 (저장 간격 미만)
-            if all_posts and len(all_posts) > 0:
-                save_posts(all_posts.copy())
-                all_posts.clear()
+            save_posts(blog_posts, blog_progress, crawled_set)
             
+            # 크롤링된 URL은 save_posts에서 이미 기록했으므로 블로그 필드와 바뀐 링크 목록만 기록
+            _update_blog_progress(blog_progress, blog_info, blog_posts, store)
+            with state_lock:
+                if blog_progress["status"] == "completed":
+                    job_data["processed_blog_ids"] += 1
+                blog_fractions[blog_id] = 1.0
         except Exception as e:
             print(f"[오류] 블로그 {blog_id} 크롤링 실패: {e}")
-            blog_progress["status"] = "failed"
-            blog_progress["error"] = str(e)
-            job_data["failed_blog_ids"] += 1
-        
-        # 블로그 진행 상황 업데이트 (기존 항목 찾아서 업데이트)
-        if "blog_progress" not in job_data:
-            job_data["blog_progress"] = []
-        
-        # 기존 블로그 진행 상황 찾기
-        existing_index = None
-        for idx, bp in enumerate(job_data["blog_progress"]):
-            if bp.get("blog_id") == blog_id:
-                existing_index = idx
-                break
+            _mark_blog_failed(blog_progress, e, store)
+            with state_lock:
+                job_data["failed_blog_ids"] += 1
+                blog_fractions[blog_id] = 1.0
         
-        # 기존 항목이 있으면 업데이트, 없으면 추가
-        if existing_index is not None:
-            job_data["blog_progress"][existing_index] = blog_progress
-        else:
-            job_data["blog_progress"].append(blog_progress)
-        
-        # 체크포인트 중간 저장 (재개 모드에서도 갱신)
-        checkpoint_manager.save_checkpoint(job_data, all_posts[-100:] if all_posts else [])
-        
-        # should_stop 확인 (블로그 크롤링 후)
+        with state_lock:
+            checkpoint_writer.submit(_blog_result_ops(job_data, blog_progress, all_post_urls, []))
+        report_progress()
+    
+    def worker() -> None:
+        # sync Playwright 객체는 스레드 간 공유할 수 없으므로 풀은 작업 스레드 안에서 생성
+        # (Phase 2 작업 스레드 묶음도 블로그 스레드마다 하나씩 두고 맡은 블로그 전체에서 재사용)
+        browser_pool = BrowserPool(headless=headless, max_pages_per_context=pages_per_context,
+                                   max_heap_mb=max_heap_mb, blocking_profile=blocking_profile)
+        post_worker_group = _new_post_worker_group(post_workers, headless, pages_per_context, max_heap_mb,
+                                                   blocking_profile)
+        try:
+            while True:
+                item = work_queue.get()
+                if item is None:
+                    break
+                if should_stop and should_stop():
+                    continue  # 중단 요청 시 남은 작업은 건너뛰고 큐만 비움
+                crawl_blog(*item, browser_pool, post_worker_group)
+        finally:
+            if post_worker_group:
+                post_worker_group.close()
+            browser_pool.close()
+    
+    workers = [threading.Thread(target=worker, daemon=True) for _ in range(worker_count)]
+    for thread in workers:
+        thread.start()
+    
+    # 작업 큐가 가득 차면 put에서 대기 (메모리 사용량 제한)
+    stopped = False
+    for idx, blog_id in enumerate(blog_ids, 1):
         if should_stop and should_stop():
-            print(f"[경고] 크롤링이 중단되었습니다.")
-            job_data["status"] = "paused"
-            # 남은 포스트 저장
-            if all_posts:
-                export_to_json(
-                    all_posts,
-                    output_path,
-                    {
-                        "crawl_type": "blog_id",
-                        "total_blog_ids": job_data["total_blog_ids"],
-                        "processed_blog_ids": job_data["processed_blog_ids"],
-                        "total_posts": total_saved_posts + len(all_posts),
-                        "status": "paused",
-                        "interrupted": True
-                    },
-                    append=True
-                )
-                total_saved_posts += len(all_posts)
-                all_posts.clear()
-            checkpoint_manager.save_checkpoint(job_data, [])
-            return []
+            print(f"[경고] 크롤링이 중단되었습니다. 진행 중인 블로그 완료 후 종료합니다... ({idx}/{total_blogs})")
+            stopped = True
+            break
+        work_queue.put((idx, blog_id))
     
-    # 최종 저장 (남은 포스트)
-    if all_posts:
-        print(f"[단계] 최종 저장: {len(all_posts)}개 포스트 저장 중...")
-        export_to_json(
-            all_posts,
-            output_path,
-            {
-                "crawl_type": "blog_id",
-                "total_blog_ids": job_data["total_blog_ids"],
-                "processed_blog_ids": job_data["processed_blog_ids"],
-                "failed_blog_ids": job_data["failed_blog_ids"],
-                "total_posts": total_saved_posts + len(all_posts),
-                "status": "completed"
-            },
-            append=True
-        )
-        total_saved_posts += len(all_posts)
-        all_posts.clear()
-        print(f"[단계] 최종 저장 완료. (총 저장된 포스트: {total_saved_posts}개)")
+    for _ in workers:
+        work_queue.put(None)
+    for thread in workers:
+        thread.join()
     
-    job_data["status"] = "completed"
+    if should_stop and should_stop():
+        stopped = True
+    
+    job_data["status"] = "paused" if stopped else "completed"
+    checkpoint_writer.submit([set_op("status", job_data["status"])])
+    checkpoint_writer.close()
+    if stopped:
+        _finalize_output(post_writer, output_path, job_data, "paused", interrupted=True)
+    else:
+        _finalize_output(post_writer, output_path, job_data, "completed")
     
+    print(f"[단계] 동시 크롤링 종료: 총 저장된 포스트 {total_saved_posts}개")
     return []
 
 
@@ -309,9 +818,30 @@ def resume_crawling(
     should_stop: Optional[Callable[[], bool]] = None,
     save_interval: int = 10,
     progress_callback: Optional[Callable[[int, int], None]] = None,
-    headless: bool = True
+    headless: bool = True,
+    post_workers: int = 1,
+    max_concurrent_blogs: int = 1,
+    pages_per_context: int = 100,
+    max_heap_mb: Optional[float] = 300.0,
+    blocking_profile: Optional[BlockingProfile] = DEFAULT_BLOCKING_PROFILE,
+    http_fetch: bool = False,
+    incremental: bool = False,
+    fsync_policy: str = 'batch',
+    store_path: Optional[str] = None,
+    html_policy: str = 'drop',
+    html_store_dir: Optional[str] = None,
+    archive_html: bool = False,
+    html_archive_dir: Optional[str] = None,
+    postprocess_workers: int = 0,
+    retry_failed: bool = False,
+    metrics: Optional[CrawlMetrics] = None,
+    metrics_port: Optional[int] = None
 ) -> List[Post]:
-    """체크포인트에서 크롤링 재개"""
+    """체크포인트에서 크롤링 재개
+
+    실패 목록(failed_urls)의 URL은 건너뛰며, retry_failed가 True이면 반대로
+    실패 목록이 있는 블로그의 실패한 URL만 다시 크롤링한다.
+    """
     # 체크포인트 로드
     checkpoint_data = checkpoint_manager.load_checkpoint(checkpoint_path)
     
@@ -322,13 +852,22 @@ def resume_crawling(
     # 완료된 블로그 찾기 (실제로 모든 포스트를 크롤링했는지 확인)
     completed_blog_ids = set()
     for bp in blog_progress:
+        if retry_failed:
+            # 실패 목록이 없는 블로그는 다시 크롤링할 것이 없음
+            if not bp.get("failed_urls"):
+                completed_blog_ids.add(bp.get("blog_id"))
+            continue
         if bp.get("status") == "completed":
             blog_id = bp.get("blog_id")
             all_urls = bp.get("all_post_urls", [])
             crawled_urls = bp.get("crawled_urls", [])
+            failed_urls = bp.get("failed_urls", [])
             
-            # 전체 링크가 있고, 크롤링된 URL 수가 전체 링크 수와 같으면 완료
-            if all_urls and len(crawled_urls) >= len(all_urls):
+            # 전체 링크가 있고, 크롤링된 URL(실패 목록 포함) 수가 전체 링크 수와 같으면 완료
+            if all_urls and len(crawled_urls) + len(failed_urls) >= len(all_urls):
+                completed_blog_ids.add(blog_id)
+            # 증분 모드에서 새 포스트가 없었던 블로그도 완료
+            elif bp.get("all_post_urls") == []:
                 completed_blog_ids.add(blog_id)
             # 전체 링크가 없거나 크롤링된 URL이 더 적으면 미완료
             else:
@@ -341,10 +880,15 @@ def resume_crawling(
     ]
     
     if not remaining_blog_ids:
-        print("[단계] 이미 완료된 크롤링입니다.")
+        print("[단계] 다시 크롤링할 실패한 포스트가 없습니다." if retry_failed else "[단계] 이미 완료된 크롤링입니다.")
         return []
     
-    print(f"[단계] 미완료 블로그 {len(remaining_blog_ids)}개 재개...")
+    if retry_failed:
+        failed_count = sum(len(bp.get("failed_urls", [])) for bp in blog_progress
+                           if bp.get("blog_id") in remaining_blog_ids)
+        print(f"[단계] 블로그 {len(remaining_blog_ids)}개의 실패한 포스트 {failed_count}개 재시도...")
+    else:
+        print(f"[단계] 미완료 블로그 {len(remaining_blog_ids)}개 재개...")
     
     # 기존 체크포인트의 blog_progress를 전달 (재개 모드)
     # 기존 체크포인트를 계속 사용하도록 설정
@@ -377,40 +921,27 @@ def resume_crawling(
         existing_blog_progress=blog_progress,  # 기존 진행 상황 전달
         save_interval=save_interval,
         progress_callback=progress_callback,
-        headless=headless
-    )
-    
-    # 기존 포스트와 병합
-    existing_posts = []
-    output_file = Path(output_path)
-    if output_file.exists():
-        try:
-            with open(output_file, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-                existing_posts = existing_data.get("posts", [])
-        except Exception as e:
-            print(f"[경고] 기존 파일 로드 실패: {e}")
-    
-    # 중복 제거 (post_id 기준)
-    existing_ids = {post.get("post_id") for post in existing_posts}
-    merged_posts = existing_posts + [
-        post.to_dict() for post in new_posts 
-        if post.post_id not in existing_ids
-    ]
-    
-    # 최종 저장
-    export_to_json(
-        merged_posts,
-        output_path,
-        {
-            "crawl_type": "blog_id",
-            "total_blog_ids": checkpoint_data.get("total_blog_ids", 0),
-            "processed_blog_ids": checkpoint_data.get("processed_blog_ids", 0) + len(remaining_blog_ids),
-            "total_posts": len(merged_posts),
-            "status": "completed",
-            "resumed": True
-        }
+        headless=headless,
+        post_workers=post_workers,
+        max_concurrent_blogs=max_concurrent_blogs,
+        pages_per_context=pages_per_context,
+        max_heap_mb=max_heap_mb,
+        blocking_profile=blocking_profile,
+        http_fetch=http_fetch,
+        incremental=incremental,
+        fsync_policy=fsync_policy,
+        store_path=store_path,
+        html_policy=html_policy,
+        html_store_dir=html_store_dir,
+        archive_html=archive_html,
+        html_archive_dir=html_archive_dir,
+        postprocess_workers=postprocess_workers,
+        retry_failed=retry_failed,
+        metrics=metrics,
+        metrics_port=metrics_port
     )
     
+    # 출력 파일과 체크포인트는 crawl_multiple_blog_ids가 실제 상태(completed/paused)로 이미 마무리함
+    # (여기서 다시 "completed"로 덮어쓰면 중단된 재개가 완료로 기록되어 다음 재개에서 건너뜀)
     return new_posts
 
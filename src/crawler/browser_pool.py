@@ -0,0 +1,214 @@
+"""
+브라우저 풀 모듈
+블로그마다 Chromium을 새로 띄우지 않고 하나의 브라우저를 재사용
+"""
+import threading
+from typing import Optional
+from playwright.sync_api import Browser, BrowserContext, CDPSession, Page, Playwright, sync_playwright
+
+from src.crawler.resource_blocking import BlockingProfile, BlockingStats, install_page_blocking
+
+
+class BrowserPool:
+    """재사용 가능한 브라우저 풀
+
+    - 브라우저는 처음 필요할 때 한 번만 실행하고 close()까지 유지
+    - 모바일 디바이스(iPhone 12) 설정이 적용된 새 컨텍스트를 제공
+    - 컨텍스트는 max_pages_per_context번 페이지를 로드하거나, heap_check_interval번마다 CDP로 잰
+      렌더러 JS 힙이 max_heap_mb를 넘으면 새로 만들어 메모리 증가를 제한
+      (쿠키/로컬 스토리지는 storage_state로 새 컨텍스트에 이어받고 디바이스 설정은 그대로 적용)
+    - 브라우저 연결이 끊기면(크래시) 다음 요청 시 자동으로 다시 실행
+    - blocking_profile이 있으면 새 페이지마다 CDP 요청 차단을 설치 (통계는 blocking_stats)
+
+    sync Playwright 객체는 만든 스레드에서만 사용할 수 있으므로
+    풀도 생성한 스레드 안에서만 사용한다. 작업 스레드마다 별도의 풀을 만든다.
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_pages_per_context: int = 100,
+        device_name: str = 'iPhone 12',
+        blocking_profile: Optional[BlockingProfile] = None,
+        max_heap_mb: Optional[float] = 300.0,
+        heap_check_interval: int = 10
+    ):
+        self.headless = headless
+        self.max_pages_per_context = max(1, max_pages_per_context)
+        self.max_heap_mb = max_heap_mb  # None이면 힙 크기로는 재활용하지 않음
+        self.heap_check_interval = max(1, heap_check_interval)
+        self.device_name = device_name
+        self.blocking_profile = blocking_profile
+        self.blocking_stats = BlockingStats()
+        self.launch_count = 0  # 브라우저 실행 횟수 (재실행 포함)
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._owner_thread = threading.get_ident()
+
+    def _check_thread(self) -> None:
+        if threading.get_ident() != self._owner_thread:
+            raise RuntimeError("BrowserPool은 생성한 스레드에서만 사용할 수 있습니다")
+
+    @property
+    def browser(self) -> Browser:
+        """실행 중인 브라우저 (없거나 연결이 끊겼으면 새로 실행)"""
+        self._check_thread()
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+
+        if self._browser is None or not self._browser.is_connected():
+            if self._browser is not None:
+                print("[경고] 브라우저 연결이 끊어졌습니다. 브라우저를 다시 실행합니다...")
+                try:
+                    self._browser.close()
+                except Exception:
+                    pass
+            self._browser = self._playwright.chromium.launch(headless=self.headless)
+            self.launch_count += 1
+            print(f"[단계] 브라우저 실행 (누적 {self.launch_count}회)")
+
+        return self._browser
+
+    def new_context(self, storage_state: Optional[dict] = None) -> BrowserContext:
+        """모바일 디바이스 설정이 적용된 새 컨텍스트 생성 (storage_state: 이어받을 쿠키/로컬 스토리지)"""
+        browser = self.browser
+        device = self._playwright.devices[self.device_name]
+        if storage_state:
+            context = browser.new_context(**device, storage_state=storage_state)
+        else:
+            context = browser.new_context(**device)
+        return context
+
+    def new_page(self, context: BrowserContext) -> Page:
+        """컨텍스트에 새 페이지 생성 (blocking_profile이 있으면 요청 차단 설치)"""
+        page = context.new_page()
+        if self.blocking_profile is not None:
+            install_page_blocking(context, page, self.blocking_profile, self.blocking_stats)
+        return page
+
+    def lease_page(self) -> "PageLease":
+        """재활용 규칙이 적용되는 페이지 대여"""
+        return PageLease(self)
+
+    def close(self) -> None:
+        """브라우저와 Playwright 종료"""
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class PageLease:
+    """풀에서 빌린 페이지
+
+    page 속성은 항상 사용 가능한 페이지를 돌려준다.
+    페이지가 닫혔거나 브라우저가 재실행되었거나 컨텍스트가 재활용 대상이면
+    새 컨텍스트와 페이지를 만든다. 페이지 로드마다 used()를 호출한다.
+    """
+
+    def __init__(self, pool: BrowserPool):
+        self.pool = pool
+        self.pages_loaded = 0  # 현재 컨텍스트에서 로드한 페이지 수
+        self.recycle_count = 0  # 한도/힙 크기로 컨텍스트를 교체한 횟수
+        self._context: Optional[BrowserContext] = None
+        self._page: Optional[Page] = None
+        self._cdp: Optional[CDPSession] = None
+        self._storage_state: Optional[dict] = None  # 새 컨텍스트에 이어받을 쿠키/로컬 스토리지
+        self._heap_before_recycle: Optional[float] = None
+
+    @property
+    def page(self) -> Page:
+        browser = self.pool.browser  # 크래시 시 여기서 브라우저 재실행
+        if self._page is None or self._page.is_closed() or self._context.browser is not browser:
+            self._renew()
+        return self._page
+
+    def used(self) -> None:
+        """페이지 로드 1회 기록 (한도 도달 또는 JS 힙 초과 시 다음 접근에서 컨텍스트 교체)"""
+        self.pages_loaded += 1
+        if self.pages_loaded >= self.pool.max_pages_per_context:
+            self._recycle(f"페이지 {self.pages_loaded}개 로드")
+            return
+
+        if self.pool.max_heap_mb is not None and self.pages_loaded % self.pool.heap_check_interval == 0:
+            heap_mb = self.heap_used_mb()
+            if heap_mb is not None and heap_mb > self.pool.max_heap_mb:
+                self._recycle(f"JS 힙 한도 {self.pool.max_heap_mb:.0f}MB 초과, 페이지 {self.pages_loaded}개 로드",
+                              heap_mb)
+
+    def heap_used_mb(self) -> Optional[float]:
+        """현재 페이지 렌더러의 JS 힙 사용량(MB) (CDP Runtime.getHeapUsage, 측정할 수 없으면 None)"""
+        if self._page is None or self._context is None:
+            return None
+        try:
+            if self._cdp is None:
+                self._cdp = self._context.new_cdp_session(self._page)
+            usage = self._cdp.send('Runtime.getHeapUsage')
+            return usage['usedSize'] / (1024 * 1024)
+        except Exception:
+            self._cdp = None
+            return None
+
+    def _recycle(self, reason: str, heap_mb: Optional[float] = None) -> None:
+        """쿠키/로컬 스토리지를 저장하고 컨텍스트를 닫음 (새 컨텍스트는 다음 page 접근에서 생성)"""
+        if heap_mb is None:
+            heap_mb = self.heap_used_mb()
+        try:
+            self._storage_state = self._context.storage_state()
+        except Exception:
+            pass  # 저장에 실패하면 마지막으로 저장한 상태를 이어받음
+        self.recycle_count += 1
+        self._heap_before_recycle = heap_mb
+        heap_text = f", JS 힙 {heap_mb:.1f}MB" if heap_mb is not None else ""
+        print(f"[단계] 컨텍스트 재활용 {self.recycle_count}회: {reason}{heap_text} → 새 컨텍스트로 교체")
+        self._close_context()
+
+    def _renew(self) -> None:
+        self._close_context()
+        self._context = self.pool.new_context(self._storage_state)
+        self._page = self.pool.new_page(self._context)
+        self.pages_loaded = 0
+        if self._heap_before_recycle is not None:
+            heap_mb = self.heap_used_mb()
+            if heap_mb is not None:
+                print(f"[단계] 새 컨텍스트 JS 힙 {heap_mb:.1f}MB (재활용 전 {self._heap_before_recycle:.1f}MB)")
+            self._heap_before_recycle = None
+
+    def _close_context(self) -> None:
+        if self._cdp is not None:
+            try:
+                self._cdp.detach()
+            except Exception:
+                pass
+            self._cdp = None
+        if self._context is not None:
+            try:
+                self._context.close()
+            except Exception:
+                pass
+        self._context = None
+        self._page = None
+
+    def close(self) -> None:
+        """빌린 컨텍스트 반납 (브라우저는 풀이 유지)"""
+        self._close_context()
+
+    def __enter__(self) -> "PageLease":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -4,12 +4,31 @@
 """
 import time
 import re
-from typing import List, Optional, Tuple, Callable
-from playwright.sync_api import Page, Browser, sync_playwright, TimeoutError as PlaywrightTimeout
+import queue
+import threading
+from functools import partial
+from typing import List, Optional, Set, Tuple, Callable, Union
+from playwright.sync_api import Page, Browser, Error as PlaywrightError, TimeoutError as PlaywrightTimeout
 
 from src.models import Post, Author, PostMetadata, PostContent, Comment
-from src.crawler.parser import extract_tags, extract_comments, extract_content, extract_metadata
-from src.utils.exceptions import BlogNotFoundError, TimeoutError, ParsingError, NetworkError
+from src.crawler.parser import (
+    extract_tags, extract_comments, extract_content, extract_metadata,
+    content_from_bundle, metadata_from_bundle
+)
+from src.crawler.scripts import TITLE_JS, PAGE_STRUCTURE_JS, POST_LINKS_JS, POST_BUNDLE_JS
+from src.crawler.readiness import ReadinessConfig, DEFAULT_READINESS, wait_for_comments, wait_for_content
+from src.utils.exceptions import BlogNotFoundError, TimeoutError, ParsingError, NetworkError, RateLimitedError
+from src.utils.rate_limiter import AdaptiveRateLimiter, THROTTLE_STATUSES
+from src.utils.retry import RetryPolicy, DEFAULT_RETRY_POLICY, failure_record, is_transient
+from src.utils.metrics import CrawlMetrics, NULL_METRICS
+from src.utils.html_store import HtmlStore, release_heavy_fields, validate_html_policy
+from src.utils.html_archive import HtmlArchive
+from src.crawler.browser_pool import BrowserPool, PageLease
+from src.crawler.resource_blocking import BlockingProfile, DEFAULT_BLOCKING_PROFILE, log_blocked
+from src.crawler.http_fetcher import HttpFetcher
+from src.crawler.static_parser import bundle_from_html
+from src.crawler.post_list_api import PostListCollector
+from src.crawler.postprocess import PostPipeline, PostProcessor
 
 
 def extract_post_id_from_url(url: str) -> str:
@@ -61,52 +80,7 @@ def extract_title(page: Page) -> str:
     
     # JavaScript로 제목 추출 (Fallback)
     try:
-        title = page.evaluate("""() => {
-            // 방법 1: 본문 제목 요소 직접 찾기
-            const titleSelectors = [
-                'h1.post_subject',
-                'h1.se-title-text',
-                '.post-title h1',
-                '.post_subject',
-                '.se-title-text',
-                'h1.title',
-                'h1',
-                '.title',
-                '[class*="title"]'
-            ];
-            
-            for (const selector of titleSelectors) {
-                const elem = document.querySelector(selector);
-                if (elem) {
-                    const text = (elem.textContent || elem.innerText || '').trim();
-                    if (text && text.length > 0 && text.length < 200) {
-                        return text;
-                    }
-                }
-            }
-            
-            // 방법 2: 페이지 title에서 추출
-            const pageTitle = document.title;
-            if (pageTitle) {
-                // " : " 구분자로 제목 추출
-                if (pageTitle.includes(' : ')) {
-                    const parts = pageTitle.split(' : ');
-                    if (parts.length > 0) {
-                        return parts[0].trim();
-                    }
-                }
-                // " - " 구분자로 제목 추출
-                if (pageTitle.includes(' - ')) {
-                    const parts = pageTitle.split(' - ');
-                    if (parts.length > 0) {
-                        return parts[0].trim();
-                    }
-                }
-                return pageTitle.trim();
-            }
-            
-            return '';
-        }""")
+        title = page.evaluate(TITLE_JS)
         
         if title and title.strip():
             return title.strip()
@@ -231,27 +205,149 @@ def extract_modified_date(page: Page) -> Optional[str]:
     return None
 
 
+def post_fields_from_bundle(data: dict, blog_id: str, postprocess: bool = True) -> dict:
+    """일괄 추출 결과(POST_BUNDLE_JS)를 필드별 추출 함수와 같은 규칙으로 변환
+    
+    postprocess가 False이면 본문 후처리(finish_content)는 호출자에게 맡긴다.
+    """
+    page_title = data.get('pageTitle') or ''
+    
+    # 제목: 페이지 title 우선, 다음으로 본문 제목 요소, 마지막으로 page title 전체
+    title = ''
+    for separator in (' : ', ' - '):
+        if separator in page_title:
+            candidate = page_title.split(separator)[0].strip()
+            if candidate and len(candidate) < 200:
+                title = candidate
+                break
+    if not title:
+        title = (data.get('title') or '').strip()
+    if not title:
+        title = page_title.strip()
+        for separator in (' : ', ' - '):
+            if separator in page_title:
+                title = page_title.split(separator)[0].strip()
+                break
+    
+    return {
+        'title': title,
+        'author': Author(blog_id=blog_id, nickname=data.get('nickname') or blog_id),
+        'published_date': data.get('publishedDate') or '',
+        'modified_date': data.get('modifiedDate') or None,
+        'metadata': metadata_from_bundle(data),
+        'content': content_from_bundle(data, postprocess)
+    }
+
+
+def post_from_static_bundle(data: dict, post_url: str, blog_id: str, postprocess: bool = True) -> Post:
+    """bundle_from_html 결과로 Post 생성 (HTTP 수집, 아카이브 재추출 공통, 댓글 없음)"""
+    post_id = extract_post_id_from_url(post_url) or str(int(time.time()))
+    fields = post_fields_from_bundle(data, blog_id, postprocess)
+    metadata = fields['metadata']
+    # 중복 제거 (순서 유지: 프로세스마다 해시 시드가 달라도 같은 결과)
+    metadata.tags = list(dict.fromkeys(data['tags']))
+    
+    return Post(
+        post_id=post_id,
+        title=fields['title'] or f"포스트 {post_id}",
+        author=fields['author'],
+        published_date=fields['published_date'],
+        modified_date=fields['modified_date'],
+        url=post_url,
+        metadata=metadata,
+        content=fields['content'],
+        comments=[]
+    )
+
+
+def archive_page(html_archive: Optional[HtmlArchive], blog_id: str, post_id: str, post_url: str, html: str) -> None:
+    """원본 페이지를 아카이브에 저장 (아카이브 실패는 크롤링을 중단시키지 않음)"""
+    if html_archive is None or not html:
+        return
+    try:
+        html_archive.put(blog_id, post_id, post_url, html)
+    except Exception as e:
+        print(f"[경고] 원본 페이지 아카이브 실패: {post_url}, 오류: {e}")
+
+
+def extract_post_bundle(page: Page, blog_id: str, postprocess: bool = True) -> Optional[dict]:
+    """제목/작성자/날짜/메타데이터/본문을 page.evaluate 1회로 추출
+    
+    필드마다 locator 왕복(포스트당 30회 이상) 대신 한 번의 호출로 가져온다.
+    실패하면 None을 반환하며 호출자는 필드별 추출 함수로 대체한다.
+    """
+    try:
+        data = page.evaluate(POST_BUNDLE_JS)
+    except Exception as e:
+        print(f"[경고] 포스트 일괄 추출 실패, 필드별 추출로 대체: {e}")
+        return None
+    
+    if not data:
+        return None
+    return post_fields_from_bundle(data, blog_id, postprocess)
+
+
+def _loaded_post_links(page: Page, blog_id: str, collector: Optional[PostListCollector]) -> List[str]:
+    """지금까지 로드된 포스트 링크 (글 목록 API 응답 우선, 없으면 DOM에서 추출)"""
+    if collector is not None:
+        collector.harvest()
+        if len(collector):
+            return collector.links
+    return page.evaluate(POST_LINKS_JS, blog_id)
+
+
+def _reached_known_posts(
+    links: List[str],
+    known_post_ids: Set[str],
+    checked_count: int
+) -> Tuple[bool, int]:
+    """
+    증분 모드: 마지막 확인 이후 새로 로드된 링크가 모두 이미 수집한 포스트인지 확인
+    
+    Returns:
+        Tuple[이미 수집한 구간 도달 여부, 현재까지 로드된 링크 수]
+    """
+    batch = links[checked_count:]
+    if not batch:
+        return False, checked_count
+    reached = all(extract_post_id_from_url(url) in known_post_ids for url in batch)
+    return reached, len(links)
+
+
 def _collect_all_post_links(
     page: Page,
     blog_id: str,
     max_posts: Optional[int] = None,
-    timeout: int = 30
+    timeout: int = 30,
+    known_post_ids: Optional[Set[str]] = None,
+    collector: Optional[PostListCollector] = None
 ) -> List[str]:
     """
     Phase 1: 링크 수집
     1. 전체글 갯수 확인
     2. 스크롤 다운하여 모든 링크 수집
-    3. JavaScript로 DOM 순서대로 모든 포스트 링크 추출
+    3. 글 목록 API 응답(collector)에서 링크 생성, 응답이 없으면 DOM 순서대로 포스트 링크 추출
+    
+    collector는 목록 페이지 접속 전에 attach해야 첫 페이지 응답도 수집된다.
+    API 응답에서 빈 페이지가 오면 더 불러올 글이 없으므로 스크롤을 멈춘다.
+    
+    known_post_ids가 있으면 증분 모드로 동작한다. 글 목록은 최신순이므로
+    한 번의 로드(스크롤)로 추가된 링크가 모두 이미 수집한 포스트이면 스크롤을 멈추고,
+    이미 수집한 포스트를 제외한 새 링크만 반환한다 (전체글 갯수 확인도 생략).
     """
     print("[단계] === Phase 1: 링크 수집 시작 ===")
+    incremental = bool(known_post_ids)
     
     # 1단계: 전체글 갯수 확인
-    print("[단계] === 1단계: 전체글 갯수 확인 (먼저) ===")
     total_post_count = None
     current_url = page.url
+    if incremental:
+        print(f"[단계] 증분 모드: 이미 수집한 포스트 {len(known_post_ids)}개, 전체글 갯수 확인 생략")
+    else:
+        print("[단계] === 1단계: 전체글 갯수 확인 (먼저) ===")
     
     # 전체글 버튼 찾기 및 클릭
-    sort_selectors = [
+    sort_selectors = [] if incremental else [
         'button[data-click-area="pls.sort"]',
         'button.link__dkflP',
         'button:has-text("전체글")',
@@ -313,12 +409,28 @@ def _collect_all_post_links(
     no_change_count = 0
     no_change_threshold = 3
     max_scrolls = 200  # 최대 스크롤 횟수 제한
+    checked_count = 0  # 증분 모드: 이미 확인한 링크 수
     
     while scroll_count < max_scrolls:
         scroll_count += 1
         if scroll_count % 10 == 0:
             print(f"[단계] 스크롤 반복 {scroll_count}")
         
+        # 증분 모드: 새로 로드된 링크가 모두 이미 수집한 포스트면 스크롤 중단
+        if incremental:
+            loaded_links = _loaded_post_links(page, blog_id, collector)
+            reached, checked_count = _reached_known_posts(loaded_links, known_post_ids, checked_count)
+            if reached:
+                print(f"[단계] 이미 수집한 포스트 구간 도달 - 스크롤 {scroll_count - 1}회 후 중단")
+                break
+        
+        # 글 목록 API가 빈 페이지를 돌려주면 마지막 페이지까지 로드된 것
+        if collector is not None:
+            collector.harvest()
+            if collector.reached_end:
+                print(f"[단계] 글 목록 API 마지막 페이지 도달 - 스크롤 완료 ({len(collector)}개 링크)")
+                break
+        
         # '맨 위로' 버튼 확인 (문서 기준)
         scroll_top_button = page.locator('button.scroll_top_button__uyAEr[data-click-area="pls.backtotop"]').first
         if scroll_top_button.count() > 0:
@@ -364,209 +476,35 @@ def _collect_all_post_links(
     # 3단계: 링크 수집
     print("[단계] === 3단계: 스크롤 완료, 글 목록에서 링크 수집 ===")
     
-    # 디버깅: 페이지 구조 확인
-    debug_info = page.evaluate("""() => {
-        const info = {
-            containers: [],
-            allLinks: 0,
-            postLinks: 0
-        };
-        
-        // 모든 가능한 컨테이너 확인
-        for (let i = 1; i <= 10; i++) {
-            for (let j = 1; j <= 10; j++) {
-                const xpath = `/html/body/div[1]/div[${i}]/div[${j}]`;
-                const container = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
-                if (container) {
-                    const linkCount = container.querySelectorAll('a[href]').length;
-                    if (linkCount > 0) {
-                        info.containers.push({xpath: xpath, links: linkCount});
-                    }
-                }
-            }
-        }
-        
-        // 전체 페이지 링크 수
-        info.allLinks = document.querySelectorAll('a[href]').length;
-        info.postLinks = document.querySelectorAll('a[href*="/' + location.pathname.split('/')[1] + '/"], a[href*="PostView"], a[href*="logNo"]').length;
-        
-        return info;
-    }""")
-    
-    print(f"[디버깅] 페이지 구조 확인:")
-    print(f"  - 전체 링크 수: {debug_info['allLinks']}")
-    print(f"  - 포스트 링크 수: {debug_info['postLinks']}")
-    if debug_info['containers']:
-        print(f"  - 링크가 있는 컨테이너: {len(debug_info['containers'])}개")
-        for container in debug_info['containers'][:5]:  # 처음 5개만 출력
-            print(f"    * {container['xpath']}: {container['links']}개 링크")
-    
-    # JavaScript로 링크 수집 (문서 기준: /html/body/div[1]/div[5]/div[4])
-    links = page.evaluate("""(blogId) => {
-        const links = [];
-        
-        // 컨테이너 찾기 (문서 기준 XPath: /html/body/div[1]/div[5]/div[4])
-        const mainContainer = document.evaluate(
-            '/html/body/div[1]/div[5]/div[4]', 
-            document, 
-            null, 
-            XPathResult.FIRST_ORDERED_NODE_TYPE, 
-            null
-        ).singleNodeValue;
-        
-        // Fallback 컨테이너들
-        const fallbackContainers = [
-            document.evaluate('/html/body/div[1]/div[5]/div[2]/div[3]', document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue,
-            mainContainer
-        ].filter(c => c !== null);
-        
-        const containers = mainContainer ? [mainContainer] : fallbackContainers;
-        
-        // 방법 1: 문서에 명시된 선택자 사용 (a.link__A4O1D, a[data-click-area="pls.textpost"])
-        containers.forEach(container => {
-            if (!container) return;
-            
-            // div.postlist__qxOgF 안의 링크 찾기 (문서 기준)
-            const postListDivs = container.querySelectorAll('div.postlist__qxOgF');
-            postListDivs.forEach(postDiv => {
-                const linkElements = postDiv.querySelectorAll('a.link__A4O1D, a[data-click-area="pls.textpost"]');
-                linkElements.forEach(a => {
-                    let href = a.getAttribute('href');
-                    if (href) {
-                        // 상대 경로를 절대 경로로 변환
-                        if (href.startsWith('/')) {
-                            href = 'https://m.blog.naver.com' + href;
-                        } else if (!href.startsWith('http')) {
-                            href = 'https://m.blog.naver.com/' + href;
-                        }
-                        
-                        // 블로그 ID와 포스트 번호 포함 확인
-                        // 형식: /blog_id/숫자 또는 ?blogId=...&logNo=...
-                        const blogIdPattern = new RegExp(blogId, 'i');
-                        const postNumberPattern = /\/(\d+)|logNo=(\d+)/;
-                        
-                        if (blogIdPattern.test(href) && postNumberPattern.test(href)) {
-                            // PostView URL로 변환 (표준 형식)
-                            const postNumMatch = href.match(/\/(\d+)/) || href.match(/logNo=(\d+)/);
-                            if (postNumMatch) {
-                                const postNum = postNumMatch[1] || postNumMatch[2];
-                                const standardUrl = `https://m.blog.naver.com/PostView.naver?blogId=${blogId}&logNo=${postNum}`;
-                                if (!links.includes(standardUrl)) {
-                                    links.push(standardUrl);
-                                }
-                            }
-                        }
-                    }
-                });
-            });
-        });
+    links = None
+    if collector is not None:
+        collector.harvest()
+        if len(collector) and total_post_count and len(collector) < total_post_count:
+            print(f"[경고] 글 목록 API 링크 수({len(collector)}개)가 전체글 갯수보다 적어 DOM에서 다시 수집")
+        elif len(collector):
+            links = collector.links
+            print(f"[단계] 글 목록 API 응답 {collector.responses_seen}개에서 {len(links)}개 링크 수집")
+    
+    if links is None:
+        # 디버깅: 페이지 구조 확인
+        debug_info = page.evaluate(PAGE_STRUCTURE_JS)
         
-        // 방법 2: Fallback - 직접 선택자로 찾기
-        if (links.length === 0) {
-            containers.forEach(container => {
-                if (!container) return;
-                
-                // 전체 링크 찾기
-                const linkElements = container.querySelectorAll('a.link__A4O1D, a[data-click-area="pls.textpost"]');
-                linkElements.forEach(a => {
-                    let href = a.getAttribute('href');
-                    if (href) {
-                        if (href.startsWith('/')) {
-                            href = 'https://m.blog.naver.com' + href;
-                        } else if (!href.startsWith('http')) {
-                            href = 'https://m.blog.naver.com/' + href;
-                        }
-                        
-                        const blogIdPattern = new RegExp(blogId, 'i');
-                        const postNumberPattern = /\/(\d+)|logNo=(\d+)/;
-                        
-                        if (blogIdPattern.test(href) && postNumberPattern.test(href)) {
-                            const postNumMatch = href.match(/\/(\d+)/) || href.match(/logNo=(\d+)/);
-                            if (postNumMatch) {
-                                const postNum = postNumMatch[1] || postNumMatch[2];
-                                const standardUrl = `https://m.blog.naver.com/PostView.naver?blogId=${blogId}&logNo=${postNum}`;
-                                if (!links.includes(standardUrl)) {
-                                    links.push(standardUrl);
-                                }
-                            }
-                        }
-                    }
-                });
-            });
-        }
+        print(f"[디버깅] 페이지 구조 확인:")
+        print(f"  - 전체 링크 수: {debug_info['allLinks']}")
+        print(f"  - 포스트 링크 수: {debug_info['postLinks']}")
+        if debug_info['containers']:
+            print(f"  - 링크가 있는 컨테이너: {len(debug_info['containers'])}개")
+            for container in debug_info['containers'][:5]:  # 처음 5개만 출력
+                print(f"    * {container['xpath']}: {container['links']}개 링크")
         
-        // 방법 3: 최종 Fallback - ul/li 구조에서 찾기
-        if (links.length === 0) {
-            containers.forEach(container => {
-                if (!container) return;
-                
-                const ulElements = container.querySelectorAll('ul');
-                ulElements.forEach(ul => {
-                    const listItems = ul.querySelectorAll('li');
-                    listItems.forEach(li => {
-                        const allLinks = li.querySelectorAll('a[href]');
-                        allLinks.forEach(a => {
-                            let href = a.getAttribute('href');
-                            if (href) {
-                                if (href.startsWith('/')) {
-                                    href = 'https://m.blog.naver.com' + href;
-                                } else if (!href.startsWith('http')) {
-                                    href = 'https://m.blog.naver.com/' + href;
-                                }
-                                
-                                const blogIdPattern = new RegExp(blogId, 'i');
-                                const postNumberPattern = /\/(\d+)|logNo=(\d+)|PostView/;
-                                
-                                if (blogIdPattern.test(href) && postNumberPattern.test(href)) {
-                                    const postNumMatch = href.match(/\/(\d+)/) || href.match(/logNo=(\d+)/);
-                                    if (postNumMatch) {
-                                        const postNum = postNumMatch[1] || postNumMatch[2];
-                                        const standardUrl = `https://m.blog.naver.com/PostView.naver?blogId=${blogId}&logNo=${postNum}`;
-                                        if (!links.includes(standardUrl)) {
-                                            links.push(standardUrl);
-                                        }
-                                    }
-                                }
-                            }
-                        });
-                    });
-                });
-            });
-        }
+        # JavaScript로 링크 수집 (문서 기준: /html/body/div[1]/div[5]/div[4])
+        links = page.evaluate(POST_LINKS_JS, blog_id)
         
-        // 방법 4: 최종 Fallback - 페이지 전체에서 블로그 ID와 포스트 번호가 있는 링크 찾기
-        if (links.length === 0) {
-            const allLinks = document.querySelectorAll('a[href]');
-            allLinks.forEach(a => {
-                let href = a.getAttribute('href');
-                if (href) {
-                    if (href.startsWith('/')) {
-                        href = 'https://m.blog.naver.com' + href;
-                    } else if (!href.startsWith('http')) {
-                        href = 'https://m.blog.naver.com/' + href;
-                    }
-                    
-                    const blogIdPattern = new RegExp(blogId, 'i');
-                    const postNumberPattern = /\/(\d{8,})|logNo=(\d{8,})/;  // 8자리 이상 숫자 (포스트 ID)
-                    
-                    if (blogIdPattern.test(href) && postNumberPattern.test(href)) {
-                        const postNumMatch = href.match(/\/(\d{8,})/) || href.match(/logNo=(\d{8,})/);
-                        if (postNumMatch) {
-                            const postNum = postNumMatch[1] || postNumMatch[2];
-                            const standardUrl = `https://m.blog.naver.com/PostView.naver?blogId=${blogId}&logNo=${postNum}`;
-                            if (!links.includes(standardUrl)) {
-                                links.push(standardUrl);
-                            }
-                        }
-                    }
-                }
-            });
-        }
-        
-        return [...new Set(links)];  // 중복 제거
-    }""", blog_id)
+        print(f"[단계] 페이지에서 {len(links)}개 링크 발견")
     
-    print(f"[단계] 페이지에서 {len(links)}개 링크 발견")
+    if incremental:
+        links = [url for url in links if extract_post_id_from_url(url) not in known_post_ids]
+        print(f"[단계] 증분 모드: 새 포스트 링크 {len(links)}개")
     
     if max_posts:
         links = links[:max_posts]
@@ -581,75 +519,107 @@ def _collect_all_post_links(
 
 
 def crawl_post_detail_mobile(
-    page: Page,
+    page: Union[Page, PageLease],
     post_url: str,
     timeout: int = 30,
-    blog_id: str = None
+    blog_id: str = None,
+    readiness: ReadinessConfig = DEFAULT_READINESS,
+    html_archive: Optional[HtmlArchive] = None,
+    postprocess: bool = True,
+    rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    metrics: CrawlMetrics = NULL_METRICS
 ) -> Post:
     """
     Phase 2: 상세 크롤링
     각 포스트의 상세 정보를 수집
+    
+    본문/해시태그/댓글 로딩은 고정 대기 대신 readiness의 최대 대기 시간 안에서
+    DOM/네트워크 신호가 오는 즉시 진행한다.
+    html_archive가 있으면 해시태그/댓글까지 펼친 뒤의 페이지 HTML을 저장한다.
+    postprocess가 False이면 본문은 페이지에서 읽은 값만 채워 반환한다 (PostPipeline에서 후처리).
+    rate_limiter가 있으면 접속마다 요청 슬롯까지 대기하고 응답 시간/타임아웃/요청 제한을 반영한다.
+    
+    실패는 TimeoutError/NetworkError(일시적)와 ParsingError(영구적)로 분류해,
+    일시적 오류만 retry_policy에 따라 지터를 준 지수 백오프로 재시도하고 마지막 오류를 그대로 던진다.
+    metrics에는 단계별(goto, readiness, bundle 또는 필드별, tags, comments, archive) 소요 시간과
+    재시도 횟수를 기록한다.
+    
+    page에 PageLease를 넘기면 시도마다 lease.page를 다시 읽으므로 페이지가 닫혔거나
+    브라우저가 크래시되어도 새 페이지로 재시도한다. Page를 넘겼는데 페이지가 닫혔으면
+    같은 페이지로는 재시도해도 실패하므로 재시도 없이 NetworkError를 던진다.
     """
-    max_retries = 3
+    max_retries = retry_policy.max_attempts
+    lease = page if isinstance(page, PageLease) else None
     
     for attempt in range(max_retries):
         try:
-            # 페이지 상태 확인
+            # 닫힌 페이지/끊긴 브라우저는 lease.page가 새로 만듦
+            if lease is not None:
+                page = lease.page
             if page.is_closed():
-                raise ValueError("페이지가 닫혔습니다")
+                raise NetworkError("페이지가 닫혔습니다")
             
             # 포스트 페이지 접속
-            try:
-                page.goto(post_url, wait_until='domcontentloaded', timeout=timeout * 1000)
-            except PlaywrightTimeout:
+            if rate_limiter:
+                rate_limiter.wait(post_url)
+            request_start = time.monotonic()
+            with metrics.timer('goto'):
                 try:
-                    page.goto(post_url, wait_until='load', timeout=timeout * 1000)
+                    response = page.goto(post_url, wait_until='domcontentloaded', timeout=timeout * 1000)
                 except PlaywrightTimeout:
-                    if attempt < max_retries - 1:
-                        time.sleep(2)
-                        continue
-                    raise TimeoutError(f"페이지 로딩 타임아웃: {post_url}")
+                    try:
+                        response = page.goto(post_url, wait_until='load', timeout=timeout * 1000)
+                    except PlaywrightTimeout:
+                        raise TimeoutError(f"페이지 로딩 타임아웃: {post_url}")
+            if response is not None and response.status in THROTTLE_STATUSES:
+                raise RateLimitedError(f"요청 제한 응답 {response.status}: {post_url}")
+            if rate_limiter:
+                rate_limiter.record_response(post_url, time.monotonic() - request_start)
             
             # 본문 로딩 대기 (중요: 네이버 블로그는 동적 로딩)
-            time.sleep(1.0)  # 초기 로딩 대기 (1.5초에서 1.0초로 단축)
-            
-            # 본문이 로드될 때까지 대기
-            try:
-                # 본문 컨테이너가 나타날 때까지 대기 (타임아웃 단축)
-                page.wait_for_selector('.se-main-container, .se-component-content, #postViewArea, .post-view-area, .post-content', timeout=3000)
-            except Exception:
-                # 선택자가 없어도 계속 진행
-                pass
-            
-            time.sleep(0.3)  # 추가 안정화 대기 (0.5초에서 0.3초로 단축)
+            # 본문 컨테이너가 나타나면 즉시 진행, 선택자가 없어도 최대 대기 후 계속 진행
+            with metrics.timer('readiness'):
+                wait_for_content(page, readiness)
             
             # Post ID 추출
             post_id = extract_post_id_from_url(post_url)
             if not post_id:
                 post_id = str(int(time.time()))
             
-            # 제목 추출
-            title = extract_title(page)
-            if not title:
-                title = f"포스트 {post_id}"
-            
-            # 작성자 정보 추출
             if not blog_id:
                 blog_id = extract_blog_id_from_url(post_url)
-            author = extract_author(page, blog_id)
-            
-            # 날짜 정보 추출
-            published_date = extract_published_date(page)
-            modified_date = extract_modified_date(page)
             
-            # 메타데이터 추출
-            metadata = extract_metadata(page)
+            # 제목/작성자/날짜/메타데이터/본문 일괄 추출 (page.evaluate 1회)
+            with metrics.timer('bundle'):
+                bundle = extract_post_bundle(page, blog_id, postprocess)
+            if bundle:
+                title = bundle['title']
+                author = bundle['author']
+                published_date = bundle['published_date']
+                modified_date = bundle['modified_date']
+                metadata = bundle['metadata']
+                content = bundle['content']
+            else:
+                # Fallback: 필드별 추출
+                with metrics.timer('title'):
+                    title = extract_title(page)
+                with metrics.timer('author'):
+                    author = extract_author(page, blog_id)
+                with metrics.timer('date'):
+                    published_date = extract_published_date(page)
+                    modified_date = extract_modified_date(page)
+                with metrics.timer('metadata'):
+                    metadata = extract_metadata(page)
+                with metrics.timer('content'):
+                    content = extract_content(page, postprocess)
             
-            # 본문 내용 추출
-            content = extract_content(page)
+            if not title:
+                title = f"포스트 {post_id}"
             
             # 해시태그 추출 (댓글보다 먼저)
-            tags = extract_tags(page)
+            with metrics.timer('tags'):
+                tags = extract_tags(page, readiness)
             metadata.tags = tags
             
             # 댓글 추출
@@ -660,14 +630,20 @@ def crawl_post_detail_mobile(
                 comments = []
                 is_secret_only = False
             else:
-                comments, is_secret_only = extract_comments(page, comment_count=comment_count)
-                
-                # 댓글 수가 0 이상인데 수집 실패한 경우 재시도
-                # 단, 비밀 댓글이면 재시도하지 않음 (비밀 댓글은 이미 건너뛰기 처리됨)
-                if comment_count > 0 and len(comments) == 0 and not is_secret_only:
-                    # 비밀 댓글이 아닌 경우에만 재시도
-                    time.sleep(1)  # 재시도 전 대기 시간 단축
-                    comments, is_secret_only = extract_comments(page, comment_count=comment_count)
+                with metrics.timer('comments'):
+                    comments, is_secret_only = extract_comments(page, comment_count=comment_count, readiness=readiness)
+                    
+                    # 댓글 수가 0 이상인데 수집 실패한 경우 재시도
+                    # 단, 비밀 댓글이면 재시도하지 않음 (비밀 댓글은 이미 건너뛰기 처리됨)
+                    if comment_count > 0 and len(comments) == 0 and not is_secret_only:
+                        # 비밀 댓글이 아닌 경우에만 재시도
+                        wait_for_comments(page, readiness)  # 고정 대기 대신 댓글 목록 렌더링 신호까지만 대기
+                        comments, is_secret_only = extract_comments(page, comment_count=comment_count,
+                                                                    readiness=readiness)
+            
+            if html_archive is not None:
+                with metrics.timer('archive'):
+                    archive_page(html_archive, blog_id, post_id, post_url, page.content())
             
             # Post 객체 생성
             post = Post(
@@ -681,21 +657,318 @@ def crawl_post_detail_mobile(
                 content=content,
                 comments=comments
             )
+            metrics.inc('browser_posts')
+            metrics.inc('content_bytes', len((content.html or '').encode('utf-8')))
             
             return post
             
-        except PlaywrightTimeout:
-            if attempt < max_retries - 1:
-                print(f"[경고] 재시도 {attempt+1}/{max_retries}: 페이지 로딩 타임아웃, 잠시 대기 후 재시도...")
-                time.sleep(2)
-                continue
-            raise TimeoutError(f"최대 재시도 횟수 초과: {post_url}")
         except Exception as e:
-            if attempt < max_retries - 1:
-                print(f"[경고] 재시도 {attempt+1}/{max_retries}: {e}, 잠시 대기 후 재시도...")
-                time.sleep(2)
-                continue
-            raise ParsingError(f"파싱 실패: {e}")
+            error = classify_error(e)
+            if is_transient(error):
+                record_rate_failure(rate_limiter, post_url, error)
+            if not retry_policy.should_retry(error, attempt) or (lease is None and page.is_closed()):
+                raise error from e
+            wait_time = retry_policy.backoff(attempt)
+            metrics.inc('retries')
+            print(f"[경고] 재시도 {attempt+1}/{max_retries}: {error}, {wait_time:.1f}초 후 재시도...")
+            time.sleep(wait_time)
+
+
+def classify_error(error: Exception) -> Exception:
+    """예외를 재시도 분류용 예외로 변환
+
+    TimeoutError/NetworkError/ParsingError는 그대로, Playwright 타임아웃은 TimeoutError,
+    그 밖의 Playwright 오류(연결 실패, 페이지/브라우저 종료)는 NetworkError,
+    나머지(추출 코드의 예외)는 ParsingError로 본다.
+    """
+    if isinstance(error, (TimeoutError, NetworkError, ParsingError)):
+        return error
+    if isinstance(error, PlaywrightTimeout):
+        return TimeoutError(f"페이지 로딩 타임아웃: {error}")
+    if isinstance(error, PlaywrightError):
+        return NetworkError(f"브라우저 오류: {error}")
+    return ParsingError(f"파싱 실패: {error}")
+
+
+def record_rate_failure(rate_limiter: Optional[AdaptiveRateLimiter], post_url: str, error: Exception) -> None:
+    """실패한 요청을 rate_limiter에 반영 (호스트 간격을 늘려 다음 요청을 그만큼 미룸)"""
+    if rate_limiter is None:
+        return
+    throttled = isinstance(error, RateLimitedError)
+    delay = rate_limiter.record_error(post_url, throttled)
+    if throttled:
+        print(f"[경고] 요청 제한 감지, 요청 간격 {delay:.1f}초로 늘림")
+
+
+def crawl_post_http(
+    fetcher: HttpFetcher,
+    post_url: str,
+    blog_id: str = None,
+    html_archive: Optional[HtmlArchive] = None,
+    postprocess: bool = True,
+    rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    metrics: CrawlMetrics = NULL_METRICS
+) -> Optional[Post]:
+    """
+    Phase 2: 브라우저 없이 서버 렌더링 HTML로 상세 크롤링
+    
+    댓글이 있거나(댓글 수를 알 수 없는 경우 포함) 해시태그 확장이 필요한 포스트,
+    서버 HTML에 본문이 없는 포스트는 None을 반환하며 호출자는 브라우저로 크롤링한다.
+    html_archive가 있으면 HTTP로 수집한 포스트의 응답 HTML을 저장한다.
+    rate_limiter가 있으면 요청 슬롯까지 대기하고 응답 시간/오류/요청 제한을 반영한다.
+    metrics에는 요청(http)/파싱(parse) 시간과 응답 바이트(http_bytes)를 기록한다.
+    """
+    if rate_limiter:
+        rate_limiter.wait(post_url)
+    request_start = time.monotonic()
+    try:
+        with metrics.timer('http'):
+            status, html = fetcher.fetch(post_url)
+    except NetworkError as e:
+        record_rate_failure(rate_limiter, post_url, e)
+        print(f"[경고] HTTP 요청 실패, 브라우저로 대체: {e}")
+        return None
+    
+    if status in THROTTLE_STATUSES:
+        record_rate_failure(rate_limiter, post_url, RateLimitedError(f"요청 제한 응답 {status}"))
+    elif rate_limiter:
+        rate_limiter.record_response(post_url, time.monotonic() - request_start)
+    
+    if status != 200:
+        print(f"[경고] HTTP 상태 {status}, 브라우저로 대체: {post_url}")
+        return None
+    metrics.inc('http_bytes', len(html.encode('utf-8')))
+    
+    with metrics.timer('parse'):
+        data = bundle_from_html(html)
+    if data is None:
+        print(f"[단계] 서버 HTML에 본문이 없어 브라우저로 대체: {post_url}")
+        return None
+    if data['comments'] > 0 or not data['commentCountFound']:
+        print(f"[단계] 댓글 수집이 필요하여 브라우저로 대체: {post_url}")
+        return None
+    if data['hasTagExpand']:
+        print(f"[단계] 해시태그 확장이 필요하여 브라우저로 대체: {post_url}")
+        return None
+    
+    if not blog_id:
+        blog_id = extract_blog_id_from_url(post_url)
+    
+    post = post_from_static_bundle(data, post_url, blog_id, postprocess)
+    archive_page(html_archive, blog_id, post.post_id, post_url, html)
+    metrics.inc('http_posts')
+    return post
+
+
+class _PostJob:
+    """블로그 하나의 Phase 2 작업 (URL 큐, 결과 큐, 크롤링 설정)"""
+
+    def __init__(self, post_urls: List[str], blog_id: str, timeout: int, rate_limiter: AdaptiveRateLimiter,
+                 readiness: ReadinessConfig, http_fetcher: Optional[HttpFetcher],
+                 html_archive: Optional[HtmlArchive], postprocess: bool, retry_policy: RetryPolicy,
+                 metrics: CrawlMetrics):
+        self.url_queue: "queue.Queue[str]" = queue.Queue()
+        for post_url in post_urls:
+            self.url_queue.put(post_url)
+        self.result_queue: "queue.Queue" = queue.Queue()
+        self.stop_event = threading.Event()
+        self.blog_id = blog_id
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.readiness = readiness
+        self.http_fetcher = http_fetcher
+        self.html_archive = html_archive
+        self.postprocess = postprocess
+        self.retry_policy = retry_policy
+        self.metrics = metrics
+
+
+def _crawl_next_post(lease: PageLease, job: _PostJob, label: str = "포스트") -> bool:
+    """URL 큐에서 하나를 꺼내 크롤링하고 (url, post, error)를 result_queue에 넣음 (큐가 비었으면 False)
+
+    큐에서 꺼낸 URL은 어떤 예외가 나도 결과나 실패로 전달한다 (스레드가 죽어 URL이 사라지지 않도록).
+    """
+    try:
+        post_url = job.url_queue.get_nowait()
+    except queue.Empty:
+        return False
+
+    # HTTP로 수집 가능하면 브라우저를 사용하지 않음
+    # (요청마다 rate_limiter로 호스트별 간격 유지, 전체 작업 스레드 공통)
+    try:
+        post = (crawl_post_http(job.http_fetcher, post_url, job.blog_id, job.html_archive, job.postprocess,
+                                job.rate_limiter, job.metrics)
+                if job.http_fetcher else None)
+    except Exception as e:
+        job.result_queue.put((post_url, None, e))
+        return True
+    if post is not None:
+        job.result_queue.put((post_url, post, None))
+        return True
+
+    # 페이지가 닫혔거나 브라우저가 크래시되면 시도마다 lease.page가 새로 생성
+    try:
+        post = crawl_post_detail_mobile(lease, post_url, job.timeout, job.blog_id, job.readiness,
+                                        job.html_archive, job.postprocess, job.rate_limiter, job.retry_policy,
+                                        job.metrics)
+        job.result_queue.put((post_url, post, None))
+    except Exception as e:
+        job.result_queue.put((post_url, None, e))
+    lease.used()
+    log_blocked(lease.pool.blocking_stats, label)
+    return True
+
+
+def _post_worker(worker_id: int, inbox: "queue.Queue", pool_factory: Callable[[], BrowserPool]) -> None:
+    """PostWorkerGroup 작업 스레드: inbox로 받은 블로그 작업을 차례로 처리
+
+    Playwright sync API 객체는 스레드 간에 공유할 수 없으므로 브라우저 풀과 페이지 대여는
+    이 스레드 안에서 만들고 그룹을 닫을 때까지 유지한다. 작업마다 끝나면 result_queue에 None을 넣는다.
+    """
+    pool = None
+    lease = None
+    try:
+        while True:
+            job = inbox.get()
+            if job is None:
+                break
+            try:
+                if pool is None:
+                    pool = pool_factory()
+                    lease = pool.lease_page()
+                while not job.stop_event.is_set() and _crawl_next_post(lease, job, f"[작업 {worker_id}] 포스트"):
+                    pass
+            except Exception as e:
+                print(f"[오류] 작업 스레드 {worker_id} 실행 실패: {e}")
+            finally:
+                job.result_queue.put(None)  # 작업 종료 신호
+    finally:
+        if lease:
+            lease.close()
+        if pool:
+            pool.close()
+
+
+class PostWorkerGroup:
+    """Phase 2 동시 크롤링 작업 스레드 묶음 (여러 블로그에서 재사용)
+
+    작업 스레드마다 pool_factory로 만든 브라우저 풀과 페이지 대여를 close()까지 유지하므로
+    블로그마다 Chromium을 새로 띄우지 않고, 컨텍스트 재활용(페이지 수/JS 힙)도 블로그를 넘어 누적된다.
+    브라우저는 처음 브라우저 경로가 필요할 때 실행된다 (HTTP로 모두 수집되면 실행하지 않음).
+    crawl_by_blog_id를 호출한 스레드도 자기 페이지 대여로 같은 URL 큐를 처리하므로
+    post_workers개 페이지로 크롤링하려면 size = post_workers - 1로 만든다.
+    """
+
+    def __init__(self, size: int, pool_factory: Optional[Callable[[], BrowserPool]] = None):
+        self.size = max(0, size)
+        self.pool_factory = pool_factory or BrowserPool
+        self._inboxes: List["queue.Queue"] = []
+        self._threads: List[threading.Thread] = []
+
+    def submit(self, job: _PostJob, count: int) -> int:
+        """작업 스레드 count개(최대 size개)에 작업 전달, 전달한 스레드 수 반환"""
+        if not self._threads:
+            for worker_id in range(1, self.size + 1):
+                inbox: "queue.Queue" = queue.Queue()
+                thread = threading.Thread(target=_post_worker, args=(worker_id, inbox, self.pool_factory),
+                                          daemon=True)
+                thread.start()
+                self._inboxes.append(inbox)
+                self._threads.append(thread)
+        count = max(0, min(count, self.size))
+        for inbox in self._inboxes[:count]:
+            inbox.put(job)
+        return count
+
+    def close(self) -> None:
+        """작업 스레드와 각 스레드의 브라우저 종료"""
+        for inbox in self._inboxes:
+            inbox.put(None)
+        for thread in self._threads:
+            thread.join(timeout=30)
+        self._inboxes.clear()
+        self._threads.clear()
+
+    def __enter__(self) -> "PostWorkerGroup":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _crawl_posts_concurrently(
+    post_urls: List[str],
+    blog_id: str,
+    timeout: int,
+    rate_limiter: AdaptiveRateLimiter,
+    post_workers: int,
+    lease: PageLease,
+    worker_group: PostWorkerGroup,
+    readiness: ReadinessConfig,
+    http_fetcher: Optional[HttpFetcher],
+    should_stop: Optional[Callable[[], bool]],
+    on_post: Callable[[Post], None],
+    on_progress: Callable[[int], None],
+    html_archive: Optional[HtmlArchive] = None,
+    postprocess: bool = True,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    on_failure: Optional[Callable[[str, Exception], None]] = None,
+    metrics: CrawlMetrics = NULL_METRICS
+) -> None:
+    """Phase 2 동시 크롤링
+
+    하나의 URL 큐를 호출한 스레드(lease)와 worker_group의 작업 스레드(최대 post_workers - 1개)가 나눠 처리한다.
+    결과 처리(on_post, on_progress)는 호출한 스레드에서만 실행되므로
+    저장 콜백과 saved_urls 갱신은 기존과 같이 단일 스레드에서 이루어진다.
+    """
+    job = _PostJob(post_urls, blog_id, timeout, rate_limiter, readiness, http_fetcher, html_archive,
+                   postprocess, retry_policy, metrics)
+    helper_count = worker_group.submit(job, min(post_workers, len(post_urls)) - 1)
+    print(f"[단계] Phase 2 동시 크롤링: 작업 페이지 {helper_count + 1}개, "
+          f"현재 초당 {rate_limiter.rate():.1f}건부터 응답에 따라 조절")
+
+    completed = 0
+
+    def handle(item) -> None:
+        nonlocal completed
+        post_url, post, error = item
+        completed += 1
+        on_progress(completed)
+
+        if error is not None:
+            print(f"[오류] 포스트 크롤링 실패: {post_url}, 오류: {error}")
+            if on_failure:
+                on_failure(post_url, error)
+            return
+
+        try:
+            on_post(post)
+        except Exception as e:
+            print(f"[오류] 포스트 처리 실패: {post_url}, 오류: {e}")
+
+    finished_helpers = 0
+    caller_active = True
+    while caller_active or finished_helpers < helper_count:
+        if should_stop and should_stop() and not job.stop_event.is_set():
+            print("[경고] 크롤링이 중단되었습니다. 진행 중인 포스트 완료 후 종료합니다...")
+            job.stop_event.set()
+
+        # 호출한 스레드도 포스트 하나씩 처리하고, 그 사이 쌓인 결과를 모두 처리
+        if caller_active:
+            caller_active = not job.stop_event.is_set() and _crawl_next_post(lease, job)
+        items = []
+        try:
+            items.append(job.result_queue.get(block=not caller_active, timeout=0.5))
+            while True:
+                items.append(job.result_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        for item in items:
+            if item is None:
+                finished_helpers += 1
+            else:
+                handle(item)
 
 
 def crawl_by_blog_id(
@@ -710,7 +983,21 @@ def crawl_by_blog_id(
     save_callback: Optional[Callable[[List[Post]], None]] = None,
     save_interval: int = 10,
     progress_callback: Optional[Callable[[int, int], None]] = None,
-    headless: bool = True
+    headless: bool = True,
+    post_workers: int = 1,
+    browser_pool: Optional[BrowserPool] = None,
+    post_worker_group: Optional[PostWorkerGroup] = None,
+    readiness: ReadinessConfig = DEFAULT_READINESS,
+    blocking_profile: Optional[BlockingProfile] = DEFAULT_BLOCKING_PROFILE,
+    http_fetcher: Optional[HttpFetcher] = None,
+    known_post_ids: Optional[Set[str]] = None,
+    html_policy: str = 'keep',
+    html_store: Optional[HtmlStore] = None,
+    html_archive: Optional[HtmlArchive] = None,
+    post_processor: Optional[PostProcessor] = None,
+    rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    metrics: Optional[CrawlMetrics] = None
 ) -> Tuple[dict, List[Post]]:
     """
     블로그 ID 기반 크롤링
@@ -719,14 +1006,41 @@ def crawl_by_blog_id(
         blog_id: 크롤링할 블로그 ID
         max_posts: 최대 수집 포스트 수
         start_date: 수집 시작 날짜 (미구현)
-        delay: 요청 간 딜레이 (초)
+        delay: 포스트 요청 시작 간격의 초기값 (초, 이후 응답 시간/오류에 따라 rate_limiter가 조절)
         timeout: 페이지 로딩 타임아웃 (초)
         should_stop: 중단 확인 콜백 함수
         all_post_urls: 전체 포스트 링크 목록 (재개 모드에서 사용)
         crawled_urls: 이미 크롤링된 포스트 URL 목록 (재개 모드에서 사용)
+        post_workers: Phase 2 동시 작업 페이지 수 (1이면 순차 크롤링,
+            2 이상이면 호출한 스레드와 작업 스레드 post_workers - 1개가 URL 큐를 공유해 동시 크롤링하며
+            delay는 호스트별 요청 간격으로 적용됨)
+        browser_pool: 재사용할 브라우저 풀 (None이면 이 호출에서만 쓰는 풀을 만들고 종료 시 닫음,
+            전달된 풀은 닫지 않으므로 여러 블로그에서 같은 브라우저를 재사용할 수 있음)
+        post_worker_group: 재사용할 Phase 2 작업 스레드 묶음 (None이면 post_workers가 2 이상일 때
+            이 호출에서만 쓰는 묶음을 만들고 종료 시 닫음, 전달하면 작업 스레드의 브라우저를
+            여러 블로그에서 재사용)
+        readiness: 본문/해시태그/댓글 로딩 최대 대기 시간 설정
+        blocking_profile: 이미지/미디어/폰트/광고 요청 차단 설정 (None이면 차단하지 않음,
+            browser_pool을 전달한 경우 풀의 설정을 따름)
+        http_fetcher: 지정하면 Phase 2에서 포스트를 먼저 HTTP로 수집하고,
+            댓글/해시태그 확장 등 JavaScript가 필요한 포스트만 브라우저로 크롤링
+        known_post_ids: 이미 수집한 포스트 ID 집합 (증분 모드, Phase 1에서 이미 수집한
+            포스트가 나오면 스크롤을 멈추고 새 포스트만 크롤링)
+        html_policy: 포스트를 만든 직후 content.html/markdown 처리 방식
+            ('keep': 유지, 'drop': 버림, 'spill': html_store에 저장하고 해시만 남김)
+        html_store: html_policy='spill'일 때 원본 HTML을 저장할 HtmlStore
+        html_archive: 지정하면 포스트 페이지 HTML을 압축 아카이브에 저장 (오프라인 재추출용)
+        post_processor: 본문 후처리(텍스트 정리, 단어 수, 링크 정규화, 마크다운) 프로세스 풀
+            (None이면 크롤링 스레드에서 처리, 어느 쪽이든 저장 콜백에는 크롤링 순서대로 전달)
+        rate_limiter: 호스트별 요청 간격 조절기 (None이면 delay로 시작하는 AdaptiveRateLimiter 생성,
+            여러 블로그에서 같은 조절기를 넘기면 현재 속도를 이어받고 rate()로 조회 가능)
+        retry_policy: 포스트 재시도 정책 (일시적 오류만 지수 백오프로 재시도)
+        metrics: 단계별 소요 시간과 카운터(posts, retries, failed_posts, 바이트)를 기록할 CrawlMetrics
+            (None이면 기록하지 않음, 포스트마다 publish()를 호출하므로 싱크에 주기적으로 전달됨)
     
     Returns:
         Tuple[블로그 메타데이터, 포스트 목록]
+        (재시도 후에도 실패한 URL은 블로그 메타데이터의 failed_urls에 오류 종류와 함께 기록)
     """
     # 입력값 검증
     if not blog_id or not blog_id.strip():
@@ -739,6 +1053,13 @@ def crawl_by_blog_id(
         timeout = 10
     if timeout > 300:
         timeout = 300
+    if post_workers < 1:
+        post_workers = 1
+    if rate_limiter is None:
+        rate_limiter = AdaptiveRateLimiter(delay)
+    if metrics is None:
+        metrics = NULL_METRICS
+    validate_html_policy(html_policy, html_store)
     
     # 블로그 메타데이터 수집
     blog_info = {
@@ -753,19 +1074,14 @@ def crawl_by_blog_id(
     if all_post_urls:
         post_urls = all_post_urls
         print(f"[단계] 재개 모드: 체크포인트에서 전체 링크 목록 {len(post_urls)}개 로드")
-        # 재개 모드에서는 브라우저 초기화를 나중에 (Phase 2에서)
-        browser = None
-        playwright = None
-        page = None
-    else:
-        # 브라우저 초기화
-        playwright = sync_playwright().start()
-        browser = playwright.chromium.launch(headless=headless)
-        
-        # 모바일 디바이스 설정 (iPhone 12)
-        device = playwright.devices['iPhone 12']
-        context = browser.new_context(**device)
-        page = context.new_page()
+    
+    # 브라우저 풀 (전달받지 않은 경우에만 직접 만들고 종료 시 닫음)
+    owns_pool = browser_pool is None
+    if owns_pool:
+        browser_pool = BrowserPool(headless=headless, blocking_profile=blocking_profile)
+    # 모바일 디바이스(iPhone 12) 페이지는 lease.page에 처음 접근할 때 생성
+    # (재개 모드나 동시 크롤링에서는 메인 스레드 페이지를 만들지 않음)
+    lease = browser_pool.lease_page()
     
     try:
         # 재개 모드가 아닐 때만 블로그 존재 여부 확인
@@ -773,7 +1089,9 @@ def crawl_by_blog_id(
             # 블로그 메인 페이지 접속
             blog_main_url = f"https://m.blog.naver.com/{blog_id}"
             print(f"[단계] 블로그 메인 페이지 접속: {blog_main_url}")
+            page = lease.page
             page.goto(blog_main_url, wait_until='domcontentloaded', timeout=timeout * 1000)
+            lease.used()
             time.sleep(2)
             
             # 블로그 존재 여부 확인
@@ -785,13 +1103,26 @@ def crawl_by_blog_id(
             # Phase 1: 링크 수집
             post_list_url = f"https://m.blog.naver.com/{blog_id}?categoryNo=0&listStyle=post&tab=1"
             print(f"[단계] 포스트 목록 페이지 접속: {post_list_url}")
-            page.goto(post_list_url, wait_until='domcontentloaded', timeout=timeout * 1000)
-            time.sleep(5)  # 페이지 로딩 대기
-            
-            post_urls = _collect_all_post_links(page, blog_id, max_posts, timeout)
+            # 무한 스크롤의 글 목록 API 응답을 첫 페이지부터 수집
+            collector = PostListCollector(blog_id)
+            collector.attach(page)
+            try:
+                page.goto(post_list_url, wait_until='domcontentloaded', timeout=timeout * 1000)
+                lease.used()
+                time.sleep(5)  # 페이지 로딩 대기
+                
+                post_urls = _collect_all_post_links(page, blog_id, max_posts, timeout, known_post_ids, collector)
+            finally:
+                collector.detach(page)
+            log_blocked(browser_pool.blocking_stats, "목록 페이지")
             
             if not post_urls:
-                print("[경고] 수집된 링크가 없습니다")
+                if known_post_ids:
+                    print("[단계] 증분 모드: 새 포스트가 없습니다")
+                    blog_info['all_post_urls'] = []
+                    blog_info['total_posts'] = 0
+                else:
+                    print("[경고] 수집된 링크가 없습니다")
                 return blog_info, []
         
         # 전체 링크 목록을 blog_info에 저장 (재개 시 사용)
@@ -801,21 +1132,10 @@ def crawl_by_blog_id(
         # should_stop 확인
         if should_stop and should_stop():
             print("[경고] 크롤링이 중단되었습니다. 브라우저 종료 중...")
-            if browser:
-                browser.close()
-            if playwright:
-                playwright.stop()
             return blog_info, []
         
         # Phase 2: 상세 크롤링
-        # 재개 모드인 경우 브라우저 초기화 (이제 필요함)
-        if all_post_urls and (browser is None or page is None):
-            playwright = sync_playwright().start()
-            browser = playwright.chromium.launch(headless=headless)
-            device = playwright.devices['iPhone 12']
-            context = browser.new_context(**device)
-            page = context.new_page()
-            print(f"[단계] 재개 모드: 브라우저 초기화 완료")
+        # (순차 크롤링은 lease를 사용, 동시 크롤링은 lease와 작업 스레드 묶음의 브라우저 풀이 함께 처리)
         
         # 이미 크롤링된 포스트 URL 목록이 있으면 제외
         crawled_urls_list = crawled_urls or []
@@ -828,67 +1148,128 @@ def crawl_by_blog_id(
         
         if not post_urls:
             print("[경고] 크롤링할 남은 포스트가 없습니다")
-            if browser:
-                browser.close()
-            if playwright:
-                playwright.stop()
             blog_info['total_posts'] = 0
             return blog_info, []
         
         posts = []
         saved_urls = []  # 저장 콜백에서 저장된 포스트 URL 추적
+        failed_urls = []  # 재시도 후에도 실패한 URL (체크포인트의 실패 목록으로 기록)
         total_urls = blog_info['total_post_urls']  # 전체 링크 수 (원래 순서 표시용)
         crawled_count = len(crawled_urls_list)
         
-        for idx, post_url in enumerate(post_urls, 1):
-            # should_stop 확인
-            if should_stop and should_stop():
-                current_idx = crawled_count + idx
-                print(f"[경고] 크롤링이 중단되었습니다. ({current_idx}/{total_urls})")
-                break
+        def record_post(post: Post) -> None:
+            """크롤링된 포스트 추가 및 저장 간격마다 저장 콜백 호출"""
+            # 저장 간격까지 버퍼에 두기 전에 무거운 필드부터 비움 (버퍼 메모리 = 가벼운 포스트 × 저장 간격)
+            posts.append(release_heavy_fields(post, html_policy, html_store))
             
-            try:
-                current_idx = crawled_count + idx
-                print(f"[단계] [{current_idx}/{total_urls}] 포스트 크롤링 중...")
-                
-                # 진행상황 업데이트
+            if save_callback and len(posts) >= save_interval:
+                print(f"[단계] 저장 간격 도달: {len(posts)}개 포스트 저장 중...")
+                # 저장할 포스트의 URL 저장
+                saved_urls.extend([p.url for p in posts])
+                with metrics.timer('save'):
+                    save_callback(posts.copy())
+                posts.clear()  # 저장 후 메모리 비우기
+                import gc
+                gc.collect()  # 가비지 컬렉션 강제 실행
+                print(f"[단계] 메모리 비우기 완료.")
+        
+        # 크롤링 스레드는 페이지에서 원본 값만 읽고 후처리는 파이프라인에서 (순서 유지)
+        # 출력에 쓰지 않는 마크다운은 html_policy='keep'일 때만 만듦
+        pipeline = PostPipeline(record_post, post_processor, markdown=html_policy == 'keep')
+        
+        def submit_post(post: Post) -> None:
+            metrics.inc('posts')
+            pipeline.submit(post)
+            metrics.publish()
+        
+        def record_failure(post_url: str, error: Exception) -> None:
+            metrics.inc('failed_posts')
+            failed_urls.append(failure_record(post_url, classify_error(error)))
+        
+        if post_workers > 1:
+            def report_progress(completed: int) -> None:
+                current_idx = crawled_count + completed
+                print(f"[단계] [{current_idx}/{total_urls}] 포스트 크롤링 완료")
                 if progress_callback:
                     progress_callback(current_idx, total_urls)
-                
-                # progress_callback 후 should_stop 확인 (중단 요청 확인)
+            
+            owns_group = post_worker_group is None
+            if owns_group:
+                post_worker_group = PostWorkerGroup(post_workers - 1, partial(
+                    BrowserPool, headless=browser_pool.headless,
+                    max_pages_per_context=browser_pool.max_pages_per_context,
+                    max_heap_mb=browser_pool.max_heap_mb, blocking_profile=browser_pool.blocking_profile
+                ))
+            try:
+                _crawl_posts_concurrently(
+                    post_urls,
+                    blog_id,
+                    timeout,
+                    rate_limiter,
+                    post_workers,
+                    lease,
+                    post_worker_group,
+                    readiness,
+                    http_fetcher,
+                    should_stop,
+                    on_post=submit_post,
+                    on_progress=report_progress,
+                    html_archive=html_archive,
+                    postprocess=False,
+                    retry_policy=retry_policy,
+                    on_failure=record_failure,
+                    metrics=metrics
+                )
+            finally:
+                if owns_group:
+                    post_worker_group.close()
+        else:
+            for idx, post_url in enumerate(post_urls, 1):
+                # should_stop 확인
                 if should_stop and should_stop():
+                    current_idx = crawled_count + idx
                     print(f"[경고] 크롤링이 중단되었습니다. ({current_idx}/{total_urls})")
                     break
+            
+                try:
+                    current_idx = crawled_count + idx
+                    print(f"[단계] [{current_idx}/{total_urls}] 포스트 크롤링 중...")
                 
-                post = crawl_post_detail_mobile(page, post_url, timeout, blog_id)
-                posts.append(post)
+                    # 진행상황 업데이트
+                    if progress_callback:
+                        progress_callback(current_idx, total_urls)
                 
-                # 저장 간격마다 저장 콜백 호출
-                if save_callback and len(posts) >= save_interval:
-                    print(f"[단계] 저장 간격 도달: {len(posts)}개 포스트 저장 중...")
-                    # 저장할 포스트의 URL 저장
-                    saved_urls.extend([p.url for p in posts])
-                    save_callback(posts.copy())
-                    posts.clear()  # 저장 후 메모리 비우기
-                    import gc
-                    gc.collect()  # 가비지 컬렉션 강제 실행
-                    print(f"[단계] 메모리 비우기 완료.")
+                    # progress_callback 후 should_stop 확인 (중단 요청 확인)
+                    if should_stop and should_stop():
+                        print(f"[경고] 크롤링이 중단되었습니다. ({current_idx}/{total_urls})")
+                        break
                 
-                # 딜레이
-                if idx < len(post_urls):
-                    time.sleep(delay)
+                    # HTTP로 수집 가능하면 브라우저를 사용하지 않음
+                    # (요청 전 rate_limiter의 호스트별 간격만큼 대기, 고정 딜레이 없음)
+                    post = (crawl_post_http(http_fetcher, post_url, blog_id, html_archive, postprocess=False,
+                                            rate_limiter=rate_limiter, metrics=metrics)
+                            if http_fetcher else None)
+                    if post is None:
+                        post = crawl_post_detail_mobile(lease, post_url, timeout, blog_id, readiness,
+                                                        html_archive, postprocess=False, rate_limiter=rate_limiter,
+                                                        retry_policy=retry_policy, metrics=metrics)
+                        lease.used()
+                        log_blocked(browser_pool.blocking_stats)
+                    submit_post(post)
                     
-            except Exception as e:
-                print(f"[오류] 포스트 크롤링 실패: {post_url}, 오류: {e}")
-                continue
+                except Exception as e:
+                    print(f"[오류] 포스트 크롤링 실패: {post_url}, 오류: {e}")
+                    record_failure(post_url, e)
+                    continue
+        
+        # 후처리 중인 포스트를 모두 저장 콜백/버퍼로 넘김
+        pipeline.flush()
         
         # 저장된 URL 정보를 blog_info에 추가
         blog_info['saved_urls'] = saved_urls
-        
-        if browser:
-            browser.close()
-        if playwright:
-            playwright.stop()
+        blog_info['failed_urls'] = failed_urls
+        if failed_urls:
+            print(f"[경고] 실패한 포스트 {len(failed_urls)}개 (실패 목록에 기록)")
         
         # 저장 콜백에서 저장된 포스트는 제외하고 남은 포스트만 반환
         # (저장 콜백에서 이미 저장되었으므로)
@@ -900,10 +1281,9 @@ def crawl_by_blog_id(
         
         return blog_info, posts
         
-    except Exception as e:
-        if browser:
-            browser.close()
-        if playwright:
-            playwright.stop()
-        raise
+    finally:
+        # 빌린 컨텍스트 반납, 직접 만든 풀만 브라우저 종료
+        lease.close()
+        if owns_pool:
+            browser_pool.close()
 
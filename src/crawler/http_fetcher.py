@@ -0,0 +1,173 @@
+"""
+HTTP 직접 요청 모듈
+브라우저 없이 포스트 페이지 HTML을 가져오는 keep-alive 연결 풀
+"""
+import gzip
+import http.client
+import threading
+import zlib
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from src.utils.exceptions import NetworkError
+
+
+# iPhone 12 Safari (Playwright devices['iPhone 12']와 같은 모바일 페이지를 받도록)
+MOBILE_USER_AGENT = (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 14_4 like Mac OS X) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/14.0.3 Mobile/15E148 Safari/604.1"
+)
+
+# 재사용 중인 연결이 서버에서 끊긴 경우 (새 연결로 한 번 재시도)
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class HttpFetcher:
+    """keep-alive 연결 풀 기반 HTTP 클라이언트 (스레드 안전)
+
+    호스트별로 유휴 연결을 보관해 포스트마다 TCP/TLS 연결을 새로 맺지 않는다.
+    base_url을 지정하면 모든 요청의 scheme/host를 바꿔 보낸다 (로컬 fixture 서버 테스트용).
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30,
+        max_idle_per_host: int = 4,
+        max_redirects: int = 5,
+        base_url: Optional[str] = None,
+        user_agent: str = MOBILE_USER_AGENT
+    ):
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.max_redirects = max_redirects
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.user_agent = user_agent
+        self.request_count = 0
+        self.connection_count = 0  # 새로 맺은 연결 수 (요청 수보다 적으면 재사용된 것)
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._closed = False
+
+    def _rewrite(self, url: str) -> str:
+        """base_url이 있으면 같은 경로로 요청 대상 변경"""
+        if not self.base_url:
+            return url
+        parsed = urlparse(url)
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+        return self.base_url + path
+
+    def _acquire(self, scheme: str, host: str) -> Tuple[http.client.HTTPConnection, bool]:
+        """(연결, 재사용 여부) 반환"""
+        with self._lock:
+            idle = self._idle.get((scheme, host))
+            if idle:
+                return idle.pop(), True
+            self.connection_count += 1
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return connection_class(host, timeout=self.timeout), False
+
+    def _release(self, scheme: str, host: str, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, host), [])
+            if not self._closed and len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _request_once(self, url: str) -> Tuple[int, Dict[str, str], bytes]:
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https'):
+            raise NetworkError(f"지원하지 않는 URL입니다: {url}")
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+        headers = {
+            'User-Agent': self.user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'ko-KR,ko;q=0.9',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        }
+
+        for attempt in range(2):
+            connection, reused = self._acquire(parsed.scheme, parsed.netloc)
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()  # 연결 재사용을 위해 본문은 항상 끝까지 읽음
+            except _STALE_CONNECTION_ERRORS as e:
+                connection.close()
+                if reused and attempt == 0:
+                    continue  # 오래된 keep-alive 연결이면 새 연결로 재시도
+                raise NetworkError(f"연결 실패: {url}, 오류: {e}")
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                raise NetworkError(f"요청 실패: {url}, 오류: {e}")
+
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(parsed.scheme, parsed.netloc, connection)
+            with self._lock:
+                self.request_count += 1
+            return response.status, response_headers, body
+
+        raise NetworkError(f"연결 실패: {url}")
+
+    def fetch(self, url: str) -> Tuple[int, str]:
+        """GET 요청 후 (상태 코드, 디코딩된 본문) 반환 (리다이렉트는 따라감)
+
+        Raises:
+            NetworkError: 연결 또는 요청 실패, 리다이렉트 횟수 초과
+        """
+        target = self._rewrite(url)
+        for _ in range(self.max_redirects + 1):
+            status, headers, body = self._request_once(target)
+            if status in (301, 302, 303, 307, 308) and headers.get('location'):
+                target = self._rewrite(urljoin(target, headers['location']))
+                continue
+            return status, _decode_body(headers, body)
+        raise NetworkError(f"리다이렉트 횟수 초과: {url}")
+
+    def close(self) -> None:
+        """유휴 연결 모두 종료"""
+        with self._lock:
+            self._closed = True
+            connections = [connection for idle in self._idle.values() for connection in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+    def __enter__(self) -> "HttpFetcher":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _decode_body(headers: Dict[str, str], body: bytes) -> str:
+    """Content-Encoding 해제 후 Content-Type의 charset(기본 UTF-8)으로 디코딩 (압축 해제 실패는 NetworkError)"""
+    encoding = headers.get('content-encoding', '').lower()
+    try:
+        if encoding == 'gzip':
+            body = gzip.decompress(body)
+        elif encoding == 'deflate':
+            try:
+                body = zlib.decompress(body)
+            except zlib.error:
+                body = zlib.decompress(body, -zlib.MAX_WBITS)
+    except (OSError, EOFError, zlib.error) as e:
+        # 잘린/손상된 압축 응답은 네트워크 오류로 처리 (호출자가 브라우저로 대체)
+        raise NetworkError(f"응답 압축 해제 실패 ({encoding}): {e}")
+
+    charset = 'utf-8'
+    content_type = headers.get('content-type', '')
+    if 'charset=' in content_type:
+        charset = content_type.split('charset=')[-1].split(';')[0].strip().strip('"') or 'utf-8'
+    try:
+        return body.decode(charset, errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
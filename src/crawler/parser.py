@@ -3,11 +3,18 @@ HTML 파싱 모듈
 해시태그, 댓글, 본문, 메타데이터 추출
 """
 import re
-import time
 from typing import List, Optional, Tuple
 from playwright.sync_api import Page
 
 from src.models import PostMetadata, PostContent, Comment
+from src.crawler.scripts import (
+    TAGS_JS, SECRET_COMMENTS_ONLY_JS, COMMENTS_JS,
+    CONTENT_CONTAINER_JS, CONTENT_TEXT_JS
+)
+from src.crawler.readiness import (
+    ReadinessConfig, DEFAULT_READINESS, count_tag_links, wait_for_tags_changed,
+    click_and_wait_for_comment_api, wait_for_comment_area, wait_for_comments
+)
 from src.utils.exceptions import ParsingError
 
 
@@ -26,8 +33,8 @@ def extract_number(page: Page, selectors: List[str]) -> int:
     return 0
 
 
-def extract_tags(page: Page) -> List[str]:
-    """해시태그 추출 (확장 버튼 클릭 후)"""
+def extract_tags(page: Page, readiness: ReadinessConfig = DEFAULT_READINESS) -> List[str]:
+    """해시태그 추출 (확장 버튼 클릭 후 목록이 늘어날 때까지 대기)"""
     tags = []
     
     # 해시태그 확장 버튼 찾기
@@ -51,10 +58,10 @@ def extract_tags(page: Page) -> List[str]:
     # 확장 버튼 클릭
     if expand_button:
         try:
-            expand_button.scroll_into_view_if_needed()
-            time.sleep(0.5)
+            before = count_tag_links(page)
+            # click()이 스크롤과 클릭 가능 상태를 자동으로 기다리므로 별도 대기 없음
             expand_button.click(timeout=5000)
-            time.sleep(2)  # 해시태그 로딩 대기
+            wait_for_tags_changed(page, before, readiness)  # 해시태그 로딩 대기
         except Exception as e:
             print(f"[경고] 해시태그 확장 버튼 클릭 실패: {e}")
     
@@ -90,30 +97,19 @@ def extract_tags(page: Page) -> List[str]:
     # JavaScript Fallback
     if not tags:
         try:
-            tags = page.evaluate("""() => {
-                const tags = [];
-                const tagLinks = document.querySelectorAll(
-                    'a.tag__tFC3j[data-click-area="pst.tag"], a.tag__tFC3j'
-                );
-                tagLinks.forEach(link => {
-                    const text = (link.textContent || link.innerText || '').trim();
-                    if (text) {
-                        const tagName = text.replace(/^#+/, '').trim();
-                        if (tagName && !tags.includes(tagName)) {
-                            tags.push(tagName);
-                        }
-                    }
-                });
-                return tags;
-            }""")
+            tags = page.evaluate(TAGS_JS)
         except Exception as e:
             print(f"[경고] JavaScript Fallback 실패: {e}")
     
     return list(set(tags))  # 중복 제거
 
 
-def extract_comments(page: Page, comment_count: Optional[int] = None) -> Tuple[List[Comment], bool]:
-    """댓글 추출 (댓글 버튼 클릭 후)
+def extract_comments(
+    page: Page,
+    comment_count: Optional[int] = None,
+    readiness: ReadinessConfig = DEFAULT_READINESS
+) -> Tuple[List[Comment], bool]:
+    """댓글 추출 (댓글 버튼 클릭 후 댓글 API 응답과 댓글 영역 로드 대기)
     
     Returns:
         (comments, is_secret_only): 댓글 리스트와 비밀 댓글 여부
@@ -144,170 +140,18 @@ def extract_comments(page: Page, comment_count: Optional[int] = None) -> Tuple[L
     if not comment_button:
         return comments, False
     
-    # 댓글 버튼 클릭
+    # 댓글 버튼 클릭 (댓글 API 응답이 올 때까지 대기)
     try:
-        comment_button.click()
-        # 댓글 영역이 로드될 때까지 최소 대기 (비밀 댓글 확인을 위해)
-        # 짧은 대기 후 즉시 비밀 댓글 확인 시도
+        click_and_wait_for_comment_api(page, comment_button, readiness)
     except Exception:
         return comments, False
     
     # 비밀 댓글 확인 (모든 댓글이 비밀 댓글이면 빠르게 패스)
-    # 댓글 영역이 로드될 때까지 짧은 대기 후 확인
     try:
-        # 최소 대기 (댓글 영역 로딩 대기) - 0.3초로 조정
-        time.sleep(0.3)  # 댓글 영역 로딩 최소 대기
+        # 댓글 영역이 로드될 때까지 대기 (로드되면 즉시 진행)
+        wait_for_comment_area(page, readiness)
         
-        # 댓글 영역이 로드될 때까지 최대 1초까지 대기 (0.1초 간격으로 확인)
-        for _ in range(7):  # 최대 7번 시도 (0.3 + 0.1*7 = 1.0초)
-            has_comment_area = page.evaluate("""() => {
-                // 먼저 페이지 전체에서 "비밀 댓글입니다" 확인 (빠른 확인)
-                if (document.body.textContent.includes('비밀 댓글입니다.')) {
-                    return true;  // 비밀 댓글이 있으면 즉시 true 반환
-                }
-                
-                const selectors = [
-                    '#naverComment_wai_u_cbox_content_wrap_tabpanel',
-                    '[role="tabpanel"]',
-                    '.u_cbox_list',
-                    '.u_cbox_content_wrap',
-                    '#cbox_module'
-                ];
-                for (const selector of selectors) {
-                    const elem = document.querySelector(selector);
-                    if (elem && elem.textContent && elem.textContent.trim().length > 0) {
-                        return true;
-                    }
-                }
-                return false;
-            }""")
-            
-            if has_comment_area:
-                break  # 댓글 영역이 로드되었으면 중단
-            
-            time.sleep(0.1)  # 추가 대기 (0.1초로 단축)
-        
-        is_secret_only = page.evaluate("""() => {
-            // 전체 페이지에서 "비밀 댓글입니다." 텍스트 확인 (빠른 확인)
-            const pageText = document.body.textContent || '';
-            if (!pageText.includes('비밀 댓글입니다.')) {
-                return false;  // 비밀 댓글이 없으면 false
-            }
-            
-            // 댓글 영역 전체 텍스트 확인 (빠른 확인)
-            // 여러 선택자로 댓글 영역 찾기
-            const selectors = [
-                '#naverComment_wai_u_cbox_content_wrap_tabpanel',
-                '[role="tabpanel"]',
-                '.u_cbox_list',
-                '.u_cbox_content_wrap',
-                '#cbox_module',
-                '.u_cbox',
-                '[id*="comment"]',
-                '[class*="comment"]'
-            ];
-            
-            let commentArea = null;
-            for (const selector of selectors) {
-                commentArea = document.querySelector(selector);
-                if (commentArea) break;
-            }
-            
-            // 댓글 영역을 찾지 못했어도 페이지에 "비밀 댓글입니다"가 있으면 확인
-            if (!commentArea) {
-                // 전체 페이지에서 댓글 관련 요소 찾기
-                const allComments = document.querySelectorAll('li, div, span');
-                let secretFound = 0;
-                let normalFound = 0;
-                for (let i = 0; i < Math.min(allComments.length, 50); i++) {
-                    const elem = allComments[i];
-                    const text = elem.textContent || '';
-                    if (text.includes('비밀 댓글입니다.')) {
-                        secretFound++;
-                        // 비밀 댓글 텍스트가 있고 다른 내용이 거의 없으면
-                        if (text.trim().length < 50 && text.includes('비밀 댓글입니다.')) {
-                            return true;  // 비밀 댓글로 판단
-                        }
-                    }
-                    // 일반 댓글 확인 (닉네임이나 내용이 있는 경우)
-                    if (elem.querySelector('.u_cbox_nick, .u_cbox_contents') && !text.includes('비밀 댓글입니다.')) {
-                        normalFound++;
-                    }
-                }
-                // 비밀 댓글만 있고 일반 댓글이 없으면
-                if (secretFound > 0 && normalFound === 0) {
-                    return true;
-                }
-                return false;
-            }
-            
-            const areaText = commentArea.textContent || '';
-            
-            // "비밀 댓글입니다." 텍스트 확인 (빠른 확인)
-            if (!areaText.includes('비밀 댓글입니다.')) {
-                return false;  // 비밀 댓글이 없으면 false
-            }
-            
-            // 댓글 아이템 수 확인 (빠른 확인)
-            const commentItems = commentArea.querySelectorAll('li.u_cbox_comment, .u_cbox_comment, .u_cbox_list_item, li');
-            const commentCount = commentItems.length;
-            
-            if (commentCount === 0) {
-                // 댓글 아이템이 없어도 영역 텍스트에 "비밀 댓글입니다"만 있으면
-                const lines = areaText.split(/\\n|\\r/).filter(line => line.trim().length > 0);
-                const secretLines = lines.filter(line => line.includes('비밀 댓글입니다.')).length;
-                if (secretLines > 0 && lines.length <= secretLines * 2) {  // 비밀 댓글 관련 텍스트가 대부분이면
-                    return true;
-                }
-                return false;
-            }
-            
-            // 빠른 확인: 첫 3개 댓글만 확인 (더 빠른 확인)
-            // 첫 3개가 모두 비밀 댓글이면 전체가 비밀 댓글일 가능성 높음
-            let secretCount = 0;
-            let hasNormalComment = false;
-            
-            const checkCount = Math.min(commentCount, 3);  // 최대 3개만 확인 (더 빠르게)
-            for (let i = 0; i < checkCount; i++) {
-                const item = commentItems[i];
-                if (!item) continue;
-                const itemText = item.textContent || '';
-                // 비밀 댓글 확인
-                if (itemText.includes('비밀 댓글입니다.')) {
-                    secretCount++;
-                } else {
-                    // 일반 댓글 확인 (닉네임이나 내용이 있으면)
-                    const hasNick = item.querySelector('span.u_cbox_nick, .u_cbox_nick');
-                    const hasContent = item.querySelector('span.u_cbox_contents, .u_cbox_contents');
-                    if (hasNick || hasContent) {
-                        const nickText = hasNick ? (hasNick.textContent || '').trim() : '';
-                        const contentText = hasContent ? (hasContent.textContent || '').trim() : '';
-                        // 비밀 댓글 텍스트가 없고 내용이 있으면 일반 댓글
-                        if (nickText || (contentText && !contentText.includes('비밀 댓글입니다.'))) {
-                            hasNormalComment = true;
-                            break;  // 일반 댓글 발견 시 즉시 종료
-                        }
-                    }
-                }
-            }
-            
-            // 앞부분 3개가 모두 비밀 댓글이면 전체가 비밀 댓글일 가능성 높음
-            if (secretCount === checkCount && checkCount > 0 && !hasNormalComment) {
-                return true;  // 빠르게 판단하여 true 반환
-            }
-            
-            // 전체 영역 텍스트에서도 확인 (댓글 아이템이 적을 때)
-            if (commentCount <= 3 && areaText.includes('비밀 댓글입니다.') && !hasNormalComment) {
-                // 전체 텍스트가 "비밀 댓글입니다."만 포함하고 다른 내용이 거의 없으면
-                const lines = areaText.split(/\\n|\\r/).filter(line => line.trim().length > 0);
-                const secretLines = lines.filter(line => line.includes('비밀 댓글입니다.')).length;
-                if (secretLines >= lines.length * 0.8 || (secretLines > 0 && lines.length <= secretLines * 2)) {  // 80% 이상이 비밀 댓글 관련 텍스트면
-                    return true;
-                }
-            }
-            
-            return false;
-        }""")
+        is_secret_only = page.evaluate(SECRET_COMMENTS_ONLY_JS)
         
         if is_secret_only:
             print("[단계] 모든 댓글이 비밀 댓글입니다. 댓글 수집 건너뛰기 (크롤링 시간 단축)")
@@ -316,92 +160,12 @@ def extract_comments(page: Page, comment_count: Optional[int] = None) -> Tuple[L
         print(f"[경고] 비밀 댓글 확인 실패: {e}")
         pass  # 비밀 댓글 확인 실패 시 정상 진행
     
-    # 추가 로딩 대기 (비밀 댓글이 아닌 경우에만)
-    time.sleep(2)  # 일반 댓글 로딩 대기
+    # 댓글 목록 렌더링 대기 (비밀 댓글이 아닌 경우에만)
+    wait_for_comments(page, readiness)
     
     # JavaScript 기반 댓글 수집 (우선)
     try:
-        comments_data = page.evaluate("""() => {
-            const comments = [];
-            
-            // 방법 1: tabpanel로 찾기
-            const tabpanel = document.querySelector(
-                '#naverComment_wai_u_cbox_content_wrap_tabpanel, [role="tabpanel"]'
-            );
-            
-            let commentItems = [];
-            if (tabpanel) {
-                const list = tabpanel.querySelector('ul.u_cbox_list');
-                if (list) {
-                    commentItems = list.querySelectorAll('li.u_cbox_comment');
-                } else {
-                    commentItems = tabpanel.querySelectorAll('li.u_cbox_comment');
-                }
-            }
-            
-            // 방법 2: 전체 페이지에서 찾기
-            if (commentItems.length === 0) {
-                commentItems = document.querySelectorAll('li.u_cbox_comment, .u_cbox_comment');
-            }
-            
-            // 각 댓글 처리
-            commentItems.forEach(item => {
-                // 비밀 댓글 확인
-                const itemText = item.textContent || '';
-                if (itemText.includes('비밀 댓글입니다.')) {
-                    // 비밀 댓글은 건너뛰기
-                    return;
-                }
-                
-                // 닉네임 추출
-                let author = '';
-                const nickElem = item.querySelector('span.u_cbox_nick');
-                if (nickElem) {
-                    author = (nickElem.textContent || '').trim();
-                } else {
-                    const aElem = item.querySelector('a.u_cbox_name > span.u_cbox_nick');
-                    if (aElem) {
-                        author = (aElem.textContent || '').trim();
-                    }
-                }
-                
-                // 내용 추출
-                let content = '';
-                const contentElem = item.querySelector('span.u_cbox_contents');
-                if (contentElem) {
-                    content = (contentElem.textContent || '').trim();
-                    // 비밀 댓글 내용 확인
-                    if (content.includes('비밀 댓글입니다.')) {
-                        return; // 비밀 댓글 건너뛰기
-                    }
-                }
-                
-                // 날짜 추출
-                let dateText = '';
-                const dateMatch = itemText.match(/\\d{4}\\.\\d{1,2}\\.\\d{1,2}\\.?\\s+\\d{1,2}:\\d{2}/);
-                if (dateMatch) {
-                    dateText = dateMatch[0];
-                }
-                
-                // 좋아요 수 추출
-                let likes = 0;
-                const likesMatch = itemText.match(/공감\\s+(\\d+)/);
-                if (likesMatch) {
-                    likes = parseInt(likesMatch[1], 10);
-                }
-                
-                if (author || content) {
-                    comments.push({
-                        author: author,
-                        content: content,
-                        date: dateText,
-                        likes: likes
-                    });
-                }
-            });
-            
-            return comments;
-        }""")
+        comments_data = page.evaluate(COMMENTS_JS)
         
         for data in comments_data:
             comments.append(Comment(
@@ -449,42 +213,16 @@ def extract_comments(page: Page, comment_count: Optional[int] = None) -> Tuple[L
     return comments, False
 
 
-def extract_content(page: Page) -> PostContent:
-    """본문 내용 추출 (모바일 네이버 블로그)"""
+def extract_content(page: Page, postprocess: bool = True) -> PostContent:
+    """본문 내용 추출 (모바일 네이버 블로그)
+    
+    postprocess가 False이면 페이지에서 읽은 값만 채운다 (text/links는 정리 전 원본,
+    word_count/markdown은 비어 있음). 나머지는 finish_content로 처리한다.
+    """
     content = PostContent()
     
     # 본문 컨테이너 찾기 (JavaScript로 더 정확하게)
-    container_info = page.evaluate("""() => {
-        // 본문 컨테이너 선택자 (우선순위 순)
-        const selectors = [
-            '.se-main-container',
-            '.se-component-content',
-            '#postViewArea',
-            '.post-view-area',
-            '.post-content',
-            '.area_view',
-            '.post-view',
-            'article',
-            '.post_body'
-        ];
-        
-        for (const selector of selectors) {
-            const elem = document.querySelector(selector);
-            if (elem) {
-                // 본문이 실제로 있는지 확인 (텍스트가 50자 이상)
-                const text = (elem.textContent || '').trim();
-                if (text.length > 50) {
-                    return {
-                        selector: selector,
-                        found: true,
-                        textLength: text.length
-                    };
-                }
-            }
-        }
-        
-        return { found: false };
-    }""")
+    container_info = page.evaluate(CONTENT_CONTAINER_JS)
     
     container = None
     
@@ -532,273 +270,9 @@ def extract_content(page: Page) -> PostContent:
         content.html = container.inner_html()
         
         # 텍스트 추출 - 본문 영역만 추출 (헤더, 푸터, 댓글 제외)
-        raw_text = page.evaluate("""(selector) => {
-            let container = null;
-            
-            // 선택자가 있으면 해당 요소 사용
-            if (selector) {
-                container = document.querySelector(selector);
-            }
-            
-            // 본문 컨테이너 찾기 (우선순위 순)
-            if (!container) {
-                const selectors = [
-                    '.se-main-container',
-                    '.se-component-content',
-                    '#postViewArea',
-                    '.post-view-area',
-                    '.post-content',
-                    '.area_view',
-                    '.post-view',
-                    'article',
-                    '.post_body',
-                    '.post_ct',
-                    '.post-view-box'
-                ];
-                
-                for (const sel of selectors) {
-                    const elem = document.querySelector(sel);
-                    if (elem) {
-                        const text = (elem.textContent || '').trim();
-                        // 본문이 실제로 있는지 확인 (50자 이상)
-                        if (text.length > 50) {
-                            container = elem;
-                            break;
-                        }
-                    }
-                }
-            }
-            
-            // 본문 영역 직접 찾기 (특정 클래스나 구조로)
-            if (!container || (container === document.body && container.textContent.length > 1000)) {
-                // 방법 1: 제목 다음부터 본문 시작하는 경우
-                const postSubject = document.querySelector('.post_subject, h1.post_subject');
-                if (postSubject) {
-                    // 제목 다음 형제 요소들에서 본문 찾기
-                    let nextSibling = postSubject.nextElementSibling;
-                    while (nextSibling) {
-                        const text = (nextSibling.textContent || '').trim();
-                        if (text.length > 50 && !text.includes('이웃추가') && !text.includes('공유하기') && !text.includes('로그인')) {
-                            container = nextSibling;
-                            break;
-                        }
-                        nextSibling = nextSibling.nextElementSibling;
-                    }
-                }
-                
-                // 방법 2: "신고하기" 버튼 다음 요소들 중 본문 찾기
-                if (!container || container === document.body) {
-                    const reportButtons = document.querySelectorAll('button, .btn, a');
-                    for (const btn of reportButtons) {
-                        const btnText = (btn.textContent || '').trim();
-                        if (btnText.includes('신고하기')) {
-                            // 신고하기 버튼 다음 형제 요소들 찾기
-                            let nextSibling = btn.parentElement || btn;
-                            while (nextSibling && nextSibling.nextElementSibling) {
-                                nextSibling = nextSibling.nextElementSibling;
-                                const text = (nextSibling.textContent || '').trim();
-                                // 본문인지 확인 (50자 이상, 제외 텍스트 없음)
-                                if (text.length > 50 && 
-                                    !text.includes('이웃추가') && 
-                                    !text.includes('공유하기') && 
-                                    !text.includes('로그인') &&
-                                    !text.includes('카테고리') &&
-                                    !text.includes('PC버전')) {
-                                    container = nextSibling;
-                                    break;
-                                }
-                            }
-                            if (container && container !== document.body) break;
-                        }
-                    }
-                }
-            }
-            
-            if (!container) {
-                // body에서 본문 영역 찾기
-                container = document.body;
-            }
-            
-            // 제목, 헤더, 푸터, 댓글 영역 제외
-            const excludeSelectors = [
-                'header', '.header', '.post-header',
-                'footer', '.footer', '.post-footer',
-                '.post-title', '.post_subject', 'h1', 'h2',
-                '.comment-area', '.u_cbox', '.comment',
-                '.post-meta', '.meta-info', '.author-info',
-                '.navigation', '.nav', '.menu',
-                '.sidebar', '.side', '.widget',
-                '.btn', '.button', 'button',
-                '.link', '.menu-item',
-                'script', 'style', 'noscript',
-                '.Nservice_item', '.Nheader',  // 네이버 서비스 메뉴
-                '.log_area', '.login',         // 로그인 영역
-                '.bottom_area', '.footer_area' // 푸터 영역
-            ];
-            
-            // 제외할 텍스트 패턴
-            const excludeTexts = [
-                '로그인이 필요합니다',
-                '이웃추가',
-                '공유하기',
-                'URL 복사',
-                '신고하기',
-                '본문 폰트 크기',
-                'PC버전으로 보기',
-                '블로그 고객센터',
-                '네이버 블로그',
-                '카테고리 이동',
-                '카테고리',
-                '검색',
-                'My Menu',
-                '본문 바로가기',
-                'Most important',
-                '내소식',
-                '이웃목록',
-                '클립만들기',
-                '글쓰기',
-                '내 체크인',
-                '최근 본 글',
-                '내 동영상',
-                '내 클립',
-                '내 상품 관리',
-                '마켓 플레이스',
-                '장바구니',
-                '마켓 구매내역',
-                '블로그팀 공식블로그',
-                '이달의 블로그',
-                '공식 블로그',
-                '블로그 앱',
-                'NAVER Corp',
-                'ⓒ'
-            ];
-            
-            // 제외할 요소들 찾기
-            const excludeElements = new Set();
-            excludeSelectors.forEach(sel => {
-                try {
-                    document.querySelectorAll(sel).forEach(el => {
-                        excludeElements.add(el);
-                    });
-                } catch (e) {}
-            });
-            
-            // 본문 텍스트 추출 (제외 요소 제외)
-            let text = '';
-            const walker = document.createTreeWalker(
-                container,
-                NodeFilter.SHOW_TEXT,
-                {
-                    acceptNode: function(node) {
-                        let parent = node.parentElement;
-                        while (parent && parent !== container) {
-                            if (excludeElements.has(parent)) {
-                                return NodeFilter.FILTER_REJECT;
-                            }
-                            // 스크립트나 스타일 태그도 제외
-                            if (parent.tagName === 'SCRIPT' || parent.tagName === 'STYLE') {
-                                return NodeFilter.FILTER_REJECT;
-                            }
-                            parent = parent.parentElement;
-                        }
-                        return NodeFilter.FILTER_ACCEPT;
-                    }
-                }
-            );
-            
-            let node;
-            let collectedLines = [];
-            while (node = walker.nextNode()) {
-                const nodeText = node.textContent.trim();
-                if (nodeText && nodeText.length > 0) {
-                    // 제외할 텍스트 패턴 확인
-                    let shouldExclude = false;
-                    for (const excludeText of excludeTexts) {
-                        if (nodeText.includes(excludeText)) {
-                            shouldExclude = true;
-                            break;
-                        }
-                    }
-                    
-                    // 추가 필터링: 불필요한 텍스트 패턴
-                    if (!shouldExclude) {
-                        // 날짜 형식 제외 (2016. 12. 18. 등)
-                        if (/^\\d{4}\\.\\s*\\d{1,2}\\.\\s*\\d{1,2}/.test(nodeText)) {
-                            shouldExclude = true;
-                        }
-                        // 숫자만 있는 줄 제외 (123 등)
-                        if (/^\\d+$/.test(nodeText)) {
-                            shouldExclude = true;
-                        }
-                        // JSON 데이터 제외
-                        if (nodeText.trim().startsWith('{') && nodeText.includes('"title"')) {
-                            shouldExclude = true;
-                        }
-                        // 블로그명/닉네임 패턴 제외
-                        if (nodeText.includes('(skalekd77)') || nodeText.includes('투영') || nodeText.includes('Too_young')) {
-                            shouldExclude = true;
-                        }
-                        // 영어만 있는 줄 (메뉴 항목 등) 제외
-                        if (/^[A-Za-z\\s\\.]+$/.test(nodeText) && nodeText.length < 30 && !nodeText.includes('\\n')) {
-                            shouldExclude = true;
-                        }
-                        // 특수 문자만 있는 줄 제외
-                        if (/^[ⓒ\\(\\)\\[\\]\\{\\}]+$/.test(nodeText)) {
-                            shouldExclude = true;
-                        }
-                        // 카테고리, 카테고리 이동 등 제외
-                        if (nodeText.includes('카테고리')) {
-                            shouldExclude = true;
-                        }
-                        // "블로그" 포함 텍스트 제외 (메뉴 등)
-                        if (nodeText.includes('블로그')) {
-                            shouldExclude = true;
-                        }
-                        // 한글과 숫자 조합이 아닌 짧은 텍스트 제외 (메뉴 등)
-                        if (nodeText.length < 5 && !/[가-힣]/.test(nodeText)) {
-                            shouldExclude = true;
-                        }
-                    }
-                    
-                    // 본문은 포함 (3자 이상, 한글이 포함된 경우 우선)
-                    if (!shouldExclude && nodeText.length >= 3) {
-                        // 한글이 포함된 텍스트는 우선 포함
-                        // 하지만 제목과 같은 짧은 텍스트는 제외
-                        const hasKorean = /[가-힣]/.test(nodeText);
-                        if (hasKorean && nodeText.length > 5) {
-                            // 제목 패턴 제외 (숫자로 시작하는 짧은 텍스트, 예: "161217 호떡 먹고싶다")
-                            if (!(/^\\d{6}\\s/.test(nodeText) && nodeText.length < 30)) {
-                                collectedLines.push(nodeText);
-                            }
-                        } else if (nodeText.length > 10 && !hasKorean) {
-                            // 영어나 기타 텍스트도 10자 이상인 경우만 포함
-                            collectedLines.push(nodeText);
-                        }
-                    }
-                }
-            }
-            
-            // 중복 제거 및 정리
-            const uniqueLines = [];
-            const seen = new Set();
-            for (const line of collectedLines) {
-                if (!seen.has(line) && line.length > 0) {
-                    seen.add(line);
-                    uniqueLines.push(line);
-                }
-            }
-            
-            // 수집된 줄들을 합치기
-            text = uniqueLines.join('\\n');
-            
-            return text.trim();
-        }""", container_info.get('selector') if container_info.get('found') else None)
+        raw_text = page.evaluate(CONTENT_TEXT_JS, container_info.get('selector') if container_info.get('found') else None)
         
-        # 텍스트 정리 (가독성 향상)
-        content.text = clean_text(raw_text)
-        
-        # 단어 수 계산 (정리된 텍스트 기준)
-        content.word_count = len(content.text.split())
+        content.text = raw_text or ''
         
         # 이미지 URL 추출
         images = []
@@ -819,25 +293,15 @@ def extract_content(page: Page) -> PostContent:
         content.images = images
         
         # 링크 URL 추출
-        links = []
         try:
             link_elements = container.locator('a[href]').all()
-            for link in link_elements:
-                href = link.get_attribute('href') or ''
-                if href:
-                    # 상대 경로를 절대 경로로 변환
-                    if href.startswith('/'):
-                        href = f"https://m.blog.naver.com{href}"
-                    elif not href.startswith('http'):
-                        href = f"https://m.blog.naver.com/{href}"
-                    if href not in links:
-                        links.append(href)
+            content.links = [link.get_attribute('href') or '' for link in link_elements]
         except Exception:
-            pass
-        content.links = links
+            content.links = []
         
-        # 마크다운 변환 (간단한 버전)
-        content.markdown = html_to_markdown(content.html)
+        # 텍스트 정리, 단어 수, 링크 정규화, 마크다운 변환
+        if postprocess:
+            finish_content(content)
         
     except Exception as e:
         print(f"[경고] 본문 추출 중 오류: {e}")
@@ -845,71 +309,190 @@ def extract_content(page: Page) -> PostContent:
     return content
 
 
+def normalize_links(hrefs) -> List[str]:
+    """링크 href 목록을 절대 경로로 변환하고 중복 제거 (순서 유지)"""
+    links = []
+    seen = set()
+    for href in hrefs:
+        if not href:
+            continue
+        # 상대 경로를 절대 경로로 변환
+        if href.startswith('/'):
+            href = f"https://m.blog.naver.com{href}"
+        elif not href.startswith('http'):
+            href = f"https://m.blog.naver.com/{href}"
+        if href not in seen:
+            seen.add(href)
+            links.append(href)
+    return links
+
+
+def finish_content(content: PostContent, markdown: bool = True) -> PostContent:
+    """페이지에서 읽은 본문의 후처리 (CPU 작업만, 페이지 접근 없음)
+    
+    텍스트 정리, 단어 수 계산, 링크 정규화, 마크다운 변환 (markdown=False면 생략).
+    이미 처리한 본문에 다시 적용해도 결과가 같다.
+    """
+    content.text, content.word_count, content.links, content.markdown = postprocess_fields(
+        content.html, content.text, content.links, markdown
+    )
+    return content
+
+
+def postprocess_fields(html: str, raw_text: str, raw_links: List[str], markdown: bool = True) -> tuple:
+    """본문 후처리 결과 (text, word_count, links, markdown) 계산 (프로세스 풀 작업 단위)"""
+    text = clean_text(raw_text or '')
+    return (
+        text,
+        len(text.split()),
+        normalize_links(raw_links or []),
+        html_to_markdown(html) if markdown else ''
+    )
+
+
+def content_from_bundle(data: dict, postprocess: bool = True) -> PostContent:
+    """일괄 추출 결과(POST_BUNDLE_JS)로 본문 내용 생성 (extract_content와 같은 결과)
+    
+    postprocess가 False이면 text/links는 원본 그대로 두고 finish_content에 맡긴다.
+    """
+    content = PostContent()
+    content.html = data.get('html') or ''
+    content.text = data.get('text') or ''
+    content.images = list(data.get('images') or [])
+    content.links = list(data.get('links') or [])
+    if postprocess:
+        finish_content(content)
+    return content
+
+
+def metadata_from_bundle(data: dict) -> PostMetadata:
+    """일괄 추출 결과(POST_BUNDLE_JS)로 메타데이터 생성 (태그는 extract_tags에서 별도로 추출)"""
+    return PostMetadata(
+        views=data.get('views') or 0,
+        likes=data.get('likes') or 0,
+        comments=data.get('comments') or 0,
+        category=data.get('category'),
+        tags=[]
+    )
+
+
+_SPACES_RE = re.compile(r'[ \t]+')
+
+
 def clean_text(text: str) -> str:
-    """텍스트 정리 - 가독성 향상"""
+    """텍스트 정리 - 가독성 향상
+    
+    줄마다 앞뒤 공백을 제거하고, 연속된 빈 줄은 하나로, 줄 안의 연속된 공백/탭은
+    공백 하나로 줄인 뒤 앞뒤 빈 줄을 제거한다 (줄 단위 한 번 순회).
+    """
     if not text:
         return ""
     
-    # 연속된 줄바꿈 정리 (3개 이상 -> 2개)
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
-    # 각 줄의 앞뒤 공백 제거
-    lines = text.split('\n')
-    cleaned_lines = [line.strip() for line in lines]
-    
-    # 연속된 빈 줄 제거 (최대 2개까지만 유지)
     result_lines = []
-    prev_empty = False
-    for line in cleaned_lines:
+    prev_empty = True  # 시작 부분의 빈 줄은 추가하지 않음
+    for line in text.split('\n'):
+        line = line.strip()
         if not line:
             if not prev_empty:
                 result_lines.append('')
                 prev_empty = True
-        else:
-            result_lines.append(line)
-            prev_empty = False
-    
-    # 연속된 공백 정리 (탭, 공백 여러 개 -> 하나의 공백)
-    result = '\n'.join(result_lines)
-    result = re.sub(r'[ \t]+', ' ', result)
-    
-    # 시작과 끝의 줄바꿈 제거
-    result = result.strip()
-    
-    return result
+            continue
+        if '  ' in line or '\t' in line:
+            line = _SPACES_RE.sub(' ', line)
+        result_lines.append(line)
+        prev_empty = False
+    
+    # 끝부분의 빈 줄 제거
+    if result_lines and not result_lines[-1]:
+        result_lines.pop()
+    return '\n'.join(result_lines)
+
+
+# html_to_markdown: 변환 대상 태그만 토큰으로 찾고, 그 사이의 나머지 태그는 한 번에 제거
+_TAG_RE = re.compile(r'<[^>]+>')
+_MARKDOWN_TAG_RE = re.compile(r'<(?:/(?:h[123]|strong|b|em|a|p)>|(?:h[123]|strong|b|em|a|img|p)[^>]*>)')
+_LINK_OPEN_RE = re.compile(r'<a[^>]*href="([^"]*)"[^>]*>')
+_IMG_RE = re.compile(r'<img[^>]*src="([^"]*)"[^>]*>')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+
+# 짝을 이루는 태그: (여는 태그 접두사, 닫는 태그, 여는 자리 문자열, 닫는 자리 문자열)
+# 여는 태그는 접두사로 판별한다 (예: '<b'는 <b>, <br>, <blockquote>도 해당,
+# 뒤에 닫는 태그가 있을 때만 변환하고 첫 번째 닫는 태그에서 끝남)
+_PAIRED_TAGS = (
+    ('<h1', '</h1>', '# ', ''),
+    ('<h2', '</h2>', '## ', ''),
+    ('<h3', '</h3>', '### ', ''),
+    ('<strong', '</strong>', '**', '**'),
+    ('<b', '</b>', '**', '**'),
+    ('<em', '</em>', '*', '*'),
+)
+_PAIRED_SUFFIXES = {close: suffix for _, close, _, suffix in _PAIRED_TAGS}
 
 
 def html_to_markdown(html: str) -> str:
-    """HTML을 마크다운으로 간단 변환"""
-    markdown = html
-    
-    # 제목 변환
-    markdown = re.sub(r'<h1[^>]*>(.*?)</h1>', r'# \1', markdown, flags=re.DOTALL)
-    markdown = re.sub(r'<h2[^>]*>(.*?)</h2>', r'## \1', markdown, flags=re.DOTALL)
-    markdown = re.sub(r'<h3[^>]*>(.*?)</h3>', r'### \1', markdown, flags=re.DOTALL)
-    
-    # 강조 변환
-    markdown = re.sub(r'<strong[^>]*>(.*?)</strong>', r'**\1**', markdown, flags=re.DOTALL)
-    markdown = re.sub(r'<b[^>]*>(.*?)</b>', r'**\1**', markdown, flags=re.DOTALL)
-    markdown = re.sub(r'<em[^>]*>(.*?)</em>', r'*\1*', markdown, flags=re.DOTALL)
-    
-    # 링크 변환
-    markdown = re.sub(r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', r'[\2](\1)', markdown, flags=re.DOTALL)
-    
-    # 이미지 변환
-    markdown = re.sub(r'<img[^>]*src="([^"]*)"[^>]*>', r'![](\1)', markdown)
-    
-    # 줄바꿈 변환
-    markdown = re.sub(r'<br[^>]*>', '\n', markdown)
-    markdown = re.sub(r'<p[^>]*>', '\n', markdown)
-    markdown = re.sub(r'</p>', '\n', markdown)
-    
-    # HTML 태그 제거
-    markdown = re.sub(r'<[^>]+>', '', markdown)
-    
-    # 공백 정리
-    markdown = re.sub(r'\n\s*\n\s*\n', '\n\n', markdown)
+    """HTML을 마크다운으로 간단 변환
     
+    변환 대상 태그를 앞에서부터 한 번 훑으며 변환하고 나머지 태그는 제거한다.
+    - h1~h3: '# ' ~ '### ', strong/b: **…**, em: *…*, a[href]: [텍스트](href)
+    - img[src]: ![](src), br / p 시작 / p 끝: 줄바꿈
+    마지막으로 세 줄 이상 이어지는 빈 줄을 두 줄로 줄인다.
+    """
+    if not html:
+        return ''
+    
+    # 종류별 마지막 닫는 태그 위치 (여는 태그 뒤에 닫는 태그가 있는지 O(1)로 판별)
+    last_close = {close: html.rfind(close) for close in _PAIRED_SUFFIXES}
+    last_link_close = html.rfind('</a>')
+    active = set()  # 변환 중인(닫는 태그를 기다리는) 짝 태그의 닫는 태그
+    link_href = None  # 변환 중인 링크의 href
+    
+    parts = []
+    position = 0
+    for match in _MARKDOWN_TAG_RE.finditer(html):
+        start, end = match.span()
+        if start > position:
+            parts.append(_TAG_RE.sub('', html[position:start]))
+        position = end
+        tag = match.group()
+        
+        if tag[1] == '/':
+            if tag in active:
+                active.discard(tag)
+                parts.append(_PAIRED_SUFFIXES[tag])
+            elif tag == '</a>':
+                if link_href is not None:
+                    parts.append(f"]({link_href})")
+                    link_href = None
+            elif tag == '</p>':
+                parts.append('\n')
+            continue
+        
+        converted = False
+        for prefix, close, opening, _ in _PAIRED_TAGS:
+            if tag.startswith(prefix):
+                if close not in active and last_close[close] >= end:
+                    active.add(close)
+                    parts.append(opening)
+                    converted = True
+                break
+        if converted:
+            continue
+        
+        if tag.startswith('<a'):
+            if link_href is None and last_link_close >= end:
+                link = _LINK_OPEN_RE.fullmatch(tag)
+                if link:
+                    link_href = link.group(1)
+                    parts.append('[')
+        elif tag.startswith('<img'):
+            image = _IMG_RE.fullmatch(tag)
+            if image:
+                parts.append(f"![]({image.group(1)})")
+        elif tag.startswith('<br') or tag.startswith('<p'):
+            parts.append('\n')
+    
+    parts.append(_TAG_RE.sub('', html[position:]))
+    markdown = _BLANK_LINES_RE.sub('\n\n', ''.join(parts))
     return markdown.strip()
 
 
@@ -0,0 +1,109 @@
+"""
+글 목록 API 응답 수집 모듈
+무한 스크롤이 호출하는 글 목록 JSON 응답에서 포스트 링크를 바로 만든다
+"""
+import re
+from typing import Dict, List, Optional
+
+
+# 모바일 글 목록 무한 스크롤 API (예: /api/blogs/{blogId}/post-list?categoryNo=0&itemCount=24&page=2)
+POST_LIST_API_PATTERN = re.compile(r'/api/blogs/([^/?]+)/post-list', re.IGNORECASE)
+
+
+def post_view_url(blog_id: str, log_no: str) -> str:
+    """POST_LINKS_JS와 같은 표준 포스트 URL"""
+    return f"https://m.blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}"
+
+
+def is_post_list_response(url: str, blog_id: str) -> bool:
+    """해당 블로그의 글 목록 API 응답인지 확인"""
+    match = POST_LIST_API_PATTERN.search(url)
+    return bool(match) and match.group(1).lower() == blog_id.lower()
+
+
+def log_nos_from_payload(payload: dict) -> Optional[List[str]]:
+    """글 목록 응답 JSON에서 포스트 번호 목록 추출 (형식이 다르면 None)"""
+    if not isinstance(payload, dict):
+        return None
+    result = payload.get('result', payload)
+    items = result.get('items') if isinstance(result, dict) else None
+    if not isinstance(items, list):
+        return None
+
+    log_nos = []
+    for item in items:
+        if isinstance(item, dict) and item.get('logNo'):
+            log_nos.append(str(item['logNo']))
+    return log_nos
+
+
+class PostListCollector:
+    """글 목록 API 응답에서 포스트 링크 수집
+
+    page.on("response")로 해당 블로그의 글 목록 응답만 모아 두고,
+    harvest()/harvest_async()에서 JSON을 읽어 응답이 도착한 순서(최신순)대로 링크를 만든다.
+    중복은 포스트 번호 기준 dict로 제거하므로 수집 비용은 링크 수에 비례한다.
+    응답 핸들러 안에서는 본문을 읽지 않는다 (sync API 이벤트 핸들러에서 대기하지 않도록).
+    """
+
+    def __init__(self, blog_id: str):
+        self.blog_id = blog_id
+        self.responses_seen = 0
+        self.reached_end = False  # 빈 페이지 응답 수신 (더 불러올 글 없음)
+        self._pending = []
+        self._log_nos: Dict[str, None] = {}  # 삽입 순서 유지 + O(1) 중복 확인
+
+    def on_response(self, response) -> None:
+        if is_post_list_response(response.url, self.blog_id):
+            self._pending.append(response)
+
+    def attach(self, page) -> None:
+        page.on("response", self.on_response)
+
+    def detach(self, page) -> None:
+        try:
+            page.remove_listener("response", self.on_response)
+        except Exception:
+            pass
+
+    def add_payload(self, payload: dict) -> int:
+        """응답 JSON 하나 반영 후 새로 추가된 링크 수 반환"""
+        log_nos = log_nos_from_payload(payload)
+        if log_nos is None:
+            return 0
+        self.responses_seen += 1
+        if not log_nos:
+            self.reached_end = True
+        before = len(self._log_nos)
+        for log_no in log_nos:
+            self._log_nos.setdefault(log_no, None)
+        return len(self._log_nos) - before
+
+    def harvest(self) -> int:
+        """도착한 응답 본문을 읽어 반영 (sync API)"""
+        added = 0
+        pending, self._pending = self._pending, []
+        for response in pending:
+            try:
+                added += self.add_payload(response.json())
+            except Exception as e:
+                print(f"[경고] 글 목록 응답 읽기 실패: {e}")
+        return added
+
+    async def harvest_async(self) -> int:
+        """도착한 응답 본문을 읽어 반영 (async API)"""
+        added = 0
+        pending, self._pending = self._pending, []
+        for response in pending:
+            try:
+                added += self.add_payload(await response.json())
+            except Exception as e:
+                print(f"[경고] 글 목록 응답 읽기 실패: {e}")
+        return added
+
+    @property
+    def links(self) -> List[str]:
+        return [post_view_url(self.blog_id, log_no) for log_no in self._log_nos]
+
+    def __len__(self) -> int:
+        return len(self._log_nos)
@@ -0,0 +1,106 @@
+"""
+포스트 후처리 단계 모듈
+브라우저를 다루는 스레드는 페이지에서 원본 값만 읽고, 텍스트 정리/단어 수/링크 정규화/
+마크다운 변환은 프로세스 풀에서 병렬로 처리한 뒤 제출한 순서대로 저장 콜백에 넘긴다
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Deque, Optional, Tuple
+
+from src.models import Post
+from src.crawler.parser import finish_content, postprocess_fields
+
+
+class PostProcessor:
+    """후처리 프로세스 풀 (여러 블로그/작업 스레드가 공유 가능)
+
+    workers가 0이면 프로세스를 만들지 않고 호출한 스레드에서 바로 처리한다.
+    None이면 CPU 코어 수만큼 만든다.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = max(0, workers)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 0 else None
+
+    def submit(self, post: Post, markdown: bool = True) -> Optional[Future]:
+        """포스트 본문 후처리 작업 제출 (프로세스 풀이 없으면 None)"""
+        if self._executor is None:
+            return None
+        content = post.content
+        # 마크다운을 만들지 않으면 HTML은 작업 프로세스로 보내지 않음
+        return self._executor.submit(postprocess_fields, content.html if markdown else '',
+                                     content.text, content.links, markdown)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class PostPipeline:
+    """블로그 하나의 후처리 파이프라인 (제출 순서대로 on_post 호출)
+
+    submit은 결과를 기다리지 않고 반환하며, 앞선 포스트의 처리가 끝나는 대로 on_post에 넘긴다.
+    처리 대기 중인 포스트가 max_pending개를 넘으면 가장 오래된 포스트를 기다린다.
+    processor가 None이면 submit에서 바로 처리해 넘긴다.
+    on_post는 submit/flush를 호출한 스레드에서만 실행된다.
+    """
+
+    def __init__(
+        self,
+        on_post: Callable[[Post], None],
+        processor: Optional[PostProcessor] = None,
+        markdown: bool = True,
+        max_pending: Optional[int] = None
+    ):
+        self.on_post = on_post
+        self.processor = processor
+        self.markdown = markdown
+        if max_pending is None:
+            max_pending = max(1, (processor.workers if processor else 0) * 4)
+        self.max_pending = max_pending
+        self._pending: Deque[Tuple[Post, Optional[Future]]] = deque()
+
+    def submit(self, post: Post) -> None:
+        future = self.processor.submit(post, self.markdown) if self.processor else None
+        self._pending.append((post, future))
+        self._deliver(block=len(self._pending) > self.max_pending)
+
+    def flush(self) -> None:
+        """남은 포스트를 모두 처리해 on_post에 넘김"""
+        while self._pending:
+            self._deliver(block=True)
+
+    def _deliver(self, block: bool) -> None:
+        # 맨 앞 포스트가 끝났을 때만 넘김 (순서 유지), block이면 맨 앞 하나는 기다림
+        while self._pending:
+            post, future = self._pending[0]
+            if future is not None and not future.done() and not block:
+                return
+            self._pending.popleft()
+            block = False
+            self._finish(post, future)
+
+    def _finish(self, post: Post, future: Optional[Future]) -> None:
+        content = post.content
+        try:
+            if future is None:
+                finish_content(content, self.markdown)
+            else:
+                try:
+                    content.text, content.word_count, content.links, content.markdown = future.result()
+                except Exception as e:
+                    print(f"[경고] 후처리 프로세스 실패, 현재 스레드에서 처리: {post.url}, 오류: {e}")
+                    finish_content(content, self.markdown)
+            self.on_post(post)
+        except Exception as e:
+            print(f"[오류] 포스트 처리 실패: {post.url}, 오류: {e}")
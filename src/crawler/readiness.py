@@ -0,0 +1,142 @@
+"""
+페이지 준비 상태 대기 모듈
+고정 sleep 대신 DOM/네트워크 신호를 기다리고, 신호가 오면 즉시 반환
+"""
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+from playwright.sync_api import Page, Locator, Response, TimeoutError as PlaywrightTimeout
+
+from src.crawler.scripts import TAGS_CHANGED_JS, COMMENT_AREA_READY_JS, COMMENTS_RENDERED_JS
+
+
+# 본문 컨테이너 선택자
+CONTENT_READY_SELECTOR = '.se-main-container, .se-component-content, #postViewArea, .post-view-area, .post-content'
+
+# 해시태그 링크 선택자 (scripts.TAGS_CHANGED_JS와 동일)
+TAG_LINK_SELECTOR = 'a.tag__tFC3j, .tag-list .tag, .area_tag a, .se_tagList a, .tag-item'
+
+
+def is_comment_api_response(response: Response) -> bool:
+    """네이버 댓글 목록 API 응답 여부 (예: apis.naver.com/commentBox/cbox/web_naver_list_jsonp.json)"""
+    return '/commentBox/' in response.url and 'list' in response.url
+
+
+@dataclass
+class ReadinessConfig:
+    """대기 최대 시간 (초)
+
+    모든 값은 하한이 아닌 상한이다. 신호가 먼저 오면 즉시 다음 단계로 진행한다.
+    """
+    content_timeout: float = 3.0  # 본문 컨테이너 표시
+    tags_timeout: float = 2.5  # 해시태그 확장 후 목록 변화
+    comment_response_timeout: float = 2.0  # 댓글 버튼 클릭 후 댓글 API 응답
+    comment_area_timeout: float = 1.0  # 댓글 영역 로드
+    comments_timeout: float = 2.0  # 댓글 목록 렌더링
+    log_waits: bool = True  # 대기마다 실제 소요 시간 출력
+
+
+DEFAULT_READINESS = ReadinessConfig()
+
+
+def log_wait(
+    config: ReadinessConfig,
+    label: str,
+    elapsed: float,
+    ready: bool,
+    fixed_sleep: Optional[float] = None
+) -> None:
+    """대기 결과 출력 (기존 고정 대기 시간과 비교)"""
+    if not config.log_waits:
+        return
+    status = "준비 완료" if ready else "최대 대기 도달"
+    message = f"[대기] {label}: {elapsed:.2f}초 ({status})"
+    if fixed_sleep is not None:
+        message += f", 기존 고정 대기 {fixed_sleep:.1f}초"
+    print(message)
+
+
+def _timed_wait(
+    config: ReadinessConfig,
+    label: str,
+    fixed_sleep: Optional[float],
+    wait: Callable[[], None]
+) -> bool:
+    """대기 함수를 실행하고 소요 시간 기록 (최대 대기 초과 시 False)"""
+    start = time.monotonic()
+    try:
+        wait()
+        ready = True
+    except PlaywrightTimeout:
+        ready = False
+    log_wait(config, label, time.monotonic() - start, ready, fixed_sleep)
+    return ready
+
+
+def wait_for_content(page: Page, config: ReadinessConfig = DEFAULT_READINESS) -> bool:
+    """본문 컨테이너가 DOM에 나타날 때까지 대기"""
+    return _timed_wait(
+        config, "본문 로딩", 1.3,
+        lambda: page.wait_for_selector(
+            CONTENT_READY_SELECTOR, state='attached', timeout=config.content_timeout * 1000
+        )
+    )
+
+
+def count_tag_links(page: Page) -> int:
+    """현재 해시태그 링크 수"""
+    try:
+        return page.locator(TAG_LINK_SELECTOR).count()
+    except Exception:
+        return 0
+
+
+def wait_for_tags_changed(page: Page, before: int, config: ReadinessConfig = DEFAULT_READINESS) -> bool:
+    """해시태그 확장 버튼 클릭 후 목록이 늘어날 때까지 대기"""
+    return _timed_wait(
+        config, "해시태그 로딩", 2.5,
+        lambda: page.wait_for_function(
+            TAGS_CHANGED_JS, arg=before, timeout=config.tags_timeout * 1000, polling='raf'
+        )
+    )
+
+
+def click_and_wait_for_comment_api(
+    page: Page,
+    button: Locator,
+    config: ReadinessConfig = DEFAULT_READINESS
+) -> bool:
+    """댓글 버튼 클릭 후 댓글 API 응답 대기
+
+    클릭 자체가 실패하면 예외를 그대로 전달하고,
+    응답이 최대 대기 시간 안에 오지 않으면 False를 반환한다.
+    """
+    start = time.monotonic()
+    clicked = False
+    try:
+        with page.expect_response(is_comment_api_response, timeout=config.comment_response_timeout * 1000):
+            button.click()
+            clicked = True
+        ready = True
+    except PlaywrightTimeout:
+        if not clicked:
+            raise
+        ready = False
+    log_wait(config, "댓글 API 응답", time.monotonic() - start, ready)
+    return ready
+
+
+def wait_for_comment_area(page: Page, config: ReadinessConfig = DEFAULT_READINESS) -> bool:
+    """댓글 영역이 로드될 때까지 대기"""
+    return _timed_wait(
+        config, "댓글 영역", 1.0,
+        lambda: page.wait_for_function(COMMENT_AREA_READY_JS, timeout=config.comment_area_timeout * 1000, polling=100)
+    )
+
+
+def wait_for_comments(page: Page, config: ReadinessConfig = DEFAULT_READINESS) -> bool:
+    """댓글 목록이 렌더링될 때까지 대기"""
+    return _timed_wait(
+        config, "댓글 목록", 2.0,
+        lambda: page.wait_for_function(COMMENTS_RENDERED_JS, timeout=config.comments_timeout * 1000, polling=100)
+    )
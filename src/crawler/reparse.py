@@ -0,0 +1,137 @@
+"""
+아카이브 재추출 모듈
+원본 페이지 아카이브(HtmlArchive)를 네이버에 다시 요청하지 않고 파서로 다시 추출한다
+
+브라우저 없이 static_parser(순수 Python DOM)로 POST_BUNDLE_JS와 같은 결과를 만들고
+parser.py의 content_from_bundle/metadata_from_bundle로 Post를 만든다.
+workers가 2 이상이면 프로세스 풀에서 여러 코어로 나눠 처리한다 (결과는 아카이브 순서 유지).
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional
+
+from src.models import Post
+from src.crawler.engine import post_from_static_bundle
+from src.crawler.static_parser import bundle_from_html
+from src.utils.file_exporter import iter_jsonl_posts, iter_saved_posts, write_posts_document
+from src.utils.html_archive import HtmlArchive
+from src.utils.html_store import release_heavy_fields
+from src.utils.json_codec import dumps_compact
+
+
+# 프로세스마다 한 번 여는 아카이브 (색인 로드 비용을 작업마다 반복하지 않음)
+_worker_archive: Optional[HtmlArchive] = None
+
+
+def reparse_entry(archive: HtmlArchive, entry: dict) -> Optional[Post]:
+    """아카이브 항목 하나를 Post로 재추출 (본문을 찾지 못하면 None)
+
+    출력에 쓰지 않는 content.html/markdown은 비워서 반환한다 (프로세스 간 전달량 감소).
+    """
+    data = bundle_from_html(archive.read(entry['ref']))
+    if data is None:
+        print(f"[경고] 아카이브 페이지에서 본문을 찾지 못했습니다: {entry['blog_id']}/{entry['post_id']}")
+        return None
+    return release_heavy_fields(post_from_static_bundle(data, entry['url'], entry['blog_id']), 'drop')
+
+
+def _init_worker(archive_dir: str) -> None:
+    global _worker_archive
+    _worker_archive = HtmlArchive(archive_dir)
+
+
+def _reparse_chunk(entries: List[dict]) -> List[Optional[Post]]:
+    """작업 프로세스: 항목 묶음 재추출"""
+    return [reparse_entry(_worker_archive, entry) for entry in entries]
+
+
+def _chunks(entries: Iterator[dict], chunk_size: int) -> Iterator[List[dict]]:
+    chunk: List[dict] = []
+    for entry in entries:
+        chunk.append(entry)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def reparse_archive(
+    archive: HtmlArchive,
+    blog_id: Optional[str] = None,
+    workers: Optional[int] = 1,
+    chunk_size: int = 64
+) -> Iterator[Post]:
+    """아카이브의 포스트를 저장 순서대로 재추출 (댓글은 페이지 HTML에서 추출하지 않음)
+
+    Args:
+        archive: 원본 페이지 아카이브
+        blog_id: 지정하면 그 블로그만
+        workers: 작업 프로세스 수 (1이면 현재 프로세스, None이면 CPU 코어 수)
+        chunk_size: 프로세스에 한 번에 넘기는 항목 수
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    entries = archive.entries(blog_id)
+
+    if workers <= 1:
+        for entry in entries:
+            post = reparse_entry(archive, entry)
+            if post is not None:
+                yield post
+        return
+
+    # 제출한 묶음 수를 제한해 결과가 메모리에 쌓이지 않게 하고, 제출 순서대로 결과를 꺼냄
+    max_pending = workers * 2
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(str(archive.directory),)) as executor:
+        pending: Deque[Future] = deque()
+        for chunk in _chunks(entries, chunk_size):
+            pending.append(executor.submit(_reparse_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from (post for post in pending.popleft().result() if post is not None)
+        while pending:
+            yield from (post for post in pending.popleft().result() if post is not None)
+
+
+def reparse_to_json(
+    archive_dir: str,
+    output_path: str,
+    previous_output: Optional[str] = None,
+    blog_id: Optional[str] = None,
+    workers: Optional[int] = 1
+) -> Path:
+    """아카이브를 재추출해 {crawl_info, posts} 출력 JSON 문서 생성
+
+    previous_output(기존 출력 JSON 또는 JSONL 스트림)이 있으면 같은 post_id의 댓글을 이어받는다.
+    """
+    archive = HtmlArchive(archive_dir)
+    previous_comments: Dict[str, list] = {}
+    if previous_output:
+        for post in iter_saved_posts(previous_output):
+            if post.get('comments'):
+                previous_comments[post['post_id']] = post['comments']
+
+    # 재추출 결과는 임시 JSONL에 쓰고 개수를 센 뒤 출력 문서로 변환 (전체 포스트를 메모리에 두지 않음)
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_file.with_name(f".{output_file.name}.reparse.jsonl")
+    total_posts = 0
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for post in reparse_archive(archive, blog_id, workers=workers):
+                post_dict = post.to_dict()
+                post_dict['comments'] = previous_comments.get(post.post_id, [])
+                f.write(dumps_compact(post_dict) + '\n')
+                total_posts += 1
+
+        print(f"[단계] 아카이브 재추출 완료: {total_posts}/{len(archive)}개 포스트")
+        return write_posts_document(iter_jsonl_posts(temp_path), total_posts, output_path, {
+            "crawl_type": "reparse",
+            "archive_dir": str(archive_dir),
+            "status": "completed"
+        })
+    finally:
+        temp_path.unlink(missing_ok=True)
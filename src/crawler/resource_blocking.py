@@ -0,0 +1,150 @@
+"""
+리소스 차단 모듈
+포스트 추출에 필요 없는 이미지/미디어/폰트와 광고·통계 요청을 페이지 단위로 차단
+
+Playwright route는 패턴과 관계없이 설치하는 순간 HTTP 캐시를 끄고 모든 요청을 Python으로
+왕복시키므로, CDP Network.setBlockedURLs로 브라우저 안에서 URL 패턴을 차단한다.
+차단된 요청은 requestfailed 이벤트(net::ERR_BLOCKED_BY_CLIENT)로 집계한다.
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Tuple
+
+
+@dataclass(frozen=True)
+class BlockingProfile:
+    """요청 차단 설정
+
+    이미지는 src 속성만 필요하므로 바이트를 받지 않는다.
+    SmartEditor 본문과 댓글 렌더링에 필요한 스크립트/XHR은 차단하지 않는다.
+    CDP 차단은 URL만 보므로 리소스 유형은 확장자 패턴으로 차단한다.
+    """
+    # 차단할 리소스 유형 (Playwright request.resource_type, 확장자는 RESOURCE_TYPE_EXTENSIONS)
+    blocked_resource_types: FrozenSet[str] = frozenset({'image', 'media', 'font'})
+    # 차단할 광고/통계 호스트 (하위 도메인 포함)
+    blocked_hosts: Tuple[str, ...] = (
+        'doubleclick.net',
+        'googlesyndication.com',
+        'google-analytics.com',
+        'googletagmanager.com',
+        'adservice.google.com',
+        'facebook.net',
+        'veta.naver.com',
+        'wcs.naver.net',
+        'lcs.naver.com',
+        'tivan.naver.com',
+        'nelo2-col.navercorp.com'
+    )
+    # 절약 바이트 추정용 리소스 유형별 평균 크기 (차단된 요청은 응답이 없으므로 추정값 사용)
+    estimated_sizes: Tuple[Tuple[str, int], ...] = (
+        ('image', 80_000),
+        ('media', 500_000),
+        ('font', 50_000),
+        ('script', 40_000),
+        ('stylesheet', 20_000)
+    )
+    default_estimated_size: int = 5_000
+
+    def url_patterns(self) -> List[str]:
+        """Network.setBlockedURLs에 넘길 URL 패턴 ('*'는 임의의 문자열)"""
+        patterns = []
+        for host in self.blocked_hosts:
+            patterns += [f"*://{host}/*", f"*://*.{host}/*"]
+        for resource_type in sorted(self.blocked_resource_types):
+            for ext in RESOURCE_TYPE_EXTENSIONS.get(resource_type, ()):
+                patterns += [f"*.{ext}", f"*.{ext}?*"]
+        return patterns
+
+    def blocks_url(self, url: str) -> bool:
+        """URL이 차단 패턴에 걸리는지 여부 (브라우저의 와일드카드 매칭과 같은 규칙)"""
+        return any(_wildcard_regex(pattern).fullmatch(url) for pattern in self.url_patterns())
+
+    def estimate_size(self, resource_type: str) -> int:
+        """차단된 요청의 추정 크기 (바이트)"""
+        return dict(self.estimated_sizes).get(resource_type, self.default_estimated_size)
+
+
+# 리소스 유형별 차단 확장자
+RESOURCE_TYPE_EXTENSIONS: Dict[str, Tuple[str, ...]] = {
+    'image': ('jpg', 'jpeg', 'png', 'gif', 'webp', 'bmp', 'svg', 'ico', 'avif',
+              'JPG', 'JPEG', 'PNG', 'GIF'),
+    'media': ('mp4', 'webm', 'm3u8', 'mp3', 'm4a'),
+    'font': ('woff', 'woff2', 'ttf', 'otf', 'eot'),
+}
+
+# 차단된 요청의 requestfailed 오류 문자열
+BLOCKED_ERROR_TEXT = 'net::ERR_BLOCKED_BY_CLIENT'
+
+
+def _wildcard_regex(pattern: str) -> "re.Pattern":
+    return re.compile('.*'.join(re.escape(part) for part in pattern.split('*')))
+
+
+DEFAULT_BLOCKING_PROFILE = BlockingProfile()
+
+
+class BlockingStats:
+    """차단 통계 (누적 및 마지막 take() 이후 구간)
+
+    sync 페이지는 만든 스레드에서, async 페이지는 이벤트 루프에서만
+    이벤트 핸들러가 실행되므로 별도 잠금 없이 사용한다.
+    """
+
+    def __init__(self):
+        self.total_requests = 0
+        self.total_bytes = 0
+        self.by_type: Dict[str, int] = {}
+        self._pending_requests = 0
+        self._pending_bytes = 0
+
+    def record(self, resource_type: str, size: int) -> None:
+        self.total_requests += 1
+        self.total_bytes += size
+        self.by_type[resource_type] = self.by_type.get(resource_type, 0) + 1
+        self._pending_requests += 1
+        self._pending_bytes += size
+
+    def take(self) -> Tuple[int, int]:
+        """마지막 호출 이후 차단된 요청 수와 추정 절약 바이트 반환 후 초기화"""
+        result = (self._pending_requests, self._pending_bytes)
+        self._pending_requests = 0
+        self._pending_bytes = 0
+        return result
+
+
+def format_bytes(size: int) -> str:
+    """바이트 수를 읽기 쉬운 단위로 변환"""
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f}MB"
+    if size >= 1024:
+        return f"{size / 1024:.0f}KB"
+    return f"{size}B"
+
+
+def log_blocked(stats: BlockingStats, label: str = "포스트") -> None:
+    """마지막 출력 이후 차단된 요청 수와 추정 절약량 출력"""
+    requests, saved = stats.take()
+    if requests:
+        print(f"[단계] {label} 리소스 차단: 요청 {requests}개, 약 {format_bytes(saved)} 절약 "
+              f"(누적 {stats.total_requests}개, 약 {format_bytes(stats.total_bytes)})")
+
+
+def _record_blocked(profile: BlockingProfile, stats: BlockingStats, request) -> None:
+    if request.failure == BLOCKED_ERROR_TEXT:
+        stats.record(request.resource_type, profile.estimate_size(request.resource_type))
+
+
+def install_page_blocking(context, page, profile: BlockingProfile, stats: BlockingStats) -> None:
+    """sync 페이지에 CDP 요청 차단 설치 (CDP 세션은 컨텍스트를 닫을 때 함께 정리됨)"""
+    cdp = context.new_cdp_session(page)
+    cdp.send('Network.enable')
+    cdp.send('Network.setBlockedURLs', {'urls': profile.url_patterns()})
+    page.on('requestfailed', lambda request: _record_blocked(profile, stats, request))
+
+
+async def install_page_blocking_async(context, page, profile: BlockingProfile, stats: BlockingStats) -> None:
+    """async 페이지에 CDP 요청 차단 설치"""
+    cdp = await context.new_cdp_session(page)
+    await cdp.send('Network.enable')
+    await cdp.send('Network.setBlockedURLs', {'urls': profile.url_patterns()})
+    page.on('requestfailed', lambda request: _record_blocked(profile, stats, request))
@@ -0,0 +1,910 @@
+"""
+페이지 내 실행 JavaScript 모음
+sync/async 엔진과 파서가 공통으로 사용
+"""
+
+# 본문 제목 요소 또는 document.title에서 제목 추출
+TITLE_JS = """() => {
+    // 방법 1: 본문 제목 요소 직접 찾기
+    const titleSelectors = [
+        'h1.post_subject',
+        'h1.se-title-text',
+        '.post-title h1',
+        '.post_subject',
+        '.se-title-text',
+        'h1.title',
+        'h1',
+        '.title',
+        '[class*="title"]'
+    ];
+
+    for (const selector of titleSelectors) {
+        const elem = document.querySelector(selector);
+        if (elem) {
+            const text = (elem.textContent || elem.innerText || '').trim();
+            if (text && text.length > 0 && text.length < 200) {
+                return text;
+            }
+        }
+    }
+
+    // 방법 2: 페이지 title에서 추출
+    const pageTitle = document.title;
+    if (pageTitle) {
+        // " : " 구분자로 제목 추출
+        if (pageTitle.includes(' : ')) {
+            const parts = pageTitle.split(' : ');
+            if (parts.length > 0) {
+                return parts[0].trim();
+            }
+        }
+        // " - " 구분자로 제목 추출
+        if (pageTitle.includes(' - ')) {
+            const parts = pageTitle.split(' - ');
+            if (parts.length > 0) {
+                return parts[0].trim();
+            }
+        }
+        return pageTitle.trim();
+    }
+
+    return '';
+}"""
+
+
+# 디버깅용: 링크가 있는 컨테이너와 링크 수 확인
+PAGE_STRUCTURE_JS = """() => {
+    const info = {
+        containers: [],
+        allLinks: 0,
+        postLinks: 0
+    };
+
+    // 모든 가능한 컨테이너 확인
+    for (let i = 1; i <= 10; i++) {
+        for (let j = 1; j <= 10; j++) {
+            const xpath = `/html/body/div[1]/div[${i}]/div[${j}]`;
+            const container = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            if (container) {
+                const linkCount = container.querySelectorAll('a[href]').length;
+                if (linkCount > 0) {
+                    info.containers.push({xpath: xpath, links: linkCount});
+                }
+            }
+        }
+    }
+
+    // 전체 페이지 링크 수
+    info.allLinks = document.querySelectorAll('a[href]').length;
+    info.postLinks = document.querySelectorAll('a[href*="/' + location.pathname.split('/')[1] + '/"], a[href*="PostView"], a[href*="logNo"]').length;
+
+    return info;
+}"""
+
+
+# 포스트 목록 DOM에서 포스트 링크 추출 (인자: blogId)
+POST_LINKS_JS = r"""(blogId) => {
+    const links = [];
+    const seen = new Set();  // 중복 확인 (links.includes는 링크 수에 대해 이차 시간)
+
+    // 컨테이너 찾기 (문서 기준 XPath: /html/body/div[1]/div[5]/div[4])
+    const mainContainer = document.evaluate(
+        '/html/body/div[1]/div[5]/div[4]', 
+        document, 
+        null, 
+        XPathResult.FIRST_ORDERED_NODE_TYPE, 
+        null
+    ).singleNodeValue;
+
+    // Fallback 컨테이너들
+    const fallbackContainers = [
+        document.evaluate('/html/body/div[1]/div[5]/div[2]/div[3]', document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue,
+        mainContainer
+    ].filter(c => c !== null);
+
+    const containers = mainContainer ? [mainContainer] : fallbackContainers;
+
+    // 방법 1: 문서에 명시된 선택자 사용 (a.link__A4O1D, a[data-click-area="pls.textpost"])
+    containers.forEach(container => {
+        if (!container) return;
+
+        // div.postlist__qxOgF 안의 링크 찾기 (문서 기준)
+        const postListDivs = container.querySelectorAll('div.postlist__qxOgF');
+        postListDivs.forEach(postDiv => {
+            const linkElements = postDiv.querySelectorAll('a.link__A4O1D, a[data-click-area="pls.textpost"]');
+            linkElements.forEach(a => {
+                let href = a.getAttribute('href');
+                if (href) {
+                    // 상대 경로를 절대 경로로 변환
+                    if (href.startsWith('/')) {
+                        href = 'https://m.blog.naver.com' + href;
+                    } else if (!href.startsWith('http')) {
+                        href = 'https://m.blog.naver.com/' + href;
+                    }
+
+                    // 블로그 ID와 포스트 번호 포함 확인
+                    // 형식: /blog_id/숫자 또는 ?blogId=...&logNo=...
+                    const blogIdPattern = new RegExp(blogId, 'i');
+                    const postNumberPattern = /\/(\d+)|logNo=(\d+)/;
+
+                    if (blogIdPattern.test(href) && postNumberPattern.test(href)) {
+                        // PostView URL로 변환 (표준 형식)
+                        const postNumMatch = href.match(/\/(\d+)/) || href.match(/logNo=(\d+)/);
+                        if (postNumMatch) {
+                            const postNum = postNumMatch[1] || postNumMatch[2];
+                            const standardUrl = `https://m.blog.naver.com/PostView.naver?blogId=${blogId}&logNo=${postNum}`;
+                            if (!seen.has(standardUrl)) {
+                                seen.add(standardUrl);
+                                links.push(standardUrl);
+                            }
+                        }
+                    }
+                }
+            });
+        });
+    });
+
+    // 방법 2: Fallback - 직접 선택자로 찾기
+    if (links.length === 0) {
+        containers.forEach(container => {
+            if (!container) return;
+
+            // 전체 링크 찾기
+            const linkElements = container.querySelectorAll('a.link__A4O1D, a[data-click-area="pls.textpost"]');
+            linkElements.forEach(a => {
+                let href = a.getAttribute('href');
+                if (href) {
+                    if (href.startsWith('/')) {
+                        href = 'https://m.blog.naver.com' + href;
+                    } else if (!href.startsWith('http')) {
+                        href = 'https://m.blog.naver.com/' + href;
+                    }
+
+                    const blogIdPattern = new RegExp(blogId, 'i');
+                    const postNumberPattern = /\/(\d+)|logNo=(\d+)/;
+
+                    if (blogIdPattern.test(href) && postNumberPattern.test(href)) {
+                        const postNumMatch = href.match(/\/(\d+)/) || href.match(/logNo=(\d+)/);
+                        if (postNumMatch) {
+                            const postNum = postNumMatch[1] || postNumMatch[2];
+                            const standardUrl = `https://m.blog.naver.com/PostView.naver?blogId=${blogId}&logNo=${postNum}`;
+                            if (!seen.has(standardUrl)) {
+                                seen.add(standardUrl);
+                                links.push(standardUrl);
+                            }
+                        }
+                    }
+                }
+            });
+        });
+    }
+
+    // 방법 3: 최종 Fallback - ul/li 구조에서 찾기
+    if (links.length === 0) {
+        containers.forEach(container => {
+            if (!container) return;
+
+            const ulElements = container.querySelectorAll('ul');
+            ulElements.forEach(ul => {
+                const listItems = ul.querySelectorAll('li');
+                listItems.forEach(li => {
+                    const allLinks = li.querySelectorAll('a[href]');
+                    allLinks.forEach(a => {
+                        let href = a.getAttribute('href');
+                        if (href) {
+                            if (href.startsWith('/')) {
+                                href = 'https://m.blog.naver.com' + href;
+                            } else if (!href.startsWith('http')) {
+                                href = 'https://m.blog.naver.com/' + href;
+                            }
+
+                            const blogIdPattern = new RegExp(blogId, 'i');
+                            const postNumberPattern = /\/(\d+)|logNo=(\d+)|PostView/;
+
+                            if (blogIdPattern.test(href) && postNumberPattern.test(href)) {
+                                const postNumMatch = href.match(/\/(\d+)/) || href.match(/logNo=(\d+)/);
+                                if (postNumMatch) {
+                                    const postNum = postNumMatch[1] || postNumMatch[2];
+                                    const standardUrl = `https://m.blog.naver.com/PostView.naver?blogId=${blogId}&logNo=${postNum}`;
+                                    if (!seen.has(standardUrl)) {
+                                        seen.add(standardUrl);
+                                        links.push(standardUrl);
+                                    }
+                                }
+                            }
+                        }
+                    });
+                });
+            });
+        });
+    }
+
+    // 방법 4: 최종 Fallback - 페이지 전체에서 블로그 ID와 포스트 번호가 있는 링크 찾기
+    if (links.length === 0) {
+        const allLinks = document.querySelectorAll('a[href]');
+        allLinks.forEach(a => {
+            let href = a.getAttribute('href');
+            if (href) {
+                if (href.startsWith('/')) {
+                    href = 'https://m.blog.naver.com' + href;
+                } else if (!href.startsWith('http')) {
+                    href = 'https://m.blog.naver.com/' + href;
+                }
+
+                const blogIdPattern = new RegExp(blogId, 'i');
+                const postNumberPattern = /\/(\d{8,})|logNo=(\d{8,})/;  // 8자리 이상 숫자 (포스트 ID)
+
+                if (blogIdPattern.test(href) && postNumberPattern.test(href)) {
+                    const postNumMatch = href.match(/\/(\d{8,})/) || href.match(/logNo=(\d{8,})/);
+                    if (postNumMatch) {
+                        const postNum = postNumMatch[1] || postNumMatch[2];
+                        const standardUrl = `https://m.blog.naver.com/PostView.naver?blogId=${blogId}&logNo=${postNum}`;
+                        if (!seen.has(standardUrl)) {
+                            seen.add(standardUrl);
+                            links.push(standardUrl);
+                        }
+                    }
+                }
+            }
+        });
+    }
+
+    return [...new Set(links)];  // 중복 제거
+}"""
+
+
+# 해시태그 링크 텍스트 추출
+TAGS_JS = """() => {
+    const tags = [];
+    const tagLinks = document.querySelectorAll(
+        'a.tag__tFC3j[data-click-area="pst.tag"], a.tag__tFC3j'
+    );
+    tagLinks.forEach(link => {
+        const text = (link.textContent || link.innerText || '').trim();
+        if (text) {
+            const tagName = text.replace(/^#+/, '').trim();
+            if (tagName && !tags.includes(tagName)) {
+                tags.push(tagName);
+            }
+        }
+    });
+    return tags;
+}"""
+
+
+# 해시태그 목록 변화 확인 (인자: 확장 버튼 클릭 전 해시태그 링크 수)
+TAGS_CHANGED_JS = """(before) => {
+    const selector = 'a.tag__tFC3j, .tag-list .tag, .area_tag a, .se_tagList a, .tag-item';
+    return document.querySelectorAll(selector).length > before;
+}"""
+
+
+# 댓글 영역 로드 여부 확인
+COMMENT_AREA_READY_JS = """() => {
+    // 먼저 페이지 전체에서 "비밀 댓글입니다" 확인 (빠른 확인)
+    if (document.body.textContent.includes('비밀 댓글입니다.')) {
+        return true;  // 비밀 댓글이 있으면 즉시 true 반환
+    }
+
+    const selectors = [
+        '#naverComment_wai_u_cbox_content_wrap_tabpanel',
+        '[role="tabpanel"]',
+        '.u_cbox_list',
+        '.u_cbox_content_wrap',
+        '#cbox_module'
+    ];
+    for (const selector of selectors) {
+        const elem = document.querySelector(selector);
+        if (elem && elem.textContent && elem.textContent.trim().length > 0) {
+            return true;
+        }
+    }
+    return false;
+}"""
+
+
+# 댓글 목록 렌더링 확인 (댓글 아이템 또는 빈 목록 안내)
+COMMENTS_RENDERED_JS = """() => {
+    if (document.querySelector('.u_cbox_comment .u_cbox_contents, .u_cbox_list_item .u_cbox_contents')) {
+        return true;
+    }
+    return !!document.querySelector('.u_cbox_list_no_comment, .u_cbox_comment_none');
+}"""
+
+
+# 모든 댓글이 비밀 댓글인지 확인
+SECRET_COMMENTS_ONLY_JS = """() => {
+    // 전체 페이지에서 "비밀 댓글입니다." 텍스트 확인 (빠른 확인)
+    const pageText = document.body.textContent || '';
+    if (!pageText.includes('비밀 댓글입니다.')) {
+        return false;  // 비밀 댓글이 없으면 false
+    }
+
+    // 댓글 영역 전체 텍스트 확인 (빠른 확인)
+    // 여러 선택자로 댓글 영역 찾기
+    const selectors = [
+        '#naverComment_wai_u_cbox_content_wrap_tabpanel',
+        '[role="tabpanel"]',
+        '.u_cbox_list',
+        '.u_cbox_content_wrap',
+        '#cbox_module',
+        '.u_cbox',
+        '[id*="comment"]',
+        '[class*="comment"]'
+    ];
+
+    let commentArea = null;
+    for (const selector of selectors) {
+        commentArea = document.querySelector(selector);
+        if (commentArea) break;
+    }
+
+    // 댓글 영역을 찾지 못했어도 페이지에 "비밀 댓글입니다"가 있으면 확인
+    if (!commentArea) {
+        // 전체 페이지에서 댓글 관련 요소 찾기
+        const allComments = document.querySelectorAll('li, div, span');
+        let secretFound = 0;
+        let normalFound = 0;
+        for (let i = 0; i < Math.min(allComments.length, 50); i++) {
+            const elem = allComments[i];
+            const text = elem.textContent || '';
+            if (text.includes('비밀 댓글입니다.')) {
+                secretFound++;
+                // 비밀 댓글 텍스트가 있고 다른 내용이 거의 없으면
+                if (text.trim().length < 50 && text.includes('비밀 댓글입니다.')) {
+                    return true;  // 비밀 댓글로 판단
+                }
+            }
+            // 일반 댓글 확인 (닉네임이나 내용이 있는 경우)
+            if (elem.querySelector('.u_cbox_nick, .u_cbox_contents') && !text.includes('비밀 댓글입니다.')) {
+                normalFound++;
+            }
+        }
+        // 비밀 댓글만 있고 일반 댓글이 없으면
+        if (secretFound > 0 && normalFound === 0) {
+            return true;
+        }
+        return false;
+    }
+
+    const areaText = commentArea.textContent || '';
+
+    // "비밀 댓글입니다." 텍스트 확인 (빠른 확인)
+    if (!areaText.includes('비밀 댓글입니다.')) {
+        return false;  // 비밀 댓글이 없으면 false
+    }
+
+    // 댓글 아이템 수 확인 (빠른 확인)
+    const commentItems = commentArea.querySelectorAll('li.u_cbox_comment, .u_cbox_comment, .u_cbox_list_item, li');
+    const commentCount = commentItems.length;
+
+    if (commentCount === 0) {
+        // 댓글 아이템이 없어도 영역 텍스트에 "비밀 댓글입니다"만 있으면
+        const lines = areaText.split(/\\n|\\r/).filter(line => line.trim().length > 0);
+        const secretLines = lines.filter(line => line.includes('비밀 댓글입니다.')).length;
+        if (secretLines > 0 && lines.length <= secretLines * 2) {  // 비밀 댓글 관련 텍스트가 대부분이면
+            return true;
+        }
+        return false;
+    }
+
+    // 빠른 확인: 첫 3개 댓글만 확인 (더 빠른 확인)
+    // 첫 3개가 모두 비밀 댓글이면 전체가 비밀 댓글일 가능성 높음
+    let secretCount = 0;
+    let hasNormalComment = false;
+
+    const checkCount = Math.min(commentCount, 3);  // 최대 3개만 확인 (더 빠르게)
+    for (let i = 0; i < checkCount; i++) {
+        const item = commentItems[i];
+        if (!item) continue;
+        const itemText = item.textContent || '';
+        // 비밀 댓글 확인
+        if (itemText.includes('비밀 댓글입니다.')) {
+            secretCount++;
+        } else {
+            // 일반 댓글 확인 (닉네임이나 내용이 있으면)
+            const hasNick = item.querySelector('span.u_cbox_nick, .u_cbox_nick');
+            const hasContent = item.querySelector('span.u_cbox_contents, .u_cbox_contents');
+            if (hasNick || hasContent) {
+                const nickText = hasNick ? (hasNick.textContent || '').trim() : '';
+                const contentText = hasContent ? (hasContent.textContent || '').trim() : '';
+                // 비밀 댓글 텍스트가 없고 내용이 있으면 일반 댓글
+                if (nickText || (contentText && !contentText.includes('비밀 댓글입니다.'))) {
+                    hasNormalComment = true;
+                    break;  // 일반 댓글 발견 시 즉시 종료
+                }
+            }
+        }
+    }
+
+    // 앞부분 3개가 모두 비밀 댓글이면 전체가 비밀 댓글일 가능성 높음
+    if (secretCount === checkCount && checkCount > 0 && !hasNormalComment) {
+        return true;  // 빠르게 판단하여 true 반환
+    }
+
+    // 전체 영역 텍스트에서도 확인 (댓글 아이템이 적을 때)
+    if (commentCount <= 3 && areaText.includes('비밀 댓글입니다.') && !hasNormalComment) {
+        // 전체 텍스트가 "비밀 댓글입니다."만 포함하고 다른 내용이 거의 없으면
+        const lines = areaText.split(/\\n|\\r/).filter(line => line.trim().length > 0);
+        const secretLines = lines.filter(line => line.includes('비밀 댓글입니다.')).length;
+        if (secretLines >= lines.length * 0.8 || (secretLines > 0 && lines.length <= secretLines * 2)) {  // 80% 이상이 비밀 댓글 관련 텍스트면
+            return true;
+        }
+    }
+
+    return false;
+}"""
+
+
+# 댓글 목록 추출 (비밀 댓글 제외)
+COMMENTS_JS = """() => {
+    const comments = [];
+
+    // 방법 1: tabpanel로 찾기
+    const tabpanel = document.querySelector(
+        '#naverComment_wai_u_cbox_content_wrap_tabpanel, [role="tabpanel"]'
+    );
+
+    let commentItems = [];
+    if (tabpanel) {
+        const list = tabpanel.querySelector('ul.u_cbox_list');
+        if (list) {
+            commentItems = list.querySelectorAll('li.u_cbox_comment');
+        } else {
+            commentItems = tabpanel.querySelectorAll('li.u_cbox_comment');
+        }
+    }
+
+    // 방법 2: 전체 페이지에서 찾기
+    if (commentItems.length === 0) {
+        commentItems = document.querySelectorAll('li.u_cbox_comment, .u_cbox_comment');
+    }
+
+    // 각 댓글 처리
+    commentItems.forEach(item => {
+        // 비밀 댓글 확인
+        const itemText = item.textContent || '';
+        if (itemText.includes('비밀 댓글입니다.')) {
+            // 비밀 댓글은 건너뛰기
+            return;
+        }
+
+        // 닉네임 추출
+        let author = '';
+        const nickElem = item.querySelector('span.u_cbox_nick');
+        if (nickElem) {
+            author = (nickElem.textContent || '').trim();
+        } else {
+            const aElem = item.querySelector('a.u_cbox_name > span.u_cbox_nick');
+            if (aElem) {
+                author = (aElem.textContent || '').trim();
+            }
+        }
+
+        // 내용 추출
+        let content = '';
+        const contentElem = item.querySelector('span.u_cbox_contents');
+        if (contentElem) {
+            content = (contentElem.textContent || '').trim();
+            // 비밀 댓글 내용 확인
+            if (content.includes('비밀 댓글입니다.')) {
+                return; // 비밀 댓글 건너뛰기
+            }
+        }
+
+        // 날짜 추출
+        let dateText = '';
+        const dateMatch = itemText.match(/\\d{4}\\.\\d{1,2}\\.\\d{1,2}\\.?\\s+\\d{1,2}:\\d{2}/);
+        if (dateMatch) {
+            dateText = dateMatch[0];
+        }
+
+        // 좋아요 수 추출
+        let likes = 0;
+        const likesMatch = itemText.match(/공감\\s+(\\d+)/);
+        if (likesMatch) {
+            likes = parseInt(likesMatch[1], 10);
+        }
+
+        if (author || content) {
+            comments.push({
+                author: author,
+                content: content,
+                date: dateText,
+                likes: likes
+            });
+        }
+    });
+
+    return comments;
+}"""
+
+
+# 본문 컨테이너 선택자 찾기
+CONTENT_CONTAINER_JS = """() => {
+    // 본문 컨테이너 선택자 (우선순위 순)
+    const selectors = [
+        '.se-main-container',
+        '.se-component-content',
+        '#postViewArea',
+        '.post-view-area',
+        '.post-content',
+        '.area_view',
+        '.post-view',
+        'article',
+        '.post_body'
+    ];
+
+    for (const selector of selectors) {
+        const elem = document.querySelector(selector);
+        if (elem) {
+            // 본문이 실제로 있는지 확인 (텍스트가 50자 이상)
+            const text = (elem.textContent || '').trim();
+            if (text.length > 50) {
+                return {
+                    selector: selector,
+                    found: true,
+                    textLength: text.length
+                };
+            }
+        }
+    }
+
+    return { found: false };
+}"""
+
+
+# 본문 텍스트 추출 (인자: 컨테이너 선택자, 헤더/푸터/댓글 제외)
+CONTENT_TEXT_JS = """(selector) => {
+    let container = null;
+
+    // 선택자가 있으면 해당 요소 사용
+    if (selector) {
+        container = document.querySelector(selector);
+    }
+
+    // 본문 컨테이너 찾기 (우선순위 순)
+    if (!container) {
+        const selectors = [
+            '.se-main-container',
+            '.se-component-content',
+            '#postViewArea',
+            '.post-view-area',
+            '.post-content',
+            '.area_view',
+            '.post-view',
+            'article',
+            '.post_body',
+            '.post_ct',
+            '.post-view-box'
+        ];
+
+        for (const sel of selectors) {
+            const elem = document.querySelector(sel);
+            if (elem) {
+                const text = (elem.textContent || '').trim();
+                // 본문이 실제로 있는지 확인 (50자 이상)
+                if (text.length > 50) {
+                    container = elem;
+                    break;
+                }
+            }
+        }
+    }
+
+    // 본문 영역 직접 찾기 (특정 클래스나 구조로)
+    if (!container || (container === document.body && container.textContent.length > 1000)) {
+        // 방법 1: 제목 다음부터 본문 시작하는 경우
+        const postSubject = document.querySelector('.post_subject, h1.post_subject');
+        if (postSubject) {
+            // 제목 다음 형제 요소들에서 본문 찾기
+            let nextSibling = postSubject.nextElementSibling;
+            while (nextSibling) {
+                const text = (nextSibling.textContent || '').trim();
+                if (text.length > 50 && !text.includes('이웃추가') && !text.includes('공유하기') && !text.includes('로그인')) {
+                    container = nextSibling;
+                    break;
+                }
+                nextSibling = nextSibling.nextElementSibling;
+            }
+        }
+
+        // 방법 2: "신고하기" 버튼 다음 요소들 중 본문 찾기
+        if (!container || container === document.body) {
+            const reportButtons = document.querySelectorAll('button, .btn, a');
+            for (const btn of reportButtons) {
+                const btnText = (btn.textContent || '').trim();
+                if (btnText.includes('신고하기')) {
+                    // 신고하기 버튼 다음 형제 요소들 찾기
+                    let nextSibling = btn.parentElement || btn;
+                    while (nextSibling && nextSibling.nextElementSibling) {
+                        nextSibling = nextSibling.nextElementSibling;
+                        const text = (nextSibling.textContent || '').trim();
+                        // 본문인지 확인 (50자 이상, 제외 텍스트 없음)
+                        if (text.length > 50 && 
+                            !text.includes('이웃추가') && 
+                            !text.includes('공유하기') && 
+                            !text.includes('로그인') &&
+                            !text.includes('카테고리') &&
+                            !text.includes('PC버전')) {
+                            container = nextSibling;
+                            break;
+                        }
+                    }
+                    if (container && container !== document.body) break;
+                }
+            }
+        }
+    }
+
+    if (!container) {
+        // body에서 본문 영역 찾기
+        container = document.body;
+    }
+
+    // 제목, 헤더, 푸터, 댓글 영역 제외
+    const excludeSelectors = [
+        'header', '.header', '.post-header',
+        'footer', '.footer', '.post-footer',
+        '.post-title', '.post_subject', 'h1', 'h2',
+        '.comment-area', '.u_cbox', '.comment',
+        '.post-meta', '.meta-info', '.author-info',
+        '.navigation', '.nav', '.menu',
+        '.sidebar', '.side', '.widget',
+        '.btn', '.button', 'button',
+        '.link', '.menu-item',
+        'script', 'style', 'noscript',
+        '.Nservice_item', '.Nheader',  // 네이버 서비스 메뉴
+        '.log_area', '.login',         // 로그인 영역
+        '.bottom_area', '.footer_area' // 푸터 영역
+    ];
+
+    // 제외할 텍스트 패턴
+    const excludeTexts = [
+        '로그인이 필요합니다',
+        '이웃추가',
+        '공유하기',
+        'URL 복사',
+        '신고하기',
+        '본문 폰트 크기',
+        'PC버전으로 보기',
+        '블로그 고객센터',
+        '네이버 블로그',
+        '카테고리 이동',
+        '카테고리',
+        '검색',
+        'My Menu',
+        '본문 바로가기',
+        'Most important',
+        '내소식',
+        '이웃목록',
+        '클립만들기',
+        '글쓰기',
+        '내 체크인',
+        '최근 본 글',
+        '내 동영상',
+        '내 클립',
+        '내 상품 관리',
+        '마켓 플레이스',
+        '장바구니',
+        '마켓 구매내역',
+        '블로그팀 공식블로그',
+        '이달의 블로그',
+        '공식 블로그',
+        '블로그 앱',
+        'NAVER Corp',
+        'ⓒ'
+    ];
+
+    // 제외할 요소들 찾기
+    const excludeElements = new Set();
+    excludeSelectors.forEach(sel => {
+        try {
+            document.querySelectorAll(sel).forEach(el => {
+                excludeElements.add(el);
+            });
+        } catch (e) {}
+    });
+
+    // 본문 텍스트 추출 (제외 요소 제외)
+    let text = '';
+    const walker = document.createTreeWalker(
+        container,
+        NodeFilter.SHOW_TEXT,
+        {
+            acceptNode: function(node) {
+                let parent = node.parentElement;
+                while (parent && parent !== container) {
+                    if (excludeElements.has(parent)) {
+                        return NodeFilter.FILTER_REJECT;
+                    }
+                    // 스크립트나 스타일 태그도 제외
+                    if (parent.tagName === 'SCRIPT' || parent.tagName === 'STYLE') {
+                        return NodeFilter.FILTER_REJECT;
+                    }
+                    parent = parent.parentElement;
+                }
+                return NodeFilter.FILTER_ACCEPT;
+            }
+        }
+    );
+
+    let node;
+    let collectedLines = [];
+    while (node = walker.nextNode()) {
+        const nodeText = node.textContent.trim();
+        if (nodeText && nodeText.length > 0) {
+            // 제외할 텍스트 패턴 확인
+            let shouldExclude = false;
+            for (const excludeText of excludeTexts) {
+                if (nodeText.includes(excludeText)) {
+                    shouldExclude = true;
+                    break;
+                }
+            }
+
+            // 추가 필터링: 불필요한 텍스트 패턴
+            if (!shouldExclude) {
+                // 날짜 형식 제외 (2016. 12. 18. 등)
+                if (/^\\d{4}\\.\\s*\\d{1,2}\\.\\s*\\d{1,2}/.test(nodeText)) {
+                    shouldExclude = true;
+                }
+                // 숫자만 있는 줄 제외 (123 등)
+                if (/^\\d+$/.test(nodeText)) {
+                    shouldExclude = true;
+                }
+                // JSON 데이터 제외
+                if (nodeText.trim().startsWith('{') && nodeText.includes('"title"')) {
+                    shouldExclude = true;
+                }
+                // 블로그명/닉네임 패턴 제외
+                if (nodeText.includes('(skalekd77)') || nodeText.includes('투영') || nodeText.includes('Too_young')) {
+                    shouldExclude = true;
+                }
+                // 영어만 있는 줄 (메뉴 항목 등) 제외
+                if (/^[A-Za-z\\s\\.]+$/.test(nodeText) && nodeText.length < 30 && !nodeText.includes('\\n')) {
+                    shouldExclude = true;
+                }
+                // 특수 문자만 있는 줄 제외
+                if (/^[ⓒ\\(\\)\\[\\]\\{\\}]+$/.test(nodeText)) {
+                    shouldExclude = true;
+                }
+                // 카테고리, 카테고리 이동 등 제외
+                if (nodeText.includes('카테고리')) {
+                    shouldExclude = true;
+                }
+                // "블로그" 포함 텍스트 제외 (메뉴 등)
+                if (nodeText.includes('블로그')) {
+                    shouldExclude = true;
+                }
+                // 한글과 숫자 조합이 아닌 짧은 텍스트 제외 (메뉴 등)
+                if (nodeText.length < 5 && !/[가-힣]/.test(nodeText)) {
+                    shouldExclude = true;
+                }
+            }
+
+            // 본문은 포함 (3자 이상, 한글이 포함된 경우 우선)
+            if (!shouldExclude && nodeText.length >= 3) {
+                // 한글이 포함된 텍스트는 우선 포함
+                // 하지만 제목과 같은 짧은 텍스트는 제외
+                const hasKorean = /[가-힣]/.test(nodeText);
+                if (hasKorean && nodeText.length > 5) {
+                    // 제목 패턴 제외 (숫자로 시작하는 짧은 텍스트, 예: "161217 호떡 먹고싶다")
+                    if (!(/^\\d{6}\\s/.test(nodeText) && nodeText.length < 30)) {
+                        collectedLines.push(nodeText);
+                    }
+                } else if (nodeText.length > 10 && !hasKorean) {
+                    // 영어나 기타 텍스트도 10자 이상인 경우만 포함
+                    collectedLines.push(nodeText);
+                }
+            }
+        }
+    }
+
+    // 중복 제거 및 정리
+    const uniqueLines = [];
+    const seen = new Set();
+    for (const line of collectedLines) {
+        if (!seen.has(line) && line.length > 0) {
+            seen.add(line);
+            uniqueLines.push(line);
+        }
+    }
+
+    // 수집된 줄들을 합치기
+    text = uniqueLines.join('\\n');
+
+    return text.trim();
+}"""
+
+
+# 포스트 필드 일괄 추출 (제목/작성자/날짜/카운터/카테고리/본문/이미지/링크를 한 번에 반환)
+# 필드별 추출 함수(engine.extract_*, parser.extract_metadata/extract_content)와 같은 선택자와 규칙 사용
+POST_BUNDLE_JS = """() => {
+    const extractTitle = """ + TITLE_JS + """;
+    const findContainer = """ + CONTENT_CONTAINER_JS + """;
+    const extractText = """ + CONTENT_TEXT_JS + """;
+
+    // 선택자 순서대로 첫 요소의 텍스트 (비어 있으면 다음 선택자)
+    const firstText = (selectors) => {
+        for (const selector of selectors) {
+            const elem = document.querySelector(selector);
+            if (elem) {
+                const text = (elem.textContent || '').trim();
+                if (text) {
+                    return text;
+                }
+            }
+        }
+        return '';
+    };
+
+    // 선택자 순서대로 첫 요소의 숫자 (숫자가 없으면 다음 선택자)
+    const firstNumber = (selectors) => {
+        for (const selector of selectors) {
+            const elem = document.querySelector(selector);
+            if (elem) {
+                const match = (elem.textContent || '').replace(/,/g, '').match(/[0-9]+/);
+                if (match) {
+                    return parseInt(match[0], 10);
+                }
+            }
+        }
+        return 0;
+    };
+
+    let category = null;
+    for (const selector of ['.category', '.area_category', '.se_category']) {
+        const elem = document.querySelector(selector);
+        if (elem) {
+            category = (elem.textContent || '').trim();
+            break;
+        }
+    }
+
+    const containerInfo = findContainer();
+    const containerSelector = containerInfo.found ? containerInfo.selector : null;
+    const container = (containerSelector && document.querySelector(containerSelector)) || document.body;
+
+    const images = [];
+    const seenImages = new Set();
+    for (const selector of ['.se-image img', '.post-content img', 'img[src]']) {
+        for (const img of container.querySelectorAll(selector)) {
+            const src = img.getAttribute('src') || img.getAttribute('data-src') || '';
+            if (src && !seenImages.has(src)) {
+                seenImages.add(src);
+                images.push(src);
+            }
+        }
+    }
+
+    const links = [];
+    for (const link of container.querySelectorAll('a[href]')) {
+        const href = link.getAttribute('href') || '';
+        if (href) {
+            links.push(href);
+        }
+    }
+
+    return {
+        pageTitle: document.title || '',
+        title: extractTitle(),
+        nickname: firstText(['.nickname', '.author-name', '.blog-author', '.blog_info .nickname']),
+        publishedDate: firstText(['.se_publishDate', '.publish-date', '.date', '.time__SNGFu', '.desc__k5fQT .time__SNGFu']),
+        modifiedDate: firstText(['.se_modifyDate', '.modified-date', '.modify-date']),
+        views: firstNumber(['.view-count', '.area_viewcount', '[data-view-count]']),
+        likes: firstNumber([
+            '.u_likeit_text._count.num', '.u_likeit_text', '.like-count',
+            '.area_likecount', '[data-like-count]', '.meta_foot__I5IqM .like__vTXys'
+        ]),
+        comments: firstNumber([
+            '.comment_btn__TUucZ .num__OVfhz', '.num__OVfhz', '.comment-count',
+            '.area_commentcount', '[data-comment-count]', '.meta_foot__I5IqM .comment__bWHnT'
+        ]),
+        category: category,
+        html: container.innerHTML,
+        text: extractText(containerSelector),
+        images: images,
+        links: links
+    };
+}"""
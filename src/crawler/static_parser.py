@@ -0,0 +1,438 @@
+"""
+서버 렌더링 HTML 파싱 모듈
+브라우저 없이 PostView.naver HTML에서 POST_BUNDLE_JS와 같은 형식의 결과를 추출
+"""
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+
+# 끝 태그가 없는 요소
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+}
+
+
+class Text:
+    """텍스트 노드"""
+    __slots__ = ('data', 'parent')
+
+    def __init__(self, data: str, parent: "Element"):
+        self.data = data
+        self.parent = parent
+
+
+class Element:
+    """요소 노드 (inner_start/inner_end: 원본 HTML에서 내부 내용의 위치)"""
+    __slots__ = ('tag', 'attrs', 'classes', 'children', 'parent', 'inner_start', 'inner_end')
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional["Element"], inner_start: int = 0):
+        self.tag = tag
+        self.attrs = attrs
+        self.classes = set((attrs.get('class') or '').split())
+        self.children: List[Union["Element", Text]] = []
+        self.parent = parent
+        self.inner_start = inner_start
+        self.inner_end = inner_start
+
+    def get(self, name: str) -> Optional[str]:
+        return self.attrs.get(name)
+
+    def iter(self) -> Iterator["Element"]:
+        """하위 요소 순회 (문서 순서, 자기 자신 제외)"""
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Element):
+                yield node
+                stack.extend(reversed(node.children))
+
+    def text_nodes(self) -> Iterator[Text]:
+        """하위 텍스트 노드 순회 (문서 순서)"""
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Text):
+                yield node
+            else:
+                stack.extend(reversed(node.children))
+
+    def text_content(self) -> str:
+        """textContent와 같은 결과 (script/style 내용 포함)"""
+        return ''.join(node.data for node in self.text_nodes())
+
+
+class _TreeBuilder(HTMLParser):
+    """HTMLParser 이벤트로 요소 트리 생성"""
+
+    def __init__(self, html: str):
+        super().__init__(convert_charrefs=True)
+        self.html = html
+        self.root = Element('#document', {}, None)
+        self.stack = [self.root]
+        # 줄 번호/열 → 절대 위치 변환용
+        self._line_offsets = [0]
+        for match in re.finditer('\n', html):
+            self._line_offsets.append(match.end())
+
+    def _offset(self) -> int:
+        line, column = self.getpos()
+        return self._line_offsets[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        start = self._offset()
+        tag_text = self.get_starttag_text() or ''
+        parent = self.stack[-1]
+        element = Element(tag, {name: value or '' for name, value in attrs}, parent, start + len(tag_text))
+        parent.children.append(element)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        start = self._offset()
+        tag_text = self.get_starttag_text() or ''
+        parent = self.stack[-1]
+        parent.children.append(Element(tag, {name: value or '' for name, value in attrs}, parent, start + len(tag_text)))
+
+    def handle_endtag(self, tag):
+        end = self._offset()
+        # 짝이 맞는 시작 태그까지 닫기 (짝이 없으면 무시)
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                for element in self.stack[index:]:
+                    element.inner_end = end
+                del self.stack[index:]
+                return
+
+    def handle_data(self, data):
+        parent = self.stack[-1]
+        parent.children.append(Text(data, parent))
+
+    def close(self):
+        super().close()
+        end = len(self.html)
+        for element in self.stack[1:]:
+            element.inner_end = end
+        self.root.inner_end = end
+
+
+def parse_html(html: str) -> Element:
+    """HTML 문자열을 요소 트리로 변환 (루트는 #document)"""
+    builder = _TreeBuilder(html)
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# ---------------------------------------------------------------------------
+# CSS 선택자 (태그, #id, .class, [attr], [attr=값], [attr*=값], [attr^=값], 하위/자식 결합자)
+# ---------------------------------------------------------------------------
+
+_COMPOUND_RE = re.compile(
+    r'([a-zA-Z][a-zA-Z0-9]*|\*)?'
+    r'((?:#[\w-]+|\.[\w-]+|\[[\w-]+(?:[*^]?=(?:"[^"]*"|\'[^\']*\'|[^\]]*))?\])*)$'
+)
+_PART_RE = re.compile(r'#([\w-]+)|\.([\w-]+)|\[([\w-]+)(?:([*^]?=)(?:"([^"]*)"|\'([^\']*)\'|([^\]]*)))?\]')
+
+_selector_cache: Dict[str, List[List[Tuple[str, Callable[[Element], bool]]]]] = {}
+
+
+def _compile_compound(text: str) -> Callable[[Element], bool]:
+    match = _COMPOUND_RE.match(text)
+    if not match:
+        raise ValueError(f"지원하지 않는 선택자: {text}")
+    tag = (match.group(1) or '').lower()
+    checks: List[Callable[[Element], bool]] = []
+    if tag and tag != '*':
+        checks.append(lambda element: element.tag == tag)
+    for part in _PART_RE.finditer(match.group(2)):
+        element_id, class_name, attr, operator = part.group(1), part.group(2), part.group(3), part.group(4)
+        value = next((group for group in part.groups()[4:] if group is not None), '')
+        if element_id:
+            checks.append(lambda element, v=element_id: element.attrs.get('id') == v)
+        elif class_name:
+            checks.append(lambda element, v=class_name: v in element.classes)
+        elif operator is None:
+            checks.append(lambda element, a=attr: a in element.attrs)
+        elif operator == '=':
+            checks.append(lambda element, a=attr, v=value: element.attrs.get(a) == v)
+        elif operator == '*=':
+            checks.append(lambda element, a=attr, v=value: v in (element.attrs.get(a) or ''))
+        else:
+            checks.append(lambda element, a=attr, v=value: (element.attrs.get(a) or '').startswith(v))
+    return lambda element: all(check(element) for check in checks)
+
+
+def _compile(selector: str) -> List[List[Tuple[str, Callable[[Element], bool]]]]:
+    """선택자 그룹을 [(결합자, 검사 함수), ...] 목록으로 변환 (오른쪽부터 검사하도록 역순 저장)"""
+    compiled = _selector_cache.get(selector)
+    if compiled is not None:
+        return compiled
+
+    compiled = []
+    for group in selector.split(','):
+        tokens = group.replace('>', ' > ').split()
+        steps = []
+        combinator = ' '
+        for token in tokens:
+            if token == '>':
+                combinator = '>'
+                continue
+            steps.append((combinator, _compile_compound(token)))
+            combinator = ' '
+        compiled.append(list(reversed(steps)))
+    _selector_cache[selector] = compiled
+    return compiled
+
+
+def _matches_steps(element: Element, steps) -> bool:
+    if not steps[0][1](element):
+        return False
+    current = element
+    for index in range(1, len(steps)):
+        combinator = steps[index - 1][0]
+        check = steps[index][1]
+        if combinator == '>':
+            current = current.parent
+            if current is None or not check(current):
+                return False
+        else:
+            current = current.parent
+            while current is not None and not check(current):
+                current = current.parent
+            if current is None:
+                return False
+    return True
+
+
+def select(root: Element, selector: str) -> List[Element]:
+    """querySelectorAll과 같이 문서 순서로 일치하는 요소 반환"""
+    compiled = _compile(selector)
+    return [element for element in root.iter() if any(_matches_steps(element, steps) for steps in compiled)]
+
+
+def select_one(root: Element, selector: str) -> Optional[Element]:
+    """querySelector와 같이 문서 순서상 첫 번째 일치 요소 반환"""
+    compiled = _compile(selector)
+    for element in root.iter():
+        if any(_matches_steps(element, steps) for steps in compiled):
+            return element
+    return None
+
+
+# ---------------------------------------------------------------------------
+# 포스트 필드 추출 (scripts.POST_BUNDLE_JS / CONTENT_TEXT_JS와 같은 규칙)
+# ---------------------------------------------------------------------------
+
+TITLE_SELECTORS = [
+    'h1.post_subject', 'h1.se-title-text', '.post-title h1', '.post_subject',
+    '.se-title-text', 'h1.title', 'h1', '.title', '[class*="title"]'
+]
+CONTENT_SELECTORS = [
+    '.se-main-container', '.se-component-content', '#postViewArea', '.post-view-area',
+    '.post-content', '.area_view', '.post-view', 'article', '.post_body'
+]
+NICKNAME_SELECTORS = ['.nickname', '.author-name', '.blog-author', '.blog_info .nickname']
+PUBLISHED_DATE_SELECTORS = ['.se_publishDate', '.publish-date', '.date', '.time__SNGFu', '.desc__k5fQT .time__SNGFu']
+MODIFIED_DATE_SELECTORS = ['.se_modifyDate', '.modified-date', '.modify-date']
+VIEW_SELECTORS = ['.view-count', '.area_viewcount', '[data-view-count]']
+LIKE_SELECTORS = [
+    '.u_likeit_text._count.num', '.u_likeit_text', '.like-count',
+    '.area_likecount', '[data-like-count]', '.meta_foot__I5IqM .like__vTXys'
+]
+COMMENT_COUNT_SELECTORS = [
+    '.comment_btn__TUucZ .num__OVfhz', '.num__OVfhz', '.comment-count',
+    '.area_commentcount', '[data-comment-count]', '.meta_foot__I5IqM .comment__bWHnT'
+]
+CATEGORY_SELECTORS = ['.category', '.area_category', '.se_category']
+TAG_SELECTORS = [
+    'a.tag__tFC3j[data-click-area="pst.tag"]', 'a.tag__tFC3j',
+    '.list_wrap__jKORt .list__yr1c8 .item__jRCnW a.tag__tFC3j', '.tag__tFC3j',
+    '.tag-list .tag', '.area_tag a', '.se_tagList a', '.tag-item'
+]
+TAG_EXPAND_SELECTOR = 'button.expand_btn__oaNLH, button[data-click-area="pst.tagmore"]'
+
+EXCLUDE_SELECTORS = ', '.join([
+    'header', '.header', '.post-header',
+    'footer', '.footer', '.post-footer',
+    '.post-title', '.post_subject', 'h1', 'h2',
+    '.comment-area', '.u_cbox', '.comment',
+    '.post-meta', '.meta-info', '.author-info',
+    '.navigation', '.nav', '.menu',
+    '.sidebar', '.side', '.widget',
+    '.btn', '.button', 'button',
+    '.link', '.menu-item',
+    'script', 'style', 'noscript',
+    '.Nservice_item', '.Nheader',
+    '.log_area', '.login',
+    '.bottom_area', '.footer_area'
+])
+EXCLUDE_TEXTS = [
+    '로그인이 필요합니다', '이웃추가', '공유하기', 'URL 복사', '신고하기', '본문 폰트 크기',
+    'PC버전으로 보기', '블로그 고객센터', '네이버 블로그', '카테고리 이동', '카테고리', '검색',
+    'My Menu', '본문 바로가기', 'Most important', '내소식', '이웃목록', '클립만들기', '글쓰기',
+    '내 체크인', '최근 본 글', '내 동영상', '내 클립', '내 상품 관리', '마켓 플레이스', '장바구니',
+    '마켓 구매내역', '블로그팀 공식블로그', '이달의 블로그', '공식 블로그', '블로그 앱', 'NAVER Corp', 'ⓒ'
+]
+_DATE_LINE_RE = re.compile(r'^[0-9]{4}\.\s*[0-9]{1,2}\.\s*[0-9]{1,2}')
+_DIGITS_ONLY_RE = re.compile(r'^[0-9]+$')
+_ENGLISH_ONLY_RE = re.compile(r'^[A-Za-z\s.]+$')
+_SYMBOLS_ONLY_RE = re.compile(r'^[ⓒ()\[\]{}]+$')
+_KOREAN_RE = re.compile(r'[가-힣]')
+_TITLE_LIKE_RE = re.compile(r'^[0-9]{6}\s')
+
+
+def _first_text(root: Element, selectors: List[str]) -> str:
+    for selector in selectors:
+        element = select_one(root, selector)
+        if element is not None:
+            text = element.text_content().strip()
+            if text:
+                return text
+    return ''
+
+
+def _first_number(root: Element, selectors: List[str]) -> Tuple[int, bool]:
+    """첫 숫자와 요소 존재 여부"""
+    found = False
+    for selector in selectors:
+        element = select_one(root, selector)
+        if element is not None:
+            found = True
+            match = re.search(r'[0-9]+', element.text_content().replace(',', ''))
+            if match:
+                return int(match.group(0)), True
+    return 0, found
+
+
+def _title(root: Element) -> str:
+    for selector in TITLE_SELECTORS:
+        element = select_one(root, selector)
+        if element is not None:
+            text = element.text_content().strip()
+            if text and len(text) < 200:
+                return text
+    return ''
+
+
+def _content_text(root: Element, container: Element) -> str:
+    """CONTENT_TEXT_JS와 같은 규칙으로 본문 텍스트 추출"""
+    excluded = set(id(element) for element in select(root, EXCLUDE_SELECTORS))
+
+    def accepted(node: Text) -> bool:
+        parent = node.parent
+        while parent is not None and parent is not container:
+            if id(parent) in excluded or parent.tag in ('script', 'style'):
+                return False
+            parent = parent.parent
+        return True
+
+    lines: List[str] = []
+    seen = set()
+    for node in container.text_nodes():
+        text = node.data.strip()
+        if not text or not accepted(node):
+            continue
+
+        exclude = any(pattern in text for pattern in EXCLUDE_TEXTS)
+        if not exclude:
+            exclude = (
+                bool(_DATE_LINE_RE.match(text))
+                or bool(_DIGITS_ONLY_RE.match(text))
+                or (text.startswith('{') and '"title"' in text)
+                or '(skalekd77)' in text or '투영' in text or 'Too_young' in text
+                or (bool(_ENGLISH_ONLY_RE.match(text)) and len(text) < 30 and '\n' not in text)
+                or bool(_SYMBOLS_ONLY_RE.match(text))
+                or '카테고리' in text
+                or '블로그' in text
+                or (len(text) < 5 and not _KOREAN_RE.search(text))
+            )
+        if exclude or len(text) < 3:
+            continue
+
+        has_korean = bool(_KOREAN_RE.search(text))
+        if has_korean and len(text) > 5:
+            if _TITLE_LIKE_RE.match(text) and len(text) < 30:
+                continue
+        elif not (len(text) > 10 and not has_korean):
+            continue
+
+        if text not in seen:
+            seen.add(text)
+            lines.append(text)
+
+    return '\n'.join(lines).strip()
+
+
+def bundle_from_html(html: str) -> Optional[dict]:
+    """서버 렌더링 HTML에서 POST_BUNDLE_JS와 같은 형식의 결과 추출
+
+    본문 컨테이너가 서버 HTML에 없으면(스크립트로 렌더링되는 페이지) None을 반환한다.
+    추가 키:
+        tags: 확장 없이 보이는 해시태그
+        hasTagExpand: 해시태그 확장 버튼 존재 여부 (있으면 브라우저 필요)
+        commentCountFound: 댓글 수 요소 존재 여부 (없으면 댓글 여부를 알 수 없음)
+    """
+    root = parse_html(html)
+
+    container_selector = None
+    for selector in CONTENT_SELECTORS:
+        element = select_one(root, selector)
+        if element is not None and len(element.text_content().strip()) > 50:
+            container_selector = selector
+            break
+    if container_selector is None:
+        return None
+    container = select_one(root, container_selector)
+
+    title_element = select_one(root, 'title')
+    category = None
+    for selector in CATEGORY_SELECTORS:
+        element = select_one(root, selector)
+        if element is not None:
+            category = element.text_content().strip()
+            break
+
+    images = []
+    seen_images = set()
+    for selector in ['.se-image img', '.post-content img', 'img[src]']:
+        for img in select(container, selector):
+            src = img.get('src') or img.get('data-src') or ''
+            if src and src not in seen_images:
+                seen_images.add(src)
+                images.append(src)
+
+    links = [link.get('href') for link in select(container, 'a[href]') if link.get('href')]
+
+    tags = []
+    for selector in TAG_SELECTORS:
+        for element in select(root, selector):
+            tag_name = element.text_content().replace('#', '').strip()
+            if tag_name and tag_name not in tags:
+                tags.append(tag_name)
+        if tags:
+            break
+
+    views, _ = _first_number(root, VIEW_SELECTORS)
+    likes, _ = _first_number(root, LIKE_SELECTORS)
+    comments, comment_count_found = _first_number(root, COMMENT_COUNT_SELECTORS)
+
+    return {
+        'pageTitle': title_element.text_content().strip() if title_element is not None else '',
+        'title': _title(root),
+        'nickname': _first_text(root, NICKNAME_SELECTORS),
+        'publishedDate': _first_text(root, PUBLISHED_DATE_SELECTORS),
+        'modifiedDate': _first_text(root, MODIFIED_DATE_SELECTORS),
+        'views': views,
+        'likes': likes,
+        'comments': comments,
+        'category': category,
+        'html': html[container.inner_start:container.inner_end],
+        'text': _content_text(root, container),
+        'images': images,
+        'links': links,
+        'tags': tags,
+        'hasTagExpand': select_one(root, TAG_EXPAND_SELECTOR) is not None,
+        'commentCountFound': comment_count_found
+    }
@@ -19,6 +19,7 @@ sys.path.insert(0, str(project_root))
 
 from src.crawler.batch_crawler import crawl_multiple_blog_ids, resume_crawling
 from src.utils.checkpoint_manager import CheckpointManager
+from src.utils.metrics import CallbackSink, CrawlMetrics, summary_line
 
 
 class StdoutRedirector:
@@ -381,6 +382,10 @@ class MainWindow:
         self.progress_label = ttk.Label(progress_frame, text="0.0% (0/0)")
         self.progress_label.pack(pady=5)
         
+        # 크롤링 지표 요약 (분당 포스트 수, 단계별 평균 소요 시간, 재시도/실패)
+        self.metrics_label = ttk.Label(progress_frame, text="")
+        self.metrics_label.pack(pady=2)
+        
         # 로그 영역
         log_frame = ttk.LabelFrame(self.root, text="로그", padding="10")
         log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -426,8 +431,11 @@ class MainWindow:
         # 메인 스레드에서 실행
         self.root.after(0, _log)
     
-    def update_progress(self, current: float, total: int, blog_current: int = None, blog_total: int = None, post_progress: float = None):
-        """진행률 업데이트 (스레드 안전)"""
+    def update_progress(self, current: float, total: int, blog_current: int = None, blog_total: int = None, post_progress: float = None,
+                        rate: float = None):
+        """진행률 업데이트 (스레드 안전, rate: 현재 초당 요청 수)"""
+        rate_text = f" · 초당 {rate:.1f}건" if rate is not None else ""
+        
         def _update():
             try:
                 if hasattr(self, 'progress_var') and hasattr(self, 'progress_label'):
@@ -442,12 +450,12 @@ class MainWindow:
                                 if blog_current is not None and blog_total is not None:
                                     # post_progress가 있으면 포스트 진행률 사용, 없으면 전체 진행률 사용
                                     display_progress = post_progress if post_progress is not None else progress
-                                    self.progress_label.config(text=f"블로그 {blog_current}/{blog_total} ({display_progress:.1f}%)")
+                                    self.progress_label.config(text=f"블로그 {blog_current}/{blog_total} ({display_progress:.1f}%){rate_text}")
                                 else:
                                     # 블로그 정보가 없으면 기존 형식으로 표시
                                     current_int = int(round(current))
                                     total_int = int(round(total))
-                                    self.progress_label.config(text=f"{progress:.1f}% ({current_int}/{total_int})")
+                                    self.progress_label.config(text=f"{progress:.1f}% ({current_int}/{total_int}){rate_text}")
                             else:
                                 if blog_current is not None and blog_total is not None:
                                     self.progress_label.config(text=f"블로그 {blog_current}/{blog_total} (0.0%)")
@@ -459,6 +467,20 @@ class MainWindow:
         # 메인 스레드에서 실행
         self.root.after(0, _update)
     
+    def update_metrics(self, snapshot: dict):
+        """크롤링 지표 요약 표시 (스레드 안전, CallbackSink에서 호출)"""
+        text = summary_line(snapshot)
+        
+        def _update():
+            try:
+                if hasattr(self, 'metrics_label') and self.metrics_label.winfo_exists():
+                    self.metrics_label.config(text=text)
+            except Exception:
+                pass  # 위젯이 파괴된 경우 무시
+        
+        # 메인 스레드에서 실행
+        self.root.after(0, _update)
+    
     def confirm_stop(self):
         """중단 확인"""
         if messagebox.askyesno("크롤링 중단", 
@@ -523,6 +545,10 @@ class MainWindow:
             # 크롤링 시작
             headless = params.get('headless', True)  # 기본값: headless
             
+            # 크롤링 지표를 진행 화면에 표시 (체크포인트 옆 .metrics 파일에도 기록됨)
+            metrics = CrawlMetrics()
+            metrics.add_sink(CallbackSink(self.update_metrics))
+            
             if resume_mode:
                 # 재개 모드
                 output_path = f"output/crawl_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -537,7 +563,8 @@ class MainWindow:
                     should_stop=self.should_stop,
                     save_interval=self.save_interval,
                     progress_callback=self.update_progress,
-                    headless=headless
+                    headless=headless,
+                    metrics=metrics
                 )
                 total_blogs = 0
             else:
@@ -560,7 +587,8 @@ class MainWindow:
                     should_stop=self.should_stop,
                     save_interval=self.save_interval,
                     progress_callback=self.update_progress,
-                    headless=headless
+                    headless=headless,
+                    metrics=metrics
                 )
                 total_blogs = len(blog_ids)
             
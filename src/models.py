@@ -1,22 +1,25 @@
 """
 데이터 모델 정의
+
+모델은 __slots__ 데이터클래스이고, to_dict는 dataclasses.asdict(재귀 깊은 복사) 대신
+필드를 직접 나열해 dict를 만든다 (리스트 필드는 복사하지 않고 그대로 참조).
 """
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Optional, List
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Author:
     """작성자 정보"""
     blog_id: str
     nickname: str
 
     def to_dict(self):
-        return asdict(self)
+        return {'blog_id': self.blog_id, 'nickname': self.nickname}
 
 
-@dataclass
+@dataclass(slots=True)
 class PostMetadata:
     """포스트 메타데이터"""
     views: int = 0
@@ -26,10 +29,16 @@ class PostMetadata:
     tags: List[str] = field(default_factory=list)
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            'views': self.views,
+            'likes': self.likes,
+            'comments': self.comments,
+            'category': self.category,
+            'tags': self.tags
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class PostContent:
     """포스트 본문 내용"""
     html: str = ""
@@ -38,16 +47,22 @@ class PostContent:
     word_count: int = 0
     images: List[str] = field(default_factory=list)
     links: List[str] = field(default_factory=list)
+    html_ref: Optional[str] = None  # HtmlStore에 내보낸 원본 HTML의 해시
 
     def to_dict(self):
-        # JSON 출력 시 html과 markdown은 제외
-        result = asdict(self)
-        result.pop('html', None)
-        result.pop('markdown', None)
+        # JSON 출력 시 html과 markdown은 제외 (html_ref는 HTML을 내보낸 경우에만 포함)
+        result = {
+            'text': self.text,
+            'word_count': self.word_count,
+            'images': self.images,
+            'links': self.links
+        }
+        if self.html_ref:
+            result['html_ref'] = self.html_ref
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     """댓글 정보"""
     author: str
@@ -56,10 +71,10 @@ class Comment:
     likes: int = 0
 
     def to_dict(self):
-        return asdict(self)
+        return {'author': self.author, 'content': self.content, 'date': self.date, 'likes': self.likes}
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """포스트 정보"""
     post_id: str
@@ -85,4 +100,3 @@ class Post:
             'content': self.content.to_dict(),
             'comments': [comment.to_dict() for comment in self.comments]
         }
-
@@ -0,0 +1,176 @@
+"""
+원자적 파일 쓰기 모듈
+임시 파일에 쓴 뒤 os.replace로 교체하여 중단되어도 잘린 파일이 남지 않게 한다
+"""
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator, TextIO, Union
+
+from src.utils.exceptions import CorruptFileError
+
+
+# 체크섬 파일: <파일>.sha256 (내용은 SHA-256 hex 한 줄)
+CHECKSUM_SUFFIX = '.sha256'
+# 파일 교체 후 체크섬 교체 전에 중단된 경우를 복구하기 위한 대기 중 체크섬
+PENDING_CHECKSUM_SUFFIX = '.sha256.pending'
+
+PathLike = Union[str, Path]
+
+
+def checksum_path_for(path: PathLike) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + CHECKSUM_SUFFIX)
+
+
+def _pending_checksum_path_for(path: PathLike) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + PENDING_CHECKSUM_SUFFIX)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """이름 변경이 디스크에 반영되도록 디렉토리 fsync (지원하지 않는 OS는 무시)"""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_small_file(path: Path, text: str, fsync: bool) -> None:
+    with open(path, 'w', encoding='ascii') as f:
+        f.write(text)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+@contextlib.contextmanager
+def atomic_open(
+    path: PathLike,
+    mode: str = 'w',
+    encoding: str = 'utf-8',
+    fsync: bool = True,
+    checksum: bool = False
+) -> Iterator[TextIO]:
+    """원자적 쓰기용 파일 열기
+
+    같은 디렉토리의 임시 파일에 쓰고, with 블록이 정상 종료되면 fsync 후
+    os.replace로 대상 파일을 교체한다. 예외가 나면 임시 파일만 지우고 기존 파일은 그대로 둔다.
+    checksum이 True이면 교체 후 <파일>.sha256에 SHA-256을 기록한다.
+    """
+    if mode not in ('w', 'wb'):
+        raise ValueError(f"atomic_open은 쓰기 모드만 지원합니다: {mode}")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix='.tmp')
+    temp_path = Path(temp_name)
+    try:
+        if mode == 'wb':
+            f = os.fdopen(fd, 'wb')
+        else:
+            f = os.fdopen(fd, 'w', encoding=encoding)
+        with f:
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        if checksum:
+            # 체크섬을 먼저 대기 파일로 기록: 파일 교체 직후 중단되어도 load 시 복구 가능
+            pending = _pending_checksum_path_for(path)
+            _write_small_file(pending, _file_sha256(temp_path) + '\n', fsync)
+            os.replace(temp_path, path)
+            os.replace(pending, checksum_path_for(path))
+        else:
+            os.replace(temp_path, path)
+        if fsync:
+            _fsync_dir(path.parent)
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def atomic_write_text(
+    path: PathLike,
+    text: str,
+    encoding: str = 'utf-8',
+    fsync: bool = True,
+    checksum: bool = False
+) -> Path:
+    """텍스트를 원자적으로 저장"""
+    with atomic_open(path, 'w', encoding=encoding, fsync=fsync, checksum=checksum) as f:
+        f.write(text)
+    return Path(path)
+
+
+def atomic_write_json(
+    path: PathLike,
+    data: Any,
+    fsync: bool = True,
+    checksum: bool = True,
+    **dump_kwargs
+) -> Path:
+    """JSON을 원자적으로 저장 (기본: ensure_ascii=False, indent=2, 체크섬 기록)"""
+    dump_kwargs.setdefault('ensure_ascii', False)
+    dump_kwargs.setdefault('indent', 2)
+    with atomic_open(path, 'w', fsync=fsync, checksum=checksum) as f:
+        json.dump(data, f, **dump_kwargs)
+    return Path(path)
+
+
+def verify_checksum(path: PathLike) -> bool:
+    """체크섬 파일과 비교 (체크섬 파일이 없으면 검증할 수 없으므로 True)
+
+    Raises:
+        CorruptFileError: 체크섬 불일치
+    """
+    path = Path(path)
+    checksum_file = checksum_path_for(path)
+    pending = _pending_checksum_path_for(path)
+    if not checksum_file.exists() and not pending.exists():
+        return True
+
+    actual = _file_sha256(path)
+    if checksum_file.exists() and checksum_file.read_text(encoding='ascii').strip() == actual:
+        return True
+    # 파일 교체 후 체크섬 교체 전에 중단된 경우: 대기 체크섬이 맞으면 교체를 마무리
+    if pending.exists() and pending.read_text(encoding='ascii').strip() == actual:
+        os.replace(pending, checksum_file)
+        return True
+    raise CorruptFileError(f"체크섬이 일치하지 않습니다: {path}")
+
+
+def load_json(path: PathLike) -> Any:
+    """체크섬을 검증한 뒤 JSON 로드
+
+    Raises:
+        FileNotFoundError: 파일 없음
+        CorruptFileError: 체크섬 불일치 또는 JSON 파싱 실패
+    """
+    path = Path(path)
+    verify_checksum(path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except json.JSONDecodeError as e:
+        raise CorruptFileError(f"JSON 파일이 손상되었습니다: {path} ({e})")
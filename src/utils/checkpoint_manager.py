@@ -1,21 +1,95 @@
 """
 체크포인트 관리 모듈
 """
+import copy
 import json
+import os
+import queue
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 
 from src.models import Post
+from src.utils.atomic_io import atomic_write_json, load_json
+
+
+# 스냅샷(batch_*.json) 옆에 두는 변경분 저널 (한 줄에 저장 1회분)
+JOURNAL_SUFFIX = '.journal'
+RECENT_POSTS_LIMIT = 100  # 체크포인트에 보관하는 최근 포스트 수
+# 블로그 진행 상황에서 blog 변경이 아닌 별도 변경(blog_urls, crawled)으로 기록하는 필드
+BLOG_LIST_FIELDS = ("blog_id", "all_post_urls", "crawled_urls")
+
+
+def set_op(key: str, value) -> dict:
+    """작업 정보 필드 하나 설정"""
+    return {"op": "set", "key": key, "value": value}
+
+
+def blog_op(blog_progress: dict, replace: bool = False) -> dict:
+    """블로그 하나의 진행 상황 필드 (링크 목록 제외, replace면 여기에 없는 기존 필드 삭제)"""
+    fields = {key: value for key, value in blog_progress.items() if key not in BLOG_LIST_FIELDS}
+    op = {"op": "blog", "blog_id": blog_progress["blog_id"], "fields": fields}
+    if replace:
+        op["replace"] = True
+    return op
+
+
+def blog_urls_op(blog_id: str, all_post_urls: Optional[List[str]]) -> dict:
+    """블로그 하나의 전체 링크 목록"""
+    return {"op": "blog_urls", "blog_id": blog_id,
+            "all_post_urls": list(all_post_urls) if all_post_urls is not None else None}
+
+
+def crawled_op(blog_id: str, urls: List[str]) -> dict:
+    """블로그 하나에서 새로 크롤링된 URL (이미 기록된 URL은 재생 시 무시)"""
+    return {"op": "crawled", "blog_id": blog_id, "urls": list(urls)}
+
+
+def blog_progress_ops(blog_progress: dict) -> List[dict]:
+    """블로그 진행 상황 항목 전체를 기록하는 변경 목록 (블로그를 새로 시작할 때)"""
+    blog_id = blog_progress["blog_id"]
+    ops = [blog_op(blog_progress, replace=True)]
+    if "all_post_urls" in blog_progress:
+        ops.append(blog_urls_op(blog_id, blog_progress["all_post_urls"]))
+    if blog_progress.get("crawled_urls"):
+        ops.append(crawled_op(blog_id, blog_progress["crawled_urls"]))
+    return ops
+
+
+def _posts_op(posts: List[Post]) -> dict:
+    return {"op": "posts", "posts": [post.to_dict() if isinstance(post, Post) else post for post in posts]}
 
 
 class CheckpointManager:
-    """체크포인트 관리 클래스"""
+    """체크포인트 관리 클래스
     
-    def __init__(self, checkpoint_dir: str = "checkpoints"):
+    체크포인트는 스냅샷(JSON) + 저널(JSONL) 두 파일로 저장한다.
+    save_changes는 호출자가 만든 변경 목록(set_op, blog_op, blog_urls_op, crawled_op)을
+    저널에 한 줄로 추가하고 ("URL X 크롤링됨", "블로그 Y 완료" 등),
+    save_checkpoint는 job_data 전체를 직전 저장 상태와 비교해 변경 목록을 만든다
+    (작업 시작처럼 무엇이 바뀌었는지 모를 때만 사용, 저장마다 쓰면 비교 비용이 큼).
+    compact_every번 저장하거나 작업이 완료/일시정지되면 스냅샷으로 합치고 저널을 비운다.
+    load_checkpoint는 스냅샷에 저널을 재생해 기존과 같은 job_data 딕셔너리를 돌려준다.
+    """
+    
+    def __init__(self, checkpoint_dir: str = "checkpoints", compact_every: int = 200):
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         self.current_checkpoint_path: Optional[Path] = None
+        self.compact_every = max(1, compact_every)
+        # 마지막으로 기록된 체크포인트 상태 (스냅샷 + 저널 반영)
+        self._state: Optional[dict] = None
+        self._state_path: Optional[Path] = None
+        self._posts: Dict[str, dict] = {}  # post_id -> 포스트 (삽입 순서 = 최근 순서)
+        self._crawled_sets: Dict[str, Set[str]] = {}  # 블로그별 crawled_urls 집합
+        self._journal_entries = 0
+        self._journal_torn = False  # 저널 마지막 줄이 잘려 있음 (다음 기록 전에 줄바꿈)
+    
+    @staticmethod
+    def journal_path_for(checkpoint_path: Path) -> Path:
+        """스냅샷 경로에 대응하는 저널 경로"""
+        return Path(checkpoint_path).with_suffix(JOURNAL_SUFFIX)
     
     def create_checkpoint(self, job_data: dict) -> Path:
         """체크포인트 생성"""
@@ -28,67 +102,270 @@ class CheckpointManager:
             "checkpoint_id": checkpoint_id,
             "created_at": datetime.now().isoformat(),
             "last_updated": datetime.now().isoformat(),
-            **job_data
+            **copy.deepcopy(job_data)
         }
         
-        with open(checkpoint_path, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint_data, f, ensure_ascii=False, indent=2)
-        
         self.current_checkpoint_path = checkpoint_path
+        self._reset_state(checkpoint_path, checkpoint_data)
+        self.compact()
         return checkpoint_path
     
     def save_checkpoint(self, job_data: dict, posts: List[Post], save_interval: int = 10) -> None:
-        """체크포인트 저장 (중간 저장)"""
+        """체크포인트 저장 (job_data 전체를 직전 저장 상태와 비교해 변경분만 저널에 추가)"""
         if not self.current_checkpoint_path:
             self.create_checkpoint(job_data)
+        if self._state_path != self.current_checkpoint_path:
+            self._load_state(self.current_checkpoint_path, job_data)
         
-        # 체크포인트 파일 로드
-        try:
-            with open(self.current_checkpoint_path, 'r', encoding='utf-8') as f:
-                checkpoint_data = json.load(f)
-        except FileNotFoundError:
-            checkpoint_data = {
-                "checkpoint_id": f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                "created_at": datetime.now().isoformat(),
-                **job_data
-            }
-        
-        # 최근 포스트 추가
-        if 'posts' not in checkpoint_data:
-            checkpoint_data['posts'] = []
-        
-        # Post 객체를 dict로 변환
-        post_dicts = [post.to_dict() for post in posts]
-        checkpoint_data['posts'].extend(post_dicts)
+        self._write_ops(self._diff(job_data, posts), job_data.get("status"))
+    
+    def save_changes(self, ops: List[dict], posts: Optional[List[Post]] = None) -> None:
+        """호출자가 만든 변경 목록을 그대로 저널에 추가 (job_data 비교 없음)
         
-        # 최근 100개만 유지 (중복 제거)
-        seen_ids = set()
-        unique_posts = []
-        for post in reversed(checkpoint_data['posts']):
-            post_id = post.get('post_id', '')
-            if post_id and post_id not in seen_ids:
-                seen_ids.add(post_id)
-                unique_posts.insert(0, post)
+        체크포인트를 만들었거나 불러온 뒤에만 사용한다.
+        status를 completed/paused로 바꾸는 변경이 있으면 스냅샷으로 합친다.
+        """
+        if self._state_path != self.current_checkpoint_path:
+            self._load_state(self.current_checkpoint_path)
         
-        checkpoint_data['posts'] = unique_posts[-100:]  # 최근 100개만
+        ops = list(ops)
+        if posts:
+            ops.append(_posts_op(posts))
+        status = None
+        for op in ops:
+            if op.get("op") == "set" and op.get("key") == "status":
+                status = op["value"]
+        self._write_ops(ops, status)
+    
+    def _write_ops(self, ops: List[dict], status: Optional[str]) -> None:
+        ops.append(set_op("last_updated", datetime.now().isoformat()))
+        self._apply(ops)
         
-        # 업데이트
-        checkpoint_data['last_updated'] = datetime.now().isoformat()
-        checkpoint_data.update(job_data)
+        journal_path = self.journal_path_for(self.current_checkpoint_path)
+        with open(journal_path, 'a', encoding='utf-8') as f:
+            if self._journal_torn:
+                f.write('\n')
+                self._journal_torn = False
+            f.write(json.dumps({"ops": ops}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_entries += 1
         
-        # 저장
-        with open(self.current_checkpoint_path, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint_data, f, ensure_ascii=False, indent=2)
+        if self._journal_entries >= self.compact_every or status in ("completed", "paused"):
+            self.compact()
+    
+    def compact(self) -> None:
+        """현재 상태를 스냅샷으로 저장하고 저널 비우기"""
+        if self._state is None or self.current_checkpoint_path is None:
+            return
+        atomic_write_json(self.current_checkpoint_path, self._snapshot())
+        # 스냅샷 교체 후에 저널을 지워야 중간에 중단되어도 변경분이 사라지지 않음
+        # (저널 재생은 같은 변경을 다시 적용해도 결과가 같음)
+        journal_path = self.journal_path_for(self.current_checkpoint_path)
+        if journal_path.exists():
+            journal_path.unlink()
+        self._journal_entries = 0
     
     def load_checkpoint(self, checkpoint_path: str) -> dict:
-        """체크포인트 로드"""
+        """체크포인트 로드 (스냅샷 체크섬 검증 후 저널 재생)
+        
+        Raises:
+            FileNotFoundError: 체크포인트 파일 없음
+            CorruptFileError: 스냅샷 체크섬 불일치 또는 손상
+        """
         path = Path(checkpoint_path)
         if not path.exists():
             raise FileNotFoundError(f"체크포인트 파일을 찾을 수 없습니다: {checkpoint_path}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
+        self._load_state(path)
         self.current_checkpoint_path = path
-        return data
+        return copy.deepcopy(self._snapshot())
+    
+    def _reset_state(self, path: Path, data: dict) -> None:
+        self._state = data
+        self._state_path = path
+        self._posts = {}
+        self._merge_posts(data.pop("posts", []) or [])
+        self._crawled_sets = {
+            bp.get("blog_id"): set(bp.get("crawled_urls") or [])
+            for bp in data.get("blog_progress", []) or []
+        }
+        self._journal_entries = 0
+        self._journal_torn = False
+    
+    def _load_state(self, path: Path, job_data: Optional[dict] = None) -> None:
+        """스냅샷을 읽고 저널을 재생해 내부 상태 구성 (파일이 없으면 job_data로 시작)"""
+        try:
+            data = load_json(path)  # 체크섬 불일치/손상 시 CorruptFileError
+        except FileNotFoundError:
+            data = {
+                "checkpoint_id": path.stem,
+                "created_at": datetime.now().isoformat(),
+                **copy.deepcopy(job_data or {})
+            }
+        self._reset_state(path, data)
+        
+        journal_path = self.journal_path_for(path)
+        if not journal_path.exists():
+            return
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                self._journal_torn = not line.endswith('\n')
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 저장 도중 중단되어 잘린 마지막 줄은 무시
+                    print(f"[경고] 체크포인트 저널 {line_no}번째 줄을 읽을 수 없어 건너뜁니다")
+                    continue
+                self._apply(entry.get("ops", []))
+                self._journal_entries += 1
+    
+    def _snapshot(self) -> dict:
+        snapshot = dict(self._state)
+        snapshot["posts"] = list(self._posts.values())
+        return snapshot
+    
+    def _merge_posts(self, post_dicts: List[dict]) -> None:
+        """최근 포스트 병합 (post_id 중복은 마지막 것 유지, 최근 100개만)"""
+        for post in post_dicts:
+            post_id = post.get('post_id', '')
+            if not post_id:
+                continue
+            self._posts.pop(post_id, None)
+            self._posts[post_id] = post
+        while len(self._posts) > RECENT_POSTS_LIMIT:
+            del self._posts[next(iter(self._posts))]
+    
+    def _find_state_blog(self, blog_id: str) -> dict:
+        blog_progress = self._state.setdefault("blog_progress", [])
+        for bp in blog_progress:
+            if bp.get("blog_id") == blog_id:
+                return bp
+        bp = {"blog_id": blog_id, "crawled_urls": []}
+        blog_progress.append(bp)
+        self._crawled_sets[blog_id] = set()
+        return bp
+    
+    def _diff(self, job_data: dict, posts: List[Post]) -> List[dict]:
+        """직전 저장 상태와 job_data의 차이를 변경 목록으로 변환"""
+        ops = []
+        for key, value in job_data.items():
+            if key in ("blog_progress", "posts"):
+                continue
+            if key not in self._state or self._state[key] != value:
+                ops.append(set_op(key, copy.deepcopy(value)))
+        
+        state_blogs = {bp.get("blog_id"): bp for bp in self._state.get("blog_progress", []) or []}
+        for bp in job_data.get("blog_progress", []) or []:
+            blog_id = bp.get("blog_id")
+            state_bp = state_blogs.get(blog_id, {})
+            
+            fields = {
+                key: copy.deepcopy(value) for key, value in bp.items()
+                if key not in BLOG_LIST_FIELDS and (key not in state_bp or state_bp[key] != value)
+            }
+            removed = [key for key in state_bp if key not in bp and key not in BLOG_LIST_FIELDS]
+            if fields or removed or blog_id not in state_blogs:
+                ops.append({"op": "blog", "blog_id": blog_id, "fields": fields, "removed": removed})
+            
+            all_post_urls = bp.get("all_post_urls")
+            if "all_post_urls" in bp and ("all_post_urls" not in state_bp
+                                          or all_post_urls != state_bp["all_post_urls"]):
+                ops.append(blog_urls_op(blog_id, all_post_urls))
+            
+            crawled_urls = bp.get("crawled_urls") or []
+            crawled_set = self._crawled_sets.get(blog_id, set())
+            if len(crawled_urls) != len(crawled_set):
+                new_urls = [url for url in dict.fromkeys(crawled_urls) if url not in crawled_set]
+                if new_urls:
+                    ops.append(crawled_op(blog_id, new_urls))
+        
+        if posts:
+            ops.append(_posts_op(posts))
+        return ops
+    
+    def _apply(self, ops: List[dict]) -> None:
+        """변경 목록을 내부 상태에 반영 (저장과 저널 재생이 같은 규칙 사용)"""
+        for op in ops:
+            kind = op.get("op")
+            if kind == "set":
+                self._state[op["key"]] = op["value"]
+            elif kind == "blog":
+                bp = self._find_state_blog(op["blog_id"])
+                if op.get("replace"):
+                    for key in [key for key in bp if key not in BLOG_LIST_FIELDS]:
+                        bp.pop(key)
+                    bp["blog_id"] = op["blog_id"]
+                bp.update(op.get("fields", {}))
+                for key in op.get("removed", []):
+                    bp.pop(key, None)
+            elif kind == "blog_urls":
+                self._find_state_blog(op["blog_id"])["all_post_urls"] = op["all_post_urls"]
+            elif kind == "crawled":
+                bp = self._find_state_blog(op["blog_id"])
+                crawled_set = self._crawled_sets.setdefault(op["blog_id"], set(bp.get("crawled_urls") or []))
+                crawled_urls = bp.setdefault("crawled_urls", [])
+                for url in op["urls"]:
+                    if url not in crawled_set:
+                        crawled_set.add(url)
+                        crawled_urls.append(url)
+            elif kind == "posts":
+                self._merge_posts(op["posts"])
+
+
+class CheckpointWriter:
+    """체크포인트 단일 작성자
+
+    여러 작업 스레드가 동시에 체크포인트를 갱신해도 파일이 꼬이지 않도록
+    저장 요청을 큐에 모아 전용 스레드 하나에서만 save_changes를 호출한다.
+    요청은 바뀐 블로그의 변경 목록만 담으므로 job_data 전체를 복사하거나 비교하지 않고,
+    밀린 요청은 변경 목록을 이어 붙여 한 번에 저장한다.
+    """
+
+    def __init__(self, checkpoint_manager: CheckpointManager):
+        self.checkpoint_manager = checkpoint_manager
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, ops: List[dict], posts: Optional[List[Post]] = None) -> None:
+        """저장 요청 (ops: set_op/blog_op/blog_urls_op/crawled_op로 만든 변경 목록, 만든 뒤 수정하지 않음)
+
+        같은 필드를 바꾸는 요청은 잠금 안에서 넣어 순서를 지킨다.
+        """
+        self._queue.put((list(ops), list(posts or [])))
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            ops, posts = item
+            closing = False
+            # 밀린 요청 합치기 (변경 목록은 요청 순서대로 이어 붙임, 포스트는 누적)
+            while True:
+                try:
+                    pending = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    closing = True
+                    break
+                ops.extend(pending[0])
+                posts.extend(pending[1])
+
+            try:
+                self.checkpoint_manager.save_changes(ops, posts)
+            except Exception as e:
+                print(f"[경고] 체크포인트 저장 실패: {e}")
+
+            if closing:
+                break
 
+    def close(self) -> None:
+        """남은 요청을 모두 저장한 뒤 작성자 스레드 종료"""
+        self._queue.put(None)
+        self._thread.join()
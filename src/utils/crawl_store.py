@@ -0,0 +1,251 @@
+"""
+SQLite 크롤링 저장소 모듈
+포스트, 댓글, 블로그별 URL 상태를 내장 SQLite DB에 저장
+"""
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from src.models import Post
+from src.utils.file_exporter import iter_saved_posts, write_posts_document
+from src.utils.json_codec import dumps_compact, loads
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,  -- 저장 순서 (출력 순서)
+    post_id TEXT NOT NULL UNIQUE,
+    blog_id TEXT,
+    url TEXT,
+    title TEXT,
+    published_date TEXT,
+    data TEXT NOT NULL  -- 댓글을 제외한 Post.to_dict() JSON
+);
+CREATE INDEX IF NOT EXISTS idx_posts_url ON posts(url);
+CREATE INDEX IF NOT EXISTS idx_posts_blog_id ON posts(blog_id);
+
+CREATE TABLE IF NOT EXISTS comments (
+    post_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    author TEXT,
+    content TEXT,
+    date TEXT,
+    likes INTEGER DEFAULT 0,
+    PRIMARY KEY (post_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS blog_urls (
+    blog_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    position INTEGER,  -- Phase 1 링크 순서 (NULL이면 목록 밖에서 크롤링된 URL)
+    crawled INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (blog_id, url)
+);
+CREATE INDEX IF NOT EXISTS idx_blog_urls_state ON blog_urls(blog_id, crawled);
+
+CREATE TABLE IF NOT EXISTS blogs (
+    blog_id TEXT PRIMARY KEY,
+    status TEXT,
+    has_post_list INTEGER NOT NULL DEFAULT 0,  -- Phase 1 링크 목록 저장 여부
+    error TEXT,
+    updated_at TEXT
+);
+"""
+
+
+class CrawlStore:
+    """SQLite 기반 크롤링 저장소 (스레드 안전)
+
+    - posts: post_id(UNIQUE), url, blog_id 인덱스로 중복 확인과 재개를 조회로 처리
+    - comments: 포스트별 댓글 (출력 시 포스트 dict의 comments로 복원)
+    - blog_urls / blogs: 블로그별 전체 링크 목록과 크롤링 여부, 상태
+
+    append()는 save_callback 배치 하나를 트랜잭션 하나로 기록하며,
+    JsonlPostWriter와 같은 append/count/finalize 인터페이스를 제공한다.
+    새 DB이고 seed_json_path에 기존 출력이 있으면 그 포스트를 먼저 가져온다.
+    """
+
+    def __init__(self, db_path: str, seed_json_path: Optional[str] = None):
+        self.path = Path(db_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+        if seed_json_path and self.count == 0:
+            seeded = self.append(iter_saved_posts(seed_json_path))
+            if seeded:
+                print(f"[단계] 기존 출력에서 포스트 {seeded}개를 저장소로 가져왔습니다: {seed_json_path}")
+
+    # ---- 포스트 ----
+
+    def append(self, posts: Iterable[Post]) -> int:
+        """새 포스트만 저장하고 URL을 크롤링 완료로 표시 (한 트랜잭션), 저장한 수 반환"""
+        written = 0
+        with self._lock, self._conn:
+            for post in posts:
+                post_dict = post.to_dict() if isinstance(post, Post) else dict(post)
+                post_id = post_dict.get("post_id")
+                if not post_id:
+                    continue
+                comments = post_dict.pop("comments", []) or []
+                blog_id = (post_dict.get("author") or {}).get("blog_id")
+                url = post_dict.get("url")
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO posts (post_id, blog_id, url, title, published_date, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (post_id, blog_id, url, post_dict.get("title"), post_dict.get("published_date"),
+                     dumps_compact(post_dict))
+                )
+                if cursor.rowcount == 0:
+                    continue  # 이미 저장된 post_id
+                written += 1
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO comments (post_id, position, author, content, date, likes) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(post_id, position, c.get("author"), c.get("content"), c.get("date"), c.get("likes", 0))
+                     for position, c in enumerate(comments)]
+                )
+                if blog_id and url:
+                    self._mark_crawled(blog_id, [url])
+        return written
+
+    @property
+    def count(self) -> int:
+        """저장된 포스트 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def has_post(self, post_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM posts WHERE post_id = ?", (post_id,)).fetchone()
+        return row is not None
+
+    def has_url(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM posts WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def post_ids_by_blog(self) -> Dict[str, Set[str]]:
+        """블로그 ID별 저장된 포스트 ID (증분 크롤링용)"""
+        post_ids: Dict[str, Set[str]] = {}
+        with self._lock:
+            for blog_id, post_id in self._conn.execute("SELECT blog_id, post_id FROM posts"):
+                if blog_id:
+                    post_ids.setdefault(blog_id, set()).add(post_id)
+        return post_ids
+
+    def iter_posts(self, batch_size: int = 500) -> Iterator[dict]:
+        """저장 순서대로 포스트 dict 읽기 (댓글 포함, batch_size개씩 조회)"""
+        last_seq = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, post_id, data FROM posts WHERE seq > ? ORDER BY seq LIMIT ?",
+                    (last_seq, batch_size)
+                ).fetchall()
+                if not rows:
+                    return
+                comments: Dict[str, List[dict]] = {}
+                placeholders = ",".join("?" * len(rows))
+                for post_id, author, content, date, likes in self._conn.execute(
+                    f"SELECT post_id, author, content, date, likes FROM comments "
+                    f"WHERE post_id IN ({placeholders}) ORDER BY post_id, position",
+                    [row[1] for row in rows]
+                ):
+                    comments.setdefault(post_id, []).append(
+                        {"author": author, "content": content, "date": date, "likes": likes}
+                    )
+            for seq, post_id, data in rows:
+                post = loads(data)
+                post["comments"] = comments.get(post_id, [])
+                yield post
+            last_seq = rows[-1][0]
+
+    def finalize(self, output_path: str, crawl_info: Dict) -> Path:
+        """저장된 포스트로 {crawl_info, posts} 출력 JSON 문서 생성"""
+        return write_posts_document(self.iter_posts(), self.count, output_path, crawl_info)
+
+    # ---- 블로그별 URL 상태 ----
+
+    def _mark_crawled(self, blog_id: str, urls: Iterable[str]) -> None:
+        self._conn.executemany(
+            "INSERT INTO blog_urls (blog_id, url, crawled) VALUES (?, ?, 1) "
+            "ON CONFLICT(blog_id, url) DO UPDATE SET crawled = 1",
+            [(blog_id, url) for url in urls]
+        )
+
+    def mark_crawled(self, blog_id: str, urls: Iterable[str]) -> None:
+        """URL을 크롤링 완료로 표시"""
+        with self._lock, self._conn:
+            self._mark_crawled(blog_id, urls)
+
+    def set_post_urls(self, blog_id: str, urls: List[str]) -> None:
+        """Phase 1에서 수집한 전체 링크 목록 저장 (기존 크롤링 여부는 유지)"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO blog_urls (blog_id, url, position) VALUES (?, ?, ?) "
+                "ON CONFLICT(blog_id, url) DO UPDATE SET position = excluded.position",
+                [(blog_id, url, position) for position, url in enumerate(urls)]
+            )
+            self._conn.execute(
+                "INSERT INTO blogs (blog_id, has_post_list, updated_at) VALUES (?, 1, ?) "
+                "ON CONFLICT(blog_id) DO UPDATE SET has_post_list = 1, updated_at = excluded.updated_at",
+                (blog_id, datetime.now().isoformat())
+            )
+
+    def post_urls(self, blog_id: str) -> Optional[List[str]]:
+        """저장된 전체 링크 목록 (Phase 1 순서, 저장된 적 없으면 None)"""
+        with self._lock:
+            row = self._conn.execute("SELECT has_post_list FROM blogs WHERE blog_id = ?", (blog_id,)).fetchone()
+            if not row or not row[0]:
+                return None
+            return [url for (url,) in self._conn.execute(
+                "SELECT url FROM blog_urls WHERE blog_id = ? AND position IS NOT NULL ORDER BY position",
+                (blog_id,)
+            )]
+
+    def crawled_urls(self, blog_id: str) -> List[str]:
+        """크롤링 완료된 URL 목록"""
+        with self._lock:
+            return [url for (url,) in self._conn.execute(
+                "SELECT url FROM blog_urls WHERE blog_id = ? AND crawled = 1", (blog_id,)
+            )]
+
+    def pending_urls(self, blog_id: str) -> List[str]:
+        """전체 링크 중 아직 크롤링하지 않은 URL (Phase 1 순서)"""
+        with self._lock:
+            return [url for (url,) in self._conn.execute(
+                "SELECT url FROM blog_urls WHERE blog_id = ? AND crawled = 0 AND position IS NOT NULL "
+                "ORDER BY position",
+                (blog_id,)
+            )]
+
+    def set_blog_status(self, blog_id: str, status: str, error: Optional[str] = None) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO blogs (blog_id, status, error, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(blog_id) DO UPDATE SET status = excluded.status, error = excluded.error, "
+                "updated_at = excluded.updated_at",
+                (blog_id, status, error, datetime.now().isoformat())
+            )
+
+    def blog_status(self, blog_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM blogs WHERE blog_id = ?", (blog_id,)).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "CrawlStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -22,3 +22,12 @@ class NetworkError(Exception):
     """네트워크 오류"""
     pass
 
+
+class RateLimitedError(NetworkError):
+    """요청 제한 응답 (429/503)"""
+    pass
+
+
+class CorruptFileError(Exception):
+    """저장 파일 손상 (체크섬 불일치 또는 JSON 파싱 실패)"""
+    pass
@@ -2,11 +2,16 @@
 파일 출력 모듈
 """
 import json
+import os
+import textwrap
+import threading
 from pathlib import Path
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Optional, Set
 from datetime import datetime
 
 from src.models import Post
+from src.utils.atomic_io import atomic_open, atomic_write_json, load_json
+from src.utils.json_codec import dumps_compact, dumps_indented, loads
 
 
 def export_to_json(
@@ -16,7 +21,11 @@ def export_to_json(
     sort_by_date: bool = False,
     append: bool = False
 ) -> Path:
-    """JSON 파일로 출력"""
+    """JSON 파일로 출력
+    
+    임시 파일에 쓴 뒤 교체하고 체크섬(.sha256)을 기록한다.
+    append 모드에서 기존 파일이 손상되었으면 덮어쓰지 않고 CorruptFileError를 발생시킨다.
+    """
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
@@ -27,17 +36,14 @@ def export_to_json(
     existing_posts = []
     existing_total = 0
     if append and output_file.exists():
-        try:
-            with open(output_file, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-                existing_posts = existing_data.get("posts", [])
-                existing_total = existing_data.get("crawl_info", {}).get("total_posts", 0)
-                # 중복 제거를 위한 기존 post_id 집합
-                existing_ids = {post.get("post_id") for post in existing_posts}
-                # 새 포스트 중 중복 제거
-                post_list = [p for p in post_list if p.get("post_id") not in existing_ids]
-        except Exception as e:
-            print(f"[경고] 기존 파일 로드 실패: {e}")
+        # 로드 실패 시 빈 목록으로 시작하면 기존 결과를 덮어쓰게 되므로 예외를 그대로 전달
+        existing_data = load_json(output_file)
+        existing_posts = existing_data.get("posts", [])
+        existing_total = existing_data.get("crawl_info", {}).get("total_posts", 0)
+        # 중복 제거를 위한 기존 post_id 집합
+        existing_ids = {post.get("post_id") for post in existing_posts}
+        # 새 포스트 중 중복 제거
+        post_list = [p for p in post_list if p.get("post_id") not in existing_ids]
     
     # 기존 포스트와 병합
     merged_posts = existing_posts + post_list
@@ -67,9 +73,191 @@ def export_to_json(
         "posts": merged_posts
     }
     
-    # JSON 파일로 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+    # JSON 파일로 저장 (원자적 교체 + 체크섬)
+    atomic_write_json(output_file, data, default=str)
+    
+    return output_file
+
+
+FSYNC_POLICIES = ('always', 'batch', 'none')
+
+
+def jsonl_path_for(output_path: str) -> Path:
+    """출력 JSON 파일에 대응하는 JSONL 스트림 경로 (output.json -> output.jsonl)"""
+    return Path(output_path).with_suffix('.jsonl')
+
+
+def iter_jsonl_posts(jsonl_path: Path) -> Iterator[dict]:
+    """JSONL 파일의 포스트를 한 줄씩 읽기 (중단으로 잘린 줄은 건너뜀)"""
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield loads(line)
+            except json.JSONDecodeError:
+                print(f"[경고] JSONL {line_no}번째 줄을 읽을 수 없어 건너뜁니다: {jsonl_path}")
+
+
+def iter_saved_posts(output_path: str) -> Iterator[dict]:
+    """저장된 포스트 읽기 (JSONL 스트림이 있으면 JSONL, 없으면 출력 JSON 문서)
+    
+    출력 JSON 문서가 손상되었으면 CorruptFileError가 발생한다.
+    """
+    jsonl_path = jsonl_path_for(output_path)
+    if jsonl_path.exists():
+        yield from iter_jsonl_posts(jsonl_path)
+        return
+    
+    output_file = Path(output_path)
+    if not output_file.exists():
+        return
+    yield from load_json(output_file).get("posts", [])
+
+
+class JsonlPostWriter:
+    """append-only JSONL 포스트 기록기 (스레드 안전)
+    
+    export_to_json(append=True)처럼 매번 전체 파일을 읽고 다시 쓰지 않고
+    새 포스트만 한 줄씩 이어 쓴다 (배치당 O(배치 크기)).
+    post_id 중복은 생성 시 한 번 읽은 ID 집합으로 거른다.
+    
+    fsync_policy:
+        - 'always': 포스트 한 줄마다 fsync
+        - 'batch': append() 호출(저장 간격)마다 fsync (기본값)
+        - 'none': flush만 하고 fsync는 OS에 맡김
+    
+    JSONL 파일이 없고 seed_json_path의 출력 JSON 문서가 있으면
+    그 포스트를 먼저 옮겨 적어 기존 결과를 이어받는다.
+    """
+    
+    def __init__(
+        self,
+        jsonl_path: Path,
+        fsync_policy: str = 'batch',
+        seed_json_path: Optional[str] = None
+    ):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"알 수 없는 fsync 정책입니다: {fsync_policy} (사용 가능: {', '.join(FSYNC_POLICIES)})")
+        self.path = Path(jsonl_path)
+        self.fsync_policy = fsync_policy
+        self._lock = threading.Lock()
+        self._ids: Set[str] = set()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if self.path.exists():
+            self._ids = {post.get("post_id") for post in iter_jsonl_posts(self.path)}
+            if self._ends_without_newline():
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write('\n')  # 중단으로 잘린 마지막 줄과 분리
+        elif seed_json_path and Path(seed_json_path).exists():
+            written = self.append(list(iter_saved_posts(seed_json_path)))
+            if written:
+                print(f"[단계] 기존 출력 파일의 포스트 {written}개를 JSONL로 이어받음")
+    
+    def _ends_without_newline(self) -> bool:
+        with open(self.path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b'\n'
+    
+    @property
+    def count(self) -> int:
+        """기록된 포스트 수"""
+        return len(self._ids)
+    
+    def append(self, posts: List[Post]) -> int:
+        """새 포스트만 이어 쓰고 기록한 수 반환"""
+        written = 0
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                for post in posts:
+                    post_dict = post.to_dict() if isinstance(post, Post) else post
+                    post_id = post_dict.get("post_id")
+                    if post_id in self._ids:
+                        continue
+                    f.write(dumps_compact(post_dict))
+                    f.write('\n')
+                    self._ids.add(post_id)
+                    written += 1
+                    if self.fsync_policy == 'always':
+                        f.flush()
+                        os.fsync(f.fileno())
+                if written and self.fsync_policy == 'batch':
+                    f.flush()
+                    os.fsync(f.fileno())
+        return written
+    
+    def finalize(self, output_path: str, crawl_info: Dict) -> Path:
+        """기록된 포스트로 {crawl_info, posts} 출력 JSON 문서 생성"""
+        return finalize_jsonl(self.path, output_path, crawl_info)
+
+
+def write_posts_document(
+    posts: Iterable[dict],
+    total_posts: int,
+    output_path: str,
+    crawl_info: Dict
+) -> Path:
+    """포스트를 한 건씩 받아 export_to_json과 같은 {crawl_info, posts} JSON 문서로 기록
+    
+    json.dump(data, indent=2)와 같은 형식이며 전체 포스트를 메모리에 올리지 않는다
+    (원자적 교체 + 체크섬).
+    """
+    output_file = Path(output_path)
+    info = {
+        **crawl_info,
+        "crawl_date": datetime.now().isoformat(),
+        "total_posts": total_posts,
+        "sort_order": "crawl_order"
+    }
+    
+    header = json.dumps({"crawl_info": info}, ensure_ascii=False, indent=2, default=str)
+    with atomic_open(output_file, checksum=True) as f:
+        f.write(header[:-2])  # 마지막 "\n}" 제거
+        if total_posts == 0:
+            f.write(',\n  "posts": []\n}')
+        else:
+            f.write(',\n  "posts": [\n')
+            for index, post in enumerate(posts):
+                if index:
+                    f.write(',\n')
+                f.write(textwrap.indent(dumps_indented(post), '    '))
+            f.write('\n  ]\n}')
     
     return output_file
 
+
+def finalize_jsonl(
+    jsonl_path: Path,
+    output_path: str,
+    crawl_info: Dict,
+    sort_by_date: bool = False
+) -> Path:
+    """JSONL 스트림을 export_to_json과 같은 {crawl_info, posts} JSON 문서로 변환
+    
+    정렬하지 않으면 포스트를 한 건씩 읽어 바로 쓰므로 전체 포스트를 메모리에 올리지 않는다.
+    """
+    jsonl_path = Path(jsonl_path)
+    
+    if sort_by_date:
+        posts = list(iter_jsonl_posts(jsonl_path)) if jsonl_path.exists() else []
+        return export_to_json(posts, output_path, crawl_info, sort_by_date=True)
+    
+    if not jsonl_path.exists():
+        return write_posts_document([], 0, output_path, crawl_info)
+    total_posts = sum(1 for _ in iter_jsonl_posts(jsonl_path))
+    return write_posts_document(iter_jsonl_posts(jsonl_path), total_posts, output_path, crawl_info)
+
+
+def load_post_ids_by_blog(output_path: str) -> Dict[str, Set[str]]:
+    """기존 출력(JSONL 스트림 또는 JSON 문서)에서 블로그 ID별로 이미 수집한 포스트 ID 로드 (증분 크롤링용)"""
+    post_ids: Dict[str, Set[str]] = {}
+    for post in iter_saved_posts(output_path):
+        blog_id = (post.get("author") or {}).get("blog_id")
+        if blog_id and post.get("post_id"):
+            post_ids.setdefault(blog_id, set()).add(post["post_id"])
+    return post_ids
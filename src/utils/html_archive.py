@@ -0,0 +1,153 @@
+"""
+원본 페이지 아카이브 모듈
+포스트 페이지 HTML을 압축해 blog_id/post_id로 찾을 수 있게 저장한다 (같은 내용은 한 번만 저장).
+파서를 고친 뒤 다시 크롤링하지 않고 아카이브로 재추출할 때 사용한다.
+"""
+import gzip
+import hashlib
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from src.utils.atomic_io import atomic_open
+from src.utils.json_codec import dumps_compact, loads
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 (없으면 gzip 사용)
+    zstandard = None
+
+
+ARCHIVE_COMPRESSIONS = ('gzip', 'zstd')
+BLOB_SUFFIXES = {'gzip': '.html.gz', 'zstd': '.html.zst'}
+INDEX_NAME = 'index.jsonl'
+
+
+def html_archive_dir_for(output_path: str) -> Path:
+    """출력 파일 옆의 아카이브 디렉토리 (output.json → output_archive/)"""
+    output_file = Path(output_path)
+    return output_file.with_name(output_file.stem + '_archive')
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 아카이브를 읽으려면 zstandard 패키지가 필요합니다")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class HtmlArchive:
+    """압축된 원본 페이지 아카이브 (스레드 안전)
+
+    - blobs/<해시 앞 2자리>/<sha256>.html.gz|.html.zst: 페이지 HTML (내용 해시로 중복 제거)
+    - index.jsonl: {blog_id, post_id, url, ref, archived_at} 한 줄씩 (같은 포스트는 마지막 줄 기준)
+
+    compression이 None이면 zstandard가 설치되어 있으면 zstd, 없으면 gzip을 사용한다.
+    """
+
+    def __init__(self, directory: str, compression: Optional[str] = None):
+        if compression is None:
+            compression = 'zstd' if zstandard is not None else 'gzip'
+        if compression not in ARCHIVE_COMPRESSIONS:
+            raise ValueError(f"compression은 {ARCHIVE_COMPRESSIONS} 중 하나여야 합니다: {compression}")
+        if compression == 'zstd' and zstandard is None:
+            raise ValueError("zstd 압축에는 zstandard 패키지가 필요합니다")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.compression = compression
+        self.index_path = self.directory / INDEX_NAME
+        self._lock = threading.Lock()
+        self._index: Dict[Tuple[str, str], dict] = {}
+        self._load_index()
+
+    def _load_index(self) -> None:
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')  # 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = loads(line)
+                except ValueError:
+                    continue  # 기록 도중 중단되어 잘린 줄
+                self._index[(entry['blog_id'], entry['post_id'])] = entry
+
+    def _blob_path(self, ref: str, compression: str) -> Path:
+        return self.directory / 'blobs' / ref[:2] / f"{ref}{BLOB_SUFFIXES[compression]}"
+
+    def _find_blob(self, ref: str) -> Optional[Tuple[Path, str]]:
+        for compression in ARCHIVE_COMPRESSIONS:
+            path = self._blob_path(ref, compression)
+            if path.exists():
+                return path, compression
+        return None
+
+    def put(self, blog_id: str, post_id: str, url: str, html: str) -> str:
+        """페이지 HTML 저장 후 참조(SHA-256) 반환 (같은 내용이면 압축 파일은 다시 쓰지 않음)"""
+        data = html.encode('utf-8')
+        ref = hashlib.sha256(data).hexdigest()
+        if self._find_blob(ref) is None:
+            with atomic_open(self._blob_path(ref, self.compression), 'wb', fsync=False) as f:
+                f.write(_compress(data, self.compression))
+
+        with self._lock:
+            key = (blog_id, post_id)
+            current = self._index.get(key)
+            if current is None or current['ref'] != ref or current.get('url') != url:
+                entry = {
+                    'blog_id': blog_id,
+                    'post_id': post_id,
+                    'url': url,
+                    'ref': ref,
+                    'archived_at': datetime.now().isoformat()
+                }
+                with open(self.index_path, 'a', encoding='utf-8') as f:
+                    f.write(dumps_compact(entry) + '\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._index[key] = entry
+        return ref
+
+    def read(self, ref: str) -> str:
+        """참조(해시)로 HTML 읽기"""
+        found = self._find_blob(ref)
+        if found is None:
+            raise FileNotFoundError(f"아카이브에 없는 페이지입니다: {ref}")
+        path, compression = found
+        return _decompress(path.read_bytes(), compression).decode('utf-8')
+
+    def get(self, blog_id: str, post_id: str) -> Optional[str]:
+        """blog_id/post_id로 마지막으로 저장된 HTML 읽기"""
+        with self._lock:
+            entry = self._index.get((blog_id, post_id))
+        return self.read(entry['ref']) if entry else None
+
+    def entries(self, blog_id: Optional[str] = None) -> Iterator[dict]:
+        """저장된 포스트 항목 (blog_id를 지정하면 그 블로그만, 저장 순서)"""
+        with self._lock:
+            entries = list(self._index.values())
+        for entry in entries:
+            if blog_id is None or entry['blog_id'] == blog_id:
+                yield entry
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
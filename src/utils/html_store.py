@@ -0,0 +1,75 @@
+"""
+포스트 원본 HTML 저장 모듈
+포스트를 만든 직후 무거운 필드(content.html, content.markdown)를 비우고,
+설정에 따라 HTML을 내용 주소(SHA-256) 파일로 내보내 메모리 사용량을 포스트 수와 무관하게 유지한다
+"""
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from src.models import Post
+from src.utils.atomic_io import atomic_write_text
+
+
+# HTML 처리 방식
+#   'keep' : 그대로 유지 (기존 동작)
+#   'drop' : 버림 (출력 JSON에는 원래 html/markdown이 없으므로 결과는 같음)
+#   'spill': HtmlStore에 저장하고 content.html_ref에 해시만 남김
+HTML_POLICIES = ('keep', 'drop', 'spill')
+
+
+def html_store_dir_for(output_path: str) -> Path:
+    """출력 파일 옆의 HTML 저장 디렉토리 (output.json → output_html/)"""
+    output_file = Path(output_path)
+    return output_file.with_name(output_file.stem + '_html')
+
+
+class HtmlStore:
+    """내용 주소 HTML 저장소 (<디렉토리>/<해시 앞 2자리>/<해시>.html)
+
+    같은 HTML은 한 번만 저장한다 (스레드 간 공유 가능, 파일은 원자적으로 기록).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def ref_for(html: str) -> str:
+        return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+    def path_for(self, ref: str) -> Path:
+        return self.directory / ref[:2] / f"{ref}.html"
+
+    def put(self, html: str) -> str:
+        """HTML 저장 후 참조(해시) 반환 (이미 있으면 쓰지 않음)"""
+        ref = self.ref_for(html)
+        path = self.path_for(ref)
+        if not path.exists():
+            atomic_write_text(path, html, fsync=False)
+        return ref
+
+    def get(self, ref: str) -> Optional[str]:
+        path = self.path_for(ref)
+        if not path.exists():
+            return None
+        return path.read_text(encoding='utf-8')
+
+
+def release_heavy_fields(post: Post, html_policy: str = 'drop', html_store: Optional[HtmlStore] = None) -> Post:
+    """포스트의 content.html/content.markdown 비우기 (html_policy에 따라 HTML은 저장소로)"""
+    if html_policy == 'keep':
+        return post
+    content = post.content
+    if html_policy == 'spill' and html_store is not None and content.html:
+        content.html_ref = html_store.put(content.html)
+    content.html = ""
+    content.markdown = ""
+    return post
+
+
+def validate_html_policy(html_policy: str, html_store: Optional[HtmlStore] = None) -> None:
+    if html_policy not in HTML_POLICIES:
+        raise ValueError(f"html_policy는 {HTML_POLICIES} 중 하나여야 합니다: {html_policy}")
+    if html_policy == 'spill' and html_store is None:
+        raise ValueError("html_policy='spill'에는 html_store가 필요합니다")
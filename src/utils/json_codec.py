@@ -0,0 +1,52 @@
+"""
+포스트 JSON 인코딩 모듈
+orjson이 설치되어 있으면 orjson으로, 없으면 표준 json으로 인코딩한다 (출력 바이트는 동일)
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+HAS_ORJSON = orjson is not None
+
+# orjson 기본 출력과 같은 구분자 (공백 없음)
+COMPACT_SEPARATORS = (',', ':')
+
+
+def _orjson_dumps(obj: Any, option: int) -> str:
+    return orjson.dumps(obj, default=str, option=option).decode('utf-8')
+
+
+def dumps_compact(obj: Any) -> str:
+    """한 줄 JSON (JSONL/DB 저장용, 공백 없는 구분자)
+
+    포스트 dict는 문자열/정수/None/리스트/dict만 담으므로 orjson과 표준 json의 출력이 같다.
+    orjson이 처리하지 못하는 값(64비트를 넘는 정수 등)은 표준 json으로 인코딩한다.
+    """
+    if orjson is not None:
+        try:
+            return _orjson_dumps(obj, 0)
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=COMPACT_SEPARATORS, default=str)
+
+
+def dumps_indented(obj: Any) -> str:
+    """들여쓰기 2칸 JSON (json.dumps(obj, ensure_ascii=False, indent=2)와 같은 출력)"""
+    if orjson is not None:
+        try:
+            return _orjson_dumps(obj, orjson.OPT_INDENT_2)
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=str)
+
+
+def loads(text: str) -> Any:
+    """JSON 파싱 (실패 시 json.JSONDecodeError, orjson의 오류도 그 하위 클래스)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
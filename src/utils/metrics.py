@@ -0,0 +1,293 @@
+"""
+크롤링 지표 모듈
+포스트마다 단계별(접속, 로딩 대기, 필드 추출, 해시태그, 댓글, 저장) 소요 시간 히스토그램과
+카운터(재시도, 실패, 바이트, 포스트 수)를 모으고, 싱크(Prometheus 텍스트 엔드포인트,
+체크포인트 옆 JSON 파일, GUI 콜백)로 내보낸다
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from src.utils.atomic_io import atomic_write_json
+
+# 히스토그램 구간 상한 (초), 마지막 구간은 +Inf
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 단계 이름 (브라우저 경로는 bundle 1회 또는 필드별 추출, HTTP 경로는 http + parse)
+STAGES = (
+    'goto', 'readiness', 'bundle', 'title', 'author', 'date', 'metadata', 'content',
+    'tags', 'comments', 'archive', 'http', 'parse', 'save'
+)
+
+
+class Histogram:
+    """누적 구간 히스토그램 (잠금은 CrawlMetrics가 담당)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """구간 상한으로 추정한 분위수 (+Inf 구간이면 최댓값)"""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for idx, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return min(self.buckets[idx], self.max) if idx < len(self.buckets) else self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else 0.0,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'max': round(self.max, 6),
+            'buckets': {str(bound): count for bound, count in zip(self.buckets, self.counts)},
+            'overflow': self.counts[-1]
+        }
+
+
+class CrawlMetrics:
+    """단계별 시간 히스토그램과 카운터 (스레드 안전, 여러 블로그/작업 스레드가 공유)
+
+    publish()는 publish_interval초마다 한 번만 싱크에 넘기므로 포스트마다 호출해도 된다.
+    카운터 'posts'로 분당 포스트 수를 계산한다.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, publish_interval: float = 2.0):
+        self.buckets = tuple(buckets)
+        self.publish_interval = publish_interval
+        self.started_at = datetime.now().isoformat()
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Dict[str, float] = {}
+        self._sinks: List["MetricsSink"] = []
+        self._last_publish = 0.0
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """with 블록의 소요 시간을 stage 히스토그램에 기록 (예외로 끝나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def inc(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def counter(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def posts_per_minute(self) -> float:
+        elapsed = time.monotonic() - self._start
+        return self.counter('posts') * 60 / elapsed if elapsed > 0 else 0.0
+
+    def snapshot(self) -> dict:
+        """현재 지표 (JSON으로 저장 가능한 dict)"""
+        elapsed = time.monotonic() - self._start
+        with self._lock:
+            counters = dict(self._counters)
+            stages = {stage: histogram.to_dict() for stage, histogram in self._histograms.items()}
+        return {
+            'started_at': self.started_at,
+            'updated_at': datetime.now().isoformat(),
+            'elapsed_seconds': round(elapsed, 3),
+            'posts_per_minute': round(counters.get('posts', 0) * 60 / elapsed, 3) if elapsed > 0 else 0.0,
+            'counters': counters,
+            'stages': stages
+        }
+
+    def prometheus_text(self) -> str:
+        """Prometheus 텍스트 형식 (naver_crawler_ 접두사)"""
+        snapshot = self.snapshot()
+        lines = [
+            '# TYPE naver_crawler_posts_per_minute gauge',
+            f"naver_crawler_posts_per_minute {snapshot['posts_per_minute']}",
+        ]
+        for name, value in sorted(snapshot['counters'].items()):
+            lines.append(f'# TYPE naver_crawler_{name}_total counter')
+            lines.append(f'naver_crawler_{name}_total {value}')
+        lines.append('# TYPE naver_crawler_stage_seconds histogram')
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            for stage, histogram in histograms:
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'naver_crawler_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'naver_crawler_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                lines.append(f'naver_crawler_stage_seconds_sum{{stage="{stage}"}} {histogram.sum:.6f}')
+                lines.append(f'naver_crawler_stage_seconds_count{{stage="{stage}"}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def add_sink(self, sink: "MetricsSink") -> None:
+        self._sinks.append(sink)
+
+    def publish(self, force: bool = False) -> None:
+        """싱크에 지표 전달 (force가 아니면 publish_interval초 간격으로만)"""
+        if not self._sinks:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_publish < self.publish_interval:
+                return
+            self._last_publish = now
+        for sink in self._sinks:
+            try:
+                sink.publish(self)
+            except Exception as e:
+                print(f"[경고] 지표 내보내기 실패 ({type(sink).__name__}): {e}")
+
+    def close(self) -> None:
+        """마지막 지표를 내보내고 싱크 정리"""
+        self.publish(force=True)
+        for sink in self._sinks:
+            try:
+                sink.close()
+            except Exception:
+                pass
+        self._sinks.clear()
+
+
+# 요약에 표시할 단계 (표시 이름)
+SUMMARY_STAGES = (('goto', '접속'), ('readiness', '대기'), ('bundle', '추출'), ('tags', '해시태그'),
+                  ('comments', '댓글'), ('http', 'HTTP'), ('save', '저장'))
+
+
+def summary_line(snapshot: dict) -> str:
+    """스냅샷 한 줄 요약 (GUI/로그 표시용, 단계는 평균 소요 시간)"""
+    parts = [f"분당 {snapshot.get('posts_per_minute', 0):.1f}개"]
+    stages = snapshot.get('stages', {})
+    for stage, label in SUMMARY_STAGES:
+        if stages.get(stage, {}).get('count'):
+            parts.append(f"{label} {stages[stage]['mean']:.2f}초")
+    counters = snapshot.get('counters', {})
+    parts.append(f"재시도 {int(counters.get('retries', 0))}")
+    parts.append(f"실패 {int(counters.get('failed_posts', 0))}")
+    return " · ".join(parts)
+
+
+class NullMetrics(CrawlMetrics):
+    """지표를 기록하지 않는 기본값 (metrics를 넘기지 않은 호출용)"""
+
+    def observe(self, stage: str, seconds: float) -> None:
+        pass
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        yield
+
+    def inc(self, name: str, value: float = 1) -> None:
+        pass
+
+    def add_sink(self, sink: "MetricsSink") -> None:
+        raise ValueError("NullMetrics에는 싱크를 추가할 수 없습니다")
+
+
+NULL_METRICS = NullMetrics()
+
+
+class MetricsSink:
+    """지표 싱크 (publish는 크롤링 스레드에서 호출되므로 오래 걸리지 않아야 함)"""
+
+    def publish(self, metrics: CrawlMetrics) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+# 체크포인트 옆 지표 파일 확장자 (내용은 JSON, 체크포인트 목록(*.json)에 섞이지 않도록 별도 확장자)
+METRICS_SUFFIX = '.metrics'
+
+
+def metrics_path_for(checkpoint_path) -> Path:
+    """체크포인트 스냅샷 경로에 대응하는 지표 파일 경로 (저널 .journal과 같은 방식)"""
+    return Path(checkpoint_path).with_suffix(METRICS_SUFFIX)
+
+
+class JsonFileSink(MetricsSink):
+    """지표 스냅샷을 JSON 파일에 원자적으로 덮어씀"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def publish(self, metrics: CrawlMetrics) -> None:
+        atomic_write_json(self.path, metrics.snapshot(), fsync=False, checksum=False)
+
+
+class CallbackSink(MetricsSink):
+    """스냅샷을 콜백에 전달 (GUI 표시용, 콜백은 크롤링 스레드에서 호출됨)"""
+
+    def __init__(self, callback: Callable[[dict], None]):
+        self.callback = callback
+
+    def publish(self, metrics: CrawlMetrics) -> None:
+        self.callback(metrics.snapshot())
+
+
+class PrometheusSink(MetricsSink):
+    """/metrics에서 Prometheus 텍스트 형식을 제공하는 HTTP 엔드포인트
+
+    요청할 때마다 현재 지표를 만들어 응답하므로 publish 주기와 상관없이 최신 값이다.
+    port가 0이면 빈 포트를 사용한다 (실제 포트는 self.port).
+    """
+
+    def __init__(self, metrics: CrawlMetrics, port: int = 9108, host: str = '127.0.0.1'):
+        sink_metrics = metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = sink_metrics.prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"[단계] 지표 엔드포인트: http://{self.host}:{self.port}/metrics")
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,109 @@
+"""
+요청 간격 제어 모듈
+"""
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """호스트별 요청 간격 제어 (스레드 안전)
+
+    여러 작업 스레드가 같은 호스트에 요청하더라도
+    요청 시작 시각이 최소 delay초 간격이 되도록 순서대로 슬롯을 배정한다.
+    """
+
+    def __init__(self, delay: float = 0.5):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_allowed: Dict[str, float] = {}
+
+    def reserve(self, url: str) -> float:
+        """다음 요청 슬롯 예약 (대기해야 할 시간(초) 반환)
+
+        asyncio 코드에서는 반환값만큼 asyncio.sleep으로 대기한다.
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = scheduled + self._host_delay(host)
+        return scheduled - now
+
+    def _host_delay(self, host: str) -> float:
+        return self.delay
+
+    def wait(self, url: str) -> float:
+        """요청 전 대기 (실제 대기한 시간(초) 반환)"""
+        wait_time = self.reserve(url)
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+
+# 요청 제한(차단)으로 보는 HTTP 상태 코드
+THROTTLE_STATUSES = (429, 503)
+
+
+class AdaptiveRateLimiter(HostRateLimiter):
+    """응답 시간과 오류에 따라 호스트별 요청 간격을 조절 (AIMD, 스레드 안전)
+
+    - 응답 시간이 target_latency 이하인 성공: 초당 요청 수를 increase_step만큼 늘림 (가산 증가)
+    - 느린 성공: 목표 대비 느린 만큼 간격을 늘림 (최대 backoff_factor배)
+    - 타임아웃/오류: 간격을 backoff_factor배, 요청 제한(429/503): backoff_factor²배 (곱셈 감소)
+    간격은 min_delay ~ max_delay 사이로 유지하고, 간격을 늘리면 그 호스트의 다음 요청도 그만큼 미룬다.
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.5,
+        min_delay: float = 0.25,
+        max_delay: float = 30.0,
+        target_latency: float = 2.0,
+        increase_step: float = 0.1,
+        backoff_factor: float = 2.0
+    ):
+        super().__init__(delay)
+        self.min_delay = min(min_delay, delay)
+        self.max_delay = max(max_delay, delay)
+        self.target_latency = target_latency
+        self.increase_step = increase_step
+        self.backoff_factor = backoff_factor
+        self._delays: Dict[str, float] = {}
+
+    def _host_delay(self, host: str) -> float:
+        return self._delays.get(host, self.delay)
+
+    def record_response(self, url: str, latency: float) -> None:
+        """성공한 요청의 응답 시간(초) 반영"""
+        host = urlparse(url).netloc
+        with self._lock:
+            delay = self._host_delay(host)
+            if latency <= self.target_latency:
+                delay = max(self.min_delay, 1 / (1 / delay + self.increase_step))
+            else:
+                slowdown = min(latency / self.target_latency, self.backoff_factor)
+                delay = min(self.max_delay, delay * slowdown)
+            self._delays[host] = delay
+
+    def record_error(self, url: str, throttled: bool = False) -> float:
+        """타임아웃/오류(throttled: 요청 제한 응답) 반영 후 늘어난 간격(초) 반환"""
+        host = urlparse(url).netloc
+        factor = self.backoff_factor ** 2 if throttled else self.backoff_factor
+        with self._lock:
+            delay = min(self.max_delay, self._host_delay(host) * factor)
+            self._delays[host] = delay
+            # 이미 예약된 슬롯과 관계없이 지금부터 간격만큼 쉬고 다음 요청
+            now = time.monotonic()
+            self._next_allowed[host] = max(self._next_allowed.get(host, now), now + delay)
+        return delay
+
+    def rate(self, url: Optional[str] = None) -> float:
+        """현재 초당 요청 수 (url을 생략하면 가장 느린 호스트 기준)"""
+        with self._lock:
+            if url is not None:
+                delay = self._host_delay(urlparse(url).netloc)
+            else:
+                delay = max(self._delays.values(), default=self.delay)
+        return 1 / delay
@@ -0,0 +1,74 @@
+"""
+재시도 정책 모듈
+오류를 일시적(타임아웃, 네트워크)/영구적(파싱 등)으로 분류하고,
+일시적 오류만 지터를 준 지수 백오프로 재시도한다
+"""
+import random
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.utils.exceptions import TimeoutError, NetworkError
+
+# 재시도하면 성공할 수 있는 오류 (RateLimitedError는 NetworkError에 포함)
+TRANSIENT_ERRORS = (TimeoutError, NetworkError)
+
+
+def is_transient(error: Exception) -> bool:
+    """일시적 오류 여부 (ParsingError 등 나머지는 다시 시도해도 같은 결과)"""
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+@dataclass
+class RetryPolicy:
+    """재시도 횟수와 백오프 설정
+
+    attempt번째(0부터) 실패 후 대기 시간은 min(max_delay, base_delay × 2^attempt)에서
+    최대 jitter 비율만큼 무작위로 줄인 값이다 (여러 작업이 같은 순간에 다시 요청하지 않도록).
+    """
+    max_attempts: int = 3  # 첫 시도 포함
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    jitter: float = 0.5
+
+    def __post_init__(self):
+        # max_attempts가 0 이하면 한 번도 시도하지 않아 크롤링 함수가 Post 대신 None을 반환하게 됨
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts는 1 이상이어야 합니다: {self.max_attempts}")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError(f"대기 시간은 0 이상이어야 합니다: base_delay={self.base_delay}, max_delay={self.max_delay}")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError(f"jitter는 0~1 사이여야 합니다: {self.jitter}")
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        return is_transient(error) and attempt < self.max_attempts - 1
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (1 - self.jitter * random.random())
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def failure_record(url: str, error: Exception) -> dict:
+    """실패한 URL 기록 (체크포인트의 failed_urls 항목)"""
+    return {
+        "url": url,
+        "error_type": type(error).__name__,
+        "error": str(error),
+        "transient": is_transient(error),
+        "attempts": 1,
+        "failed_at": datetime.now().isoformat()
+    }
+
+
+def merge_failures(failed_urls: list, new_failures: list, succeeded_urls) -> list:
+    """기존 실패 목록에 새 실패를 합치고 이번에 성공한 URL은 제외 (같은 URL은 시도 횟수 누적)"""
+    succeeded = set(succeeded_urls)
+    merged = {entry["url"]: entry for entry in failed_urls if entry["url"] not in succeeded}
+    for entry in new_failures:
+        previous = merged.get(entry["url"])
+        if previous:
+            entry = dict(entry, attempts=previous.get("attempts", 1) + entry.get("attempts", 1))
+        merged[entry["url"]] = entry
+    return list(merged.values())
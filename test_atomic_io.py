@@ -0,0 +1,132 @@
+"""
+원자적 파일 쓰기 테스트
+중단/손상 상황에서 기존 파일이 보존되고 체크섬으로 손상을 감지하는지 확인
+"""
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.atomic_io import (
+    PENDING_CHECKSUM_SUFFIX, _file_sha256, atomic_open, atomic_write_json, checksum_path_for, load_json
+)
+from src.utils.checkpoint_manager import CheckpointManager
+from src.utils.exceptions import CorruptFileError
+from src.utils.file_exporter import export_to_json
+
+
+def test_atomic_write():
+    """쓰기 중 예외 시 기존 파일 유지, 체크섬 검증, 교체 직후 중단 복구"""
+    print("\n=== 원자적 쓰기 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        path = test_dir / "data.json"
+        atomic_write_json(path, {"value": 1})
+        assert load_json(path) == {"value": 1}
+        assert checksum_path_for(path).exists()
+        print("✓ 저장 + 체크섬 기록")
+
+        try:
+            with atomic_open(path, checksum=True) as f:
+                f.write('{"value": 2, "trunc')
+                raise KeyboardInterrupt  # 쓰는 도중 중단
+        except KeyboardInterrupt:
+            pass
+        assert load_json(path) == {"value": 1}
+        assert [p.name for p in test_dir.iterdir() if p.name.endswith('.tmp')] == []
+        print("✓ 쓰기 도중 중단되어도 기존 파일 유지, 임시 파일 정리")
+
+        raw = path.read_bytes()
+        path.write_bytes(raw.replace(b'1', b'7'))
+        try:
+            load_json(path)
+            raise AssertionError("손상된 파일이 로드됨")
+        except CorruptFileError:
+            pass
+        print("✓ 체크섬 불일치 감지")
+
+        # 파일 교체 후 체크섬 교체 전에 중단된 경우 (대기 체크섬으로 복구)
+        path.write_text('{"value": 3}', encoding='utf-8')
+        pending = path.with_name(path.name + PENDING_CHECKSUM_SUFFIX)
+        pending.write_text(_file_sha256(path) + '\n', encoding='ascii')
+        assert load_json(path) == {"value": 3}
+        assert not pending.exists()
+        print("✓ 교체 직후 중단된 체크섬 복구")
+
+        legacy = test_dir / "legacy.json"
+        legacy.write_text('{"value": 4}', encoding='utf-8')
+        assert load_json(legacy) == {"value": 4}
+        legacy.write_text('{"value": ', encoding='utf-8')
+        try:
+            load_json(legacy)
+            raise AssertionError("잘린 JSON이 로드됨")
+        except CorruptFileError:
+            pass
+        print("✓ 체크섬 없는 기존 파일 로드, 잘린 JSON 감지")
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def test_persisted_artifacts():
+    """출력 파일/체크포인트가 손상되면 덮어쓰지 않고 오류"""
+    print("\n=== 출력 파일/체크포인트 손상 처리 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        output_path = test_dir / "output.json"
+        export_to_json([{"post_id": "1"}], str(output_path), {"status": "running"})
+        with open(output_path, 'r+', encoding='utf-8') as f:
+            f.truncate(40)
+        damaged = output_path.read_bytes()
+        try:
+            export_to_json([{"post_id": "2"}], str(output_path), {"status": "running"}, append=True)
+            raise AssertionError("손상된 출력 파일을 덮어씀")
+        except CorruptFileError:
+            pass
+        assert output_path.read_bytes() == damaged
+        print("✓ 손상된 출력 파일은 append 시 덮어쓰지 않음")
+
+        manager = CheckpointManager(str(test_dir / "checkpoints"))
+        path = manager.create_checkpoint({"status": "running", "blog_progress": []})
+        data = json.loads(path.read_text(encoding='utf-8'))
+        data["status"] = "completed"
+        path.write_text(json.dumps(data), encoding='utf-8')
+        try:
+            CheckpointManager(str(test_dir / "checkpoints")).load_checkpoint(str(path))
+            raise AssertionError("체크섬이 맞지 않는 체크포인트가 로드됨")
+        except CorruptFileError:
+            pass
+        print("✓ 체크섬이 맞지 않는 체크포인트 로드 거부")
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("원자적 파일 쓰기 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_atomic_write()
+        test_persisted_artifacts()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
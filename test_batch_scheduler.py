@@ -0,0 +1,145 @@
+"""
+다중 블로그 동시 크롤링 스케줄러 테스트
+crawl_by_blog_id를 가짜 함수로 대체하여 실제 크롤링 없이 확인
+"""
+import sys
+import json
+import time
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.models import Post, Author
+from src.crawler import batch_crawler
+from src.utils.checkpoint_manager import CheckpointManager
+
+
+def fake_crawl_by_blog_id(blog_id, save_callback=None, save_interval=10, crawled_urls=None,
+                          progress_callback=None, **kwargs):
+    """블로그마다 포스트 7개를 만드는 가짜 크롤러"""
+    urls = [f"https://m.blog.naver.com/PostView.naver?blogId={blog_id}&logNo={i}" for i in range(7)]
+    skip = set(crawled_urls or [])
+    posts = []
+    saved_urls = []
+    for idx, url in enumerate(urls, 1):
+        if url in skip:
+            continue
+        time.sleep(0.01)
+        posts.append(Post(
+            post_id=f"{blog_id}-{idx}",
+            title=f"{blog_id} 포스트 {idx}",
+            author=Author(blog_id=blog_id, nickname=blog_id),
+            published_date="2025. 01. 01.",
+            url=url
+        ))
+        if progress_callback:
+            progress_callback(idx, len(urls))
+        if save_callback and len(posts) >= save_interval:
+            saved_urls.extend(p.url for p in posts)
+            save_callback(posts.copy())
+            posts.clear()
+    return {"blog_id": blog_id, "all_post_urls": urls, "saved_urls": saved_urls}, posts
+
+
+def test_concurrent_batch():
+    """블로그 동시 크롤링 시 출력 파일과 체크포인트 일관성 확인"""
+    print("\n=== 다중 블로그 동시 크롤링 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    original = batch_crawler.crawl_by_blog_id
+    groups = []
+
+    def recording_crawl_by_blog_id(blog_id, post_worker_group=None, **kwargs):
+        groups.append(post_worker_group)
+        return fake_crawl_by_blog_id(blog_id, **kwargs)
+
+    batch_crawler.crawl_by_blog_id = recording_crawl_by_blog_id
+    try:
+        manager = CheckpointManager(str(test_dir / "checkpoints"))
+        saved_ops = []
+        original_save_changes = manager.save_changes
+
+        def recording_save_changes(ops, posts=None):
+            saved_ops.extend(ops)
+            original_save_changes(ops, posts)
+
+        manager.save_changes = recording_save_changes
+        output_path = str(test_dir / "output.json")
+        blog_ids = [f"blog{i}" for i in range(6)]
+        progress_calls = []
+        lock = threading.Lock()
+
+        def progress(current, total, **kwargs):
+            with lock:
+                progress_calls.append((current, total))
+
+        batch_crawler.crawl_multiple_blog_ids(
+            blog_ids,
+            output_path,
+            manager,
+            save_interval=3,
+            progress_callback=progress,
+            max_concurrent_blogs=3,
+            post_workers=3
+        )
+
+        with open(output_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        post_ids = [post["post_id"] for post in data["posts"]]
+        assert len(post_ids) == 42, f"포스트 수 불일치: {len(post_ids)}"
+        assert len(set(post_ids)) == 42
+        print(f"✓ 출력 파일 포스트 {len(post_ids)}개 (중복 없음)")
+
+        checkpoint = manager.load_checkpoint(str(manager.current_checkpoint_path))
+        assert checkpoint["status"] == "completed"
+        assert checkpoint["processed_blog_ids"] == 6
+        assert len(checkpoint["blog_progress"]) == 6
+        for bp in checkpoint["blog_progress"]:
+            assert bp["status"] == "completed", bp
+            assert len(bp["crawled_urls"]) == 7 and bp["posts_crawled"] == 7
+        print("✓ 체크포인트 블로그별 진행 상황 정상")
+
+        crawled_sizes = [len(op["urls"]) for op in saved_ops if op["op"] == "crawled"]
+        assert crawled_sizes and max(crawled_sizes) <= 3
+        assert {op["op"] for op in saved_ops} <= {"set", "blog", "blog_urls", "crawled"}
+        print(f"✓ 체크포인트 작성자에는 바뀐 블로그의 변경만 전달 (새 URL 최대 {max(crawled_sizes)}개씩)")
+
+        assert progress_calls and progress_calls[-1][1] == 6
+        print(f"✓ 진행상황 콜백 {len(progress_calls)}회 호출")
+
+        distinct_groups = {id(group): group for group in groups}.values()
+        assert len(groups) == 6 and len(distinct_groups) <= 3
+        assert all(group is not None and group.size == 2 for group in distinct_groups)
+        print(f"✓ Phase 2 작업 스레드 묶음은 블로그 스레드마다 하나 ({len(distinct_groups)}개), 블로그 6개에서 재사용")
+    finally:
+        batch_crawler.crawl_by_blog_id = original
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("동시 크롤링 스케줄러 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_concurrent_batch()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
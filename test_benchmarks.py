@@ -0,0 +1,130 @@
+"""
+오프라인 벤치마크 테스트
+로컬 fixture 서버의 글 목록 API/포스트/댓글 재현, 작은 사이트로 시나리오 실행, 기준 초과 판정 확인
+"""
+import sys
+import json
+import shutil
+import tempfile
+import urllib.request
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.fixture_server import BASE_LOG_NO, FixtureServer, FixtureSite
+from benchmarks.run_benchmarks import (
+    check_thresholds, run_http_batch, run_http_blog, thresholds_from, unchecked_reason
+)
+from src.crawler.http_fetcher import HttpFetcher
+from src.crawler.static_parser import bundle_from_html
+from src.utils.metrics import CrawlMetrics
+
+
+def get_json(url):
+    return json.loads(urllib.request.urlopen(url, timeout=5).read().decode("utf-8"))
+
+
+def test_fixture_server():
+    """글 목록 API 페이지, 포스트 페이지, 댓글 API 재현"""
+    print("\n=== fixture 서버 테스트 ===")
+
+    site = FixtureSite(blog_ids=["b1"], posts_per_blog=5, page_size=2, comment_every=2, comments_per_post=4)
+    with FixtureServer(site) as server:
+        pages = [get_json(f"{server.base_url}/api/blogs/b1/post-list?page={page}")["result"]["items"]
+                 for page in (1, 2, 3, 4)]
+        assert [len(items) for items in pages] == [2, 2, 1, 0]
+        assert pages[0][0]["logNo"] == BASE_LOG_NO + 5  # 최신순
+        print("✓ 글 목록 API: 페이지당 2개, 빈 페이지가 마지막")
+
+        with HttpFetcher(timeout=5, base_url=server.base_url) as fetcher:
+            status, html = fetcher.fetch(site.post_urls("b1")[1])
+        data = bundle_from_html(html)
+        assert status == 200 and data is not None
+        assert data["title"] and data["text"] and data["commentCountFound"] and data["comments"] == 4
+        print(f"✓ 포스트 페이지를 HTTP 경로 파서로 추출: {data['title']}")
+
+        comments = get_json(f"{server.base_url}/commentBox/cbox/web_naver_list_jsonp.json?objectId={BASE_LOG_NO + 4}")
+        assert comments["result"]["count"]["comment"] == 4
+        assert site.comment_count(BASE_LOG_NO + 3) == 0
+        print("✓ 댓글 API: 2번째 포스트마다 댓글 4개")
+        assert server.counter["requests"] == 6
+
+
+def test_scenarios_small_site():
+    """작은 사이트로 블로그 단위/배치 시나리오 실행"""
+    print("\n=== 시나리오 실행 테스트 ===")
+
+    site = FixtureSite(blog_ids=["b1", "b2"], posts_per_blog=4, body_repeat=2)
+    work_dir = Path(tempfile.mkdtemp())
+    try:
+        with FixtureServer(site) as server:
+            metrics = CrawlMetrics()
+            run_http_blog(site, server.base_url, metrics, work_dir)
+            assert metrics.counter("posts") == 4 and metrics.counter("http_posts") == 4
+            print("✓ crawl_by_blog_id: 포스트 4개")
+
+            metrics = CrawlMetrics()
+            run_http_batch(site, server.base_url, metrics, work_dir)
+            assert metrics.counter("posts") == 8 and metrics.counter("failed_posts") == 0
+            assert metrics.snapshot()["stages"]["http"]["count"] == 8
+            print("✓ 배치 재개 경로: 블로그 2개, 포스트 8개")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def test_check_thresholds():
+    """처리량/RSS/단계 p95/누락 포스트 기준 판정"""
+    print("\n=== 기준 판정 테스트 ===")
+
+    result = {"status": "ok", "posts": 50, "expected_posts": 50, "failed_posts": 0, "posts_per_sec": 20.0,
+              "peak_rss_mb": 50.0, "stages": {"http": {"p95": 0.025}, "save": {"p95": 0.005}}}
+    thresholds = thresholds_from(result, margin=0.5)
+    assert thresholds["min_posts_per_sec"] == 10.0 and thresholds["max_peak_rss_mb"] == 75.0
+    assert thresholds["max_stage_p95"] == {"http": 0.05, "save": 0.05}
+    assert check_thresholds(result, thresholds) == []
+    print("✓ 측정값에서 만든 기준은 통과")
+
+    slow = dict(result, posts_per_sec=5.0, posts=45, stages={"http": {"p95": 0.5}})
+    failures = check_thresholds(slow, thresholds)
+    assert len(failures) == 3
+    assert any("초당 포스트" in f for f in failures) and any("http p95" in f for f in failures)
+    print(f"✓ 회귀 감지: {failures}")
+
+    assert check_thresholds(dict(result, peak_rss_mb=None), dict(thresholds, max_peak_rss_mb=1.0)) == []
+    assert check_thresholds({"status": "skipped"}, thresholds) == []
+    assert check_thresholds({"status": "error", "reason": "종료 코드 1"}, thresholds) == ["종료 코드 1"]
+    print("✓ RSS 미측정/건너뛴 시나리오는 통과, 실행 실패는 실패")
+
+    recorded = {"http_blog": thresholds}
+    assert unchecked_reason(dict(result, scenario="http_blog"), recorded) is None
+    assert "기준 없음" in unchecked_reason(dict(result, scenario="browser_blog"), recorded)
+    assert "건너뜀" in unchecked_reason({"scenario": "browser_blog", "status": "skipped", "reason": "Chromium"}, recorded)
+    print("✓ 건너뛴/기준 없는 시나리오는 비교하지 않은 시나리오로 분류 (--allow-skip 없으면 실패)")
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("오프라인 벤치마크 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_fixture_server()
+        test_scenarios_small_site()
+        test_check_thresholds()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,226 @@
+"""
+브라우저 풀 테스트
+sync_playwright를 가짜 객체로 대체하여 실제 브라우저 없이 확인
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.crawler import browser_pool as browser_pool_module
+from src.crawler.browser_pool import BrowserPool
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+        self.heap_mb = 5.0  # CDP로 측정되는 JS 힙 사용량
+
+    def is_closed(self):
+        return self.closed
+
+
+class FakeCDPSession:
+    def __init__(self, page):
+        self.page = page
+
+    def send(self, method):
+        assert method == 'Runtime.getHeapUsage'
+        return {'usedSize': self.page.heap_mb * 1024 * 1024, 'totalSize': self.page.heap_mb * 2 * 1024 * 1024}
+
+    def detach(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.closed = False
+        self.cookies = list(options.get('storage_state', {}).get('cookies', []))
+
+    def new_page(self):
+        return FakePage()
+
+    def new_cdp_session(self, page):
+        return FakeCDPSession(page)
+
+    def storage_state(self):
+        return {'cookies': list(self.cookies), 'origins': []}
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self, **options):
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+    def close(self):
+        self.connected = False
+
+
+class FakeChromium:
+    def __init__(self):
+        self.browsers = []
+
+    def launch(self, headless=True):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+        self.devices = {'iPhone 12': {'user_agent': 'iPhone'}}
+        self.stopped = False
+
+    def start(self):
+        return self
+
+    def stop(self):
+        self.stopped = True
+
+
+def test_browser_pool():
+    """브라우저 재사용, 컨텍스트 재활용, 크래시 후 재실행 확인"""
+    print("\n=== 브라우저 풀 테스트 ===")
+
+    fake = FakePlaywright()
+    original = browser_pool_module.sync_playwright
+    browser_pool_module.sync_playwright = lambda: fake
+    try:
+        pool = BrowserPool(max_pages_per_context=3)
+
+        # 여러 블로그(대여)가 하나의 브라우저를 재사용
+        for _ in range(3):
+            with pool.lease_page() as lease:
+                page = lease.page
+                lease.used()
+                assert lease.page is page
+        assert pool.launch_count == 1
+        browser = fake.chromium.browsers[0]
+        assert len(browser.contexts) == 3
+        assert all(context.closed for context in browser.contexts)
+        assert browser.contexts[0].options == {'user_agent': 'iPhone'}
+        print("✓ 대여마다 새 컨텍스트, 브라우저는 1회만 실행")
+
+        # N개 페이지 로드 후 컨텍스트 재활용
+        lease = pool.lease_page()
+        pages = []
+        for _ in range(7):
+            if lease.page not in pages:
+                pages.append(lease.page)
+            lease.used()
+        assert len(pages) == 3, len(pages)
+        print("✓ 페이지 3개 로드마다 컨텍스트 교체")
+
+        # 브라우저 크래시 후 자동 재실행
+        fake.chromium.browsers[-1].connected = False
+        page = lease.page
+        assert pool.launch_count == 2
+        assert not page.is_closed()
+        print("✓ 브라우저 연결 끊김 후 재실행")
+
+        lease.close()
+        pool.close()
+        assert fake.stopped
+        print("✓ 풀 종료 시 Playwright 정리")
+    finally:
+        browser_pool_module.sync_playwright = original
+
+
+def test_heap_recycling():
+    """JS 힙이 한도를 넘으면 컨텍스트 교체, 쿠키와 디바이스 설정 유지"""
+    print("\n=== 힙 기준 컨텍스트 재활용 테스트 ===")
+
+    fake = FakePlaywright()
+    original = browser_pool_module.sync_playwright
+    browser_pool_module.sync_playwright = lambda: fake
+    try:
+        pool = BrowserPool(max_pages_per_context=100, max_heap_mb=200, heap_check_interval=2)
+        lease = pool.lease_page()
+        first_page = lease.page
+        browser = fake.chromium.browsers[0]
+        browser.contexts[0].cookies.append({'name': 'NNB', 'value': 'abc'})
+
+        # 힙이 한도 이하면 교체하지 않음
+        for _ in range(4):
+            lease.used()
+        assert lease.page is first_page and lease.recycle_count == 0
+        assert lease.heap_used_mb() == 5.0
+
+        # 확인 간격(2번째 로드)에서 한도를 넘으면 다음 접근에서 교체
+        first_page.heap_mb = 350.0
+        lease.used()
+        assert lease.page is first_page
+        lease.used()
+        new_page = lease.page
+        assert new_page is not first_page and lease.recycle_count == 1
+        assert browser.contexts[0].closed and lease.pages_loaded == 0
+        print("✓ 힙 350MB > 200MB: 확인 간격에 맞춰 새 컨텍스트로 교체")
+
+        new_context = browser.contexts[1]
+        assert new_context.options['user_agent'] == 'iPhone'
+        assert new_context.cookies == [{'name': 'NNB', 'value': 'abc'}]
+        print("✓ 새 컨텍스트에 쿠키와 디바이스 설정 유지")
+
+        # 페이지 수 기준 재활용도 쿠키를 이어받음
+        pool.max_pages_per_context = 2
+        lease.used()
+        lease.used()
+        assert lease.page is not new_page and lease.recycle_count == 2
+        assert browser.contexts[2].cookies == [{'name': 'NNB', 'value': 'abc'}]
+        print("✓ 페이지 수 한도 재활용에도 쿠키 유지")
+
+        # max_heap_mb가 None이면 힙은 확인하지 않음
+        pool.max_heap_mb = None
+        pool.max_pages_per_context = 100
+        page = lease.page
+        page.heap_mb = 1000.0
+        for _ in range(10):
+            lease.used()
+        assert lease.page is page
+        print("✓ max_heap_mb=None이면 힙 크기로 교체하지 않음")
+
+        lease.close()
+        pool.close()
+    finally:
+        browser_pool_module.sync_playwright = original
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("브라우저 풀 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_browser_pool()
+        test_heap_recycling()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
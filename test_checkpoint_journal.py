@@ -0,0 +1,205 @@
+"""
+체크포인트 저널 테스트
+변경분만 저널에 추가하고, 스냅샷 + 저널 재생 결과가 job_data와 같은지 확인
+"""
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.models import Post, Author
+from src.utils.checkpoint_manager import (
+    CheckpointManager, blog_op, blog_progress_ops, crawled_op, set_op
+)
+
+
+def make_post(idx):
+    return Post(
+        post_id=str(idx),
+        title=f"포스트 {idx}",
+        author=Author(blog_id="blog0", nickname="blog0"),
+        published_date="2025. 01. 01.",
+        url=f"https://m.blog.naver.com/PostView.naver?blogId=blog0&logNo={idx}"
+    )
+
+
+def new_job(blog_count):
+    return {
+        "crawl_type": "blog_id",
+        "blog_ids": [f"blog{i}" for i in range(blog_count)],
+        "total_blog_ids": blog_count,
+        "processed_blog_ids": 0,
+        "failed_blog_ids": 0,
+        "status": "running",
+        "blog_progress": []
+    }
+
+
+def normalized(data):
+    """비교용: 시간 필드 제외, crawled_urls는 집합으로"""
+    data = {k: v for k, v in data.items() if k not in ("checkpoint_id", "created_at", "last_updated", "posts")}
+    data["blog_progress"] = [
+        {**bp, "crawled_urls": sorted(set(bp.get("crawled_urls", [])))}
+        for bp in data.get("blog_progress", [])
+    ]
+    return data
+
+
+def test_journal_replay():
+    """저장마다 저널 한 줄 추가, 스냅샷은 그대로, 로드 시 재생"""
+    print("\n=== 체크포인트 저널 재생 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        manager = CheckpointManager(str(test_dir), compact_every=1000)
+        job = new_job(2)
+        path = manager.create_checkpoint(job)
+        snapshot_before = path.read_text(encoding='utf-8')
+
+        urls = [f"https://m.blog.naver.com/PostView.naver?blogId=blog0&logNo={i}" for i in range(300)]
+        job["blog_progress"].append({
+            "blog_id": "blog0", "status": "in_progress", "posts_crawled": 0,
+            "started_at": "2025-01-01T00:00:00", "crawled_urls": [], "all_post_urls": urls
+        })
+        for step in range(30):
+            bp = job["blog_progress"][0]
+            bp["crawled_urls"].extend(urls[step * 10:(step + 1) * 10])
+            bp["crawled_urls"] = list(set(bp["crawled_urls"]))  # _update_blog_progress처럼 순서가 바뀜
+            bp["posts_crawled"] = len(bp["crawled_urls"])
+            manager.save_checkpoint(job, [make_post(i) for i in range(step * 10, (step + 1) * 10)])
+        bp["status"] = "completed"
+        bp["completed_at"] = "2025-01-01T01:00:00"
+        job["processed_blog_ids"] = 1
+        job["blog_progress"].append({"blog_id": "blog1", "status": "failed", "error": "오류",
+                                     "crawled_urls": [], "all_post_urls": None})
+        job["failed_blog_ids"] = 1
+        manager.save_checkpoint(job, [make_post(5)])
+
+        journal_path = CheckpointManager.journal_path_for(path)
+        lines = journal_path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 31
+        assert path.read_text(encoding='utf-8') == snapshot_before
+        # all_post_urls는 처음 한 번만 기록
+        assert sum(1 for line in lines if '"blog_urls"' in line) == 2
+        print(f"✓ 저장 31회 → 저널 {len(lines)}줄 ({journal_path.stat().st_size}바이트), 스냅샷은 변경 없음")
+
+        loaded = CheckpointManager(str(test_dir)).load_checkpoint(str(path))
+        assert normalized(loaded) == normalized(job)
+        post_ids = [post["post_id"] for post in loaded["posts"]]
+        assert len(post_ids) == 100 and post_ids[-1] == "5" and post_ids[0] == "201"
+        print("✓ 스냅샷 + 저널 재생 결과가 job_data와 일치 (최근 포스트 100개, 중복 제거)")
+
+        # 저장 도중 중단되어 잘린 줄
+        with open(journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"ops": [{"op": "set", "key": "status", "val')
+        loaded = CheckpointManager(str(test_dir)).load_checkpoint(str(path))
+        assert loaded["status"] == "running"
+        manager = CheckpointManager(str(test_dir))
+        loaded = manager.load_checkpoint(str(path))
+        loaded["failed_blog_ids"] = 2
+        manager.save_checkpoint(loaded, [])
+        assert CheckpointManager(str(test_dir)).load_checkpoint(str(path))["failed_blog_ids"] == 2
+        print("✓ 잘린 마지막 저널 줄 무시, 이후 저장은 다음 줄에 기록")
+
+        # 재개: 로드한 체크포인트에 이어서 저장 후 완료 시 스냅샷으로 합침
+        manager = CheckpointManager(str(test_dir))
+        loaded = manager.load_checkpoint(str(path))
+        loaded["status"] = "completed"
+        manager.save_checkpoint(loaded, [])
+        assert not journal_path.exists()
+        snapshot = json.loads(path.read_text(encoding='utf-8'))
+        assert snapshot["status"] == "completed" and snapshot["failed_blog_ids"] == 2
+        assert normalized(snapshot)["blog_progress"] == normalized(job)["blog_progress"]
+        print("✓ 완료 시 스냅샷으로 합치고 저널 삭제")
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def test_periodic_compaction():
+    """compact_every번 저장마다 스냅샷으로 합침"""
+    print("\n=== 주기적 스냅샷 합치기 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        manager = CheckpointManager(str(test_dir), compact_every=5)
+        job = new_job(1)
+        path = manager.create_checkpoint(job)
+        journal_path = CheckpointManager.journal_path_for(path)
+        for step in range(12):
+            job["processed_blog_ids"] = step
+            manager.save_checkpoint(job, [])
+        assert len(journal_path.read_text(encoding='utf-8').splitlines()) == 2
+        assert json.loads(path.read_text(encoding='utf-8'))["processed_blog_ids"] == 9
+        assert CheckpointManager(str(test_dir)).load_checkpoint(str(path))["processed_blog_ids"] == 11
+        print("✓ 5회마다 합치기, 남은 저널 2줄 재생")
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def test_explicit_ops():
+    """호출자가 넘긴 변경 목록만 기록 (job_data 비교 없음)"""
+    print("\n=== 변경 목록 저장 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        manager = CheckpointManager(str(test_dir), compact_every=1000)
+        job = new_job(1)
+        job["blog_progress"].append({"blog_id": "blog0", "status": "failed", "error": "이전 오류",
+                                     "crawled_urls": ["u0"], "all_post_urls": ["u0", "u1", "u2"]})
+        path = manager.create_checkpoint(job)
+        journal_path = CheckpointManager.journal_path_for(path)
+
+        bp = {"blog_id": "blog0", "status": "in_progress", "posts_crawled": 1,
+              "crawled_urls": ["u0"], "all_post_urls": ["u0", "u1", "u2"]}
+        manager.save_changes(blog_progress_ops(bp))
+        manager.save_changes([crawled_op("blog0", ["u1"]), blog_op({"blog_id": "blog0", "posts_crawled": 2})],
+                             [make_post(1)])
+        line = journal_path.read_text(encoding='utf-8').splitlines()[-1]
+        assert '"u0"' not in line and '"u2"' not in line  # 바뀐 URL만 기록
+        print(f"✓ 새 URL 1개 저장 → 저널 {len(line)}바이트 (전체 링크 목록 없음)")
+
+        loaded = CheckpointManager(str(test_dir)).load_checkpoint(str(path))
+        loaded_bp = loaded["blog_progress"][0]
+        assert "error" not in loaded_bp and loaded_bp["status"] == "in_progress"
+        assert loaded_bp["crawled_urls"] == ["u0", "u1"] and loaded_bp["posts_crawled"] == 2
+        assert loaded_bp["all_post_urls"] == ["u0", "u1", "u2"]
+        assert [post["post_id"] for post in loaded["posts"]] == ["1"]
+        print("✓ 블로그 새로 시작 시 이전 실행의 error 필드 삭제, 재생 결과 일치")
+
+        manager.save_changes([set_op("status", "completed")])
+        assert not journal_path.exists()
+        assert json.loads(path.read_text(encoding='utf-8'))["status"] == "completed"
+        print("✓ status를 completed로 바꾸면 스냅샷으로 합침")
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("체크포인트 저널 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_journal_replay()
+        test_periodic_compaction()
+        test_explicit_ops()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,169 @@
+"""
+SQLite 크롤링 저장소 테스트
+포스트/댓글/URL 상태 저장, 중복 제외, 최종 문서 형식, 배치 크롤링 연동 확인
+"""
+import sys
+import json
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.models import Post, Author, Comment
+from src.crawler import batch_crawler
+from src.utils.checkpoint_manager import CheckpointManager
+from src.utils.crawl_store import CrawlStore
+from src.utils.file_exporter import export_to_json
+
+
+def make_post(blog_id, idx, comments=0):
+    return Post(
+        post_id=f"{blog_id}-{idx}",
+        title=f"{blog_id} 포스트 \"{idx}\"",
+        author=Author(blog_id=blog_id, nickname=blog_id),
+        published_date="2025. 01. 01.",
+        url=f"https://m.blog.naver.com/PostView.naver?blogId={blog_id}&logNo={idx}",
+        comments=[Comment(author=f"댓글러{c}", content=f"댓글 {c}", date="2025. 01. 02.", likes=c)
+                  for c in range(comments)]
+    )
+
+
+def without_crawl_date(path):
+    return re.sub(r'"crawl_date": "[^"]*"', '', Path(path).read_text(encoding='utf-8'))
+
+
+def test_store():
+    """중복 제외 저장, 댓글 복원, URL 상태 조회, 최종 문서 형식"""
+    print("\n=== SQLite 저장소 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        posts = [make_post("a", i, comments=i % 3) for i in range(5)] + [make_post("b", 0)]
+        store = CrawlStore(str(test_dir / "crawl.db"))
+        assert store.append(posts[:3]) == 3
+        assert store.append(posts[2:]) == 3  # posts[2]는 중복
+        assert store.count == 6
+        assert store.has_post("a-4") and not store.has_post("a-9")
+        assert store.has_url(posts[1].url)
+        assert store.post_ids_by_blog() == {"a": {f"a-{i}" for i in range(5)}, "b": {"b-0"}}
+        print("✓ post_id 중복 제외 저장, post_id/url/blog_id 조회")
+
+        stored = list(store.iter_posts(batch_size=2))
+        assert stored == [post.to_dict() for post in posts]
+        print("✓ 저장 순서와 댓글까지 그대로 복원")
+
+        urls = [make_post("a", i).url for i in range(8)]
+        store.set_post_urls("a", urls)
+        assert store.post_urls("a") == urls
+        assert store.post_urls("c") is None
+        assert set(store.crawled_urls("a")) == set(urls[:5])
+        assert store.pending_urls("a") == urls[5:]
+        store.set_blog_status("a", "in_progress")
+        assert store.blog_status("a") == "in_progress"
+        print("✓ 블로그별 전체 링크/크롤링된 URL/남은 URL 조회")
+
+        store.finalize(str(test_dir / "out.json"), {"status": "completed"})
+        export_to_json(posts, str(test_dir / "ref.json"), {"status": "completed"})
+        assert without_crawl_date(test_dir / "out.json") == without_crawl_date(test_dir / "ref.json")
+        store.close()
+        print("✓ 최종 문서 형식이 export_to_json과 동일")
+
+        # 새 DB는 기존 출력 JSON의 포스트를 이어받음
+        with CrawlStore(str(test_dir / "seeded.db"), seed_json_path=str(test_dir / "ref.json")) as seeded:
+            assert seeded.count == 6
+            assert list(seeded.iter_posts()) == stored
+        with CrawlStore(str(test_dir / "crawl.db")) as reopened:
+            assert reopened.count == 6
+        print("✓ 기존 출력 이어받기, 다시 열어도 유지")
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def fake_crawl_by_blog_id(blog_id, save_callback=None, save_interval=10, all_post_urls=None,
+                          crawled_urls=None, **kwargs):
+    """블로그마다 포스트 5개 중 crawled_urls에 없는 것만 만드는 가짜 크롤러"""
+    urls = [make_post(blog_id, idx).url for idx in range(5)]
+    skip = set(crawled_urls or [])
+    posts = []
+    saved_urls = []
+    for idx in range(5):
+        if urls[idx] in skip:
+            continue
+        posts.append(make_post(blog_id, idx, comments=1))
+        if save_callback and len(posts) >= save_interval:
+            saved_urls.extend(p.url for p in posts)
+            save_callback(posts.copy())
+            posts.clear()
+    return {"blog_id": blog_id, "all_post_urls": urls, "saved_urls": saved_urls}, posts
+
+
+def test_batch_with_store():
+    """store_path로 배치 크롤링: 저장소에 저장하고 종료 시 출력 문서 생성, 재실행 시 저장된 URL 건너뜀"""
+    print("\n=== 저장소 배치 크롤링 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    original = batch_crawler.crawl_by_blog_id
+    batch_crawler.crawl_by_blog_id = fake_crawl_by_blog_id
+    try:
+        manager = CheckpointManager(str(test_dir / "checkpoints"))
+        output_path = str(test_dir / "output.json")
+        store_path = str(test_dir / "crawl.db")
+        batch_crawler.crawl_multiple_blog_ids(["b1", "b2"], output_path, manager,
+                                              save_interval=2, store_path=store_path)
+
+        data = json.loads(Path(output_path).read_text(encoding='utf-8'))
+        assert data["crawl_info"]["status"] == "completed"
+        assert data["crawl_info"]["total_posts"] == 10
+        assert all(len(p["comments"]) == 1 for p in data["posts"])
+        assert not (test_dir / "output.jsonl").exists()
+        with CrawlStore(store_path) as store:
+            assert store.blog_status("b1") == "completed"
+            assert store.pending_urls("b2") == []
+        print(f"✓ 출력 문서 포스트 {len(data['posts'])}개, 블로그 상태 저장소에 기록")
+
+        calls = []
+
+        def recording_crawl(blog_id, **kwargs):
+            calls.append(len(kwargs.get("crawled_urls") or []))
+            return fake_crawl_by_blog_id(blog_id, **kwargs)
+
+        batch_crawler.crawl_by_blog_id = recording_crawl
+        batch_crawler.crawl_multiple_blog_ids(["b1", "b3"], str(test_dir / "output2.json"),
+                                              CheckpointManager(str(test_dir / "checkpoints")),
+                                              store_path=store_path)
+        assert calls == [5, 0]
+        data = json.loads((test_dir / "output2.json").read_text(encoding='utf-8'))
+        assert data["crawl_info"]["total_posts"] == 15
+        print("✓ 다시 실행하면 저장소에 있는 URL은 건너뛰고 새 블로그만 추가")
+    finally:
+        batch_crawler.crawl_by_blog_id = original
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("SQLite 크롤링 저장소 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_store()
+        test_batch_with_store()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,143 @@
+"""
+원본 페이지 아카이브 테스트
+압축/중복 제거 저장과, 아카이브만으로 크롤링 결과를 다시 추출하는지 확인
+"""
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.crawler.engine import crawl_by_blog_id
+from src.crawler.http_fetcher import HttpFetcher
+from src.crawler.reparse import reparse_archive, reparse_to_json
+from src.utils.file_exporter import export_to_json
+from src.utils.html_archive import HtmlArchive, INDEX_NAME
+from test_http_fetcher import FIXTURE_DIR, post_url, start_server
+
+
+def test_archive_store():
+    """압축 저장, 내용 해시로 중복 제거, 잘린 색인 줄 복구"""
+    print("\n=== 아카이브 저장 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        html = (FIXTURE_DIR / "post_plain.html").read_text(encoding="utf-8")
+        archive = HtmlArchive(str(test_dir), compression="gzip")
+        ref = archive.put("testblog", "1", post_url(1), html)
+        assert archive.put("testblog", "1", post_url(1), html) == ref
+        assert archive.put("otherblog", "7", post_url(7), html) == ref
+        blobs = list((test_dir / "blobs").rglob("*.html.gz"))
+        assert len(blobs) == 1 and blobs[0].stat().st_size < len(html.encode("utf-8"))
+        assert len((test_dir / INDEX_NAME).read_text(encoding="utf-8").splitlines()) == 2
+        print(f"✓ 같은 페이지는 압축 파일 1개 ({blobs[0].stat().st_size}바이트), 색인 2줄")
+
+        with open(test_dir / INDEX_NAME, "a", encoding="utf-8") as f:
+            f.write('{"blog_id": "testblog", "post_id": "9", "ur')
+        archive = HtmlArchive(str(test_dir))
+        assert len(archive) == 2 and archive.get("testblog", "1") == html
+        archive.put("testblog", "2", post_url(2), html + "<!-- 변경 -->")
+        assert len(HtmlArchive(str(test_dir))) == 3
+        assert archive.get("testblog", "9") is None
+        print("✓ blog_id/post_id로 조회, 잘린 색인 줄 무시 후 이어 쓰기")
+
+        try:
+            HtmlArchive(str(test_dir), compression="lz4")
+            raise AssertionError("지원하지 않는 압축 방식이 허용됨")
+        except ValueError:
+            pass
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def test_crawl_and_reparse():
+    """HTTP 경로로 크롤링하며 아카이브 → 네트워크 없이 같은 포스트로 재추출"""
+    print("\n=== 아카이브 재추출 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    server = start_server()
+    host, port = server.server_address
+    try:
+        archive = HtmlArchive(str(test_dir / "archive"))
+        saved = []
+        with HttpFetcher(timeout=5, base_url=f"http://{host}:{port}") as fetcher:
+            crawl_by_blog_id("testblog", delay=0.5, all_post_urls=[post_url(1)], save_callback=saved.extend,
+                             save_interval=1, http_fetcher=fetcher, html_archive=archive)
+        server.shutdown()
+        assert len(saved) == 1 and len(archive) == 1
+
+        reparsed = list(reparse_archive(archive))
+        assert [post.to_dict() for post in reparsed] == [saved[0].to_dict()]
+        print(f"✓ 서버 없이 재추출한 포스트가 크롤링 결과와 동일: {reparsed[0].title}")
+
+        previous = saved[0].to_dict()
+        previous["comments"] = [{"author": "손님", "content": "맛있어요", "date": None, "likes": 0}]
+        export_to_json([previous], str(test_dir / "previous.json"), {"status": "completed"})
+        reparse_to_json(str(test_dir / "archive"), str(test_dir / "reparsed.json"),
+                        previous_output=str(test_dir / "previous.json"))
+        data = json.loads((test_dir / "reparsed.json").read_text(encoding="utf-8"))
+        assert data["crawl_info"]["total_posts"] == 1
+        assert data["posts"][0]["comments"] == previous["comments"]
+        print("✓ 재추출 출력 문서 생성, 기존 출력의 댓글 이어받기")
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def test_parallel_reparse():
+    """프로세스 풀 재추출 결과가 순차 재추출과 같고 아카이브 순서 유지"""
+    print("\n=== 프로세스 풀 재추출 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        html = (FIXTURE_DIR / "post_plain.html").read_text(encoding="utf-8")
+        archive = HtmlArchive(str(test_dir / "archive"))
+        for idx in range(40):
+            archive.put("testblog", str(idx), post_url(idx), html.replace("호떡 만들기", f"호떡 만들기 {idx}"))
+        archive.put("testblog", "js", post_url("js"), (FIXTURE_DIR / "post_js_only.html").read_text(encoding="utf-8"))
+
+        sequential = [post.to_dict() for post in reparse_archive(archive)]
+        parallel = [post.to_dict() for post in reparse_archive(archive, workers=2, chunk_size=3)]
+        assert len(sequential) == 40
+        assert parallel == sequential
+        assert [post["post_id"] for post in parallel] == [str(idx) for idx in range(40)]
+        print(f"✓ 작업 프로세스 2개로 {len(parallel)}개 재추출, 순차 결과와 동일 (본문 없는 페이지 제외)")
+
+        reparse_to_json(str(test_dir / "archive"), str(test_dir / "out.json"), workers=2)
+        data = json.loads((test_dir / "out.json").read_text(encoding="utf-8"))
+        assert data["crawl_info"]["total_posts"] == 40 and data["posts"] == sequential
+        assert not list(test_dir.glob(".*.jsonl"))
+        print("✓ 재추출 출력 문서 생성, 임시 파일 정리")
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("원본 페이지 아카이브 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_archive_store()
+        test_crawl_and_reparse()
+        test_parallel_reparse()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,113 @@
+"""
+원본 HTML 처리 테스트
+포스트를 만든 직후 html/markdown을 비우고, spill이면 내용 주소 파일로 저장하는지 확인
+"""
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.models import Post, Author, PostContent
+from src.crawler.engine import crawl_by_blog_id
+from src.crawler.http_fetcher import HttpFetcher
+from src.utils.html_store import HtmlStore, release_heavy_fields
+from test_http_fetcher import post_url, start_server
+
+
+def make_post(idx, html):
+    return Post(
+        post_id=str(idx),
+        title=f"포스트 {idx}",
+        author=Author(blog_id="testblog", nickname="testblog"),
+        published_date="2025. 01. 01.",
+        content=PostContent(html=html, text="본문", markdown="본문")
+    )
+
+
+def test_release_heavy_fields():
+    """keep/drop/spill 정책, 같은 HTML은 한 번만 저장"""
+    print("\n=== 무거운 필드 비우기 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        store = HtmlStore(str(test_dir / "html"))
+        html = "<div>본문</div>" * 100
+
+        post = release_heavy_fields(make_post(1, html), 'keep')
+        assert post.content.html == html
+        post = release_heavy_fields(make_post(1, html), 'drop')
+        assert post.content.html == "" and post.content.markdown == "" and post.content.html_ref is None
+        assert "html_ref" not in post.to_dict()["content"]
+        print("✓ keep은 유지, drop은 비우고 출력 형식 그대로")
+
+        first = release_heavy_fields(make_post(1, html), 'spill', store)
+        second = release_heavy_fields(make_post(2, html), 'spill', store)
+        assert first.content.html == "" and first.content.html_ref == second.content.html_ref
+        assert first.to_dict()["content"]["html_ref"] == first.content.html_ref
+        assert store.get(first.content.html_ref) == html
+        assert len(list((test_dir / "html").rglob("*.html"))) == 1
+        print("✓ spill은 해시 파일로 저장 (같은 HTML은 한 번만), 출력에 html_ref 기록")
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def test_crawl_spills_before_buffering():
+    """crawl_by_blog_id가 저장 콜백에 넘기기 전에 HTML을 내보냄 (HTTP 경로, 브라우저 없음)"""
+    print("\n=== 크롤링 중 HTML 내보내기 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    server = start_server()
+    host, port = server.server_address
+    try:
+        store = HtmlStore(str(test_dir / "html"))
+        saved = []
+        with HttpFetcher(timeout=5, base_url=f"http://{host}:{port}") as fetcher:
+            blog_info, remaining = crawl_by_blog_id(
+                "testblog",
+                delay=0.5,
+                all_post_urls=[post_url(1)],
+                save_callback=saved.extend,
+                save_interval=1,
+                http_fetcher=fetcher,
+                html_policy='spill',
+                html_store=store
+            )
+        assert remaining == [] and len(saved) == 1
+        content = saved[0].content
+        assert content.html == "" and content.markdown == ""
+        assert "호떡이 최고입니다" in store.get(content.html_ref)
+        assert "호떡이 최고입니다" in content.text
+        print(f"✓ 저장 콜백에는 HTML 없는 포스트 전달, 원본은 {store.path_for(content.html_ref).name}")
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("원본 HTML 처리 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_release_heavy_fields()
+        test_crawl_spills_before_buffering()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,196 @@
+"""
+HTTP 직접 요청 경로 테스트
+로컬 fixture 서버에서 저장된 포스트 HTML을 받아 브라우저 없이 Post를 만드는지 확인
+"""
+import gzip
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.crawler.browser_pool import BrowserPool
+from src.crawler.engine import PostWorkerGroup, _crawl_posts_concurrently, crawl_post_http
+from src.crawler.http_fetcher import HttpFetcher
+from src.crawler.readiness import DEFAULT_READINESS
+from src.utils.rate_limiter import AdaptiveRateLimiter
+
+FIXTURE_DIR = project_root / "test_fixtures"
+
+# logNo -> fixture 파일
+FIXTURES = {
+    "1": "post_plain.html",
+    "2": "post_with_comments.html",
+    "3": "post_js_only.html",
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """PostView.naver?logNo=N 요청에 fixture HTML을 keep-alive로 응답"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path == "/old":
+            self.send_response(302)
+            self.send_header("Location", "/PostView.naver?blogId=testblog&logNo=1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        log_no = parse_qs(parsed.query).get("logNo", [""])[0]
+        if log_no == "4":  # 잘린 gzip 응답
+            body = gzip.compress((FIXTURE_DIR / FIXTURES["1"]).read_bytes())[:100]
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        name = FIXTURES.get(log_no)
+        if parsed.path != "/PostView.naver" or name is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = (FIXTURE_DIR / name).read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def post_url(log_no):
+    return f"https://m.blog.naver.com/PostView.naver?blogId=testblog&logNo={log_no}"
+
+
+def test_http_fetch_path():
+    """댓글/태그 펼침이 없는 포스트는 HTTP만으로 수집, 나머지는 None (브라우저 폴백)"""
+    print("\n=== HTTP 직접 요청 경로 테스트 ===")
+
+    server = start_server()
+    host, port = server.server_address
+    try:
+        with HttpFetcher(timeout=5, base_url=f"http://{host}:{port}") as fetcher:
+            post = crawl_post_http(fetcher, post_url(1), blog_id="testblog")
+            assert post is not None
+            assert post.post_id == "1"
+            assert post.title == "호떡 만들기"
+            assert post.author.nickname == "호떡장인"
+            assert post.published_date == "2025. 1. 2. 10:00"
+            assert post.metadata.category == "요리"
+            assert post.metadata.likes == 1234
+            assert post.metadata.comments == 0
+            assert sorted(post.metadata.tags) == ["겨울간식", "호떡"]
+            assert post.comments == []
+            assert "호떡이 최고입니다" in post.content.text
+            assert "스크립트" not in post.content.text
+            assert "12345" not in post.content.text  # 숫자만 있는 줄은 제외
+            assert "https://postfiles.pstatic.net/b.png" in post.content.images
+            assert "https://example.com/recipe" in post.content.links
+            print(f"✓ HTTP 수집: {post.title}, 태그 {len(post.metadata.tags)}개, 본문 {len(post.content.text)}자")
+
+            assert crawl_post_http(fetcher, post_url(2), blog_id="testblog") is None
+            print("✓ 댓글이 있는 포스트는 브라우저 폴백")
+
+            assert crawl_post_http(fetcher, post_url(3), blog_id="testblog") is None
+            print("✓ 본문이 스크립트로만 그려지는 페이지는 브라우저 폴백")
+
+            assert crawl_post_http(fetcher, post_url(99), blog_id="testblog") is None
+            print("✓ 200이 아닌 응답은 브라우저 폴백")
+
+            assert crawl_post_http(fetcher, post_url(4), blog_id="testblog") is None
+            print("✓ 잘린 gzip 응답은 NetworkError로 처리되어 브라우저 폴백")
+
+            status, html = fetcher.fetch("https://m.blog.naver.com/old")
+            assert status == 200 and "호떡 만들기" in html
+            print("✓ 리다이렉트 추적")
+
+            assert fetcher.connection_count < fetcher.request_count
+            print(f"✓ keep-alive 연결 재사용: 요청 {fetcher.request_count}개, 연결 {fetcher.connection_count}개")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class BrokenFetcher:
+    """파싱 단계 버그처럼 NetworkError가 아닌 예외를 던지는 fetcher"""
+
+    def fetch(self, url):
+        raise ValueError("예상하지 못한 응답 형식")
+
+
+def test_worker_reports_http_errors():
+    """동시 크롤링에서 HTTP 경로의 예외도 URL별 실패로 전달, 작업 스레드 브라우저 풀은 블로그를 넘어 재사용"""
+    print("\n=== 작업 스레드 HTTP 예외 / 풀 재사용 테스트 ===")
+
+    pools = []
+
+    def pool_factory():
+        pools.append(BrowserPool())
+        return pools[-1]
+
+    caller_pool = BrowserPool()
+    lease = caller_pool.lease_page()
+    with PostWorkerGroup(2, pool_factory) as group:
+        for blog_id in ("blog1", "blog2"):
+            urls = [post_url(n).replace("testblog", blog_id) for n in range(1, 6)]
+            posts, failures, progress = [], [], []
+            _crawl_posts_concurrently(
+                urls, blog_id, 10, AdaptiveRateLimiter(0.001), 3, lease, group, DEFAULT_READINESS,
+                BrokenFetcher(), None, on_post=posts.append, on_progress=progress.append,
+                on_failure=lambda url, error: failures.append((url, error))
+            )
+            assert posts == [] and progress == [1, 2, 3, 4, 5]
+            assert sorted(url for url, _ in failures) == sorted(urls)
+            assert all(isinstance(error, ValueError) for _, error in failures)
+        print("✓ 블로그 2개 × URL 5개 모두 실패로 전달")
+        assert len(pools) == 2
+        print("✓ 작업 스레드 2개의 브라우저 풀을 두 블로그에서 재사용 (블로그마다 새로 만들지 않음)")
+    lease.close()
+    caller_pool.close()
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("HTTP 직접 요청 경로 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_http_fetch_path()
+        test_worker_reports_http_errors()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
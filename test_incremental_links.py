@@ -0,0 +1,117 @@
+"""
+증분 링크 수집 테스트
+가짜 목록 페이지로 이미 수집한 포스트가 나오면 스크롤을 멈추는지 확인
+"""
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.crawler.engine import _collect_all_post_links
+from src.crawler.scripts import POST_LINKS_JS, PAGE_STRUCTURE_JS
+from src.utils.file_exporter import load_post_ids_by_blog
+
+BLOG_ID = "testblog"
+PAGE_SIZE = 10
+
+
+class FakeLocator:
+    first = property(lambda self: self)
+
+    def count(self):
+        return 0
+
+
+class FakeListPage:
+    """최신순 글 목록: 스크롤할 때마다 PAGE_SIZE개씩 더 로드"""
+
+    def __init__(self, post_ids):
+        self.post_ids = post_ids
+        self.loaded = PAGE_SIZE
+        self.scrolls = 0
+        self.url = f"https://m.blog.naver.com/{BLOG_ID}?categoryNo=0&listStyle=post&tab=1"
+
+    def locator(self, selector):
+        return FakeLocator()
+
+    def evaluate(self, script, arg=None):
+        if script == POST_LINKS_JS:
+            return [f"https://m.blog.naver.com/{BLOG_ID}/{post_id}" for post_id in self.post_ids[:self.loaded]]
+        if script == PAGE_STRUCTURE_JS:
+            return {'allLinks': self.loaded, 'postLinks': self.loaded, 'containers': []}
+        if script == 'document.body.scrollHeight':
+            return self.loaded * 100
+        if script == 'window.scrollTo(0, document.body.scrollHeight)':
+            self.scrolls += 1
+            self.loaded = min(self.loaded + PAGE_SIZE, len(self.post_ids))
+            return None
+        raise AssertionError(f"예상하지 못한 스크립트: {script[:40]}")
+
+
+def test_incremental_collection():
+    """새 포스트 15개 + 기존 포스트 85개 목록에서 새 포스트만 수집"""
+    print("\n=== 증분 링크 수집 테스트 ===")
+
+    post_ids = [str(1000 - i) for i in range(100)]  # 최신순
+    known = set(post_ids[15:])
+
+    page = FakeListPage(post_ids)
+    links = _collect_all_post_links(page, BLOG_ID, known_post_ids=known)
+    assert [link.rsplit('/', 1)[1] for link in links] == post_ids[:15]
+    # 0~9(새), 10~19(일부 새), 20~29(모두 기존) 로드 후 중단
+    assert page.scrolls == 2, page.scrolls
+    print(f"✓ 새 포스트 {len(links)}개 수집, 스크롤 {page.scrolls}회 후 중단 (전체 스크롤 시 9회)")
+
+    page = FakeListPage(post_ids)
+    links = _collect_all_post_links(page, BLOG_ID, known_post_ids=set(post_ids))
+    assert links == [] and page.scrolls == 0
+    print("✓ 새 포스트가 없으면 스크롤 없이 종료")
+
+
+def test_load_post_ids_by_blog():
+    """출력 파일에서 블로그별 포스트 ID 로드"""
+    print("\n=== 기존 포스트 ID 로드 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / "output.json"
+        assert load_post_ids_by_blog(str(output_path)) == {}
+
+        output_path.write_text(json.dumps({
+            "crawl_info": {},
+            "posts": [
+                {"post_id": "1", "author": {"blog_id": "a"}},
+                {"post_id": "2", "author": {"blog_id": "a"}},
+                {"post_id": "3", "author": {"blog_id": "b"}},
+            ]
+        }), encoding='utf-8')
+        assert load_post_ids_by_blog(str(output_path)) == {"a": {"1", "2"}, "b": {"3"}}
+    print("✓ 블로그별 포스트 ID 로드")
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("증분 링크 수집 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_incremental_collection()
+        test_load_post_ids_by_blog()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,146 @@
+"""
+JSONL 스트리밍 출력 테스트
+배치 저장은 JSONL에 이어 쓰고, 최종 문서는 export_to_json과 같은 형식인지 확인
+"""
+import sys
+import json
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.models import Post, Author
+from src.crawler import batch_crawler
+from src.utils.checkpoint_manager import CheckpointManager
+from src.utils.file_exporter import (
+    JsonlPostWriter, export_to_json, finalize_jsonl, iter_jsonl_posts, jsonl_path_for
+)
+
+
+def make_post(blog_id, idx):
+    return Post(
+        post_id=f"{blog_id}-{idx}",
+        title=f"{blog_id} 포스트 \"{idx}\"",
+        author=Author(blog_id=blog_id, nickname=blog_id),
+        published_date="2025. 01. 01.",
+        url=f"https://m.blog.naver.com/PostView.naver?blogId={blog_id}&logNo={idx}"
+    )
+
+
+def without_crawl_date(path):
+    return re.sub(r'"crawl_date": "[^"]*"', '', Path(path).read_text(encoding='utf-8'))
+
+
+def test_writer_and_finalize():
+    """중복 제외 이어 쓰기, 잘린 줄 복구, 기존 출력 이어받기, 최종 문서 형식"""
+    print("\n=== JSONL 기록/변환 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    try:
+        posts = [make_post("a", i) for i in range(5)]
+        jsonl_path = test_dir / "out.jsonl"
+
+        writer = JsonlPostWriter(jsonl_path)
+        assert writer.append(posts[:3]) == 3
+        assert writer.append(posts[2:]) == 2  # posts[2]는 중복
+        assert writer.count == 5
+        print("✓ post_id 중복 제외 이어 쓰기")
+
+        # 중단으로 마지막 줄이 잘린 경우
+        with open(jsonl_path, 'a', encoding='utf-8') as f:
+            f.write('{"post_id": "a-9", "tit')
+        writer = JsonlPostWriter(jsonl_path, fsync_policy='always')
+        assert writer.count == 5
+        assert writer.append([make_post("a", 9)]) == 1
+        assert [p["post_id"] for p in iter_jsonl_posts(jsonl_path)][-1] == "a-9"
+        print("✓ 잘린 마지막 줄 건너뛰고 이어 쓰기")
+
+        # 최종 문서가 export_to_json 결과와 같은 형식인지
+        finalize_jsonl(jsonl_path, str(test_dir / "out.json"), {"status": "completed"})
+        export_to_json(posts + [make_post("a", 9)], str(test_dir / "ref.json"), {"status": "completed"})
+        assert without_crawl_date(test_dir / "out.json") == without_crawl_date(test_dir / "ref.json")
+        finalize_jsonl(test_dir / "none.jsonl", str(test_dir / "empty.json"), {"status": "running"})
+        export_to_json([], str(test_dir / "empty_ref.json"), {"status": "running"})
+        assert without_crawl_date(test_dir / "empty.json") == without_crawl_date(test_dir / "empty_ref.json")
+        print("✓ 최종 문서 형식이 export_to_json과 동일")
+
+        # 기존 출력 JSON 이어받기
+        export_to_json(posts[:2], str(test_dir / "old.json"), {"status": "completed"})
+        writer = JsonlPostWriter(jsonl_path_for(str(test_dir / "old.json")), seed_json_path=str(test_dir / "old.json"))
+        assert writer.count == 2
+        print("✓ 기존 출력 JSON의 포스트 이어받기")
+
+        try:
+            JsonlPostWriter(test_dir / "x.jsonl", fsync_policy='sometimes')
+            raise AssertionError("잘못된 fsync 정책이 허용됨")
+        except ValueError:
+            pass
+        print("✓ fsync 정책 검증")
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def fake_crawl_by_blog_id(blog_id, save_callback=None, save_interval=10, **kwargs):
+    """블로그마다 포스트 5개를 만드는 가짜 크롤러"""
+    posts = []
+    saved_urls = []
+    for idx in range(5):
+        posts.append(make_post(blog_id, idx))
+        if save_callback and len(posts) >= save_interval:
+            saved_urls.extend(p.url for p in posts)
+            save_callback(posts.copy())
+            posts.clear()
+    urls = [make_post(blog_id, idx).url for idx in range(5)]
+    return {"blog_id": blog_id, "all_post_urls": urls, "saved_urls": saved_urls}, posts
+
+
+def test_sequential_batch_output():
+    """순차 배치 크롤링: 저장 간격마다 JSONL, 종료 시 출력 문서 생성"""
+    print("\n=== 순차 배치 출력 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    original = batch_crawler.crawl_by_blog_id
+    batch_crawler.crawl_by_blog_id = fake_crawl_by_blog_id
+    try:
+        manager = CheckpointManager(str(test_dir / "checkpoints"))
+        output_path = str(test_dir / "output.json")
+        batch_crawler.crawl_multiple_blog_ids(["b1", "b2", "b3"], output_path, manager, save_interval=2)
+
+        data = json.loads(Path(output_path).read_text(encoding='utf-8'))
+        assert data["crawl_info"]["status"] == "completed"
+        assert data["crawl_info"]["total_posts"] == 15
+        assert len({p["post_id"] for p in data["posts"]}) == 15
+        assert sum(1 for _ in iter_jsonl_posts(jsonl_path_for(output_path))) == 15
+        print(f"✓ 출력 문서 포스트 {len(data['posts'])}개, 상태 {data['crawl_info']['status']}")
+    finally:
+        batch_crawler.crawl_by_blog_id = original
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("JSONL 스트리밍 출력 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_writer_and_finalize()
+        test_sequential_batch_output()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,192 @@
+"""
+크롤링 지표 테스트
+단계별 히스토그램/카운터, Prometheus 텍스트 엔드포인트, 체크포인트 옆 JSON 파일,
+크롤링 함수의 단계/재시도/포스트 수 기록 확인
+"""
+import sys
+import json
+import shutil
+import tempfile
+import urllib.request
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from src.crawler import batch_crawler
+from src.crawler.engine import crawl_by_blog_id, crawl_post_detail_mobile
+from src.crawler.http_fetcher import HttpFetcher
+from src.utils.checkpoint_manager import CheckpointManager
+from src.utils.exceptions import TimeoutError
+from src.utils.metrics import (
+    CallbackSink, CrawlMetrics, Histogram, JsonFileSink, PrometheusSink, metrics_path_for, summary_line
+)
+from src.utils.retry import RetryPolicy
+from test_http_fetcher import post_url, start_server
+from test_retry_policy import FakePage
+
+
+def test_histogram_and_counters():
+    """구간 히스토그램, 분위수, 타이머, 카운터"""
+    print("\n=== 히스토그램 / 카운터 테스트 ===")
+
+    histogram = Histogram((0.1, 1.0, 10.0))
+    for value in (0.05, 0.05, 0.5, 2.0, 50.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1, 1]
+    assert histogram.quantile(0.4) == 0.1 and histogram.quantile(0.6) == 1.0
+    assert histogram.quantile(1.0) == 50.0  # +Inf 구간은 최댓값
+    print("✓ 구간별 개수와 분위수 추정")
+
+    metrics = CrawlMetrics()
+    with metrics.timer('goto'):
+        pass
+    try:
+        with metrics.timer('comments'):
+            raise ValueError("추출 실패")
+    except ValueError:
+        pass
+    metrics.inc('posts', 3)
+    metrics.inc('retries')
+    snapshot = metrics.snapshot()
+    assert snapshot['stages']['goto']['count'] == 1 and snapshot['stages']['comments']['count'] == 1
+    assert snapshot['counters'] == {'posts': 3, 'retries': 1}
+    assert snapshot['posts_per_minute'] > 0
+    json.dumps(snapshot)
+    line = summary_line(snapshot)
+    assert line.startswith("분당 ") and "접속" in line and "재시도 1" in line
+    print(f"✓ 예외로 끝난 단계도 기록, 요약: {line}")
+
+
+def test_sinks():
+    """Prometheus 엔드포인트, JSON 파일, 콜백 싱크"""
+    print("\n=== 지표 싱크 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    metrics = CrawlMetrics(publish_interval=60)
+    received = []
+    json_path = metrics_path_for(test_dir / "batch_20250101_000000.json")
+    assert json_path.name == "batch_20250101_000000.metrics"
+    metrics.add_sink(JsonFileSink(json_path))
+    metrics.add_sink(CallbackSink(received.append))
+    prometheus = PrometheusSink(metrics, port=0)
+    metrics.add_sink(prometheus)
+    try:
+        metrics.observe('goto', 0.3)
+        metrics.inc('posts')
+
+        body = urllib.request.urlopen(f"http://127.0.0.1:{prometheus.port}/metrics", timeout=5).read().decode()
+        assert 'naver_crawler_posts_total 1' in body
+        assert 'naver_crawler_stage_seconds_bucket{stage="goto",le="0.25"} 0' in body
+        assert 'naver_crawler_stage_seconds_bucket{stage="goto",le="0.5"} 1' in body
+        assert 'naver_crawler_stage_seconds_count{stage="goto"} 1' in body
+        print("✓ /metrics: Prometheus 텍스트 형식 (누적 구간)")
+
+        metrics.publish()
+        metrics.publish()  # publish_interval 안이므로 무시
+        assert len(received) == 1
+        assert json.loads(json_path.read_text(encoding="utf-8"))['counters']['posts'] == 1
+        print("✓ JSON 파일/콜백은 publish_interval 간격으로만 갱신")
+    finally:
+        metrics.close()
+        shutil.rmtree(test_dir, ignore_errors=True)
+    assert len(received) == 2  # close에서 마지막 지표 전달
+    print("✓ 종료 시 마지막 지표 전달 후 엔드포인트 종료")
+
+
+def test_crawl_records_stages():
+    """크롤링 함수가 단계 시간과 카운터를 기록"""
+    print("\n=== 크롤링 단계 기록 테스트 ===")
+
+    metrics = CrawlMetrics()
+    page = FakePage(PlaywrightTimeout("timeout"))
+    try:
+        crawl_post_detail_mobile(page, "https://m.blog.naver.com/test/1", retry_policy=RetryPolicy(base_delay=0.01),
+                                 metrics=metrics)
+        raise AssertionError("예외가 발생하지 않음")
+    except TimeoutError:
+        pass
+    snapshot = metrics.snapshot()
+    assert snapshot['stages']['goto']['count'] == 3
+    assert snapshot['counters']['retries'] == 2
+    print("✓ 브라우저 경로: 시도마다 goto 기록, 재시도 2회")
+
+    server = start_server()
+    host, port = server.server_address
+    try:
+        saved = []
+        with HttpFetcher(timeout=5, base_url=f"http://{host}:{port}") as fetcher:
+            crawl_by_blog_id("testblog", delay=0.5, all_post_urls=[post_url(1)] * 4, save_callback=saved.extend,
+                             save_interval=2, http_fetcher=fetcher, metrics=metrics)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    snapshot = metrics.snapshot()
+    assert snapshot['counters']['posts'] == 4 and snapshot['counters']['http_posts'] == 4
+    assert snapshot['counters']['http_bytes'] > 0
+    assert snapshot['stages']['http']['count'] == 4 and snapshot['stages']['parse']['count'] == 4
+    assert snapshot['stages']['save']['count'] == 2
+    print(f"✓ HTTP 경로: 포스트 4개, 응답 {int(snapshot['counters']['http_bytes'])}바이트, 저장 2회 기록")
+
+
+def test_batch_metrics_file():
+    """배치 크롤링은 체크포인트 옆에 지표 파일을 남기고 체크포인트 목록에는 섞이지 않음"""
+    print("\n=== 배치 지표 파일 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    original = batch_crawler.crawl_by_blog_id
+    received = []
+
+    def fake_crawl_by_blog_id(blog_id, metrics=None, **kwargs):
+        with metrics.timer('goto'):
+            pass
+        metrics.inc('posts')
+        return {"blog_id": blog_id, "all_post_urls": [], "saved_urls": [], "failed_urls": []}, []
+
+    try:
+        manager = CheckpointManager(str(test_dir / "checkpoints"))
+        metrics = CrawlMetrics()
+        metrics.add_sink(CallbackSink(received.append))
+        batch_crawler.crawl_by_blog_id = fake_crawl_by_blog_id
+        batch_crawler.crawl_multiple_blog_ids(["b1", "b2"], str(test_dir / "output.json"), manager, metrics=metrics)
+
+        metrics_file = metrics_path_for(manager.current_checkpoint_path)
+        data = json.loads(metrics_file.read_text(encoding="utf-8"))
+        assert data['counters']['posts'] == 2 and data['stages']['goto']['count'] == 2
+        assert received and received[-1]['counters']['posts'] == 2
+        assert [path.name for path in (test_dir / "checkpoints").glob("*.json")] == [manager.current_checkpoint_path.name]
+        print(f"✓ {metrics_file.name}: 포스트 2개, 콜백 싱크에도 전달, 체크포인트 목록(*.json)은 그대로")
+    finally:
+        batch_crawler.crawl_by_blog_id = original
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("크롤링 지표 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_histogram_and_counters()
+        test_sinks()
+        test_crawl_records_stages()
+        test_batch_metrics_file()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,95 @@
+"""
+데이터 모델/JSON 인코딩 테스트
+슬롯 모델의 to_dict가 dataclasses.asdict 결과와 같고, orjson 경로가 표준 json과 같은 바이트를 내는지 확인
+"""
+import sys
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.models import Post, Author, PostMetadata, PostContent, Comment
+from src.utils import json_codec
+
+
+def make_post():
+    return Post(
+        post_id="224000000001",
+        title="호떡 만들기 \"겨울\" 간식\t ",
+        author=Author(blog_id="hotteok", nickname="호떡장인"),
+        published_date="2025. 1. 2. 10:00",
+        url="https://m.blog.naver.com/PostView.naver?blogId=hotteok&logNo=224000000001",
+        metadata=PostMetadata(views=10, likes=1234, comments=2, category="요리", tags=["호떡", "겨울간식"]),
+        content=PostContent(html="<p>본문</p>", text="본문\n둘째 줄 \\ / \x01", markdown="본문",
+                            word_count=2, images=["https://img/1.jpg"], links=[]),
+        comments=[Comment(author="손님", content="맛있어요 😀", date="2025. 1. 3.", likes=3),
+                  Comment(author="손님2", content="")]
+    )
+
+
+def test_to_dict():
+    """to_dict가 기존 asdict 기반 출력과 같은 키 순서/값"""
+    print("\n=== 모델 to_dict 테스트 ===")
+
+    post = make_post()
+    expected = {
+        "post_id": post.post_id,
+        "title": post.title,
+        "author": asdict(post.author),
+        "published_date": post.published_date,
+        "modified_date": None,
+        "url": post.url,
+        "metadata": asdict(post.metadata),
+        "content": {k: v for k, v in asdict(post.content).items() if k not in ("html", "markdown", "html_ref")},
+        "comments": [asdict(c) for c in post.comments]
+    }
+    assert json.dumps(post.to_dict(), ensure_ascii=False) == json.dumps(expected, ensure_ascii=False)
+    assert not hasattr(post, "__dict__")
+    print("✓ to_dict 결과가 asdict 기반 출력과 동일, __dict__ 없음")
+
+
+def test_codec_byte_compatible():
+    """orjson 유무와 관계없이 같은 바이트 출력"""
+    print("\n=== JSON 인코딩 호환성 테스트 ===")
+
+    data = make_post().to_dict()
+    data["big"] = 2 ** 70  # orjson이 처리하지 못해 표준 json으로 인코딩되는 값
+    fast = (json_codec.dumps_compact(data), json_codec.dumps_indented(data))
+    original = json_codec.orjson
+    json_codec.orjson = None
+    try:
+        slow = (json_codec.dumps_compact(data), json_codec.dumps_indented(data))
+    finally:
+        json_codec.orjson = original
+    assert fast == slow
+    assert slow[1] == json.dumps(data, ensure_ascii=False, indent=2)
+    assert json_codec.loads(fast[0]) == data
+    print(f"✓ orjson 사용 가능: {json_codec.HAS_ORJSON}, 한 줄/들여쓰기 출력 모두 표준 json과 동일")
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("데이터 모델 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_to_dict()
+        test_codec_byte_compatible()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,189 @@
+"""
+본문 텍스트 정리 / 마크다운 변환 테스트
+clean_text, html_to_markdown이 픽스처에서 이전과 같은 결과를 내는지 확인하고
+저장된 실제 페이지로 변환 속도를 측정한다
+
+사용법:
+    python test_parser_text.py                   # 테스트 + 픽스처 기준 속도 측정
+    python test_parser_text.py <아카이브 디렉토리>  # HtmlArchive에 저장된 실제 페이지로 속도 측정
+"""
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.crawler.parser import clean_text, html_to_markdown
+from src.crawler.static_parser import bundle_from_html
+from src.utils.html_archive import HtmlArchive
+
+FIXTURE_DIR = project_root / "test_fixtures"
+
+# 정규식 여러 번 적용하던 이전 구현의 출력 (픽스처 본문)
+EXPECTED_MARKDOWN = {
+    "post_plain.html": (
+        '겨울에는 따끈한 호떡이 최고입니다. 반죽은 전날 미리 만들어 두세요.\n\n'
+        '      ![](https://postfiles.pstatic.net/a.jpg)\n'
+        '      \n'
+        '설탕과 계피를 섞어 속을 채운 뒤 &amp; 약불에서 천천히 굽습니다.\n\n'
+        '2025. 1. 2.\n\n'
+        '12345\n\n'
+        '[지난 레시피 보러가기 링크입니다](/testblog/100) [원문 레시피 페이지 바로가기](https://example.com/recipe)\n\n'
+        '      ![](https://postfiles.pstatic.net/b.png)\n'
+        '      console.log("본문 안 스크립트 텍스트는 제외됩니다");'
+    ),
+    "post_with_comments.html": (
+        '이 글에는 댓글이 달려 있어서 브라우저로 댓글을 수집해야 합니다. '
+        '본문은 HTTP 경로로도 읽을 수 있을 만큼 충분히 깁니다.'
+    ),
+}
+
+EXPECTED_TEXT = {
+    "post_plain.html": (
+        '겨울에는 따끈한 호떡이 최고입니다. 반죽은 전날 미리 만들어 두세요.\n'
+        '설탕과 계피를 섞어 속을 채운 뒤 & 약불에서 천천히 굽습니다.\n'
+        '지난 레시피 보러가기 링크입니다\n'
+        '원문 레시피 페이지 바로가기'
+    ),
+    "post_with_comments.html": (
+        '이 글에는 댓글이 달려 있어서 브라우저로 댓글을 수집해야 합니다. '
+        '본문은 HTTP 경로로도 읽을 수 있을 만큼 충분히 깁니다.'
+    ),
+}
+
+
+def fixture_bundle(name: str) -> dict:
+    return bundle_from_html((FIXTURE_DIR / name).read_text(encoding="utf-8"))
+
+
+def test_fixture_output():
+    """픽스처 본문의 변환 결과가 이전 구현과 같은지"""
+    print("\n=== 픽스처 변환 결과 테스트 ===")
+
+    for name in EXPECTED_MARKDOWN:
+        data = fixture_bundle(name)
+        assert html_to_markdown(data["html"]) == EXPECTED_MARKDOWN[name], name
+        assert clean_text(data["text"]) == EXPECTED_TEXT[name], name
+        print(f"✓ {name}: 마크다운 {len(EXPECTED_MARKDOWN[name])}자, 텍스트 {len(EXPECTED_TEXT[name])}자 일치")
+
+
+def test_markdown_rules():
+    """태그별 변환 규칙 (이전 구현의 동작 그대로)"""
+    print("\n=== 마크다운 변환 규칙 테스트 ===")
+
+    samples = [
+        ("<h1>제목</h1>", "# 제목"),
+        ("<h2 class='t'>소제목</h2><h3>작은 제목</h3>", "## 소제목### 작은 제목"),
+        ("<p>단락 <strong>강조</strong> <em>기울임</em></p>", "단락 **강조** *기울임*"),
+        ('<a href="https://example.com" target="_blank">링크</a>', "[링크](https://example.com)"),
+        ("<a href='https://example.com'>작은따옴표</a>", "작은따옴표"),
+        ('<img src="a.jpg" alt="">', "![](a.jpg)"),
+        ("<img data-src='a.jpg'>", ""),
+        ("첫 줄<br>둘째 줄<br/>셋째 줄", "첫 줄\n둘째 줄\n셋째 줄"),
+        ("<p>a</p><p></p><p></p><p>b</p>", "a\n\nb"),
+        # 여는 태그는 접두사로 판별 (<br>도 '<b'로 보고, 뒤에 </b>가 있으면 강조로 변환)
+        ("줄<br>바꿈 <b>굵게</b>", "줄**바꿈 굵게**"),
+        ("<h1>닫히지 않은 제목", "닫히지 않은 제목"),
+        ("<div><span>태그만 </span>제거</div>", "태그만 제거"),
+        ("", ""),
+    ]
+    for html, expected in samples:
+        assert html_to_markdown(html) == expected, (html, html_to_markdown(html))
+    print(f"✓ {len(samples)}개 규칙 확인")
+
+
+def test_clean_text_rules():
+    """줄 단위 공백 정리"""
+    print("\n=== 텍스트 정리 테스트 ===")
+
+    samples = [
+        ("  a  \t b  \n\n\n  c ", "a b\n\nc"),
+        ("\n\n  첫 줄\n \n\t\n둘째 줄\n\n", "첫 줄\n\n둘째 줄"),
+        (" 공백 ", "공백"),
+        ("", ""),
+    ]
+    for text, expected in samples:
+        assert clean_text(text) == expected, (text, clean_text(text))
+    print(f"✓ {len(samples)}개 규칙 확인")
+
+
+def test_unclosed_tags_linear():
+    """닫는 태그가 없는 태그가 많아도 선형 시간 (이전 구현은 .*? 역추적으로 수 초)"""
+    print("\n=== 닫히지 않은 태그 처리 시간 테스트 ===")
+
+    html = "<h1>제목 " * 5000 + "<b>굵게 " * 5000
+    start = time.perf_counter()
+    markdown = html_to_markdown(html)
+    elapsed = time.perf_counter() - start
+    assert markdown.startswith("제목") and "#" not in markdown and "**" not in markdown
+    assert elapsed < 0.5, f"{elapsed:.2f}초"
+    print(f"✓ 닫히지 않은 태그 10,000개: {elapsed * 1000:.1f}ms")
+
+
+def iter_archive_bodies(archive_dir: str):
+    """아카이브에 저장된 실제 페이지에서 본문 (html, text) 추출"""
+    archive = HtmlArchive(archive_dir)
+    for entry in archive.entries():
+        data = bundle_from_html(archive.read(entry["ref"]))
+        if data is not None:
+            yield data["html"] or "", data["text"] or ""
+
+
+def benchmark(bodies, repeat: int = 20):
+    """본문 목록으로 변환 시간 측정 (포스트당 평균 ms)"""
+    if not bodies:
+        print("[경고] 측정할 본문이 없습니다")
+        return
+    total_bytes = sum(len(html.encode("utf-8")) for html, _ in bodies)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html, _ in bodies:
+            html_to_markdown(html)
+    markdown_ms = (time.perf_counter() - start) * 1000 / (repeat * len(bodies))
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, text in bodies:
+            clean_text(text)
+    text_ms = (time.perf_counter() - start) * 1000 / (repeat * len(bodies))
+
+    print(f"  본문 {len(bodies)}개 (평균 {total_bytes // len(bodies):,}바이트), {repeat}회 반복")
+    print(f"  html_to_markdown: 포스트당 {markdown_ms:.3f}ms")
+    print(f"  clean_text:       포스트당 {text_ms:.3f}ms")
+
+
+def main():
+    print("=" * 60)
+    print("본문 텍스트 정리 / 마크다운 변환 테스트")
+    print("=" * 60)
+
+    try:
+        test_fixture_output()
+        test_markdown_rules()
+        test_clean_text_rules()
+        test_unclosed_tags_linear()
+
+        print("\n=== 변환 속도 측정 ===")
+        if len(sys.argv) > 1:
+            print(f"  아카이브: {sys.argv[1]}")
+            benchmark(list(iter_archive_bodies(sys.argv[1])), repeat=5)
+        else:
+            # 실제 크기에 가까운 긴 본문 (픽스처 본문 200번 반복, 약 180KB)
+            data = fixture_bundle("post_plain.html")
+            benchmark([(data["html"] * 200, data["text"] * 200)])
+
+        print("\n" + "=" * 60)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,86 @@
+"""
+포스트 일괄 추출 결과 변환 테스트
+POST_BUNDLE_JS 반환값을 필드별 추출 함수와 같은 규칙으로 변환하는지 확인
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.crawler.engine import post_fields_from_bundle
+
+
+def test_post_fields_from_bundle():
+    """일괄 추출 결과 변환"""
+    print("\n=== 일괄 추출 결과 변환 테스트 ===")
+
+    data = {
+        'pageTitle': '호떡 만들기 : 네이버 블로그',
+        'title': '호떡 만들기 (본문)',
+        'nickname': '',
+        'publishedDate': '2025. 1. 2. 10:00',
+        'modifiedDate': '',
+        'views': 12,
+        'likes': 3,
+        'comments': 0,
+        'category': '요리',
+        'html': '<p>첫 줄</p><a href="/PostView.naver?logNo=1">링크</a>',
+        'text': '  첫 줄  \n\n\n\n둘째 줄',
+        'images': ['https://example.com/a.jpg'],
+        'links': ['/PostView.naver?logNo=1', 'https://example.com', '/PostView.naver?logNo=1', 'tag']
+    }
+    fields = post_fields_from_bundle(data, 'testblog')
+
+    assert fields['title'] == '호떡 만들기'
+    assert fields['author'].nickname == 'testblog'
+    assert fields['published_date'] == '2025. 1. 2. 10:00'
+    assert fields['modified_date'] is None
+    print("✓ 제목/작성자/날짜 변환")
+
+    metadata = fields['metadata']
+    assert (metadata.views, metadata.likes, metadata.comments, metadata.category) == (12, 3, 0, '요리')
+    print("✓ 메타데이터 변환")
+
+    content = fields['content']
+    assert content.text == '첫 줄\n\n둘째 줄'
+    assert content.word_count == 4
+    assert content.links == [
+        'https://m.blog.naver.com/PostView.naver?logNo=1',
+        'https://example.com',
+        'https://m.blog.naver.com/tag'
+    ]
+    assert '[링크](/PostView.naver?logNo=1)' in content.markdown
+    print("✓ 본문 텍스트/링크/마크다운 변환")
+
+    # 페이지 title에 구분자가 없으면 본문 제목 요소 사용
+    fields = post_fields_from_bundle({'pageTitle': '네이버 블로그', 'title': ' 본문 제목 '}, 'testblog')
+    assert fields['title'] == '본문 제목'
+    fields = post_fields_from_bundle({'pageTitle': '', 'title': ''}, 'testblog')
+    assert fields['title'] == ''
+    print("✓ 제목 Fallback 순서")
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("포스트 일괄 추출 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_post_fields_from_bundle()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,147 @@
+"""
+글 목록 API 응답 수집 테스트
+가짜 목록 페이지가 스크롤마다 글 목록 JSON 응답을 보내고, DOM 추출 없이 링크를 만드는지 확인
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.crawler.engine import _collect_all_post_links
+from src.crawler.post_list_api import PostListCollector, is_post_list_response, log_nos_from_payload
+
+BLOG_ID = "testblog"
+PAGE_SIZE = 24
+
+
+class FakeResponse:
+    def __init__(self, url, payload):
+        self.url = url
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+class FakeLocator:
+    first = property(lambda self: self)
+
+    def count(self):
+        return 0
+
+
+class FakeApiListPage:
+    """스크롤할 때마다 다음 글 목록 API 응답을 보내는 목록 페이지 (DOM 추출은 허용하지 않음)"""
+
+    def __init__(self, total):
+        self.log_nos = [str(224000000000 + total - i) for i in range(total)]  # 최신순
+        self.page_no = 0
+        self.scrolls = 0
+        self.handlers = []
+        self.url = f"https://m.blog.naver.com/{BLOG_ID}?categoryNo=0&listStyle=post&tab=1"
+
+    def on(self, event, handler):
+        assert event == "response"
+        self.handlers.append(handler)
+
+    def remove_listener(self, event, handler):
+        self.handlers.remove(handler)
+
+    def emit(self, response):
+        for handler in list(self.handlers):
+            handler(response)
+
+    def load_next_page(self):
+        self.page_no += 1
+        start = (self.page_no - 1) * PAGE_SIZE
+        items = [{"logNo": int(log_no), "titleWithInspectMessage": f"글 {log_no}"}
+                 for log_no in self.log_nos[start:start + PAGE_SIZE]]
+        url = f"https://m.blog.naver.com/api/blogs/{BLOG_ID}/post-list?categoryNo=0&itemCount={PAGE_SIZE}&page={self.page_no}"
+        self.emit(FakeResponse("https://m.blog.naver.com/api/blogs/other/post-list?page=1", {"result": {"items": [{"logNo": 1}]}}))
+        self.emit(FakeResponse(url, {"isSuccess": True, "result": {"items": items}}))
+
+    def locator(self, selector):
+        return FakeLocator()
+
+    def evaluate(self, script, arg=None):
+        if script == 'document.body.scrollHeight':
+            return self.page_no * 1000
+        if script == 'window.scrollTo(0, document.body.scrollHeight)':
+            self.scrolls += 1
+            self.load_next_page()
+            return None
+        raise AssertionError(f"DOM 추출 스크립트가 호출됨: {script[:40]}")
+
+
+def test_payload_parsing():
+    """응답 URL 판별과 JSON 파싱"""
+    print("\n=== 글 목록 응답 파싱 테스트 ===")
+
+    assert is_post_list_response("https://m.blog.naver.com/api/blogs/TestBlog/post-list?page=2", "testblog")
+    assert not is_post_list_response("https://m.blog.naver.com/api/blogs/other/post-list?page=2", "testblog")
+    assert not is_post_list_response("https://m.blog.naver.com/PostView.naver?blogId=testblog&logNo=1", "testblog")
+    assert log_nos_from_payload({"result": {"items": [{"logNo": 12}, {"logNo": "13"}, {}]}}) == ["12", "13"]
+    assert log_nos_from_payload({"result": {"items": []}}) == []
+    assert log_nos_from_payload({"error": "x"}) is None
+    print("✓ 응답 URL 판별, logNo 추출")
+
+
+def test_collect_from_api():
+    """API 응답만으로 링크 수집, 빈 페이지에서 스크롤 중단, 중복 제거"""
+    print("\n=== 글 목록 API 링크 수집 테스트 ===")
+
+    page = FakeApiListPage(total=60)
+    collector = PostListCollector(BLOG_ID)
+    collector.attach(page)
+    page.load_next_page()  # 목록 페이지 접속 시 첫 페이지 응답
+    page.emit(FakeResponse(
+        f"https://m.blog.naver.com/api/blogs/{BLOG_ID}/post-list?page=1",
+        {"result": {"items": [{"logNo": int(page.log_nos[0])}]}}
+    ))  # 같은 페이지 재요청 (중복)
+
+    links = _collect_all_post_links(page, BLOG_ID, collector=collector)
+    collector.detach(page)
+
+    expected = [f"https://m.blog.naver.com/PostView.naver?blogId={BLOG_ID}&logNo={log_no}" for log_no in page.log_nos]
+    assert links == expected
+    # 24 + 24 + 12 다음 빈 페이지 응답에서 중단
+    assert page.scrolls == 3, page.scrolls
+    assert collector.reached_end
+    assert page.handlers == []
+    print(f"✓ 링크 {len(links)}개 수집 (응답 {collector.responses_seen}개, 스크롤 {page.scrolls}회, DOM 추출 없음)")
+
+    page = FakeApiListPage(total=200)
+    collector = PostListCollector(BLOG_ID)
+    collector.attach(page)
+    page.load_next_page()
+    known = set(page.log_nos[30:])
+    links = _collect_all_post_links(page, BLOG_ID, known_post_ids=known, collector=collector)
+    assert len(links) == 30 and page.scrolls == 2, (len(links), page.scrolls)
+    print(f"✓ 증분 모드: 새 포스트 {len(links)}개, 스크롤 {page.scrolls}회 후 중단")
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("글 목록 API 응답 수집 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_payload_parsing()
+        test_collect_from_api()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,131 @@
+"""
+본문 후처리 단계 테스트
+프로세스 풀 후처리 결과가 크롤링 스레드에서 처리한 결과와 같고 제출 순서대로 전달되는지 확인
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.crawler.engine import crawl_by_blog_id, post_from_static_bundle
+from src.crawler.http_fetcher import HttpFetcher
+from src.crawler.postprocess import PostPipeline, PostProcessor
+from src.crawler.static_parser import bundle_from_html
+from test_http_fetcher import FIXTURE_DIR, post_url, start_server
+
+
+def raw_posts(count: int):
+    """후처리 전 포스트 (앞쪽 포스트일수록 본문이 길어 처리가 늦게 끝남)"""
+    data = bundle_from_html((FIXTURE_DIR / "post_plain.html").read_text(encoding="utf-8"))
+    posts = []
+    for idx in range(count):
+        repeat = (count - idx) * 20
+        post_data = dict(data, html=data["html"] * repeat, text=data["text"] * repeat)
+        posts.append(post_from_static_bundle(post_data, post_url(idx), "testblog", postprocess=False))
+    return posts
+
+
+def test_pipeline_order():
+    """프로세스 풀 결과가 현재 스레드 처리와 같고 제출 순서 유지"""
+    print("\n=== 후처리 파이프라인 테스트 ===")
+
+    inline = []
+    pipeline = PostPipeline(inline.append)
+    for post in raw_posts(12):
+        pipeline.submit(post)
+    assert len(inline) == 12  # 프로세스 풀이 없으면 submit에서 바로 전달
+    assert inline[0].content.word_count > 0 and inline[0].content.markdown
+    assert all(link.startswith("https://") for link in inline[0].content.links)
+
+    delivered = []
+    with PostProcessor(2) as processor:
+        pipeline = PostPipeline(delivered.append, processor, max_pending=4)
+        for post in raw_posts(12):
+            pipeline.submit(post)
+        pipeline.flush()
+
+    assert [post.url for post in delivered] == [post.url for post in inline]
+    assert [post.content for post in delivered] == [post.content for post in inline]
+    print(f"✓ 작업 프로세스 2개로 {len(delivered)}개 후처리, 순서와 결과가 현재 스레드 처리와 동일")
+
+    without_markdown = []
+    with PostProcessor(1) as processor:
+        pipeline = PostPipeline(without_markdown.append, processor, markdown=False)
+        for post in raw_posts(3):
+            pipeline.submit(post)
+        pipeline.flush()
+    assert all(post.content.markdown == "" and post.content.word_count > 0 for post in without_markdown)
+    print("✓ markdown=False면 마크다운 변환 생략 (HTML은 작업 프로세스로 보내지 않음)")
+
+
+def test_failed_delivery_continues():
+    """저장 콜백이 실패해도 다음 포스트는 계속 전달"""
+    print("\n=== 전달 실패 처리 테스트 ===")
+
+    delivered = []
+
+    def on_post(post):
+        if post.url == post_url(1):
+            raise IOError("저장 실패")
+        delivered.append(post.url)
+
+    pipeline = PostPipeline(on_post)
+    for post in raw_posts(3):
+        pipeline.submit(post)
+    pipeline.flush()
+    assert delivered == [post_url(0), post_url(2)]
+    print("✓ 실패한 포스트만 건너뛰고 나머지 전달")
+
+
+def test_crawl_with_processor():
+    """crawl_by_blog_id에 프로세스 풀을 넘겨도 저장 결과 동일"""
+    print("\n=== 크롤링 후처리 단계 테스트 ===")
+
+    server = start_server()
+    host, port = server.server_address
+    try:
+        results = []
+        for processor in (None, PostProcessor(2)):
+            saved = []
+            with HttpFetcher(timeout=5, base_url=f"http://{host}:{port}") as fetcher:
+                crawl_by_blog_id("testblog", delay=0.5, all_post_urls=[post_url(1)] * 3, save_callback=saved.extend,
+                                 save_interval=2, http_fetcher=fetcher, post_processor=processor)
+            if processor:
+                processor.close()
+            results.append(saved)
+
+        assert len(results[0]) == 2  # 저장 간격 2 → 2개 저장, 1개는 반환값
+        assert [post.to_dict() for post in results[1]] == [post.to_dict() for post in results[0]]
+        assert results[1][0].content.text and results[1][0].content.word_count > 0
+        print(f"✓ 프로세스 풀 후처리 결과가 크롤링 스레드 처리와 동일 ({len(results[1])}개 저장)")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("본문 후처리 단계 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_pipeline_order()
+        test_failed_delivery_continues()
+        test_crawl_with_processor()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
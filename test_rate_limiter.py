@@ -0,0 +1,151 @@
+"""
+호스트별 요청 간격 제어 테스트
+실제 크롤링 없이 HostRateLimiter / AdaptiveRateLimiter 동작 확인
+"""
+import sys
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.crawler.engine import crawl_by_blog_id, crawl_post_http
+from src.crawler.http_fetcher import HttpFetcher
+from src.utils.rate_limiter import AdaptiveRateLimiter, HostRateLimiter
+from test_http_fetcher import post_url, start_server
+
+
+def test_host_rate_limiter():
+    """여러 스레드에서 같은 호스트 요청 간격 유지 확인"""
+    print("\n=== 호스트별 요청 간격 테스트 ===")
+
+    delay = 0.1
+    limiter = HostRateLimiter(delay)
+    start_times = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(3):
+            limiter.wait("https://m.blog.naver.com/PostView.naver?blogId=test&logNo=1")
+            with lock:
+                start_times.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    start_times.sort()
+    gaps = [b - a for a, b in zip(start_times, start_times[1:])]
+    assert len(start_times) == 12
+    assert min(gaps) >= delay * 0.9, f"요청 간격이 너무 짧음: {min(gaps):.3f}초"
+    print(f"✓ 12개 요청, 최소 간격 {min(gaps):.3f}초")
+
+    # 다른 호스트는 서로 대기하지 않음
+    limiter = HostRateLimiter(1.0)
+    limiter.wait("https://a.example.com/1")
+    waited = limiter.wait("https://b.example.com/1")
+    assert waited == 0
+    print("✓ 호스트별 독립 간격 정상")
+
+
+def test_adaptive_rate_limiter():
+    """빠른 응답에는 가산 증가, 느린 응답/오류/요청 제한에는 곱셈 감소"""
+    print("\n=== 적응형 요청 간격 테스트 ===")
+
+    url = "https://m.blog.naver.com/PostView.naver?blogId=test&logNo=1"
+    limiter = AdaptiveRateLimiter(0.5, min_delay=0.25, max_delay=8.0, target_latency=1.0)
+    assert limiter.rate(url) == 2.0
+    limiter.record_response(url, 0.2)
+    assert abs(limiter.rate(url) - 2.1) < 1e-9
+    for _ in range(100):
+        limiter.record_response(url, 0.2)
+    assert limiter.rate(url) == 4.0  # min_delay 0.25초에서 멈춤
+    print(f"✓ 빠른 응답: 초당 2.0건 → {limiter.rate(url):.1f}건 (최소 간격 유지)")
+
+    limiter.record_response(url, 1.5)
+    assert abs(1 / limiter.rate(url) - 0.375) < 1e-9
+    assert limiter.record_error(url) == 0.75
+    assert limiter.record_error(url, throttled=True) == 3.0
+    assert limiter.record_error(url, throttled=True) == 8.0  # max_delay
+    print("✓ 느린 응답 ×1.5, 타임아웃 ×2, 요청 제한 ×4 (최대 간격 유지)")
+
+    limiter = AdaptiveRateLimiter(0.1)
+    limiter.wait(url)
+    limiter.record_error(url, throttled=True)
+    assert limiter.reserve(url) > 0.3  # 간격을 늘리면 다음 요청도 바로 미룸
+    assert limiter.rate("https://other.example.com/") == 10.0 and limiter.rate() == 2.5
+    print("✓ 간격을 늘리면 예약된 다음 요청도 미룸, 호스트별 독립")
+
+
+class ThrottleHandler(BaseHTTPRequestHandler):
+    """항상 429로 응답"""
+
+    def do_GET(self):
+        self.send_response(429)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_crawl_feedback():
+    """크롤링 응답이 요청 간격에 반영되는지 (빠른 응답 → 속도 증가, 429 → 감소)"""
+    print("\n=== 크롤링 응답 반영 테스트 ===")
+
+    server = start_server()
+    host, port = server.server_address
+    try:
+        limiter = AdaptiveRateLimiter(0.5)
+        with HttpFetcher(timeout=5, base_url=f"http://{host}:{port}") as fetcher:
+            crawl_by_blog_id("testblog", all_post_urls=[post_url(1)] * 4, save_callback=lambda posts: None,
+                             http_fetcher=fetcher, rate_limiter=limiter)
+        assert limiter.rate(post_url(1)) > 2.0
+        print(f"✓ 로컬 응답 4건 후 초당 {limiter.rate(post_url(1)):.1f}건으로 증가")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    try:
+        limiter = AdaptiveRateLimiter(0.5)
+        with HttpFetcher(timeout=5, base_url=f"http://{host}:{port}") as fetcher:
+            assert crawl_post_http(fetcher, post_url(1), "testblog", rate_limiter=limiter) is None
+        assert limiter.rate(post_url(1)) == 0.5
+        print("✓ 429 응답 후 초당 2.0건 → 0.5건으로 감소")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("요청 간격 제어 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_host_rate_limiter()
+        test_adaptive_rate_limiter()
+        test_crawl_feedback()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,111 @@
+"""
+페이지 준비 상태 대기 테스트
+가짜 페이지 객체로 신호 기반 대기와 최대 대기 처리 확인
+"""
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+from src.crawler.readiness import (
+    ReadinessConfig, wait_for_content, wait_for_comments, click_and_wait_for_comment_api
+)
+
+
+class FakeExpectResponse:
+    def __init__(self, arrives):
+        self.arrives = arrives
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None and not self.arrives:
+            raise PlaywrightTimeout("응답 없음")
+        return False
+
+
+class FakePage:
+    """ready_after초 뒤에 신호가 오는 가짜 페이지"""
+
+    def __init__(self, ready_after, response_arrives=True):
+        self.ready_after = ready_after
+        self.response_arrives = response_arrives
+
+    def _wait(self, timeout):
+        if self.ready_after * 1000 > timeout:
+            time.sleep(timeout / 1000)
+            raise PlaywrightTimeout("최대 대기 초과")
+        time.sleep(self.ready_after)
+
+    def wait_for_selector(self, selector, state=None, timeout=None):
+        self._wait(timeout)
+
+    def wait_for_function(self, script, arg=None, timeout=None, polling=None):
+        self._wait(timeout)
+
+    def expect_response(self, predicate, timeout=None):
+        return FakeExpectResponse(self.response_arrives)
+
+
+class FakeButton:
+    def __init__(self, fails=False):
+        self.fails = fails
+
+    def click(self):
+        if self.fails:
+            raise PlaywrightTimeout("클릭 실패")
+
+
+def test_readiness():
+    """신호가 오면 즉시 진행하고, 오지 않으면 최대 대기 후 진행"""
+    print("\n=== 준비 상태 대기 테스트 ===")
+    config = ReadinessConfig(content_timeout=0.3, comments_timeout=0.2, log_waits=False)
+
+    start = time.monotonic()
+    assert wait_for_content(FakePage(0.05), config)
+    assert time.monotonic() - start < 0.25
+    print("✓ 본문이 나타나면 즉시 진행")
+
+    start = time.monotonic()
+    assert not wait_for_comments(FakePage(5), config)
+    elapsed = time.monotonic() - start
+    assert 0.2 <= elapsed < 1.0, elapsed
+    print(f"✓ 신호가 없으면 최대 대기 후 진행 ({elapsed:.2f}초)")
+
+    assert click_and_wait_for_comment_api(FakePage(0), FakeButton(), config)
+    assert not click_and_wait_for_comment_api(FakePage(0, response_arrives=False), FakeButton(), config)
+    try:
+        click_and_wait_for_comment_api(FakePage(0), FakeButton(fails=True), config)
+        raise AssertionError("클릭 실패가 전달되지 않음")
+    except PlaywrightTimeout:
+        pass
+    print("✓ 댓글 API 응답 대기 및 클릭 실패 전달")
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("준비 상태 대기 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_readiness()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,121 @@
+"""
+리소스 차단 테스트
+가짜 CDP 세션/페이지로 차단 패턴과 절약량 통계 확인
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from src.crawler.resource_blocking import (
+    BLOCKED_ERROR_TEXT, BlockingProfile, BlockingStats, DEFAULT_BLOCKING_PROFILE, install_page_blocking
+)
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type, failure):
+        self.url = url
+        self.resource_type = resource_type
+        self.failure = failure
+
+
+class FakeCDPSession:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, method, params=None):
+        self.sent.append((method, params))
+
+
+class FakePage:
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+
+class FakeContext:
+    def __init__(self):
+        self.cdp = FakeCDPSession()
+        self.routes = []
+
+    def new_cdp_session(self, page):
+        return self.cdp
+
+    def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+
+def test_resource_blocking():
+    """이미지/폰트/광고는 차단하고 본문·댓글 스크립트는 유지"""
+    print("\n=== 리소스 차단 테스트 ===")
+
+    context = FakeContext()
+    page = FakePage()
+    stats = BlockingStats()
+    install_page_blocking(context, page, DEFAULT_BLOCKING_PROFILE, stats)
+    assert context.routes == []  # route를 쓰지 않으므로 HTTP 캐시 유지
+    assert context.cdp.sent == [
+        ('Network.enable', None),
+        ('Network.setBlockedURLs', {'urls': DEFAULT_BLOCKING_PROFILE.url_patterns()}),
+    ]
+    print("✓ route 대신 CDP Network.setBlockedURLs로 차단 설치")
+
+    cases = [
+        ("https://postfiles.pstatic.net/a.jpg?type=w80", "image", True),
+        ("https://ssl.pstatic.net/font.woff2", "font", True),
+        ("https://www.googletagmanager.com/gtm.js", "script", True),
+        ("https://nam.veta.naver.com/call", "xhr", True),
+        ("https://m.blog.naver.com/PostView.naver?blogId=a&logNo=1", "document", False),
+        ("https://ssl.pstatic.net/static.blog/mobile/se.js", "script", False),
+        ("https://apis.naver.com/commentBox/cbox/web_naver_list_jsonp.json", "script", False),
+        ("https://notveta.naver.com/x", "xhr", False),
+        ("https://ssl.pstatic.net/static/x.icon.js", "script", False),
+    ]
+    for url, resource_type, expected in cases:
+        blocked = DEFAULT_BLOCKING_PROFILE.blocks_url(url)
+        assert blocked == expected, (url, blocked)
+        failure = BLOCKED_ERROR_TEXT if blocked else None
+        page.handlers['requestfailed'](FakeRequest(url, resource_type, failure))
+    # 차단이 아닌 이유로 실패한 요청은 집계하지 않음
+    page.handlers['requestfailed'](FakeRequest("https://m.blog.naver.com/x", "document", "net::ERR_TIMED_OUT"))
+    print("✓ 차단 패턴 (리소스 확장자, 광고/통계 호스트)")
+
+    profile = BlockingProfile()
+    assert hash(profile) == hash(DEFAULT_BLOCKING_PROFILE)
+    assert profile.estimate_size('image') == 80_000 and profile.estimate_size('xhr') == 5_000
+    print("✓ 프로필은 불변 (해시 가능)")
+
+    requests, saved = stats.take()
+    assert requests == 4
+    assert saved == 80_000 + 50_000 + 40_000 + 5_000
+    assert stats.take() == (0, 0)
+    assert stats.total_requests == 4
+    print(f"✓ 절약량 통계: 요청 {requests}개, {saved}바이트")
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("리소스 차단 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_resource_blocking()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
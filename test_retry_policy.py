@@ -0,0 +1,316 @@
+"""
+재시도 정책 / 실패 목록 테스트
+오류 분류, 지수 백오프, 일시적 오류만 재시도, 체크포인트 실패 목록과 실패한 URL만 재시도 확인
+"""
+import sys
+import json
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeout
+
+from src.models import Post, Author
+from src.crawler import batch_crawler
+from src.crawler import async_engine
+from src.crawler.browser_pool import PageLease
+from src.crawler.engine import classify_error, crawl_post_detail_mobile
+from src.utils.checkpoint_manager import CheckpointManager
+from src.utils.exceptions import NetworkError, ParsingError, RateLimitedError, TimeoutError
+from src.utils.rate_limiter import AdaptiveRateLimiter
+from src.utils.retry import RetryPolicy, failure_record, is_transient, merge_failures
+
+
+class FakePage:
+    """goto마다 지정한 예외를 던지는 페이지"""
+
+    def __init__(self, error: Exception, closed: bool = False):
+        self.error = error
+        self.gotos = 0
+        self.closed = closed
+
+    def is_closed(self):
+        return self.closed
+
+    def goto(self, url, **kwargs):
+        self.gotos += 1
+        raise self.error
+
+
+def test_classify_and_backoff():
+    """오류 분류와 지터를 준 지수 백오프"""
+    print("\n=== 오류 분류 / 백오프 테스트 ===")
+
+    assert isinstance(classify_error(PlaywrightTimeout("느림")), TimeoutError)
+    assert isinstance(classify_error(PlaywrightError("net::ERR_CONNECTION_RESET")), NetworkError)
+    assert isinstance(classify_error(KeyError("title")), ParsingError)
+    assert is_transient(RateLimitedError("429")) and not is_transient(ParsingError("x"))
+    print("✓ Playwright 타임아웃 → TimeoutError, 브라우저 오류 → NetworkError, 그 밖의 예외 → ParsingError")
+
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.5)
+    for attempt, full in enumerate([1.0, 2.0, 4.0, 5.0, 5.0]):
+        for _ in range(50):
+            assert full * 0.5 <= policy.backoff(attempt) <= full
+    assert RetryPolicy(jitter=0).backoff(2) == 4.0
+    assert policy.should_retry(TimeoutError("t"), 1) and not policy.should_retry(TimeoutError("t"), 2)
+    assert not policy.should_retry(ParsingError("p"), 0)
+    print("✓ 대기 시간 1 → 2 → 4 → 5초 (최대), 최대 50%까지 무작위로 줄임")
+
+    for invalid in ({"max_attempts": 0}, {"base_delay": -1.0}, {"jitter": -0.1}, {"jitter": 1.5}):
+        try:
+            RetryPolicy(**invalid)
+            raise AssertionError(f"잘못된 설정이 통과됨: {invalid}")
+        except ValueError:
+            pass
+    print("✓ max_attempts < 1, 음수 대기 시간, 범위 밖 jitter는 ValueError")
+
+
+def test_retry_only_transient():
+    """일시적 오류만 재시도하고 영구적 오류는 바로 실패"""
+    print("\n=== 일시적 오류만 재시도 테스트 ===")
+
+    policy = RetryPolicy(base_delay=0.01)
+    page = FakePage(PlaywrightTimeout("timeout"))
+    try:
+        crawl_post_detail_mobile(page, "https://m.blog.naver.com/test/1", retry_policy=policy)
+        raise AssertionError("예외가 발생하지 않음")
+    except TimeoutError:
+        pass
+    assert page.gotos == 6  # 시도마다 domcontentloaded, load 두 번 접속
+    print("✓ 타임아웃은 3번 시도 후 TimeoutError")
+
+    page = FakePage(RuntimeError("추출 코드 버그"))
+    try:
+        crawl_post_detail_mobile(page, "https://m.blog.naver.com/test/1", retry_policy=policy)
+        raise AssertionError("예외가 발생하지 않음")
+    except ParsingError:
+        pass
+    assert page.gotos == 1
+    print("✓ 파싱 오류는 재시도하지 않고 ParsingError")
+
+
+class FakeLease(PageLease):
+    """page에 접근할 때마다 새 페이지를 돌려주는 대여 (닫힌 페이지 교체 확인용)"""
+
+    def __init__(self, error: Exception):
+        self.error = error
+        self.pages = []
+
+    @property
+    def page(self):
+        self.pages.append(FakePage(self.error))
+        return self.pages[-1]
+
+
+def test_closed_page_retry():
+    """닫힌 페이지: 대여를 넘기면 시도마다 새 페이지, 페이지만 넘기면 재시도 없이 실패"""
+    print("\n=== 닫힌 페이지 재시도 테스트 ===")
+
+    policy = RetryPolicy(base_delay=0.01)
+    lease = FakeLease(PlaywrightError("Target page, context or browser has been closed"))
+    try:
+        crawl_post_detail_mobile(lease, "https://m.blog.naver.com/test/1", retry_policy=policy)
+        raise AssertionError("예외가 발생하지 않음")
+    except NetworkError:
+        pass
+    assert len(lease.pages) == 3 and all(page.gotos == 1 for page in lease.pages)
+    print("✓ 대여를 넘기면 시도마다 lease.page를 다시 읽어 새 페이지로 재시도")
+
+    page = FakePage(PlaywrightTimeout("timeout"), closed=True)
+    try:
+        crawl_post_detail_mobile(page, "https://m.blog.naver.com/test/1", retry_policy=policy)
+        raise AssertionError("예외가 발생하지 않음")
+    except NetworkError:
+        pass
+    assert page.gotos == 0
+    print("✓ 닫힌 Page는 같은 페이지로 재시도하지 않고 바로 NetworkError")
+
+
+class FakeAsyncPage(FakePage):
+    """async API용 가짜 페이지"""
+
+    async def goto(self, url, **kwargs):
+        self.gotos += 1
+        raise self.error
+
+
+def test_async_retry_policy():
+    """asyncio 버전도 같은 분류/재시도 정책 사용"""
+    print("\n=== asyncio 버전 재시도 테스트 ===")
+
+    policy = RetryPolicy(base_delay=0.01)
+    for page, expected, gotos in [
+        (FakeAsyncPage(PlaywrightTimeout("timeout")), TimeoutError, 6),
+        (FakeAsyncPage(RuntimeError("추출 코드 버그")), ParsingError, 1),
+        (FakeAsyncPage(PlaywrightTimeout("timeout"), closed=True), NetworkError, 0),
+    ]:
+        try:
+            asyncio.run(async_engine.crawl_post_detail_mobile(page, "https://m.blog.naver.com/test/1",
+                                                              retry_policy=policy))
+            raise AssertionError("예외가 발생하지 않음")
+        except expected:
+            pass
+        assert page.gotos == gotos, (expected, page.gotos)
+    print("✓ 타임아웃은 3번 시도, 파싱 오류와 닫힌 페이지는 재시도 없이 실패")
+
+    url = "https://m.blog.naver.com/test/1"
+    rate_limiter = AdaptiveRateLimiter(delay=0.01, min_delay=0.01, max_delay=0.05)
+    try:
+        asyncio.run(async_engine.crawl_post_detail_mobile(FakeAsyncPage(PlaywrightTimeout("timeout")), url,
+                                                          retry_policy=policy, rate_limiter=rate_limiter))
+        raise AssertionError("예외가 발생하지 않음")
+    except TimeoutError:
+        pass
+    assert rate_limiter.rate(url) == 1 / 0.05
+    print("✓ 타임아웃마다 rate_limiter 간격 증가 (고정 간격 아님)")
+
+
+def test_merge_failures():
+    """실패 목록 병합: 성공한 URL 제외, 다시 실패한 URL은 시도 횟수 누적"""
+    print("\n=== 실패 목록 병합 테스트 ===")
+
+    first = [failure_record("u1", TimeoutError("t")), failure_record("u2", ParsingError("p"))]
+    merged = merge_failures(first, [failure_record("u2", ParsingError("p2"))], ["u1"])
+    assert [(entry["url"], entry["attempts"], entry["error"]) for entry in merged] == [("u2", 2, "p2")]
+    assert first[0]["transient"] and not first[1]["transient"]
+    print("✓ 성공한 u1 제외, u2 시도 2회")
+
+
+def blog_urls(blog_id):
+    return [f"https://m.blog.naver.com/PostView.naver?blogId={blog_id}&logNo={i}" for i in range(5)]
+
+
+def make_fake_crawl(failing: set, calls: list):
+    """failing에 있는 URL은 실패로 기록하는 가짜 크롤러"""
+    def fake_crawl_by_blog_id(blog_id, save_callback=None, crawled_urls=None, **kwargs):
+        skip = set(crawled_urls or [])
+        urls = blog_urls(blog_id)
+        attempted = [url for url in urls if url not in skip]
+        calls.append(attempted)
+        posts, failed = [], []
+        for url in attempted:
+            if url in failing:
+                failed.append(failure_record(url, TimeoutError("페이지 로딩 타임아웃")))
+                continue
+            posts.append(Post(post_id=url[-1], title=f"포스트 {url[-1]}",
+                              author=Author(blog_id=blog_id, nickname=blog_id),
+                              published_date="2025. 01. 01.", url=url))
+        return {"blog_id": blog_id, "all_post_urls": urls, "saved_urls": [], "failed_urls": failed}, posts
+    return fake_crawl_by_blog_id
+
+
+def test_dead_letter_checkpoint():
+    """실패한 URL을 체크포인트에 기록하고 retry_failed로 그 URL만 재시도"""
+    print("\n=== 체크포인트 실패 목록 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    original = batch_crawler.crawl_by_blog_id
+    urls = blog_urls("b1")
+    calls = []
+    try:
+        manager = CheckpointManager(str(test_dir / "checkpoints"))
+        output_path = str(test_dir / "output.json")
+        batch_crawler.crawl_by_blog_id = make_fake_crawl({urls[2], urls[4]}, calls)
+        batch_crawler.crawl_multiple_blog_ids(["b1"], output_path, manager)
+        checkpoint_path = str(manager.current_checkpoint_path)
+
+        bp = CheckpointManager(str(test_dir / "checkpoints")).load_checkpoint(checkpoint_path)["blog_progress"][0]
+        assert bp["status"] == "completed" and len(bp["crawled_urls"]) == 3
+        assert [entry["url"] for entry in bp["failed_urls"]] == [urls[2], urls[4]]
+        assert bp["failed_urls"][0]["error_type"] == "TimeoutError"
+        print(f"✓ 실패한 포스트 {len(bp['failed_urls'])}개를 체크포인트 failed_urls에 기록")
+
+        # 일반 재개는 실패 목록을 건너뜀 (이미 완료)
+        resumed = batch_crawler.resume_crawling(checkpoint_path, output_path,
+                                                CheckpointManager(str(test_dir / "checkpoints")))
+        assert resumed == []
+        assert len(calls) == 1
+        print("✓ 일반 재개는 실패한 URL을 다시 시도하지 않음")
+
+        # 실패한 URL만 재시도: logNo=2는 성공, logNo=4는 다시 실패
+        batch_crawler.crawl_by_blog_id = make_fake_crawl({urls[4]}, calls)
+        batch_crawler.resume_crawling(checkpoint_path, output_path, CheckpointManager(str(test_dir / "checkpoints")),
+                                      retry_failed=True)
+        assert calls[-1] == [urls[2], urls[4]]
+
+        bp = CheckpointManager(str(test_dir / "checkpoints")).load_checkpoint(checkpoint_path)["blog_progress"][0]
+        assert len(bp["crawled_urls"]) == 4
+        assert [(entry["url"], entry["attempts"]) for entry in bp["failed_urls"]] == [(urls[4], 2)]
+        data = json.loads(Path(output_path).read_text(encoding="utf-8"))
+        assert data["crawl_info"]["total_posts"] == 4
+        print("✓ retry_failed: 실패한 2개만 다시 크롤링, 성공한 URL은 실패 목록에서 제외, 출력 포스트 4개")
+    finally:
+        batch_crawler.crawl_by_blog_id = original
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def test_paused_resume_status():
+    """중단된 재개는 paused로 기록되어 다음 재개에서 남은 블로그를 이어서 크롤링"""
+    print("\n=== 중단된 재개 상태 테스트 ===")
+
+    test_dir = Path(tempfile.mkdtemp())
+    original = batch_crawler.crawl_by_blog_id
+    calls = []
+    try:
+        manager = CheckpointManager(str(test_dir / "checkpoints"))
+        output_path = str(test_dir / "output.json")
+        batch_crawler.crawl_by_blog_id = make_fake_crawl(set(), calls)
+        batch_crawler.crawl_multiple_blog_ids(["b1", "b2", "b3"], output_path, manager,
+                                              should_stop=lambda: len(calls) >= 1)
+        checkpoint_path = str(manager.current_checkpoint_path)
+        assert len(calls) == 1
+
+        # 재개도 블로그 하나 후 중단
+        batch_crawler.resume_crawling(checkpoint_path, output_path, CheckpointManager(str(test_dir / "checkpoints")),
+                                      should_stop=lambda: len(calls) >= 2)
+        checkpoint = CheckpointManager(str(test_dir / "checkpoints")).load_checkpoint(checkpoint_path)
+        data = json.loads(Path(output_path).read_text(encoding="utf-8"))
+        assert checkpoint["status"] == "paused", checkpoint["status"]
+        assert data["crawl_info"]["status"] == "paused" and data["crawl_info"]["resumed"]
+        print("✓ 중단된 재개는 체크포인트/출력 모두 paused")
+
+        batch_crawler.resume_crawling(checkpoint_path, output_path, CheckpointManager(str(test_dir / "checkpoints")))
+        assert len(calls) == 3 and calls[-1] == blog_urls("b3")
+        data = json.loads(Path(output_path).read_text(encoding="utf-8"))
+        assert data["crawl_info"]["status"] == "completed"
+        checkpoint = CheckpointManager(str(test_dir / "checkpoints")).load_checkpoint(checkpoint_path)
+        assert checkpoint["status"] == "completed"
+        print("✓ 다음 재개에서 남은 블로그 b3 크롤링 후 completed")
+    finally:
+        batch_crawler.crawl_by_blog_id = original
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+
+def main():
+    """메인 테스트 함수"""
+    print("=" * 50)
+    print("재시도 정책 / 실패 목록 테스트 시작")
+    print("=" * 50)
+
+    try:
+        test_classify_and_backoff()
+        test_retry_only_transient()
+        test_closed_page_retry()
+        test_async_retry_policy()
+        test_merge_failures()
+        test_dead_letter_checkpoint()
+        test_paused_resume_status()
+
+        print("\n" + "=" * 50)
+        print("✓ 모든 테스트 통과!")
+        print("=" * 50)
+        return 0
+    except Exception as e:
+        print(f"\n✗ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())